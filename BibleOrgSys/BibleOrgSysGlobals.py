@@ -90,6 +90,16 @@ CHANGELOG:
     2023-09-28 Fixed preloadCommonData() to not create new variables
     2023-10-11 Raised XMLError on XML errors (rather than halt)
     2024-06-14 Print more info for failed pickles
+    2025-06-07 Added foldedTextsFlag
+    2025-06-13 Added columnarEntriesFlag
+    2025-06-14 Incremented PICKLED_BIBLE_VERSION (InternalBibleEntry now has marker codes and flags)
+    2025-06-18 Added verseCacheSize
+    2025-06-19 Added bookMemoryBudget
+    2025-06-20 Added bookResultsCacheFlag
+    2025-06-25 Added process-wide worker pool (getWorkerPool(), mapInWorkers(), starmapInWorkers(), imapInWorkers(), shutdownWorkerPool())
+    2025-06-26 Nested mapInWorkers()/imapInWorkers() calls (which run in the one worker process) now give a warning
+    2025-06-26 getForkedWorkerPool() doesn't fork while the process-wide worker pool is running
+    2025-06-26 A mapInWorkers() timeout only terminates the worker pool if no other call is using it
 """
 from gettext import gettext as _
 import sys
@@ -101,6 +111,11 @@ from datetime import datetime
 import unicodedata
 from argparse import ArgumentParser, Namespace
 import configparser
+from collections import deque
+import multiprocessing
+from multiprocessing.pool import Pool
+import threading
+import atexit
 
 # pwd:Optional[Any] # Should be Module
 try: import pwd
@@ -114,10 +129,10 @@ if __name__ == '__main__':
         sys.path.insert( 0, aboveFolderpath )
 
 
-LAST_MODIFIED_DATE = '2024-06-14' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "BibleOrgSysGlobals"
 PROGRAM_NAME = "BibleOrgSys (BOS) Globals"
-PROGRAM_VERSION = '0.92'
+PROGRAM_VERSION = '0.93'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -132,7 +147,7 @@ SUPPORT_SITE_NAME = 'Freely-Given.org'
 SUPPORT_SITE_URL = f'https://{SUPPORT_SITE_NAME}/'
 DISTRIBUTABLE_RESOURCES_URL = f'{SUPPORT_SITE_URL}Software/BibleOrganisationalSystem/DistributableResources/'
 
-PICKLED_BIBLE_VERSION = '1' # Must be incremented if Bible internals get changed
+PICKLED_BIBLE_VERSION = '2' # Must be incremented if Bible internals get changed
 
 
 programStartTime = datetime.now()
@@ -141,7 +156,12 @@ commandLineArguments = Namespace()
 strictCheckingFlag = debugFlag = False
 prependBOMFlag = True
 maxProcesses = 1
-alreadyMultiprocessing = False # Not used in this module, but set to prevent multiple levels of multiprocessing (illegal)
+alreadyMultiprocessing = False # Set in worker processes (which can't start their own workers) -- see mapInWorkers()
+foldedTextsFlag = False # If set, InternalBibleBook.processLines() also makes caseless/diacritic-insensitive copies of each cleanText (faster searches, more memory)
+columnarEntriesFlag = False # If set, InternalBibleBook.processLines() stores the processed lines in an InternalBibleColumnarEntryList (less memory, slightly slower access)
+verseCacheSize = 0 # If non-zero, each new InternalBible keeps an LRU cache of this many getContextVerseData()/getVerseText() results
+bookMemoryBudget = 0 # If non-zero, the approximate number of bytes of loaded books shared by all new InternalBibles before the least-recently-used books are unloaded
+bookResultsCacheFlag = False # If set, InternalBibleBook _discover() and checkBook() results are cached in the BOSObjectCache folder (keyed by a hash of each book's raw lines)
 verbosityLevel = 2
 verbosityString = 'Normal'
 
@@ -1608,6 +1628,208 @@ def addStandardOptionsAndProcess( parserObject, exportAvailable=False ) -> None:
 # end of BibleOrgSysGlobals.addStandardOptionsAndProcess
 
 
+_workerPool = None # The process-wide pool of worker processes -- see getWorkerPool()
+_workerPoolSettings = None # The settings that the workers in the pool inherited when they were started
+_workerPoolUseCount = 0 # Number of mapInWorkers()/imapInWorkers() calls currently using the pool (so it doesn't get restarted under them)
+_workerPoolLock = threading.RLock() # In case a long-running program uses BibleOrgSys from several threads
+
+def _initialiseWorkerProcess() -> None:
+    """
+    Runs in each new worker process (before it does any tasks).
+    """
+    global alreadyMultiprocessing
+    alreadyMultiprocessing = True # Workers can't start their own workers
+# end of BibleOrgSysGlobals._initialiseWorkerProcess
+
+
+def _getWorkerPoolSettings() -> tuple:
+    """
+    Returns the settings that (forked) workers inherit when they're started
+        so that we can tell if the pool needs restarting.
+    """
+    return ( maxProcesses, verbosityLevel, debugFlag, strictCheckingFlag,
+            foldedTextsFlag, columnarEntriesFlag, bookResultsCacheFlag,
+            len(USFMParagraphMarkers) ) # Zero if preloadCommonData() hasn't been run yet
+# end of BibleOrgSysGlobals._getWorkerPoolSettings
+
+
+def getWorkerPool() -> Pool|None:
+    """
+    Returns the process-wide pool of maxProcesses worker processes
+        which is started the first time that it's needed and then reused,
+        (or restarted if maxProcesses or one of the other settings has changed since, and the pool isn't in use).
+
+    Returns None if maxProcesses is one, or if this is already a worker process.
+
+    Most callers should use mapInWorkers() or imapInWorkers() rather than using the pool directly.
+    """
+    global _workerPool, _workerPoolSettings
+    if maxProcesses < 2 or alreadyMultiprocessing: return None
+
+    with _workerPoolLock:
+        currentSettings = _getWorkerPoolSettings()
+        if _workerPool is not None and currentSettings != _workerPoolSettings and not _workerPoolUseCount:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, "getWorkerPool: Restarting the worker processes because the settings have changed…" )
+            shutdownWorkerPool()
+        if _workerPool is None:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"getWorkerPool: Starting {maxProcesses} worker processes…" )
+            _workerPool = multiprocessing.Pool( processes=maxProcesses, initializer=_initialiseWorkerProcess )
+            _workerPoolSettings = currentSettings
+        return _workerPool
+# end of BibleOrgSysGlobals.getWorkerPool
+
+
+def getForkedWorkerPool( numProcesses:int ) -> Pool|None:
+    """
+    Returns a new pool of numProcesses worker processes forked from this process right now
+        so that they share (copy-on-write) whatever is currently loaded, e.g., the Bible being checked,
+        rather than having it pickled into every task.
+
+    Unlike getWorkerPool(), the caller must close this pool when finished with it
+        (e.g., by using it as a context manager).
+    The pool can't be kept and reused (like the getWorkerPool() one)
+        because the workers would then only have what was loaded when they were forked.
+
+    Forking while the process-wide pool is running isn't safe
+        (because a forked process can be left deadlocked on a lock held by one of that pool's threads),
+        so that pool is stopped first (a later getWorkerPool() will start it again),
+        or if it's in use, None is returned and the caller should do the work itself.
+    """
+    with _workerPoolLock:
+        if _workerPoolUseCount:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, "getForkedWorkerPool: Not forking because the process-wide worker pool is in use" )
+            return None
+        shutdownWorkerPool()
+    return multiprocessing.get_context( 'fork' ).Pool( processes=numProcesses, initializer=_initialiseWorkerProcess )
+# end of BibleOrgSysGlobals.getForkedWorkerPool
+
+
+def mapInWorkers( function, parameters, timeout:float|None=None ) -> list:
+    """
+    Runs function( parameter ) for each of the parameters in the process-wide pool of worker processes
+        and returns the list of results (in the same order as the parameters).
+
+    The function (and its parameters and results) must be picklable.
+
+    Only the main process can give tasks to the pool.
+    This can be called again while another mapInWorkers() or imapInWorkers() is in progress
+        in the main process, e.g., while processing the results (or from another thread),
+        and the new tasks are just added to the same pool.
+    But nested tasks can't be given to the pool from a task that's already running in a worker process
+        (a worker waiting for the pool that it belongs to could deadlock it),
+        so there (or if maxProcesses is one) the tasks are run one after the other
+        (with a warning if in a worker process).
+
+    If timeout (seconds) is given and the results aren't all ready by then,
+        multiprocessing.TimeoutError is raised.
+    If no other call is using the pool, it's terminated first (so that any hung tasks are stopped),
+        otherwise it's left running for the other calls.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"mapInWorkers( {function}, …, {timeout} )" )
+    return _mapInWorkers( 'mapInWorkers', function, parameters, timeout, starFlag=False )
+# end of BibleOrgSysGlobals.mapInWorkers
+
+
+def starmapInWorkers( function, parameterTuples, timeout:float|None=None ) -> list:
+    """
+    Like mapInWorkers() except that each of the parameterTuples is unpacked,
+        i.e., runs function( *parameterTuple ).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"starmapInWorkers( {function}, …, {timeout} )" )
+    return _mapInWorkers( 'starmapInWorkers', function, parameterTuples, timeout, starFlag=True )
+# end of BibleOrgSysGlobals.starmapInWorkers
+
+
+def _mapInWorkers( callerName:str, function, parameters, timeout:float|None, starFlag:bool ) -> list:
+    """
+    Does the work for mapInWorkers() and starmapInWorkers().
+    """
+    global _workerPoolUseCount
+    parameters = list( parameters ) # In case we were given an iterator
+
+    with _workerPoolLock:
+        workerPool = getWorkerPool()
+        if workerPool is not None: _workerPoolUseCount += 1
+    if workerPool is None:
+        if alreadyMultiprocessing:
+            logging.warning( f"{callerName}: Running {len(parameters)} nested tasks one after the other in this worker process" )
+        return [function( *parameter ) for parameter in parameters] if starFlag \
+                else [function( parameter ) for parameter in parameters]
+
+    try:
+        asyncResult = workerPool.starmap_async( function, parameters ) if starFlag \
+                        else workerPool.map_async( function, parameters )
+        try: return asyncResult.get( timeout )
+        except multiprocessing.TimeoutError:
+            with _workerPoolLock:
+                if _workerPoolUseCount == 1 and _workerPool is workerPool: # No-one else is using it
+                    shutdownWorkerPool( terminateFlag=True ) # The next getWorkerPool() will start a new pool
+            raise
+    finally:
+        with _workerPoolLock: _workerPoolUseCount -= 1
+# end of BibleOrgSysGlobals._mapInWorkers
+
+
+def imapInWorkers( function, parameters, maxAhead:int|None=None ):
+    """
+    Generator which runs function( parameter ) for each of the parameters in the process-wide pool of worker processes
+        and yields the results (in the same order as the parameters).
+
+    Only maxAhead tasks (default is twice maxProcesses) are given to the pool ahead of the results being used,
+        so that if the caller stops iterating early, the pool isn't left busy with lots of unwanted tasks.
+
+    Nesting works the same as for mapInWorkers(),
+        i.e., nested tasks from a worker process are run there one after the other.
+    """
+    global _workerPoolUseCount
+    fnPrint( DEBUGGING_THIS_MODULE, f"imapInWorkers( {function}, {parameters}, {maxAhead} )" )
+
+    with _workerPoolLock:
+        workerPool = getWorkerPool()
+        if workerPool is not None: _workerPoolUseCount += 1
+    if workerPool is None:
+        if alreadyMultiprocessing:
+            logging.warning( "imapInWorkers: Running nested tasks one after the other in this worker process" )
+        for parameter in parameters:
+            yield function( parameter )
+        return
+
+    if maxAhead is None: maxAhead = 2 * maxProcesses
+    try:
+        pendingResults = deque()
+        for parameter in parameters:
+            pendingResults.append( workerPool.apply_async( function, (parameter,) ) )
+            if len(pendingResults) >= maxAhead:
+                yield pendingResults.popleft().get()
+        while pendingResults:
+            yield pendingResults.popleft().get()
+    finally:
+        with _workerPoolLock: _workerPoolUseCount -= 1
+# end of BibleOrgSysGlobals.imapInWorkers
+
+
+def shutdownWorkerPool( terminateFlag:bool=False ) -> None:
+    """
+    Stops the process-wide pool of worker processes (if it was started).
+
+    Waits for any tasks that have already been given to the pool to finish, unless terminateFlag is set.
+    A later getWorkerPool() (or mapInWorkers(), etc.) will start a new pool.
+
+    This is also called by closedown() and when the program exits.
+    """
+    global _workerPool, _workerPoolSettings
+    with _workerPoolLock:
+        if _workerPool is None: return
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"shutdownWorkerPool: Stopping worker processes{' now' if terminateFlag else ''}…" )
+        if terminateFlag: _workerPool.terminate()
+        else: _workerPool.close()
+        _workerPool.join()
+        _workerPool = _workerPoolSettings = None
+# end of BibleOrgSysGlobals.shutdownWorkerPool
+
+atexit.register( shutdownWorkerPool )
+
+
 def printAllGlobals( indent=None ):
     """
     Print all global variables (for debugging usually).
@@ -1645,6 +1867,7 @@ def closedown( cProgName, cProgVersion ):
     """
     Does all the finishing off for the program.
     """
+    shutdownWorkerPool()
     msg = f"{cProgName} v{cProgVersion} finished at {datetime.now().strftime('%H:%M')} after {elapsedTime(programStartTime)}."
     logging.info( msg )
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, msg )
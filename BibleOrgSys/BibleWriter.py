@@ -63,6 +63,8 @@ Contains functions:
     toMySword( outputFolderpath:Path|None=None )
     toESword( outputFolderpath:Path|None=None )
     toMyBible( outputFolderpath:Path|None=None )
+    toSQLiteFTS( outputFolderpath:Path|None=None ) for full-text searching without loading the Bible
+    toConcordance( outputFolderpath:Path|None=None ) for word frequency and co-occurrence queries
     toSwordSearcher( outputFolderpath:Path|None=None )
     toDrupalBible( outputFolderpath:Path|None=None )
     toPhotoBible( outputFolderpath:Path|None=None )
@@ -81,6 +83,10 @@ TODO: Move most of these exports out of this 11,000 line file into their own pla
 CHANGELOG:
     2022-06-05 Prevent unnecessary warning display for Zefania character styles
     2022-07-29 Added BOMs to some file writes
+    2025-06-08 Added toSQLiteFTS() export
+    2025-06-09 Added toConcordance() export (also done by doAllExports)
+    2025-06-14 Use marker flag bit tests (rather than marker list searches) in some exports
+    2025-06-25 Use the process-wide worker pool in doAllExports()
 """
 from gettext import gettext as _
 from typing import Any
@@ -109,21 +115,22 @@ from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.InputOutput import ControlFiles
 from BibleOrgSys.InputOutput.MLWriter import MLWriter
-from BibleOrgSys.Internals.InternalBibleInternals import BOS_CUSTOM_NESTING_MARKERS, BOS_NESTING_MARKERS, InternalBibleExtraList
+from BibleOrgSys.Internals.InternalBibleInternals import BOS_CUSTOM_NESTING_MARKERS, BOS_NESTING_MARKERS, InternalBibleExtraList, \
+    MARKER_FLAG_HEADER, MARKER_FLAG_TITLE, MARKER_FLAG_INTRODUCTION, MARKER_FLAG_BIBLE_PARAGRAPH
 from BibleOrgSys.Internals.InternalBible import InternalBible
 from BibleOrgSys.Reference.BibleOrganisationalSystems import BibleOrganisationalSystem
 from BibleOrgSys.Reference.BibleReferences import BibleReferenceList
 from BibleOrgSys.Reference.USFM3Markers import OFTEN_IGNORED_USFM_HEADER_MARKERS, USFM_ALL_TITLE_MARKERS, \
                             USFM_ALL_INTRODUCTION_MARKERS, USFM_PRECHAPTER_MARKERS, \
                             USFM_ALL_SECTION_HEADING_MARKERS, \
-                            USFM_BIBLE_PARAGRAPH_MARKERS, USFM_ALL_BIBLE_PARAGRAPH_MARKERS
+                            USFM_ALL_BIBLE_PARAGRAPH_MARKERS
 from BibleOrgSys.Misc.NoisyReplaceFunctions import noisyRegExDeleteAll
 
 
-LAST_MODIFIED_DATE = '2023-05-04' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "BibleWriter"
 PROGRAM_NAME = "Bible writer"
-PROGRAM_VERSION = '0.96'
+PROGRAM_VERSION = '0.97'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -5991,15 +5998,16 @@ class BibleWriter( InternalBible ):
             for processedBibleEntry in bkData._processedLines: # Process internal Bible data lines
                 haveNotesFlag = False
                 marker, text, extras = processedBibleEntry.getMarker(), processedBibleEntry.getAdjustedText(), processedBibleEntry.getExtras()
+                markerFlags = processedBibleEntry.getMarkerFlags()
                 #if marker in ('id', 'ide', 'h', 'toc1','toc2','toc3', ): pass # Just ignore these metadata markers
                 if '¬' in marker or marker in BOS_CUSTOM_NESTING_MARKERS or marker=='v=':
                     continue # Just ignore added markers — not needed here
-                if marker in USFM_PRECHAPTER_MARKERS:
+                if markerFlags & (MARKER_FLAG_HEADER|MARKER_FLAG_TITLE|MARKER_FLAG_INTRODUCTION) or marker=='ie': # i.e., marker in USFM_PRECHAPTER_MARKERS
                     if self.doExtraChecking:
                         assert C=='-1' or marker=='rem' or marker.startswith('mte')
                     V = str( int(V) + 1 )
 
-                if marker in OFTEN_IGNORED_USFM_HEADER_MARKERS or marker in ('ie',): # Just ignore these lines
+                if markerFlags & MARKER_FLAG_HEADER or marker=='ie': # Just ignore these lines
                     ignoredMarkers.add( marker )
                 elif marker == 'c':
                     C, V = text, '0'
@@ -6024,10 +6032,10 @@ class BibleWriter( InternalBible ):
                     #writerObject.writeLineOpenClose ( 'VERS', verseText, ('vnumber',verseNumberString) )
 
                 elif marker in ('mt1','mt2','mt3','mt4', 'mte1','mte2','mte3','mte4', 'ms1','ms2','ms3','ms4',) \
-                or marker in USFM_ALL_INTRODUCTION_MARKERS \
+                or markerFlags & MARKER_FLAG_INTRODUCTION \
                 or marker in ('s1','s2','s3','s4', 'r','sr','mr', 'd','sp','cd', 'cl','lit', ):
                     ignoredMarkers.add( marker )
-                elif marker in USFM_BIBLE_PARAGRAPH_MARKERS:
+                elif markerFlags & MARKER_FLAG_BIBLE_PARAGRAPH:
                     if self.doExtraChecking: assert not text and not extras
                     ignoredMarkers.add( marker )
                 elif marker in ('b', 'nb', 'ib', ):
@@ -6191,15 +6199,16 @@ class BibleWriter( InternalBible ):
             C, V = '-1', '-1' # So first/id line starts at -1:0
             for processedBibleEntry in bkData._processedLines: # Process internal Bible data lines
                 marker, text, extras = processedBibleEntry.getMarker(), processedBibleEntry.getAdjustedText(), processedBibleEntry.getExtras()
+                markerFlags = processedBibleEntry.getMarkerFlags()
                 #if marker in ('id', 'ide', 'h', 'toc1','toc2','toc3', ): pass # Just ignore these metadata markers
                 if '¬' in marker or marker in BOS_CUSTOM_NESTING_MARKERS or marker=='v=':
                     continue # Just ignore added markers — not needed here
-                if marker in USFM_PRECHAPTER_MARKERS:
+                if markerFlags & (MARKER_FLAG_HEADER|MARKER_FLAG_TITLE|MARKER_FLAG_INTRODUCTION) or marker=='ie': # i.e., marker in USFM_PRECHAPTER_MARKERS
                     if self.doExtraChecking:
                         assert C=='-1' or marker=='rem' or marker.startswith('mte')
                     V = str( int(V) + 1 )
 
-                if marker in OFTEN_IGNORED_USFM_HEADER_MARKERS or marker in ('ie',): # Just ignore these lines
+                if markerFlags & MARKER_FLAG_HEADER or marker=='ie': # Just ignore these lines
                     ignoredMarkers.add( marker )
                 elif marker == 'c':
                     C, V = text, '0'
@@ -6229,10 +6238,10 @@ class BibleWriter( InternalBible ):
                     writerObject.writeLineOpen ( 'PARAGRAPH' )
                     haveOpenParagraph = True
                 elif marker in ('mt1','mt2','mt3','mt4', 'mte1','mte2','mte3','mte4', 'ms1','ms2','ms3','ms4', ) \
-                or marker in USFM_ALL_INTRODUCTION_MARKERS \
+                or markerFlags & MARKER_FLAG_INTRODUCTION \
                 or marker in ('s1','s2','s3','s4', 'r','sr','mr', 'd','sp','cd', 'cl','lit', ):
                     ignoredMarkers.add( marker )
-                elif marker in USFM_BIBLE_PARAGRAPH_MARKERS:
+                elif markerFlags & MARKER_FLAG_BIBLE_PARAGRAPH:
                     if self.doExtraChecking: assert not text and not extras
                     ignoredMarkers.add( marker )
                 elif marker in ('b', 'nb', 'ib', ):
@@ -7190,6 +7199,49 @@ class BibleWriter( InternalBible ):
 
 
 
+    def toSQLiteFTS( self, outputFolderpath:Path|None=None, controlDict=None ) -> bool:
+        """
+        Write the verses and searchable lines into a SQLite3 database with FTS5 full-text search indexes
+            which can be searched with SQLiteFTSBibleSearcher (without loading this Bible).
+
+        The verses are made from the C:V index so that they match getVerseText().
+        """
+        from BibleOrgSys.Formats.SQLiteFTSBible import createSQLiteFTSDatabase
+
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, "Running BibleWriter:toSQLiteFTS…" )
+        if self.doExtraChecking: assert self.books
+
+        if not self.doneSetupGeneric: self.__setupWriter()
+        if not outputFolderpath: outputFolderpath = BibleOrgSysGlobals.DEFAULT_WRITEABLE_OUTPUT_FOLDERPATH.joinpath( 'BOS_SQLiteFTS_Export/' )
+        if not os.access( outputFolderpath, os.F_OK ): os.makedirs( outputFolderpath ) # Make the empty folder if there wasn't already one there
+        # ControlDict is not used (yet)
+
+        return createSQLiteFTSDatabase( self, outputFolderpath, controlDict )
+    # end of BibleWriter.toSQLiteFTS
+
+
+
+    def toConcordance( self, outputFolderpath:Path|None=None, controlDict=None ) -> bool:
+        """
+        Write a word concordance (word -> verse ordinal postings) into a compressed binary file
+            which can be memory-mapped and queried with BibleConcordance.
+        """
+        from BibleOrgSys.Internals.InternalBibleConcordance import writeConcordance, CONCORDANCE_FILENAME_ENDING
+
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, "Running BibleWriter:toConcordance…" )
+        if self.doExtraChecking: assert self.books
+
+        if not self.doneSetupGeneric: self.__setupWriter()
+        if not outputFolderpath: outputFolderpath = BibleOrgSysGlobals.DEFAULT_WRITEABLE_OUTPUT_FOLDERPATH.joinpath( 'BOS_Concordance_Export/' )
+        if not os.access( outputFolderpath, os.F_OK ): os.makedirs( outputFolderpath ) # Make the empty folder if there wasn't already one there
+        # ControlDict is not used (yet)
+
+        filename = BibleOrgSysGlobals.makeSafeFilename( f'{self.getAName( abbrevFirst=True )}{CONCORDANCE_FILENAME_ENDING}' )
+        return writeConcordance( self, Path( outputFolderpath, filename ) )
+    # end of BibleWriter.toConcordance
+
+
+
     def toSwordSearcher( self, outputFolderpath:Path|None=None ):
         """
         Write the pseudo USFM out into the SwordSearcher pre-Forge format.
@@ -7239,14 +7291,15 @@ class BibleWriter( InternalBible ):
             C, V = '-1', '-1' # So first/id line starts at -1:0
             for entry in internalBibleBookData:
                 marker, text = entry.getMarker(), entry.getCleanText()
+                markerFlags = entry.getMarkerFlags()
                 if '¬' in marker or marker in BOS_CUSTOM_NESTING_MARKERS or marker=='v=':
                     continue # Just ignore added markers — not needed here
-                if marker in USFM_PRECHAPTER_MARKERS:
+                if markerFlags & (MARKER_FLAG_HEADER|MARKER_FLAG_TITLE|MARKER_FLAG_INTRODUCTION) or marker=='ie': # i.e., marker in USFM_PRECHAPTER_MARKERS
                     if self.doExtraChecking:
                         assert C=='-1' or marker=='rem' or marker.startswith('mte')
                     V = str( int(V) + 1 )
 
-                if marker in OFTEN_IGNORED_USFM_HEADER_MARKERS or marker in ('ie',): # Just ignore these lines
+                if markerFlags & MARKER_FLAG_HEADER or marker=='ie': # Just ignore these lines
                     ignoredMarkers.add( marker )
                 elif marker == 'c': C, V = text, '0'
                 elif marker in ('c#',):
@@ -7263,10 +7316,10 @@ class BibleWriter( InternalBible ):
                     writer.write( "$$ {} {}:{}\n".format( bookCode, C, text ) )
 
                 elif marker in ('mt1','mt2','mt3','mt4', 'mte1','mte2','mte3','mte4', 'ms1','ms2','ms3','ms4', ) \
-                or marker in USFM_ALL_INTRODUCTION_MARKERS \
+                or markerFlags & MARKER_FLAG_INTRODUCTION \
                 or marker in ('s1','s2','s3','s4', 'r','sr','mr', 'd','sp','cd', 'cl','lit', ):
                     ignoredMarkers.add( marker )
-                elif marker in USFM_BIBLE_PARAGRAPH_MARKERS:
+                elif markerFlags & MARKER_FLAG_BIBLE_PARAGRAPH:
                     if self.doExtraChecking: assert not text
                     ignoredMarkers.add( marker )
                 elif marker in ('b', 'nb', 'ib', ):
@@ -7410,14 +7463,15 @@ class BibleWriter( InternalBible ):
             C, V = '-1', '-1' # So first/id line starts at -1:0
             for entry in bookObject._processedLines:
                 marker, text = entry.getMarker(), entry.getAdjustedText()
+                markerFlags = entry.getMarkerFlags()
                 if '¬' in marker or marker in BOS_CUSTOM_NESTING_MARKERS or marker=='v=':
                     continue # Just ignore added markers — not needed here
-                if marker in USFM_PRECHAPTER_MARKERS:
+                if markerFlags & (MARKER_FLAG_HEADER|MARKER_FLAG_TITLE|MARKER_FLAG_INTRODUCTION) or marker=='ie': # i.e., marker in USFM_PRECHAPTER_MARKERS
                     if self.doExtraChecking:
                         assert C=='-1' or marker=='rem' or marker.startswith('mte')
                     V = str( int(V) + 1 )
 
-                if marker in OFTEN_IGNORED_USFM_HEADER_MARKERS or marker in ('ie',): # Just ignore these lines
+                if markerFlags & MARKER_FLAG_HEADER or marker=='ie': # Just ignore these lines
                     ignoredMarkers.add( marker )
                 elif marker == 'c':
                     if accumulator:
@@ -7446,10 +7500,10 @@ class BibleWriter( InternalBible ):
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "toDrupalBible V is now", repr(V) )
 
                 elif marker in ('mt1','mt2','mt3','mt4', 'mte1','mte2','mte3','mte4', 'ms1','ms2','ms3','ms4', ) \
-                or marker in USFM_ALL_INTRODUCTION_MARKERS \
+                or markerFlags & MARKER_FLAG_INTRODUCTION \
                 or marker in ('s1','s2','s3','s4', 'r','sr','mr', 'd','sp','cd', 'cl','lit', ):
                     ignoredMarkers.add( marker )
-                elif marker in USFM_BIBLE_PARAGRAPH_MARKERS:
+                elif markerFlags & MARKER_FLAG_BIBLE_PARAGRAPH:
                     if self.doExtraChecking: assert not text
                     ignoredMarkers.add( marker )
                 elif marker in ('b', 'nb', 'ib', ):
@@ -9816,6 +9870,7 @@ class BibleWriter( InternalBible ):
         MyBOutputFolder = os.path.join( givenOutputFolderName, 'BOS_MyBible_' + ('Reexport/' if self.objectTypeString=='MyBible' else 'Export/' ) )
         SwSOutputFolder = os.path.join( givenOutputFolderName, 'BOS_SwordSearcher_Export/' )
         DrOutputFolder = os.path.join( givenOutputFolderName, 'BOS_DrupalBible_' + ('Reexport/' if self.objectTypeString=='DrupalBible' else 'Export/' ) )
+        concordanceOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Concordance_Export/' )
         photoOutputFolder = os.path.join( givenOutputFolderName, 'BOS_PhotoBible_Export/' )
         ODFOutputFolder = os.path.join( givenOutputFolderName, 'BOS_ODF_Export/' )
         TeXOutputFolder = os.path.join( givenOutputFolderName, 'BOS_TeX_Export/' )
@@ -9872,14 +9927,14 @@ class BibleWriter( InternalBible ):
             MyBExportResult = self.toMyBible( MyBOutputFolder )
             SwSExportResult = self.toSwordSearcher( SwSOutputFolder )
             DrExportResult = self.toDrupalBible( DrOutputFolder )
+            concordanceExportResult = self.toConcordance( concordanceOutputFolder )
             if wantPhotoBible: PhotoBibleExportResult = self.toPhotoBible( photoOutputFolder )
             if wantODFs: ODFExportResult = self.toODF( ODFOutputFolder )
             if wantPDFs: TeXExportResult = self.toTeX( TeXOutputFolder ) # Put this last since it's slowest
 
         # NOTE: We can't pickle sqlite3.Cursor objects so can not use multiprocessing here for e-Sword Bibles or commentaries
         elif self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible') \
-        and BibleOrgSysGlobals.maxProcesses > 1 \
-        and not BibleOrgSysGlobals.alreadyMultiprocessing: # Process all the exports with different threads
+        and BibleOrgSysGlobals.maxProcesses > 1: # Process all the exports with different threads
             # We move the three longest processes to the top here,
             #   so they start first to help us get finished quicker on multiCPU systems.
             self.__outputProcesses = [self.toPhotoBible if wantPhotoBible else None,
@@ -9894,7 +9949,7 @@ class BibleWriter( InternalBible ):
                                     self.toUSX2XML, self.toUSXXML, self.toUSFXXML, self.toOSISXML,
                                     self.toZefaniaXML, self.toHaggaiXML, self.toOpenSongXML,
                                     self.toSwordModule, self.totheWord, self.toMySword, self.toESword, self.toMyBible,
-                                    self.toSwordSearcher, self.toDrupalBible, ]
+                                    self.toSwordSearcher, self.toDrupalBible, self.toConcordance, ]
             self.__outputFolders = [photoOutputFolder, #ODFOutputFolder,
                                     TeXOutputFolder,
                                     pickledBibleOutputFolder, listOutputFolder,
@@ -9906,12 +9961,11 @@ class BibleWriter( InternalBible ):
                                     USX2OutputFolder, USX3OutputFolder, USFXOutputFolder, OSISOutputFolder,
                                     zefOutputFolder, hagOutputFolder, OSOutputFolder,
                                     swOutputFolder, tWOutputFolder, MySwOutputFolder, ESwOutputFolder, MyBOutputFolder,
-                                    SwSOutputFolder, DrOutputFolder, ]
+                                    SwSOutputFolder, DrOutputFolder, concordanceOutputFolder, ]
             assert len(self.__outputFolders) == len(self.__outputProcesses)
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BibleWriter.doAllExports: Running {} exports on {} CPUs".format( len(self.__outputProcesses), BibleOrgSysGlobals.maxProcesses ) )
             if BibleOrgSysGlobals.verbosityLevel > 1:
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from various exports may be interspersed." )
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
             # With no timeout safeguard
             #with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
                 #results = pool.map( self.doExportHelper, zip(self.__outputProcesses,self.__outputFolders) ) # have the pool do our loads
@@ -9932,27 +9986,17 @@ class BibleWriter( InternalBible ):
             if wantPDFs: timeoutFactor += 12 # seems about 2 minutes for 68 books
             processorFactor = 1.0 # Make bigger for a slower CPU, or can make smaller for a fast one
             timeoutSeconds = max( 60, int(timeoutFactor*len(self.books)*processorFactor) ) # (was 1200s=20m but failed for projects with > 66 books)
-            pool = multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses )
-            asyncResultObject = pool.map_async( self.doExportHelper, zip(self.__outputProcesses,self.__outputFolders) ) # have the pool do our loads
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "async results1 are", asyncResultObject )
-            pool.close() # Can't add more workers to the pool now
-            asyncResultObject.wait( timeoutSeconds ) # Wait for every worker to finish
-            # Once the timeout has finished we can try to get the results
-            if asyncResultObject.ready():
-                results = asyncResultObject.get()
-            else:
+            try:
+                results = BibleOrgSysGlobals.mapInWorkers( self.doExportHelper, zip(self.__outputProcesses,self.__outputFolders), timeout=timeoutSeconds ) # have the pool do our loads
+            except multiprocessing.TimeoutError: # the pool has been terminated if nothing else was using it (and will be restarted next time it's needed)
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BibleWriter.doAllExports: Got a timeout after {} seconds".format( timeoutSeconds ) )
-                pool.terminate() # No results available now
-                #pool.join()
-                #results = asyncResultObject.get() # Should work now
                 result = timeoutSeconds # Will count as True yet be different
                 results = [result if wantPhotoBible else None, # Just have to assume everything worked
                                     #result if wantODFs else None,
                                     result if wantPDFs else None,
                                     result, result, result, result, result, result, result, result, result, result, result, result,
-                                    result, result, result, result, result, result, result, result, result, result, result, ]
+                                    result, result, result, result, result, result, result, result, result, result, result, result, ]
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "async results2 are", results )
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
             vPrint( 'Info', DEBUGGING_THIS_MODULE, "BibleWriter.doAllExports: Multiprocessing got {} results".format( len(results) ) )
             assert len(results) == len(self.__outputFolders)
             ( PhotoBibleExportResult, #ODFExportResult,
@@ -9963,7 +10007,7 @@ class BibleWriter( InternalBible ):
                 htmlExportResult, BDExportResult, EWBExportResult,
                 USX2ExportResult, USX3ExportResult, USFXExportResult, OSISExportResult, ZefExportResult, HagExportResult, OSExportResult,
                 swExportResult, tWExportResult, MySwExportResult, ESwExportResult, MyBExportResult, SwSExportResult,
-                DrExportResult ) = results
+                DrExportResult, concordanceExportResult ) = results
             if wantODFs: # Do this one separately (coz it's so much longer, plus often locks up)
                 # Timeout is now done per book inside the toODF function
                 #if BibleOrgSysGlobals.alreadyMultiprocessing or 'win' in sys.platform: # SIGALRM doesn't work
@@ -10130,6 +10174,11 @@ class BibleWriter( InternalBible ):
                 DrExportResult = False
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'BibleWriter.doAllExports.toDrupalBible: Unexpected {err}: {traceback.format_exc()})' )
                 logger.error( "BibleWriter.doAllExports.toDrupalBible: Oops, failed with {}!".format( err ) )
+            try: concordanceExportResult = self.toConcordance( concordanceOutputFolder )
+            except Exception as err:
+                concordanceExportResult = False
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'BibleWriter.doAllExports.toConcordance: Unexpected {err}: {traceback.format_exc()})' )
+                logger.error( "BibleWriter.doAllExports.toConcordance: Oops, failed with {}!".format( err ) )
             if wantPhotoBible:
                 try: PhotoBibleExportResult = self.toPhotoBible( photoOutputFolder )
                 except Exception as err:
@@ -10153,7 +10202,7 @@ class BibleWriter( InternalBible ):
         if BibleOrgSysGlobals.verbosityLevel > 1:
             finishString = "BibleWriter.doAllExports finished:  Pck={}  Lst={}  BCV={} PsUSFM={} USFM2={} USFM3={} ESFM={} Tx={} VPL={}  md={}  " \
                             "HTML={} BD={} EWB={}  USX2={} USX3={}  USFX={} OSIS={}  Zef={} Hag={} OS={}  Sw={}  " \
-                            "tW={} MySw={} eSw={} MyB={}  SwS={} Dr={}  PB={} ODF={} TeX={} {}" \
+                            "tW={} MySw={} eSw={} MyB={}  SwS={} Dr={} Conc={}  PB={} ODF={} TeX={} {}" \
                 .format( pickleResult, listOutputResult, BCVExportResult,
                     pseudoUSFMExportResult, USFM2ExportResult, USFM3ExportResult, ESFMExportResult,
                     textExportResult, VPLExportResult,
@@ -10163,7 +10212,7 @@ class BibleWriter( InternalBible ):
                     USX2ExportResult, USX3ExportResult, USFXExportResult, OSISExportResult,
                     ZefExportResult, HagExportResult, OSExportResult,
                     swExportResult, tWExportResult, MySwExportResult, ESwExportResult, MyBExportResult,
-                    SwSExportResult, DrExportResult,
+                    SwSExportResult, DrExportResult, concordanceExportResult,
                     PhotoBibleExportResult, ODFExportResult, TeXExportResult,
                     datetime.now().strftime('%H:%M') )
             trueCount  = finishString.count( 'True' )
@@ -10180,7 +10229,7 @@ class BibleWriter( InternalBible ):
             #and SwSExportResult and DrExportResult \
             #and (PhotoBibleExportResult or not wantPhotoBible) and (ODFExportResult or not wantODFs) and (TeXExportResult or not wantPDFs):
             if falseCount == 0:
-                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BibleWriter.doAllExports finished all requested (which was {}/30) exports successfully!".format( trueCount ) )
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BibleWriter.doAllExports finished all requested (which was {}/31) exports successfully!".format( trueCount ) )
             else:
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "{} ({} True, {} False, {} None)".format( finishString, trueCount, falseCount, noneCount ) )
         return { 'Pickle':pickleResult, 'listOutput':listOutputResult, 'BCVOutput':BCVExportResult,
@@ -10193,7 +10242,7 @@ class BibleWriter( InternalBible ):
                 'ZefExport':ZefExportResult, 'HagExport':HagExportResult, 'OSExport':OSExportResult,
                 'swExport':swExportResult,
                 'tWExport':tWExportResult, 'MySwExport':MySwExportResult, 'ESwExport':ESwExportResult, 'MyBExport':MyBExportResult,
-                'SwSExport':SwSExportResult, 'DrExport':DrExportResult,
+                'SwSExport':SwSExportResult, 'DrExport':DrExportResult, 'concordanceExport':concordanceExportResult,
                 'PhotoBibleExport':PhotoBibleExportResult, 'ODFExport':ODFExportResult, 'TeXExport':TeXExportResult, }
     # end of BibleWriter.doAllExports
 # end of class BibleWriter
@@ -43,10 +43,10 @@ from BibleOrgSys.Bible import Bible, BibleBook
 from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList, InternalBibleEntry
 
 
-LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "BCVBible"
 PROGRAM_NAME = "BCV Bible handler"
-PROGRAM_VERSION = '0.22'
+PROGRAM_VERSION = '0.24'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -350,6 +350,16 @@ class BCVBible( Bible ):
     # end of BCVBible.loadBookMP
 
 
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The BCV books are only loaded if they're in our givenBookList (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['givenBookList'] = self.givenBookList
+        return bookLoaderSettings
+    # end of BCVBible._getBookLoaderSettings
+
+
     def loadBooks( self ):
         """
         Load all the books.
@@ -363,14 +373,9 @@ class BCVBible( Bible ):
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Loading {} BCV books using {} processes…").format( len(self.givenBookList), BibleOrgSysGlobals.maxProcesses ) )
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookMP, self.givenBookList ) # have the pool do our loads
-                    assert len(results) == len(self.givenBookList)
-                    for bBook in results:
-                        bBook.containerBibleObject = self # Because the pickling and unpickling messes this up
-                        self.stashBook( bBook ) # Saves them in the correct order
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = self._loadBooksMP( self.givenBookList ) # have the pool do our loads
+                for bBook in results:
+                    self.stashBook( bBook ) # Saves them in the correct order
             else: # Just single threaded
                 # Load the books one by one -- assuming that they have regular Paratext style filenames
                 for BBB in self.givenBookList:
@@ -617,11 +622,8 @@ def briefDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testBCV, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testBCV, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nBCV D{}/ Trying {}".format( j+1, someFolder ) )
@@ -712,11 +714,8 @@ def fullDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testBCV, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testBCV, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nBCV D{}/ Trying {}".format( j+1, someFolder ) )
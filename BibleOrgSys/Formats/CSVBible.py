@@ -48,6 +48,7 @@ CHANGELOG:
     2023-02-01 Allowed for multiple files as well as one single file for the whole Bible
                 TODO: It hasn't been fully tested, and filecheck has not yet been updated to reflect this
     2023-05-30 Allow for a filepath to be given to the class (as well as a folderpath)
+    2025-06-25 Use the process-wide worker pool (BibleOrgSysGlobals.mapInWorkers()) in the demos
 """
 from gettext import gettext as _
 from pathlib import Path
@@ -67,10 +68,10 @@ from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.Bible import Bible, BibleBook
 
 
-LAST_MODIFIED_DATE = '2024-06-05' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "CSVBible"
 PROGRAM_NAME = "CSV Bible format handler"
-PROGRAM_VERSION = '0.35'
+PROGRAM_VERSION = '0.36'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -547,11 +548,8 @@ def briefDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testCSV, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testCSV, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nCSV D{}/ Trying {}".format( j+1, someFolder ) )
@@ -601,11 +599,8 @@ def fullDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testCSV, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testCSV, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nCSV D{}/ Trying {}".format( j+1, someFolder ) )
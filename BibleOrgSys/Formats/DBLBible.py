@@ -56,10 +56,10 @@ from BibleOrgSys.Formats.PTX7Bible import loadPTX7Languages, loadPTXVersificatio
 from BibleOrgSys.Formats.PTX8Bible import getFlagFromAttribute
 
 
-LAST_MODIFIED_DATE = '2023-09-18' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "DigitalBibleLibrary"
 PROGRAM_NAME = "Digital Bible Library (DBL) XML Bible handler"
-PROGRAM_VERSION = '0.31'
+PROGRAM_VERSION = '0.32'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -1557,43 +1557,33 @@ class DBLBible( Bible ):
         #self.USXFilenamesObject = USXFilenames( self.USXFolderpath )
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "fo", self.USXFilenamesObject )
 
-        # Load the books one by one -- assuming that they have regular Paratext style filenames
+        # Work out our (BBB,filename) 2-tuples -- assuming that they have regular Paratext style filenames
         if 'OurBookList' in self.suppliedMetadata['DBL']:
-            for BBB in self.suppliedMetadata['DBL']['OurBookList']:
-                filename = BibleOrgSysGlobals.loadedBibleBooksCodes.getUSFMAbbreviation( BBB ).upper() + '.usx'
-                vPrint( 'Never', DEBUGGING_THIS_MODULE, "About to load {} from {} …".format( BBB, filename ) )
-                UBB = USXXMLBibleBook( self, BBB )
-                UBB.load( filename, self.USXFolderpath, self.encoding )
-                UBB.validateMarkers()
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, UBB )
-                self.books[BBB] = UBB
-                # Make up our book name dictionaries while we're at it
-                assumedBookNames = UBB.getAssumedBookNames()
-                for assumedBookName in assumedBookNames:
-                    self.BBBToNameDict[BBB] = assumedBookName
-                    assumedBookNameLower = assumedBookName.lower()
-                    self.bookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                    self.combinedBookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                    if ' ' in assumedBookNameLower: self.combinedBookNameDict[assumedBookNameLower.replace(' ','')] = BBB # Store the deduced book name (lower case without spaces)
+            BBBFilenameTuples = [(BBB, BibleOrgSysGlobals.loadedBibleBooksCodes.getUSFMAbbreviation( BBB ).upper() + '.usx')
+                                    for BBB in self.suppliedMetadata['DBL']['OurBookList']]
         else:
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "bookListKey", bookListKey )
-            for USFMBookCode in self.suppliedMetadata['DBL']['contents'][bookListKey]['books']:
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMBookCode", USFMBookCode )
-                BBB = BibleOrgSysGlobals.loadedBibleBooksCodes.getBBBFromUSFMAbbreviation( USFMBookCode )
-                filename = USFMBookCode + '.usx'
-                UBB = USXXMLBibleBook( self, BBB )
-                UBB.load( filename, self.USXFolderpath, self.encoding )
-                UBB.validateMarkers()
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, UBB )
-                self.books[BBB] = UBB
-                # Make up our book name dictionaries while we're at it
-                assumedBookNames = UBB.getAssumedBookNames()
-                for assumedBookName in assumedBookNames:
-                    self.BBBToNameDict[BBB] = assumedBookName
-                    assumedBookNameLower = assumedBookName.lower()
-                    self.bookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                    self.combinedBookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                    if ' ' in assumedBookNameLower: self.combinedBookNameDict[assumedBookNameLower.replace(' ','')] = BBB # Store the deduced book name (lower case without spaces)
+            BBBFilenameTuples = [(BibleOrgSysGlobals.loadedBibleBooksCodes.getBBBFromUSFMAbbreviation( USFMBookCode ), USFMBookCode + '.usx')
+                                    for USFMBookCode in self.suppliedMetadata['DBL']['contents'][bookListKey]['books']]
+
+        if BibleOrgSysGlobals.maxProcesses > 1 \
+        and len(BBBFilenameTuples) > 1: # Load all the books as quickly as possible
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Loading {} DBL books using {} processes…").format( len(BBBFilenameTuples), BibleOrgSysGlobals.maxProcesses ) )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
+            loadedBooks = self._loadBooksMP( BBBFilenameTuples ) # have the pool do our loads
+        else: # Just single threaded
+            loadedBooks = [self._loadBookMP( BBBFilenameTuple ) for BBBFilenameTuple in BBBFilenameTuples]
+        for UBB in loadedBooks:
+            BBB = UBB.BBB
+            self.books[BBB] = UBB
+            # Make up our book name dictionaries while we're at it
+            assumedBookNames = UBB.getAssumedBookNames()
+            for assumedBookName in assumedBookNames:
+                self.BBBToNameDict[BBB] = assumedBookName
+                assumedBookNameLower = assumedBookName.lower()
+                self.bookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
+                self.combinedBookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
+                if ' ' in assumedBookNameLower: self.combinedBookNameDict[assumedBookNameLower.replace(' ','')] = BBB # Store the deduced book name (lower case without spaces)
 
         if not self.books: # Didn't successfully load any regularly named books -- maybe the files have weird names??? -- try to be intelligent here
             vPrint( 'Info', DEBUGGING_THIS_MODULE, "DBLBible.loadBooks: Didn't find any regularly named USX files in '{}'".format( self.USXFolderpath ) )
@@ -1601,6 +1591,33 @@ class DBLBible( Bible ):
         self.doPostLoadProcessing()
     # end of DBLBible.loadBooks
 
+    def _loadBookMP( self, BBB_Filename_duple ) -> USXXMLBibleBook:
+        """
+        Load and return the requested USX book (but doesn't save it as that is not safe for multiprocessing).
+
+        Parameter is a 2-tuple containing BBB and the filename (in our USXFolderpath).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"DBLBible._loadBookMP( {BBB_Filename_duple} )" )
+        BBB, filename = BBB_Filename_duple
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "About to load {} from {} …".format( BBB, filename ) )
+        UBB = USXXMLBibleBook( self, BBB )
+        UBB.load( filename, self.USXFolderpath, self.encoding )
+        UBB.validateMarkers()
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, UBB )
+        return UBB
+    # end of DBLBible._loadBookMP
+
+
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The USX books are loaded from our USXFolderpath (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['USXFolderpath'] = self.USXFolderpath
+        return bookLoaderSettings
+    # end of DBLBible._getBookLoaderSettings
+
+
     def load( self ):
         self.loadBooks()
 # end of class DBLBible
@@ -1694,11 +1711,8 @@ def briefDemo() -> None:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
             parameters = [('F'+str(j+1),os.path.join(sampleFolder, folderName+'/'),folderName) \
                                                 for j,folderName in enumerate(sorted(foundFolders))]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, folderName in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL F{}/ Trying {}".format( j+1, folderName ) )
@@ -1727,11 +1741,8 @@ def briefDemo() -> None:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
             parameters = [('G'+str(j+1),os.path.join(sampleFolder, folderName+'/'),folderName) \
                                                 for j,folderName in enumerate(sorted(foundFolders))]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, folderName in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL G{}/ Trying {}".format( j+1, folderName ) )
@@ -1760,11 +1771,8 @@ def briefDemo() -> None:
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
                 parameters = [('H'+str(j+1),os.path.join(testFolder, folderName+'/'),folderName) \
                                                     for j,folderName in enumerate(sorted(foundFolders))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, folderName in enumerate( sorted( foundFolders ) ):
                     vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL H{}/ Trying {}".format( j+1, folderName ) )
@@ -1875,11 +1883,8 @@ def fullDemo() -> None:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
             parameters = [('F'+str(j+1),os.path.join(sampleFolder, folderName+'/'),folderName) \
                                                 for j,folderName in enumerate(sorted(foundFolders))]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, folderName in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL F{}/ Trying {}".format( j+1, folderName ) )
@@ -1908,11 +1913,8 @@ def fullDemo() -> None:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
             parameters = [('G'+str(j+1),os.path.join(sampleFolder, folderName+'/'),folderName) \
                                                 for j,folderName in enumerate(sorted(foundFolders))]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, folderName in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL G{}/ Trying {}".format( j+1, folderName ) )
@@ -1941,11 +1943,8 @@ def fullDemo() -> None:
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various modules may be interspersed.") )
                 parameters = [('H'+str(j+1),os.path.join(testFolder, folderName+'/'),folderName) \
                                                     for j,folderName in enumerate(sorted(foundFolders))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( __processDBLBible, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.mapInWorkers( __processDBLBible, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, folderName in enumerate( sorted( foundFolders ) ):
                     vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDBL H{}/ Trying {}".format( j+1, folderName ) )
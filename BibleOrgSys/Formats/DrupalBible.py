@@ -88,10 +88,10 @@ from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.Bible import Bible, BibleBook
 
 
-LAST_MODIFIED_DATE = '2020-04-18' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "DrupalBible"
 PROGRAM_NAME = "DrupalBible Bible format handler"
-PROGRAM_VERSION = '0.13'
+PROGRAM_VERSION = '0.14'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -393,11 +393,8 @@ def briefDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testDB, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testDB, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDrupalBible D{}/ Trying {}".format( j+1, someFolder ) )
@@ -450,11 +447,8 @@ def fullDemo() -> None:
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
             parameters = [folderName for folderName in sorted(foundFolders)]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( testDB, parameters ) # have the pool do our loads
-                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( testDB, parameters ) # have the pool do our loads
+            assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
         else: # Just single threaded
             for j, someFolder in enumerate( sorted( foundFolders ) ):
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nDrupalBible D{}/ Trying {}".format( j+1, someFolder ) )
@@ -52,6 +52,8 @@ CHANGELOG:
     2023-04-20 Handle word numbers for proper nouns that include a \\sup, e.g., 'Aʸsaias/(Yəshaˊə\\sup yāh\\sup*)'
     2023-08-07 Handle numbers in word regex, e.g. 'feeding 5,000 men'
     2024-03-21 Add code to handle two word tables (OT and NT) from different source folders
+    2025-06-24 Use InternalBible._loadBooksMP() so that the whole Bible isn't pickled with every book
+    2025-06-26 Added _getBookLoaderSettings() for the book loader payloads
 """
 from gettext import gettext as _
 import os
@@ -75,10 +77,10 @@ from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList,
 from BibleOrgSys.Bible import Bible
 
 
-LAST_MODIFIED_DATE = '2025-01-14' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "ESFMBible"
 PROGRAM_NAME = "ESFM Bible handler"
-PROGRAM_VERSION = '0.76'
+PROGRAM_VERSION = '0.77'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -522,13 +524,25 @@ class ESFMBible( Bible ):
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag:
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  ESFMBible: Loading {} from {} from {}…").format( BBB, self.name, self.sourceFolder ) )
         EBB = ESFMBibleBook( self, BBB )
-        EBB.load( self.possibleFilenameDict[BBB], self.sourceFolder )
+        EBB.load( filename, self.sourceFolder )
         EBB.validateMarkers() # Usually activates InternalBibleBook.processLines()
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("    Finishing loading ESFM book {}.").format( BBB ) )
         return EBB
     # end of ESFMBible.loadBookMP
 
 
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The ESFM books also need our dictionaries (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['dontLoadBook'] = self.dontLoadBook
+        bookLoaderSettings['semanticDict'] = self.semanticDict
+        bookLoaderSettings['StrongsDict'] = self.StrongsDict
+        return bookLoaderSettings
+    # end of ESFMBible._getBookLoaderSettings
+
+
     def loadBooks( self ):
         """
         Load all the books that we can find.
@@ -548,15 +562,10 @@ class ESFMBible( Bible ):
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "ESFMBible: Loading {} ESFM books using {} processes…".format( len(self.maximumPossibleFilenameTuples), BibleOrgSysGlobals.maxProcesses ) )
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed." )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookMP, self.maximumPossibleFilenameTuples ) # have the pool do our loads
-                    assert len(results) == len(self.maximumPossibleFilenameTuples)
-                    for bBook in results:
-                        if bBook is not None:
-                            bBook.containerBibleObject = self # Because the pickling and unpickling messes this up
-                            self.stashBook( bBook ) # Saves them in the correct order
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = self._loadBooksMP( self.maximumPossibleFilenameTuples ) # have the pool do our loads
+                for bBook in results:
+                    if bBook is not None:
+                        self.stashBook( bBook ) # Saves them in the correct order
             else: # Just single threaded
                 # Load the books one by one -- assuming that they have regular Paratext style filenames
                 for BBB,filename in self.maximumPossibleFilenameTuples:
@@ -50,10 +50,10 @@ from BibleOrgSys.Bible import Bible, BibleBook
 from BibleOrgSys.Reference.BibleOrganisationalSystems import BibleOrganisationalSystem
 
 
-LAST_MODIFIED_DATE = '2020-04-29' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "GoBible"
 PROGRAM_NAME = "Go Bible format handler"
-PROGRAM_VERSION = '0.04'
+PROGRAM_VERSION = '0.06'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -432,6 +432,20 @@ class GoBible( Bible ):
     # end of GoBible.loadBookMP
 
 
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The GoBible books need our book list and the details of the unzipped data files (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['bookList'] = self.bookList
+        bookLoaderSettings['filenameBases'] = self.filenameBases
+        bookLoaderSettings['dataFolderpath'] = self.dataFolderpath
+        bookLoaderSettings['numChaptersList'] = self.numChaptersList
+        bookLoaderSettings['numVersesList'] = self.numVersesList
+        return bookLoaderSettings
+    # end of GoBible._getBookLoaderSettings
+
+
     def loadBooks( self ):
         """
         Load all the books.
@@ -446,14 +460,9 @@ class GoBible( Bible ):
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Loading {} GoBible books using {} processes…").format( len(self.bookList), BibleOrgSysGlobals.maxProcesses ) )
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookMP, self.bookList ) # have the pool do our loads
-                    assert len(results) == len(self.bookList)
-                    for bBook in results:
-                        bBook.containerBibleObject = self # Because the pickling and unpickling messes this up
-                        self.stashBook( bBook ) # Saves them in the correct order
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = self._loadBooksMP( self.bookList ) # have the pool do our loads
+                for bBook in results:
+                    self.stashBook( bBook ) # Saves them in the correct order
             else: # Just single threaded
                 # Load the books one by one -- assuming that they have regular Paratext style filenames
                 for BBB in self.bookList:
@@ -693,11 +702,8 @@ def briefDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFiles) ) )
                 parameters = [os.path.join(testFolder, filename) for filename in sorted(foundFiles)]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( testGoBible, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.mapInWorkers( testGoBible, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nGoBible D{}/ Trying {}".format( j+1, someFile ) )
@@ -752,11 +758,8 @@ def fullDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFiles) ) )
                 parameters = [os.path.join(testFolder, filename) for filename in sorted(foundFiles)]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( testGoBible, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.mapInWorkers( testGoBible, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nGoBible D{}/ Trying {}".format( j+1, someFile ) )
@@ -53,10 +53,10 @@ from BibleOrgSys.Reference.USFM3Markers import USFM_BIBLE_PARAGRAPH_MARKERS
 from BibleOrgSys.Bible import Bible, BibleBook
 
 
-LAST_MODIFIED_DATE = '2023-02-27' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "OSISXMLBible"
 PROGRAM_NAME = "OSIS XML Bible format handler"
-PROGRAM_VERSION = '0.67'
+PROGRAM_VERSION = '0.68'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -375,14 +375,11 @@ class OSISXMLBible( Bible ):
                 # Load all the books as quickly as possible
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Loading {len(self.possibleFilenames)} OSIS books using {BibleOrgSysGlobals.maxProcesses} processes…" )
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookFileMP, self.possibleFilenames ) # have the pool do our loads
-                    assert len(results) == len(self.possibleFilenames)
-                    for bBook,bookLoadErrors in results:
-                        self.stashBook( bBook ) # Saves them in the correct order
-                        loadErrors += bookLoadErrors
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.mapInWorkers( self._loadBookFileMP, self.possibleFilenames ) # have the pool do our loads
+                assert len(results) == len(self.possibleFilenames)
+                for bBook,bookLoadErrors in results:
+                    self.stashBook( bBook ) # Saves them in the correct order
+                    loadErrors += bookLoadErrors
             else: # Just single threaded
                 for filename in self.possibleFilenames:
                     pathname = os.path.join( self.sourceFolder, filename )
@@ -43,6 +43,7 @@ NOTE: Unfortunately it seems that loading a very large pickled object
             _loadBookEssentials( self, BBB )
         loadBook( self, BBB )
             _loadBookMP( self, BBB )
+            _getBookLoaderSettings( self )
         loadBooks( self )
 """
 from gettext import gettext as _
@@ -67,10 +68,10 @@ from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList
 from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleBookCVIndex, InternalBibleBookSectionIndex
 
 
-LAST_MODIFIED_DATE = '2024-06-13' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "PickledBible"
 PROGRAM_NAME = "Pickle Bible handler"
-PROGRAM_VERSION = '0.19'
+PROGRAM_VERSION = '0.20'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -715,6 +716,18 @@ class PickledBible( Bible ):
     # end of PickledBible.loadBookMP
 
 
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The books are loaded from our pickle file or folder (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['pickleIsZipped'] = self.pickleIsZipped
+        bookLoaderSettings['pickleSourceFolder'] = self.pickleSourceFolder
+        if self.pickleIsZipped: bookLoaderSettings['pickleFilepath'] = self.pickleFilepath
+        return bookLoaderSettings
+    # end of PickledBible._getBookLoaderSettings
+
+
     def loadBooks( self ) -> None:
         """
         Load all the Bible books.
@@ -727,21 +740,15 @@ class PickledBible( Bible ):
             return
 
         if len( self.pickleVersionData['bookList'] ) > 2:
-            if BibleOrgSysGlobals.maxProcesses > 1 \
-            and not BibleOrgSysGlobals.alreadyMultiprocessing: # Get our subprocesses ready and waiting for work
+            if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 # Load all the books as quickly as possible
                 #parameters = [BBB for BBB,filename in self.pickleVersionData['bookList']] # Can only pass a single parameter to map
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Loading {} {} books using {} processes…").format( len(self.pickleVersionData['bookList']), 'Pickle', BibleOrgSysGlobals.maxProcesses ) )
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookMP, self.pickleVersionData['bookList'] ) # have the pool do our loads
-                    assert len(results) == len(self.pickleVersionData['bookList'])
-                    for bBook in results:
-                        bBook.containerBibleObject = self # Because the pickling and unpickling messes this up
-                        self.stashBook( bBook ) # Saves them in the correct order
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = self._loadBooksMP( self.pickleVersionData['bookList'] ) # have the pool do our loads
+                for bBook in results:
+                    self.stashBook( bBook ) # Saves them in the correct order
             else: # Just single threaded
                 # Load the books one by one -- assuming that they have regular Paratext style filenames
                 for BBB in self.pickleVersionData['bookList']:
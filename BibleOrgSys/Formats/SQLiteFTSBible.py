@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# SQLiteFTSBible.py
+#
+# Module handling SQLite3 full-text search (FTS5) Bible databases
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module for writing and searching SQLite3 full-text search Bible databases
+    so that searches can be done (e.g., on a web server) without loading any Bible objects.
+
+The database is written by BibleWriter.toSQLiteFTS() (which calls createSQLiteFTSDatabase() below)
+    and contains the following tables:
+    TABLE metadata (name TEXT PRIMARY KEY, value TEXT);
+    TABLE books (bookOrder INTEGER PRIMARY KEY, BBB TEXT UNIQUE);
+    TABLE verses (verseID INTEGER PRIMARY KEY, BBB TEXT, C TEXT, V TEXT, verseText TEXT);
+        with one row for each entry in the book's C:V index
+        and with verseText exactly as given by InternalBible.getVerseText().
+    TABLE lines (lineID INTEGER PRIMARY KEY, verseID INTEGER, BBB TEXT, C TEXT, V TEXT, paragraphMarker TEXT,
+                    marker TEXT, originalMarker TEXT, cleanText TEXT, fullText TEXT, extras TEXT);
+        with one row for each of the book's processed lines that findText() might search
+        and with C and V (and the preceding paragraph marker) as findText() tracks them.
+    VIRTUAL TABLE versesFTS USING fts5 (verseText) -- for BM25 ranked searches
+    VIRTUAL TABLE linesFTS USING fts5 (cleanText, fullText) -- with the trigram tokenizer
+
+SQLiteFTSBibleSearcher.findText() accepts the same options as InternalBible.findText()
+    and gives identical results (using the trigram index to skip lines which can't possibly match).
+SQLiteFTSBibleSearcher.rankedSearch() finds verses containing all of the given words
+    in order of relevance (as given by the SQLite bm25() function).
+"""
+from gettext import gettext as _
+from pathlib import Path
+import os
+import logging
+import sqlite3
+import json
+import re
+from datetime import datetime
+
+if __name__ == '__main__':
+    import sys
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleExtra, InternalBibleExtraList, MARKER_FLAG_PARAGRAPH, MARKER_FLAG_END
+from BibleOrgSys.Internals.InternalBible import prepareFindTextOptions, findTextInEntry
+from BibleOrgSys.Internals.InternalBibleSearchIndexes import getCompiledRegexLiteralQuery, TRIGRAM_LENGTH
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+SHORT_PROGRAM_NAME = "SQLiteFTSBible"
+PROGRAM_NAME = "SQLite full-text search Bible handler"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+SQLITE_FTS_FORMAT_VERSION = '1' # Increment this if the database tables change
+SQLITE_FTS_FILENAME_ENDING = '.FTS.sqlite3'
+
+# The verse text from getVerseText() uses these characters to mark headings and poetry lines
+#   but they would otherwise be treated as part of the word by the unicode61 tokenizer
+VERSE_TEXT_SEPARATORS = '¹²³⁴₁₂₃₄'
+
+
+
+def createSQLiteFTSDatabase( BibleObject, outputFolderpath:Path, controlDict=None ) -> bool:
+    """
+    Create a SQLite3 full-text search database from the given Bible object
+        (which must have its books loaded).
+
+    The verses are taken from each book's C:V index,
+        so that the verse boundaries (and the verse text) exactly match getVerseText().
+
+    ControlDict is not used (yet).
+
+    Returns True if successful.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"createSQLiteFTSDatabase( {BibleObject.getAName()}, {outputFolderpath} )" )
+
+    workAbbreviation = BibleObject.abbreviation if 'abbreviation' in BibleObject.__dict__ and BibleObject.abbreviation \
+                        else BibleObject.getAName( abbrevFirst=True )
+    filename = BibleOrgSysGlobals.makeSafeFilename( f'{workAbbreviation}{SQLITE_FTS_FILENAME_ENDING}' )
+    filepath = Path( outputFolderpath ).joinpath( filename )
+    if os.path.exists( filepath ): os.remove( filepath ) # Don't append to an old database
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, '  createSQLiteFTSDatabase: ' + _("Writing {!r}…").format( filepath ) )
+
+    conn = sqlite3.connect( filepath )
+    cursor = conn.cursor()
+    cursor.execute( 'CREATE TABLE metadata (name TEXT PRIMARY KEY, value TEXT)' )
+    cursor.executemany( 'INSERT INTO metadata VALUES(?,?)',
+                        ( ('formatVersion',SQLITE_FTS_FORMAT_VERSION),
+                          ('workName',BibleObject.getAName( abbrevFirst=True )),
+                          ('name',BibleObject.getAName()),
+                          ('abbreviation',workAbbreviation),
+                          ('sourceType',BibleObject.objectTypeString),
+                          ('createdBy',PROGRAM_NAME_VERSION),
+                          ('creationDate',datetime.now().strftime('%Y-%m-%d')), ) )
+    cursor.execute( 'CREATE TABLE books (bookOrder INTEGER PRIMARY KEY, BBB TEXT UNIQUE)' )
+    cursor.execute( 'CREATE TABLE verses (verseID INTEGER PRIMARY KEY, BBB TEXT, C TEXT, V TEXT, verseText TEXT)' )
+    cursor.execute( 'CREATE TABLE lines (lineID INTEGER PRIMARY KEY, verseID INTEGER, BBB TEXT, C TEXT, V TEXT, paragraphMarker TEXT,'
+                    ' marker TEXT, originalMarker TEXT, cleanText TEXT, fullText TEXT, extras TEXT)' )
+
+    verseID = 0
+    for bookOrder, (BBB,bookObject) in enumerate( BibleObject.books.items(), start=1 ):
+        if not bookObject._processedFlag: bookObject.processLines()
+        cursor.execute( 'INSERT INTO books VALUES(?,?)', (bookOrder,BBB) )
+        bookEntries = bookObject._processedLines
+
+        # Firstly write the verses using the C:V index
+        verseIDs = [None] * len(bookEntries) # So each line knows its verse
+        for (C,V),indexEntry in bookObject._CVIndex.items():
+            try: verseText = BibleObject.getVerseText( (BBB,C,V) )
+            except (KeyError, ValueError): # shouldn't happen as we're using the index keys
+                logging.error( f"createSQLiteFTSDatabase: Unable to get verse text for {BBB} {C}:{V}" )
+                continue
+            verseID += 1
+            cursor.execute( 'INSERT INTO verses VALUES(?,?,?,?,?)', (verseID,BBB,C,V,verseText) )
+            for entryIndex in range( indexEntry.getEntryIndex(), indexEntry.getNextEntryIndex() ):
+                if verseIDs[entryIndex] is None: verseIDs[entryIndex] = verseID
+
+        # Now write the lines (tracking C:V in exactly the same way as InternalBible.findText())
+        lineRows = []
+        C, V = '-1', '-1' # So first/id line starts at -1:0
+        marker = lastParagraphMarker = None
+        markerFlags = 0
+        for entryIndex,lineEntry in enumerate( bookEntries ):
+            if markerFlags & MARKER_FLAG_PARAGRAPH:
+                lastParagraphMarker = marker
+            marker, markerFlags, cleanText = lineEntry.getMarker(), lineEntry.getMarkerFlags(), lineEntry.getCleanText()
+            if markerFlags & MARKER_FLAG_END or marker in ('headers','intro','chapters'): continue # findText() always ignores these added lines
+            if marker == 'c': C, V = cleanText, '0'
+            elif marker == 'v': V = cleanText
+            elif C == '-1': V = str( int(V) + 1 )
+            extras = lineEntry.getExtras()
+            lineRows.append( (verseIDs[entryIndex], BBB, C, V, lastParagraphMarker, marker, lineEntry.getOriginalMarker(),
+                                cleanText, lineEntry.getFullText(),
+                                json.dumps( [list(extra) for extra in extras], ensure_ascii=False ) if extras else None) )
+        cursor.executemany( 'INSERT INTO lines(verseID,BBB,C,V,paragraphMarker,marker,originalMarker,cleanText,fullText,extras)'
+                            ' VALUES(?,?,?,?,?,?,?,?,?,?)', lineRows )
+    cursor.execute( 'CREATE INDEX verses_BCV ON verses (BBB, C, V)' )
+    cursor.execute( 'CREATE INDEX lines_BBB ON lines (BBB, lineID)' )
+    conn.commit() # save (commit) the changes
+
+    # Now make the full-text search indexes
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, _("  Making full-text search indexes for {:,} verses…").format( verseID ) )
+    try:
+        cursor.execute( "CREATE VIRTUAL TABLE versesFTS USING fts5 (verseText, content='verses', content_rowid='verseID',"
+                        f" tokenize=\"unicode61 remove_diacritics 2 separators '{VERSE_TEXT_SEPARATORS}'\")" )
+        cursor.execute( "INSERT INTO versesFTS(versesFTS) VALUES('rebuild')" )
+    except sqlite3.OperationalError as err: # This SQLite build doesn't include the FTS5 extension
+        logging.error( f"createSQLiteFTSDatabase: Unable to make full-text search index (needs SQLite with FTS5) so removing {filepath}: {err}" )
+        conn.close()
+        os.remove( filepath ) # Don't leave a database that SQLiteFTSBibleSearcher can't use
+        return False
+    try:
+        cursor.execute( "CREATE VIRTUAL TABLE linesFTS USING fts5 (cleanText, fullText, content='lines', content_rowid='lineID', tokenize='trigram')" )
+        cursor.execute( "INSERT INTO linesFTS(linesFTS) VALUES('rebuild')" )
+    except sqlite3.OperationalError as err: # The trigram tokenizer needs SQLite 3.34 or later
+        logging.warning( f"createSQLiteFTSDatabase: Unable to make trigram index (so findText() will be slower): {err}" )
+    conn.commit() # save (commit) the changes
+    cursor.execute( 'VACUUM' )
+    conn.close()
+
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  createSQLiteFTSDatabase wrote {len(BibleObject.books)} books with {verseID:,} verses to {filepath}" )
+    return True
+# end of createSQLiteFTSDatabase
+
+
+
+def getFTSQueryString( literalQuery ) -> str|None:
+    """
+    Convert a literal query (a string or a 2-tuple ('AND'|'OR', list of sub-queries))
+        into an FTS5 query string for the trigram index.
+
+    Returns None if the query can't be used,
+        i.e., it contains literals which are too short or which aren't ASCII
+        (because SQLite and Python might not fold the case of other characters in exactly the same way).
+    """
+    if literalQuery is None: return None
+    if isinstance( literalQuery, str ):
+        if len(literalQuery) < TRIGRAM_LENGTH or not literalQuery.isascii(): return None
+        return '"{}"'.format( literalQuery.replace( '"', '""' ) )
+    operator, subQueries = literalQuery
+    subQueryStrings = [getFTSQueryString( subQuery ) for subQuery in subQueries]
+    if operator == 'AND':
+        subQueryStrings = [subQueryString for subQueryString in subQueryStrings if subQueryString is not None]
+        if not subQueryStrings: return None
+    elif None in subQueryStrings: return None # For OR, we need every alternative
+    return '({})'.format( f' {operator} '.join( subQueryStrings ) )
+# end of getFTSQueryString
+
+
+
+class SQLiteFTSEntry:
+    """
+    A lightweight version of InternalBibleEntry made from a row of the lines table
+        with just enough for InternalBible.findTextInEntry().
+    """
+    __slots__ = ('marker','originalMarker','cleanText','fullText','extrasJSON')
+
+    def __init__( self, marker:str, originalMarker:str, cleanText:str, fullText:str, extrasJSON:str|None ) -> None:
+        self.marker, self.originalMarker, self.cleanText, self.fullText, self.extrasJSON = marker, originalMarker, cleanText, fullText, extrasJSON
+
+    def getMarker( self ) -> str: return self.marker
+    def getOriginalMarker( self ) -> str: return self.originalMarker
+    def getCleanText( self ) -> str: return self.cleanText
+    def getFullText( self ) -> str: return self.fullText
+    def getExtras( self ) -> InternalBibleExtraList|None:
+        if self.extrasJSON is None: return None
+        return InternalBibleExtraList( [InternalBibleExtra( *extra, None ) for extra in json.loads( self.extrasJSON )] )
+# end of class SQLiteFTSEntry
+
+
+
+class SQLiteFTSBibleSearcher:
+    """
+    Class to answer search queries from a SQLite3 full-text search Bible database
+        (as made by createSQLiteFTSDatabase()) without loading a Bible object.
+    """
+    def __init__( self, databaseFilepath ) -> None:
+        """
+        Open the database (read-only) and read the metadata and book list.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SQLiteFTSBibleSearcher.__init__( {databaseFilepath} )" )
+        self.databaseFilepath = Path( databaseFilepath )
+        self.connection = sqlite3.connect( f'file:{self.databaseFilepath}?mode=ro', uri=True )
+
+        self.metadata = dict( self.connection.execute( 'SELECT name, value FROM metadata' ) )
+        if self.metadata.get( 'formatVersion' ) != SQLITE_FTS_FORMAT_VERSION:
+            logging.warning( f"SQLiteFTSBibleSearcher: Expected format version {SQLITE_FTS_FORMAT_VERSION} but {self.databaseFilepath} is {self.metadata.get( 'formatVersion' )}" )
+        self.workName = self.metadata.get( 'workName', self.databaseFilepath.name )
+        self.bookList = [BBB for (BBB,) in self.connection.execute( 'SELECT BBB FROM books ORDER BY bookOrder' )]
+        self.haveTrigramIndexFlag = self.connection.execute( "SELECT count(*) FROM sqlite_master WHERE name='linesFTS'" ).fetchone()[0] > 0
+    # end of SQLiteFTSBibleSearcher.__init__
+
+
+    def __str__( self ) -> str:
+        """
+        This method returns the string representation of a SQLite FTS Bible searcher.
+        """
+        result = f"SQLiteFTSBibleSearcher object for {self.workName}"
+        result += f"\n  {len(self.bookList)} books from {self.databaseFilepath}"
+        if not self.haveTrigramIndexFlag: result += "\n  (No trigram index)"
+        return result
+    # end of SQLiteFTSBibleSearcher.__str__
+
+    def __len__( self ) -> int:
+        return len( self.bookList )
+
+
+    def close( self ) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+    # end of SQLiteFTSBibleSearcher.close
+
+
+    def getBookList( self ) -> list[str]:
+        return self.bookList
+
+
+    def getVerseText( self, BCVReference:SimpleVerseKey|tuple[str,str,str] ) -> str:
+        """
+        Returns the verse text exactly as given by InternalBible.getVerseText() when the database was made.
+
+        Expects a SimpleVerseKey for the parameter
+            but also copes with a (B,C,V) tuple (where V can be a verse range as used in the C:V index).
+
+        Raises a KeyError if the BCVReference isn't found.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SQLiteFTSBibleSearcher.getVerseText( {BCVReference} )" )
+        if isinstance( BCVReference, tuple ): BBB, C, V = BCVReference[:3]
+        else: BBB, C, V = BCVReference.getBBB(), *BCVReference.getCV()
+        row = self.connection.execute( 'SELECT verseText FROM verses WHERE BBB=? AND C=? AND V=?', (BBB,C,V) ).fetchone()
+        if row is None: raise KeyError( f"{BBB} {C}:{V}" )
+        return row[0]
+    # end of SQLiteFTSBibleSearcher.getVerseText
+
+
+    def rankedSearch( self, searchText:str, maxResults:int=20, bookList:list[str]|None=None ) -> list[tuple[SimpleVerseKey,str,float]]:
+        """
+        Search for verses containing all of the words in searchText
+            (ignoring case and diacritics).
+
+        Returns a list of up to maxResults 3-tuples, best match first, containing
+            SimpleVerseKey (with any verse bridge removed), verseText, and the bm25 score (more negative is better).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SQLiteFTSBibleSearcher.rankedSearch( {searchText!r}, {maxResults}, {bookList} )" )
+        words = re.findall( r'\w+', searchText )
+        if not words: return []
+        queryString = ' '.join( f'"{word}"' for word in words )
+
+        sqlString = 'SELECT verses.BBB, verses.C, verses.V, verses.verseText, bm25(versesFTS) FROM versesFTS' \
+                    ' JOIN verses ON verses.verseID = versesFTS.rowid WHERE versesFTS MATCH ?'
+        parameters = [queryString]
+        if bookList:
+            sqlString += ' AND verses.BBB IN ({})'.format( ','.join( '?' * len(bookList) ) )
+            parameters.extend( bookList )
+        sqlString += ' ORDER BY bm25(versesFTS) LIMIT ?'
+        parameters.append( maxResults )
+
+        results = []
+        for BBB, C, V, verseText, score in self.connection.execute( sqlString, parameters ):
+            ixHyphen = V.find( '-' )
+            if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+            results.append( (SimpleVerseKey( BBB, C, V ), verseText, score) )
+        return results
+    # end of SQLiteFTSBibleSearcher.rankedSearch
+
+
+    def iterFindText( self, optionsDict, resultSummaryDict:dict|None=None, maxResults:int|None=None ):
+        """
+        Search the database for the given text which is contained in a dictionary of options
+            exactly as for InternalBible.iterFindText()
+            (and yielding the same 4-tuples or 5-tuples).
+
+        The optionsDict is checked and updated immediately (not when the iteration starts).
+
+        If a resultSummaryDict is given, it's updated as the search proceeds with:
+            searchedBookList, foundBookList, numResults, and reachedMaxResults flag.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SQLiteFTSBibleSearcher.iterFindText( {optionsDict}, {maxResults} )" )
+        ourFindText, compiledFindText, ourMarkerList = prepareFindTextOptions( optionsDict, self.workName )
+
+        # See if we can use the trigram index to find the lines that need to be searched
+        #   (It can't help with marker searches, or with diacritics which SQLite might remove differently.)
+        ftsQueryString = None
+        if self.haveTrigramIndexFlag \
+        and optionsDict['includeMainTextFlag'] and not optionsDict['includeMarkerTextFlag'] \
+        and not optionsDict['ignoreDiacriticsFlag']:
+            ftsQueryString = getFTSQueryString( getCompiledRegexLiteralQuery( compiledFindText ) if optionsDict['regexFlag'] else ourFindText )
+            if ftsQueryString is not None:
+                ftsQueryString = '{{{}}} : {}'.format( 'fullText' if optionsDict['includeExtrasFlag'] else 'cleanText', ftsQueryString )
+        dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  iterFindText using {ftsQueryString=}" )
+
+        if resultSummaryDict is None: resultSummaryDict = {}
+        resultSummaryDict.update( { 'searchedBookList':[], 'foundBookList':[], 'numResults':0, 'reachedMaxResults':False, } )
+        return self._iterFindTextResults( optionsDict, resultSummaryDict, ourFindText, compiledFindText, ourMarkerList, ftsQueryString, maxResults )
+    # end of SQLiteFTSBibleSearcher.iterFindText
+
+
+    def _iterFindTextResults( self, optionsDict, resultSummaryDict:dict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                    ftsQueryString:str|None, maxResults:int|None ):
+        """
+        The generator which does the actual search for iterFindText().
+        """
+        searchBBBs = [BBB for BBB in self.bookList \
+                        if optionsDict['bookList'] is None or optionsDict['bookList']=='ALL' or BBB in optionsDict['bookList']]
+        resultList = []
+        for BBB in searchBBBs:
+            resultSummaryDict['searchedBookList'].append( BBB )
+            if ftsQueryString is None:
+                rows = self.connection.execute( 'SELECT C, V, paragraphMarker, marker, originalMarker, cleanText, fullText, extras'
+                                                ' FROM lines WHERE BBB=? ORDER BY lineID', (BBB,) ).fetchall()
+            else:
+                rows = self.connection.execute( 'SELECT C, V, paragraphMarker, marker, originalMarker, cleanText, fullText, extras'
+                                                ' FROM lines WHERE BBB=? AND lineID IN (SELECT rowid FROM linesFTS WHERE linesFTS MATCH ?)'
+                                                ' ORDER BY lineID', (BBB,ftsQueryString) ).fetchall()
+            for C, V, paragraphMarker, marker, originalMarker, cleanText, fullText, extrasJSON in rows:
+                if ourMarkerList:
+                    if marker not in ourMarkerList and not (marker in ('v~','p~') and paragraphMarker in ourMarkerList):
+                        continue
+                elif C=='-1' and not optionsDict['includeIntroFlag']: continue
+                if optionsDict['chapterList'] is None \
+                or C in optionsDict['chapterList'] \
+                or int(C) in optionsDict['chapterList']:
+                    findTextInEntry( BBB, C, V, SQLiteFTSEntry( marker, originalMarker, cleanText, fullText, extrasJSON ),
+                                        marker, cleanText, optionsDict, ourFindText, compiledFindText, resultList )
+                    for resultTuple in resultList:
+                        if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+                        resultSummaryDict['numResults'] += 1
+                        yield resultTuple
+                        if maxResults is not None and resultSummaryDict['numResults'] >= maxResults:
+                            resultSummaryDict['reachedMaxResults'] = True
+                            return
+                    resultList.clear()
+    # end of SQLiteFTSBibleSearcher._iterFindTextResults
+
+
+    def findText( self, optionsDict ):
+        """
+        Search the database for the given text which is contained in a dictionary of options
+            exactly as for InternalBible.findText().
+
+        Always returns three values:
+            1/ The updated dictionary of all parameters, i.e., updated optionsDict
+            2/ The result summary dict, containing searchedBookList, foundBookList (and numResults, reachedMaxResults)
+            3/ A list with (zero or more) search results
+                being 4-tuples or 5-tuples for caseless searches (see InternalBible.findText()).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SQLiteFTSBibleSearcher.findText( {optionsDict} )" )
+        resultSummaryDict = {}
+        resultList = list( self.iterFindText( optionsDict, resultSummaryDict ) )
+        return optionsDict, resultSummaryDict, resultList
+    # end of SQLiteFTSBibleSearcher.findText
+# end of class SQLiteFTSBibleSearcher
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest2/' )
+    UB = USFMBible( testFolder, "Matigsalug", 'MBTV' )
+    UB.load()
+    outputFolderpath = BibleOrgSysGlobals.DEFAULT_WRITEABLE_OUTPUT_FOLDERPATH.joinpath( 'BOS_SQLiteFTS_Export/' )
+    UB.toSQLiteFTS( outputFolderpath )
+
+    searcher = SQLiteFTSBibleSearcher( outputFolderpath.joinpath( f'MBTV{SQLITE_FTS_FILENAME_ENDING}' ) )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, searcher )
+    for findText in ( 'kandin', 'regex:[Kk]and.n\\b', ):
+        _optionsDict, resultSummaryDict, resultList = searcher.findText( { 'findText':findText } )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Found {findText!r} {len(resultList):,} times in {resultSummaryDict['foundBookList']}" )
+    for verseKey, verseText, score in searcher.rankedSearch( 'kandin', maxResults=3 ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {verseKey.getShortText()} ({score:.2f}) {verseText}" )
+    searcher.close()
+# end of SQLiteFTSBible.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of SQLiteFTSBible.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of SQLiteFTSBible.py
@@ -77,10 +77,10 @@ from BibleOrgSys.Online.SwordInstallManager import processConfLines, ALL_SWORD_C
 
 
 
-LAST_MODIFIED_DATE = '2023-02-02' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "SwordModules"
 PROGRAM_NAME = "Sword module handler"
-PROGRAM_VERSION = '0.49'
+PROGRAM_VERSION = '0.50'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -2379,23 +2379,20 @@ class SwordModules:
         displayCount = loadCount = 0
         if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
             parameters = [moduleRoughName for moduleRoughName in self.confs]
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( self.loadModule, parameters ) # have the pool do our loads
-                vPrint( 'Normal', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules: Have results from pool now" )
-                assert len(results) == len(parameters)
-                for j, theseResults in enumerate( results ):
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, j )
-                    moduleRoughName = parameters[j]
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, " SwordModules.loadAllModules:", j, moduleRoughName )
-                    result, swM = theseResults
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, " ", " SwordModules.loadAllModules:", j, moduleRoughName, result )
-                    displayCount += 1
-                    if result:
-                        loadCount += 1
-                        self.modules[moduleRoughName] = swM
-                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules: All done here1" )
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = BibleOrgSysGlobals.mapInWorkers( self.loadModule, parameters ) # have the pool do our loads
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules: Have results from pool now" )
+            assert len(results) == len(parameters)
+            for j, theseResults in enumerate( results ):
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, j )
+                moduleRoughName = parameters[j]
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, " SwordModules.loadAllModules:", j, moduleRoughName )
+                result, swM = theseResults
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, " ", " SwordModules.loadAllModules:", j, moduleRoughName, result )
+                displayCount += 1
+                if result:
+                    loadCount += 1
+                    self.modules[moduleRoughName] = swM
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules: All done here1" )
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules: All done here2" )
             vPrint( 'Info', DEBUGGING_THIS_MODULE, "SwordModules.loadAllModules here", displayCount, loadCount )
         else: # Just single threaded
@@ -6,7 +6,7 @@
 #
 # Module handling compilations of USFM Bible books
 #
-# Copyright (C) 2010-2023 Robert Hunt
+# Copyright (C) 2010-2025 Robert Hunt
 # Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
 # License: See gpl-3.0.txt
 #
@@ -28,12 +28,18 @@ Module for defining and manipulating complete or partial USFM Bibles.
 
 NOTE: If it has a .SSF file, then it should be considered a PTX7Bible.
     Or if it has a Settings.XML file, then it should be considered a PTX8Bible.
+
+Also contains findReplaceText() (with confirmation for each replacement)
+    and batchFindReplaceText() (for applying a list of rules in a single pass)
+    which work on the USFM files of USFM and Paratext Bibles.
 """
 from gettext import gettext as _
 from pathlib import Path
 import os
 import logging
 import re
+import shutil
+import tempfile
 import multiprocessing
 
 if __name__ == '__main__':
@@ -49,10 +55,10 @@ from BibleOrgSys.Bible import Bible
 
 
 
-LAST_MODIFIED_DATE = '2023-03-10' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "USFMBible"
 PROGRAM_NAME = "USFM Bible handler"
-PROGRAM_VERSION = '0.80'
+PROGRAM_VERSION = '0.81'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -480,6 +486,160 @@ def findReplaceText( self, optionsDict, confirmCallback ):
 
 
 
+BATCH_RULE_GROUP_NAME_FORMAT = 'BOSRule{}'
+BATCH_WORD_START_REGEX_STRING = r'(?<![^\W\d_])' # Not preceded by a letter
+BATCH_WORD_END_REGEX_STRING = r'(?![^\W\d_])' # Not followed by a letter
+BATCH_REGEX_BACKREFERENCE_REGEX = re.compile( r'\\[1-9]|\(\?P=' )
+
+
+def compileFindReplaceRules( ruleList:list[tuple] ) -> tuple[re.Pattern,list[tuple[str,re.Pattern|None]]]:
+    """
+    Compile an ordered list of find/replace rules into a single combined regex.
+
+    Each rule is a 2-tuple (findText, replaceText) or a 3-tuple (findText, replaceText, wordMode)
+        where findText and wordMode are as for findReplaceText(),
+        i.e., findText can start with 'regex:' (and then the wordMode is ignored).
+    At any position in the text, the first rule in the list which matches is used.
+
+    Returns the combined regex, and a list (parallel to ruleList) of 2-tuples
+        with the replaceText and the rule's own compiled regex (None for non-regex rules).
+
+    Raises a ValueError if a rule can't be used.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"compileFindReplaceRules( {ruleList} )" )
+
+    rulePatternStrings, ruleReplacements = [], []
+    for n,rule in enumerate( ruleList ):
+        findText, replaceText = rule[0], rule[1]
+        wordMode = rule[2] if len(rule) > 2 else 'Any'
+        if not findText: raise ValueError( f"Find/replace rule {n} has no findText: {rule}" )
+        if findText.lower().startswith( 'regex:' ):
+            patternString = findText[6:]
+            if BATCH_REGEX_BACKREFERENCE_REGEX.search( patternString ):
+                raise ValueError( f"Find/replace rule {n} can't use backreferences in a batch: {findText!r}" )
+            try: ruleReplacements.append( (replaceText, re.compile( patternString )) )
+            except re.error as err: raise ValueError( f"Find/replace rule {n} has a bad regex {findText!r}: {err}" )
+        else:
+            if wordMode not in ( 'Any', 'Whole', 'Begins', 'EndsWord', 'EndsLine', ):
+                raise ValueError( f"Find/replace rule {n} has an unknown wordMode: {wordMode!r}" )
+            patternString = re.escape( findText )
+            if wordMode in ('Whole','Begins'): patternString = BATCH_WORD_START_REGEX_STRING + patternString
+            if wordMode in ('Whole','EndsWord'): patternString += BATCH_WORD_END_REGEX_STRING
+            elif wordMode == 'EndsLine': patternString += r'\Z' # as for findReplaceText()
+            ruleReplacements.append( (replaceText, None) )
+        rulePatternStrings.append( f'(?P<{BATCH_RULE_GROUP_NAME_FORMAT.format( n )}>{patternString})' )
+
+    try: combinedRegex = re.compile( '|'.join( rulePatternStrings ) )
+    except re.error as err: raise ValueError( f"Unable to combine {len(ruleList)} find/replace rules: {err}" )
+    return combinedRegex, ruleReplacements
+# end of compileFindReplaceRules
+
+
+def _writeBookFileAtomically( filepath:str, fileText:str, encoding:str, doBackups:bool, numBackups:int=5 ) -> None:
+    """
+    Write the text to a temporary file in the same folder and then rename it over the original file
+        so that the book file is never left half-written.
+
+    If doBackups is set, the original file is copied (rather than renamed)
+        to the first backup, after moving any older backups along.
+    """
+    folderpath, filename = os.path.split( filepath )
+    with tempfile.NamedTemporaryFile( 'wt', encoding=encoding, newline='\r\n', dir=folderpath,
+                                        prefix=f'.{filename}.', suffix='.tmp', delete=False ) as tempFile:
+        tempFile.write( fileText )
+        tempFilepath = tempFile.name
+    try:
+        if doBackups and os.access( filepath, os.F_OK ):
+            # Use the same backup filenames as BibleOrgSysGlobals.backupAnyExistingFile()
+            for n in range( numBackups, 1, -1 ): # e.g., 5,4,3,2
+                sourceFilepath = f"{filepath}.bak{'' if n==2 else n-1}"
+                if os.access( sourceFilepath, os.F_OK ): os.replace( sourceFilepath, f'{filepath}.bak{n}' )
+            shutil.copy2( filepath, f'{filepath}.bak' )
+        shutil.copymode( filepath, tempFilepath )
+        os.replace( tempFilepath, filepath )
+    except Exception:
+        os.remove( tempFilepath )
+        raise
+# end of _writeBookFileAtomically
+
+
+def batchFindReplaceText( self, ruleList:list[tuple], optionsDict:dict|None=None ) -> dict:
+    """
+    Apply an ordered list of find/replace rules to the Bible book files
+        without any confirmations.
+
+    "self" in this case is either a USFMBible or a PTX 7 or 8 Bible object.
+
+    The rules (see compileFindReplaceRules()) are combined into a single regex
+        so each book file is read and processed only once,
+        i.e., the replacement text isn't searched again by later rules.
+
+    The optionsDict can contain:
+        bookList: 'ALL' (default) or a list of BBBs
+        doBackups: True (default) to keep up to five backup copies of each changed file
+        reloadBooks: True (default) to reload (and hence reindex) any changed books that are already loaded
+
+    Each changed file is written atomically,
+        and only the changed books are reloaded (or else marked as needing reloading).
+
+    Returns a result dictionary containing:
+        numReplaces, ruleReplaceCounts (a list parallel to ruleList),
+        searchedBookList, replacedBookList, and reloadedBookList.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"batchFindReplaceText( {self}, {len(ruleList)} rules, {optionsDict} )" )
+    if optionsDict is None: optionsDict = {}
+    bookList = optionsDict.get( 'bookList', 'ALL' )
+    doBackups = optionsDict.get( 'doBackups', True )
+    reloadBooks = optionsDict.get( 'reloadBooks', True )
+
+    combinedRegex, ruleReplacements = compileFindReplaceRules( ruleList )
+    ruleGroupIndexes = { combinedRegex.groupindex[BATCH_RULE_GROUP_NAME_FORMAT.format( n )]:n for n in range( len(ruleList) ) }
+    resultDict = { 'numReplaces':0, 'ruleReplaceCounts':[0]*len(ruleList),
+                    'searchedBookList':[], 'replacedBookList':[], 'reloadedBookList':[], }
+
+    if not self.preloadDone: self.preload()
+    encoding = self.encoding
+    if encoding is None: encoding = 'utf-8'
+
+    def getReplacement( match:re.Match ) -> str:
+        """
+        Find which rule matched and return its replacement text.
+        """
+        n = ruleGroupIndexes[match.lastindex]
+        resultDict['ruleReplaceCounts'][n] += 1
+        replaceText, ruleRegex = ruleReplacements[n]
+        if ruleRegex is None: return replaceText
+        return ruleRegex.match( match.string, match.start() ).expand( replaceText ) # Handles any groups in the replaceText
+    # end of getReplacement
+
+    if not self.maximumPossibleFilenameTuples:
+        logging.critical( _("No book files to search/replace in {}!").format( self.sourceFolder ) )
+        return resultDict
+    for BBB,filename in self.maximumPossibleFilenameTuples:
+        if bookList is None or bookList=='ALL' or BBB in bookList:
+            bookFilepath = os.path.join( self.sourceFolder, filename )
+            with open( bookFilepath, 'rt', encoding=encoding ) as bookFile:
+                bookText = bookFile.read()
+            resultDict['searchedBookList'].append( BBB )
+            newBookText, numReplaces = combinedRegex.subn( getReplacement, bookText )
+            if not numReplaces or newBookText == bookText: continue
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  batchFindReplaceText: Saving {numReplaces:,} replacements in {bookFilepath}…" )
+            _writeBookFileAtomically( bookFilepath, newBookText, encoding, doBackups )
+            resultDict['numReplaces'] += numReplaces
+            resultDict['replacedBookList'].append( BBB )
+            self.bookNeedsReloading[BBB] = True
+
+    if reloadBooks:
+        for BBB in resultDict['replacedBookList']:
+            if BBB in self.books:
+                self.reloadBook( BBB )
+                resultDict['reloadedBookList'].append( BBB )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"batchFindReplaceText made {resultDict['numReplaces']:,} replacements in {len(resultDict['replacedBookList'])} books" )
+    return resultDict
+# end of batchFindReplaceText
+
+
+
 class USFMBible( Bible ):
     """
     Class to load and manipulate USFM Bibles.
@@ -635,7 +795,7 @@ class USFMBible( Bible ):
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag:
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, '  ' + _("Loading {} from {} from {}…").format( BBB, self.name, self.sourceFolder ) )
         UBB = USFMBibleBook( self, BBB ) # Ensure that we point back to the original instance
-        UBB.load( self.possibleFilenameDict[BBB], self.sourceFolder, self.encoding )
+        UBB.load( filename, self.sourceFolder, self.encoding )
         UBB.validateMarkers() # Usually activates InternalBibleBook.processLines()
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("    Finishing loading USFM book {}.").format( BBB ) )
         return UBB
@@ -660,15 +820,10 @@ class USFMBible( Bible ):
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Loading {} USFM books using {} processes…").format( len(self.maximumPossibleFilenameTuples), numProcesses ) )
                     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=numProcesses ) as pool: # start worker processes
-                    results = pool.map( self._loadBookMP, self.maximumPossibleFilenameTuples ) # have the pool do our loads
-                    assert len(results) == len(self.maximumPossibleFilenameTuples)
-                    for bBook in results:
-                        #dPrint( 'Info', DEBUGGING_THIS_MODULE, f"Stashing {bBook.BBB} {id(bBook)} with {id(bBook.containerBibleObject)}" )
-                        bBook.containerBibleObject = self # Because the pickling and unpickling messes this up
-                        self.stashBook( bBook ) # Saves them in the correct order
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = self._loadBooksMP( self.maximumPossibleFilenameTuples ) # have the pool do our loads
+                for bBook in results:
+                    #dPrint( 'Info', DEBUGGING_THIS_MODULE, f"Stashing {bBook.BBB} {id(bBook)} with {id(bBook.containerBibleObject)}" )
+                    self.stashBook( bBook ) # Saves them in the correct order
             else: # Just single threaded
                 # Load the books one by one -- assuming that they have regular Paratext style filenames
                 for BBB,filename in self.maximumPossibleFilenameTuples:
@@ -28,6 +28,8 @@ Module for defining and manipulating complete or partial USX Bibles.
 
 CHANGELOG:
     2023-09-28 Add test for USFMAllExpandedCharacterMarkers in main()
+    2025-06-24 Use InternalBible._loadBooksMP() so that the whole Bible isn't pickled with every book
+    2025-06-26 _loadBookMP() takes a (BBB,filename) 2-tuple (like the USFM loaders) for the book loader payloads
 """
 from gettext import gettext as _
 import os
@@ -48,10 +50,10 @@ from BibleOrgSys.Formats.USXXMLBibleBook import USXXMLBibleBook
 from BibleOrgSys.Bible import Bible
 
 
-LAST_MODIFIED_DATE = '2023-10-12' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "USXXMLBibleHandler"
 PROGRAM_NAME = "USX XML Bible handler"
-PROGRAM_VERSION = '0.43'
+PROGRAM_VERSION = '0.44'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -241,13 +243,16 @@ class USXXMLBible( Bible ):
     # end of USXXMLBible.loadBook
 
 
-    def _loadBookMP( self, BBB:str, filename=None ):
+    def _loadBookMP( self, BBB_Filename_duple ):
         """
         Used for multiprocessing.
 
+        Parameter is a 2-tuple containing BBB and the filename (or None to use the preloaded one).
+
         NOTE: You should ensure that preload() has been called first.
         """
-        fnPrint( DEBUGGING_THIS_MODULE, "USXXMLBible._loadBookMP( {}, {} )".format( BBB, filename ) )
+        fnPrint( DEBUGGING_THIS_MODULE, "USXXMLBible._loadBookMP( {} )".format( BBB_Filename_duple ) )
+        BBB, filename = BBB_Filename_duple
         if self.doExtraChecking:
             assert self.preloadDone
 
@@ -272,6 +277,16 @@ class USXXMLBible( Bible ):
     # end of USXXMLBible._loadBookMP
 
 
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        The USX books are loaded from our givenFolderName (see InternalBible._loadBooksMP()).
+        """
+        bookLoaderSettings = super()._getBookLoaderSettings()
+        bookLoaderSettings['givenFolderName'] = self.givenFolderName
+        return bookLoaderSettings
+    # end of USXXMLBible._getBookLoaderSettings
+
+
     def loadBooks( self ):
         """
         Load the books.
@@ -296,31 +311,24 @@ class USXXMLBible( Bible ):
         if BibleOrgSysGlobals.maxProcesses > 1 \
         and not BibleOrgSysGlobals.alreadyMultiprocessing: # Get our subprocesses ready and waiting for work
             # Load all the books as quickly as possible
-            parameters = []
-            for BBB,filename in self.USXFilenamesObject.getConfirmedFilenameTuples():
-                parameters.append( BBB )
+            parameters = self.USXFilenamesObject.getConfirmedFilenameTuples() # (BBB,filename) 2-tuples
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "parameters", parameters )
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Loading {} {} books using {} processes…").format( len(parameters), 'USX', BibleOrgSysGlobals.maxProcesses ) )
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( self._loadBookMP, parameters ) # have the pool do our loads
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "results", results )
-                #assert len(results) == len(parameters)
-                for j, UBB in enumerate( results ):
-                    BBB = parameters[j]
-                    #self.books[BBB] = UBB
-                    UBB.containerBibleObject = self # Because the pickling and unpickling messes this up
-                    self.stashBook( UBB )
-                    # Make up our book name dictionaries while we're at it
-                    assumedBookNames = UBB.getAssumedBookNames()
-                    for assumedBookName in assumedBookNames:
-                        self.BBBToNameDict[BBB] = assumedBookName
-                        assumedBookNameLower = assumedBookName.lower()
-                        self.bookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                        self.combinedBookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
-                        if ' ' in assumedBookNameLower: self.combinedBookNameDict[assumedBookNameLower.replace(' ','')] = BBB # Store the deduced book name (lower case without spaces)
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            results = self._loadBooksMP( parameters ) # have the pool do our loads
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "results", results )
+            for j, UBB in enumerate( results ):
+                BBB = parameters[j][0]
+                #self.books[BBB] = UBB
+                self.stashBook( UBB )
+                # Make up our book name dictionaries while we're at it
+                assumedBookNames = UBB.getAssumedBookNames()
+                for assumedBookName in assumedBookNames:
+                    self.BBBToNameDict[BBB] = assumedBookName
+                    assumedBookNameLower = assumedBookName.lower()
+                    self.bookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
+                    self.combinedBookNameDict[assumedBookNameLower] = BBB # Store the deduced book name (just lower case)
+                    if ' ' in assumedBookNameLower: self.combinedBookNameDict[assumedBookNameLower.replace(' ','')] = BBB # Store the deduced book name (lower case without spaces)
         else: # Just single threaded
             for BBB,filename in self.possibleFilenameDict.items():
                 self.loadBook( BBB, filename ) # also saves it
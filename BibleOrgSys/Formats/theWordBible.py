@@ -70,10 +70,10 @@ from BibleOrgSys.Reference.BibleOrganisationalSystems import BibleOrganisational
 from BibleOrgSys.Bible import Bible, BibleBook
 
 
-LAST_MODIFIED_DATE = '2023-06-04' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "theWordBible"
 PROGRAM_NAME = "theWord Bible format handler"
-PROGRAM_VERSION = '0.57'
+PROGRAM_VERSION = '0.58'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -1422,11 +1422,8 @@ def briefDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
                 parameters = [('C'+str(j+1),testFolder,filename) for j,filename in enumerate(sorted(foundFiles))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.starmap( testtWB, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.starmapInWorkers( testtWB, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     indexString = 'C{}'.format( j+1 )
@@ -1448,11 +1445,8 @@ def briefDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
                 parameters = [('D'+str(j+1),testFolder,filename) for j,filename in enumerate(sorted(foundFiles))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.starmap( testtWB, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.starmapInWorkers( testtWB, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     indexString = 'D{}'.format( j+1 )
@@ -1503,11 +1497,8 @@ def fullDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
                 parameters = [('C'+str(j+1),testFolder,filename) for j,filename in enumerate(sorted(foundFiles))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.starmap( testtWB, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.starmapInWorkers( testtWB, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     indexString = 'C{}'.format( j+1 )
@@ -1529,11 +1520,8 @@ def fullDemo() -> None:
             if BibleOrgSysGlobals.maxProcesses > 1: # Get our subprocesses ready and waiting for work
                 vPrint( 'Normal', DEBUGGING_THIS_MODULE, "\nTrying all {} discovered modules…".format( len(foundFolders) ) )
                 parameters = [(f'D{j+1}',testFolder,filename) for j,filename in enumerate(sorted(foundFiles))]
-                BibleOrgSysGlobals.alreadyMultiprocessing = True
-                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                    results = pool.starmap( testtWB, parameters ) # have the pool do our loads
-                    assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                results = BibleOrgSysGlobals.starmapInWorkers( testtWB, parameters ) # have the pool do our loads
+                assert len(results) == len(parameters) # Results (all None) are actually irrelevant to us here
             else: # Just single threaded
                 for j, someFile in enumerate( sorted( foundFiles ) ):
                     indexString = f'D{j+1}'
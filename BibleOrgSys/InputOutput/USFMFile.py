@@ -31,10 +31,14 @@ Module for reading UTF-8 USFM (Unified Standard Format Marker) Bible file.
   The USFM and its data field are read into a 2-tuple and saved (in order) in the list.
 
   Raises an IOError error if file doesn't exist.
+
+CHANGELOG:
+    2025-06-24 Added bulk read (whole file with one compiled regex) as the default for USFMFile.read()
 """
 
 from gettext import gettext as _
 import sys
+import re
 import logging
 
 if __name__ == '__main__':
@@ -46,15 +50,21 @@ from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, LARGE_DUMMY_VALUE
 
 
-LAST_MODIFIED_DATE = '2024-03-10' # by RJH
+LAST_MODIFIED_DATE = '2025-06-24' # by RJH
 SHORT_PROGRAM_NAME = "USFMFile"
 PROGRAM_NAME = "USFM File loader"
-PROGRAM_VERSION = '0.87'
+PROGRAM_VERSION = '0.88'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
 
 
+BULK_READ_FLAG = True # Set to False to force the original line-by-line read
+# Matches every line of a file buffer (in MULTILINE mode) giving
+#   (backslash or '', marker name, closure '*' or '\\*' or '', text)
+#   with the same marker/text split as splitUSFMMarkerFromText() below
+USFM_BUFFER_LINE_REGEX = re.compile( r'^(?:(\\)([^ *\\\n]*)(?: |(\\?\*))?)?(.*)$', re.MULTILINE )
+
 
 def splitUSFMMarkerFromText( line:str ) -> tuple[str|None,str]:
     """
@@ -147,6 +157,9 @@ class USFMFile:
         if ignoreSFMs is None: ignoreSFMs = ()
         if encoding is None: encoding = 'utf-8'
 
+        if BULK_READ_FLAG and self._readBulk( USFMFilepath, ignoreSFMs, encoding ):
+            return
+
         lastLine, lineCount, result = '', 0, []
 
         with open( USFMFilepath, encoding=encoding ) as ourFile: # Automatically closes the file when done
@@ -192,6 +205,55 @@ class USFMFile:
 
             self.lines = result
     # end of USFMFile.read
+
+
+    def _readBulk( self, USFMFilepath:str, ignoreSFMs, encoding:str ) -> bool:
+        """
+        Read the whole file in one go and split all the lines
+            with one compiled regex over the buffer.
+
+        Gives exactly the same list of (marker, text) tuples as the line-by-line code in read().
+
+        Returns False (without changing self.lines) if the file couldn't be decoded
+            so that the line-by-line code can report (and skip) the bad line.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"USFMFile._readBulk( {USFMFilepath=}, {ignoreSFMs=}, {encoding=} )" )
+
+        try:
+            with open( USFMFilepath, encoding=encoding ) as ourFile: # Automatically closes the file when done
+                buffer = ourFile.read()
+        except UnicodeError: return False
+
+        if buffer and buffer[0]==BibleOrgSysGlobals.BOM and encoding.lower()=='utf-8':
+            logging.info( "USFMFile: Detected Unicode Byte Order Marker (BOM) in {}".format( USFMFilepath ) )
+            buffer = buffer[1:] # Remove the Unicode Byte Order Marker (BOM)
+
+        result = []
+        continuations = {} # Index into result -> list of continuation lines (joined at the end rather than concatenating each time)
+        marker = None
+        for lineCount, (backslash, markerName, closure, text) in enumerate( USFM_BUFFER_LINE_REGEX.findall( buffer ), start=1 ):
+            if backslash: # It's a SFM line
+                marker = markerName + closure
+                if marker not in ignoreSFMs:
+                    result.append( (marker, text) )
+            elif text and text[0]!='#': # Not a blank line or comment line, so it's a non-SFM line
+                if not result: # We don't have any SFM data lines yet
+                    if BibleOrgSysGlobals.verbosityLevel > 2:
+                        logging.error( "Non-USFM line in " + str(USFMFilepath) + " -- line ignored at #" + str(lineCount) )
+                    marker = None # Saved without a marker (as the line-by-line code does)
+                    if marker not in ignoreSFMs:
+                        result.append( (marker, text) )
+                elif marker not in ignoreSFMs: # Append this continuation line
+                    try: continuations[len(result)-1].append( text )
+                    except KeyError: continuations[len(result)-1] = [text]
+
+        for ix,continuationLines in continuations.items():
+            oldmarker, oldtext = result[ix]
+            result[ix] = (oldmarker, ' '.join( [oldtext] + continuationLines ))
+
+        self.lines = result
+        return True
+    # end of USFMFile._readBulk
 # end of class USFMFile
 
 
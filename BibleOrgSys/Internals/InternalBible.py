@@ -63,6 +63,26 @@ Note that this software does write some files to
 CHANGELOG:
     2024-01-24 add getContextVerseDataRange() function
     2025-02-13 Changed special characters in getVerseText() function and add includeNonCanonical parameter
+    2025-06-02 Added makeWordIndex() and saveWordIndex() for faster findText() searches
+    2025-06-04 Added trigram index prefilter for findText() regex searches
+    2025-06-05 Added iterFindText() generator (with maxResults and cancelCallback) and made findText() use it
+    2025-06-06 Added parallelFlag to findText() and iterFindText() to search books using multiprocessing
+    2025-06-07 Added makeFoldedCleanTexts() so that caseless/diacritic-insensitive searches don't refold every line
+    2025-06-08 Split out prepareFindTextOptions() and findTextInEntry() so that other classes can answer findText() queries
+    2025-06-12 Added getVerseOrdinalIndex() and getContextVerseDataByOrdinals() and use them for getContextVerseDataRange() across books
+    2025-06-13 Added makeColumnarEntryLists() and getEntryListsMemorySize()
+    2025-06-14 Use marker flag bit tests in findText()
+    2025-06-17 getContextVerseDataByOrdinals() returns an InternalBibleEntryListView (rather than a copy) for a single book
+    2025-06-18 Added optional LRU cache for getContextVerseData() and getVerseText() (see setVerseCacheSize())
+    2025-06-19 Added optional book memory budget which unloads least-recently-used books (see setBookMemoryBudget())
+    2025-06-20 Re-enabled multiprocessing discover() using forked workers which don't need the Bible to be pickled
+    2025-06-21 Added multiprocessing check() (also using forked workers)
+    2025-06-22 Added replaceBookChapterLines() to update a book after a chapter has been edited
+    2025-06-24 Added _loadBooksMP() so that the format loaders don't pickle the whole Bible to and from the worker processes
+    2025-06-25 Use the process-wide worker pool (or BibleOrgSysGlobals.getForkedWorkerPool()) for multiprocessing
+    2025-06-26 Multiprocessing discover() and check() now need parallelFlag to be set
+    2025-06-26 reProcessBook() adjusts the combined word counts (rather than re-aggregating them from every book)
+    2025-06-26 _loadBooksMP() only sends a small payload for each book to the process-wide worker pool (rather than forking)
 """
 from __future__ import annotations # So we can use typing -> ClassName (before Python 3.10)
 from gettext import gettext as _
@@ -70,10 +90,11 @@ import os
 import sys
 import logging
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import re
 import multiprocessing
 import copy
+import weakref
 
 if __name__ == '__main__':
     aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
@@ -81,16 +102,19 @@ if __name__ == '__main__':
         sys.path.insert( 0, aboveAboveFolderpath )
 from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
-from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList, InternalBibleEntry, BOS_EXTRA_TYPES, BOS_EXTRA_MARKERS
+from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList, InternalBibleEntryListView, InternalBibleEntry, BOS_EXTRA_TYPES, BOS_EXTRA_MARKERS, \
+    InternalBibleStringTable, ENTRY_LIST_SIZE_HANDLERS, getMarkerFlags, MARKER_FLAG_PARAGRAPH, MARKER_FLAG_VERSE_TEXT, MARKER_FLAG_END
 from BibleOrgSys.Internals.InternalBibleBook import BCV_VERSION
+from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleVerseOrdinalIndex, InternalBibleVerseCache
+from BibleOrgSys.Internals.InternalBibleSearchIndexes import InternalBibleWordIndex, InternalBibleTrigramIndex, getCompiledRegexLiteralQuery
 from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
 from BibleOrgSys.Reference.BibleBooksCodes import BOOKLIST_OT39, BOOKLIST_NT27
 
 
-LAST_MODIFIED_DATE = '2025-03-22' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "InternalBible"
 PROGRAM_NAME = "Internal Bible handler"
-PROGRAM_VERSION = '0.92'
+PROGRAM_VERSION = '0.99'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -101,6 +125,462 @@ JSON_INDENT = 0 # None gives smallest file (no newlines), then 0, 1, 2, ....
 
 InternalBibleProperties = {} # Used for diagnostic reasons
 
+FIND_TEXT_WORKER_OPTIONS = ( 'wordMode', 'caselessFlag', 'ignoreDiacriticsFlag', 'includeIntroFlag', 'includeMainTextFlag',
+                'includeMarkerTextFlag', 'includeExtrasFlag', 'contextLength', 'chapterList', 'regexFlag', ) # Needed by findTextInEntry()
+
+
+def prepareFindTextOptions( optionsDict:dict, workName:str ) -> tuple[str,re.Pattern|None,list[str]]:
+    """
+    Check the findText() options dictionary and add default options for any missing ones
+        as well as updating the 'findHistoryList'.
+
+    This is also used by other classes which answer findText() queries.
+
+    Returns a 3-tuple with the (adjusted) text to find, the compiled regex (or None), and the standardised marker list.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"prepareFindTextOptions( {optionsDict}, {workName} )" )
+
+    optionsList = ( 'parentWindow', 'parentBox', 'givenBible', 'workName',
+            'findText', 'findHistoryList', 'wordMode', 'caselessFlag', 'ignoreDiacriticsFlag',
+            'includeIntroFlag', 'includeMainTextFlag', 'includeMarkerTextFlag', 'includeExtrasFlag',
+            'contextLength', 'bookList', 'chapterList', 'markerList', 'regexFlag',
+            'currentBCV', )
+    for someKey in optionsDict:
+        if someKey not in optionsList:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "findText warning: unexpected {!r} option = {!r}".format( someKey, optionsDict[someKey] ) )
+            if DEBUGGING_THIS_MODULE: halt
+
+    # Go through all the given options
+    if 'workName' not in optionsDict: optionsDict['workName'] = workName
+    if 'findHistoryList' not in optionsDict: optionsDict['findHistoryList'] = [] # Oldest first
+    if 'wordMode' not in optionsDict: optionsDict['wordMode'] = 'Any' # or 'Whole' or 'EndsWord' or 'Begins' or 'EndsLine'
+    if 'caselessFlag' not in optionsDict: optionsDict['caselessFlag'] = True
+    if 'ignoreDiacriticsFlag' not in optionsDict: optionsDict['ignoreDiacriticsFlag'] = False
+    if 'includeIntroFlag' not in optionsDict: optionsDict['includeIntroFlag'] = True
+    if 'includeMainTextFlag' not in optionsDict: optionsDict['includeMainTextFlag'] = True
+    if 'includeMarkerTextFlag' not in optionsDict: optionsDict['includeMarkerTextFlag'] = False
+    if 'includeExtrasFlag' not in optionsDict: optionsDict['includeExtrasFlag'] = False
+    if 'contextLength' not in optionsDict: optionsDict['contextLength'] = 30 # each side
+    if 'bookList' not in optionsDict: optionsDict['bookList'] = 'ALL' # or BBB or a list
+    if 'chapterList' not in optionsDict: optionsDict['chapterList'] = None
+    if 'markerList' not in optionsDict: optionsDict['markerList'] = None
+    optionsDict['regexFlag'] = False
+
+    if BibleOrgSysGlobals.debugFlag:
+        if optionsDict['chapterList']: assert optionsDict['bookList'] is None or len(optionsDict['bookList']) == 1 \
+                            or optionsDict['chapterList'] == [0] # Only combinations that make sense
+        assert '\r' not in optionsDict['findText'] and '\n' not in optionsDict['findText']
+        assert optionsDict['wordMode'] in ( 'Any', 'Whole', 'Begins', 'EndsWord', 'EndsLine', )
+        if optionsDict['wordMode'] != 'Any': assert ' ' not in optionsDict['findText']
+        if optionsDict['markerList']:
+            assert isinstance( optionsDict['markerList'], list )
+            assert not optionsDict['includeIntroFlag']
+            assert not optionsDict['includeMainTextFlag']
+            assert not optionsDict['includeMarkerTextFlag']
+            assert not optionsDict['includeExtrasFlag']
+
+    ourMarkerList = []
+    if optionsDict['markerList']:
+        for marker in optionsDict['markerList']:
+            ourMarkerList.append( BibleOrgSysGlobals.loadedUSFMMarkers.toStandardMarker( marker ) )
+
+    ourFindText = optionsDict['findText']
+    # Save the search history (with the 'regex:' text still prefixed if applicable)
+    try: optionsDict['findHistoryList'].remove( ourFindText )
+    except ValueError: pass
+    optionsDict['findHistoryList'].append( ourFindText ) # Make sure it goes on the end
+
+    compiledFindText = None
+    if ourFindText.lower().startswith( 'regex:' ):
+        optionsDict['regexFlag'] = True
+        ourFindText = ourFindText[6:]
+        compiledFindText = re.compile( ourFindText )
+    if optionsDict['ignoreDiacriticsFlag']: ourFindText = BibleOrgSysGlobals.removeAccents( ourFindText )
+    if optionsDict['caselessFlag']: ourFindText = ourFindText.lower()
+    searchLen = len( ourFindText )
+    if BibleOrgSysGlobals.debugFlag: assert searchLen
+
+    return ourFindText, compiledFindText, ourMarkerList
+# end of prepareFindTextOptions
+
+
+
+def findTextInEntry( BBB:str, C:str, V:str, lineEntry:InternalBibleEntry, marker:str, cleanText:str,
+                      optionsDict:dict, ourFindText:str, compiledFindText, resultList:list, foldedCleanText:str|None=None ) -> str:
+    """
+    Search a single (already selected) Bible entry for InternalBible.findText()
+        appending any 4-tuple or 5-tuple results to resultList.
+
+    This is used by both the line-by-line scan and the word index search
+        so that they give identical results.
+
+    If foldedCleanText is given, it's the cleanText already adjusted for the caseless and ignoreDiacritics options.
+
+    Returns V (which will have any verse bridge removed if something was found).
+    """
+    # Get our text to search
+    origTextToBeSearched = lineEntry.getFullText() if optionsDict['includeExtrasFlag'] else cleanText
+    if C != '0' and not optionsDict['includeMainTextFlag']:
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got {!r} but  don't include main text".format( origTextToBeSearched ) )
+        if getMarkerFlags( marker ) & (MARKER_FLAG_VERSE_TEXT|MARKER_FLAG_PARAGRAPH):
+            origTextToBeSearched = ''
+            if origTextToBeSearched != cleanText: # we must have extras -- we need to remove the main text
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Got extras" )
+                assert optionsDict['includeExtrasFlag']
+                origTextToBeSearched = ''
+                for extra in lineEntry.getExtras():
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "extra", extra )
+                    extraStart = ''
+                    if optionsDict['includeMarkerTextFlag']:
+                        eTypeIndex = BOS_EXTRA_TYPES.index( extra.getType() )
+                        extraStart = '\\{} '.format( BOS_EXTRA_MARKERS[eTypeIndex] )
+                    origTextToBeSearched += ' ' if origTextToBeSearched else '' + extraStart + extra.getText()
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Now", repr(origTextToBeSearched) )
+    if optionsDict['includeMarkerTextFlag']:
+        origTextToBeSearched = '\\{} {}'.format( marker, origTextToBeSearched )
+    if not origTextToBeSearched: return V
+    if foldedCleanText is not None and origTextToBeSearched is cleanText: # We've already done the work
+        textToBeSearched = foldedCleanText
+    else:
+        textToBeSearched = origTextToBeSearched
+        if optionsDict['ignoreDiacriticsFlag']: textToBeSearched = BibleOrgSysGlobals.removeAccents( textToBeSearched )
+        if optionsDict['caselessFlag']: textToBeSearched = textToBeSearched.lower()
+    textLen = len( textToBeSearched )
+
+    if optionsDict['regexFlag']: # ignores wordMode flag
+        for match in compiledFindText.finditer( textToBeSearched ):
+            ix, ixAfter = match.span()
+
+            if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
+                contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
+                contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
+            else: contextBefore = contextAfter = None
+
+            ixHyphen = V.find( '-' )
+            if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+            resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
+                                                origTextToBeSearched[ix:ixAfter], contextAfter, ) \
+                        if optionsDict['caselessFlag'] else \
+                            (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
+            resultList.append( resultTuple )
+    else: # not regExp
+        searchLen = len( ourFindText )
+        ix = -1
+        while True:
+            ix = textToBeSearched.find( ourFindText, ix+1 )
+            if ix == -1: break
+            ixAfter = ix + searchLen
+            if optionsDict['wordMode'] == 'Whole':
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BF", repr(textToBeSearched[ix-1]) )
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "AF", repr(textToBeSearched[ixAfter]) )
+                if ix>0 and textToBeSearched[ix-1].isalpha(): continue
+                if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
+            elif optionsDict['wordMode'] == 'Begins':
+                if ix>0 and textToBeSearched[ix-1].isalpha(): continue
+            elif optionsDict['wordMode'] == 'EndsWord':
+                if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
+            elif optionsDict['wordMode'] == 'EndsLine':
+                if ixAfter<textLen: continue
+
+            if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
+                contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
+                contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
+            else: contextBefore = contextAfter = None
+
+            ixHyphen = V.find( '-' )
+            if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+            #adjMarker = None if marker=='v~' else marker # most markers are v~ -- ignore them (for space)
+            resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
+                                                origTextToBeSearched[ix:ixAfter], contextAfter, ) \
+                        if optionsDict['caselessFlag'] else \
+                            (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
+            resultList.append( resultTuple )
+
+    return V
+# end of findTextInEntry
+
+
+
+def _iterFindTextInBookEntries( BBB:str, bookEntries, optionsDict:dict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                candidateEntryIndexes:set[int]|None=None, prefilterCounts:dict[str,int]|None=None,
+                                foldedCleanTexts:list[str]|None=None ):
+    """
+    Go through the processed lines of a Bible book
+        and yield the 4-tuple or 5-tuple results for InternalBible.findText().
+
+    If candidateEntryIndexes is given (from a prefilter),
+        only those lines are actually searched (but C:V is still tracked through all of them)
+        and the number of matching lines is added to prefilterCounts.
+
+    If foldedCleanTexts is given, it's a list (parallel to bookEntries) of the cleanTexts
+        already adjusted for the caseless and ignoreDiacritics options.
+    """
+    resultList = []
+    C, V = '-1', '-1' # So first/id line starts at -1:0
+    marker, markerFlags = None, 0
+    for entryIndex,lineEntry in enumerate( bookEntries ):
+        if markerFlags & MARKER_FLAG_PARAGRAPH:
+            lastParagraphMarker = marker
+
+        marker, markerFlags, cleanText = lineEntry.getMarker(), lineEntry.getMarkerFlags(), lineEntry.getCleanText()
+        if markerFlags & MARKER_FLAG_END: continue # we'll always ignore these added lines
+        if marker in ('headers','intro','chapters'): continue # we'll always ignore these added lines
+        if marker == 'c': C, V = cleanText, '0'
+        elif marker == 'v': V = cleanText
+        elif C == '-1' and marker not in ('headers','intro'): V = str( int(V) + 1 )
+        if ourMarkerList:
+            if marker not in ourMarkerList and not (marker in ('v~','p~') and lastParagraphMarker in ourMarkerList):
+                continue
+        elif C=='-1' and not optionsDict['includeIntroFlag']: continue
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Searching in {} {}:{} {} = {}".format( BBB, C, V, marker, cleanText ) )
+
+        if optionsDict['chapterList'] is None \
+        or C in optionsDict['chapterList'] \
+        or int(C) in optionsDict['chapterList']:
+            #if optionsDict['chapterList'] and V=='0':
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  findText: will search {} chapter {}").format( BBB, C ) )
+            if candidateEntryIndexes is not None and entryIndex not in candidateEntryIndexes:
+                continue # the prefilter shows that it can't match
+            V = findTextInEntry( BBB, C, V, lineEntry, marker, cleanText, optionsDict, ourFindText, compiledFindText, resultList,
+                                    None if foldedCleanTexts is None else foldedCleanTexts[entryIndex] )
+            if resultList:
+                if candidateEntryIndexes is not None: prefilterCounts['numMatchedLines'] += 1
+                yield from resultList
+                resultList.clear()
+# end of _iterFindTextInBookEntries
+
+
+
+def _findTextInBookMP( parameters ) -> tuple[list[tuple],int]:
+    """
+    Multiprocessing version!
+    Search one Bible book for InternalBible.findText().
+
+    Parameter is an 8-tuple containing BBB, the book entries, the (reduced) optionsDict,
+        ourFindText, compiledFindText, ourMarkerList, and any candidateEntryIndexes and foldedCleanTexts.
+
+    Returns a list of the results, and the number of matched lines (for the prefilter statistics).
+        To save pickling time, the SimpleVerseKey in each result is replaced by a (C,V,I) tuple.
+    """
+    BBB, bookEntries, optionsDict, ourFindText, compiledFindText, ourMarkerList, candidateEntryIndexes, foldedCleanTexts = parameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"_findTextInBookMP( {BBB}, {len(bookEntries)} entries, {ourFindText!r} )" )
+    if not BibleOrgSysGlobals.USFMParagraphMarkers: # Might not be set if processes are spawned rather than forked
+        BibleOrgSysGlobals.preloadCommonData()
+
+    prefilterCounts = { 'numMatchedLines':0 }
+    bookResults = [ (resultTuple[0].getCVI(),) + resultTuple[1:] \
+                    for resultTuple in _iterFindTextInBookEntries( BBB, bookEntries, optionsDict, ourFindText, compiledFindText,
+                                                                    ourMarkerList, candidateEntryIndexes, prefilterCounts, foldedCleanTexts ) ]
+    return bookResults, prefilterCounts['numMatchedLines']
+# end of _findTextInBookMP
+
+
+forkedBibleObject = None # Set (just before forking the worker processes) by InternalBible._discoverBooksMP() and _checkBooksMP()
+forkedTypicalAddedUnitData = None # Set (just before forking the worker processes) by InternalBible._checkBooksMP()
+
+
+# The (small) attributes of the Bible which are sent to the worker processes by InternalBible._loadBooksMP()
+#   (if the Bible has them) -- formats which need more add them in their own _getBookLoaderSettings()
+BOOK_LOADER_ATTRIBUTE_NAMES = ( 'name', 'givenName', 'shortName', 'projectName', 'abbreviation',
+                                'sourceFilename', 'sourceFilepath', 'objectNameString', 'objectTypeString',
+                                'doExtraChecking', 'preloadDone', 'settingsDict', 'uWencoded', )
+
+def _loadBookFromPayloadMP( bookLoadPayload:tuple ):
+    """
+    Multiprocessing version!
+    Load one book in a worker process from the payload made by InternalBible._loadBooksMP(),
+        i.e., (BibleClass, sourceFolder, BBB, filename, encoding, bookLoaderSettings).
+
+    An empty Bible of the right class is made without running its __init__() (which might scan the folder again),
+        given the settings, and then its (format-specific) _loadBookMP() is called
+        with (BBB,filename) if a filename was given, else just with BBB.
+
+    The book is sent back without its containerBibleObject (which the parent process puts back).
+    """
+    BibleClass, sourceFolder, BBB, filename, encoding, bookLoaderSettings = bookLoadPayload
+    fnPrint( DEBUGGING_THIS_MODULE, f"_loadBookFromPayloadMP( {BibleClass.__name__}, {sourceFolder}, {BBB}, {filename}, {encoding} )" )
+
+    bookLoader = BibleClass.__new__( BibleClass )
+    InternalBible.__init__( bookLoader )
+    for attributeName in ( 'verseCache', 'bookMemoryBudget', ): # Not needed just to load a book
+        bookLoader.__dict__.pop( attributeName, None )
+    bookLoader.__dict__.update( bookLoaderSettings )
+    bookLoader.sourceFolder, bookLoader.encoding = sourceFolder, encoding
+
+    bookObject = bookLoader._loadBookMP( BBB if filename is None else (BBB,filename) )
+    if bookObject is not None:
+        bookObject.containerBibleObject = None # The parent process puts it back
+    return bookObject
+# end of _loadBookFromPayloadMP
+
+
+def _discoverBookMP( BBB:str ) -> dict:
+    """
+    Multiprocessing version!
+    Run the discover on one book of the Bible which the forked worker process inherited from InternalBible.discover().
+
+    Only the BBB is sent to the worker (the Bible itself is shared copy-on-write, not pickled)
+        and only the book discovery dictionary is sent back.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_discoverBookMP( {BBB} )" )
+    return forkedBibleObject.books[BBB]._discover()
+# end of _discoverBookMP
+
+
+def _checkBookMP( BBB:str ) -> dict:
+    """
+    Multiprocessing version!
+    Run the checks on one book of the Bible which the forked worker process inherited from InternalBible.check().
+
+    Only the BBB is sent to the worker (the Bible itself is shared copy-on-write, not pickled)
+        and only the book check results dictionary is sent back.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_checkBookMP( {BBB} )" )
+    bookObject = forkedBibleObject.books[BBB]
+    bookObject.checkBook( forkedBibleObject.discoveryResults['ALL'], forkedTypicalAddedUnitData )
+    return bookObject.checkResultsDictionary
+# end of _checkBookMP
+
+
+
+class InternalBibleBookMemoryBudget:
+    """
+    Keeps track of the approximate memory used by the loaded books of one or more InternalBibles
+        and unloads the least-recently-used books whenever the total exceeds the budget.
+
+    Unloaded books are flagged as needing reloading
+        so that loadBookIfNecessary() transparently reloads them when they're next accessed.
+
+    Only books from Bibles which can load individual books (i.e., have a loadBook() function)
+        are included, because other books can't be reloaded.
+    """
+    __slots__ = ('maxBytes','processWideFlag','_residentBooks','_unloadedBooks',
+                 'totalBytes','numEvictions','numReloads') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, maxBytes:int, processWideFlag:bool=False ) -> None:
+        """
+        Creates an empty memory budget of maxBytes.
+        """
+        assert maxBytes > 0
+        self.maxBytes, self.processWideFlag = maxBytes, processWideFlag
+        self._residentBooks:OrderedDict[tuple[int,str],tuple[weakref.ref,int]] = OrderedDict() # Least recently used first
+        self._unloadedBooks:set[tuple[int,str]] = set()
+        self.totalBytes = self.numEvictions = self.numReloads = 0
+    # end of InternalBibleBookMemoryBudget.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the budget.
+        """
+        return f"InternalBibleBookMemoryBudget object{' (process-wide)' if self.processWideFlag else ''}: {self.totalBytes:,}/{self.maxBytes:,} bytes in {len(self._residentBooks)} books ({self.numEvictions:,} evictions, {self.numReloads:,} reloads)"
+    # end of InternalBibleBookMemoryBudget.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self._residentBooks )
+
+
+    def __reduce__( self ): # Don't pickle the (weak) references to the resident books
+        return (getProcessBookMemoryBudget, ()) if self.processWideFlag else (InternalBibleBookMemoryBudget, (self.maxBytes,))
+
+
+    def noteBookUsed( self, BibleObject, BBB:str ) -> None:
+        """
+        Marks the book as the most recently used one.
+        """
+        try: self._residentBooks.move_to_end( (id(BibleObject),BBB) )
+        except KeyError: pass # Not one of ours
+    # end of InternalBibleBookMemoryBudget.noteBookUsed
+
+
+    def noteBookLoaded( self, BibleObject, BBB:str, numBytes:int ) -> None:
+        """
+        Adds the newly (re)loaded book (of approximately numBytes)
+            and then unloads other books if we're now over budget.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookMemoryBudget.noteBookLoaded( {BibleObject.getAName( abbrevFirst=True )}, {BBB}, {numBytes:,} )" )
+
+        bookKey = (id(BibleObject), BBB)
+        self.forgetBook( BibleObject, BBB ) # in case it was already here
+        if bookKey in self._unloadedBooks:
+            self._unloadedBooks.discard( bookKey )
+            self.numReloads += 1
+        self._residentBooks[bookKey] = (weakref.ref( BibleObject ), numBytes)
+        self.totalBytes += numBytes
+        self._unloadBooksIfNecessary()
+    # end of InternalBibleBookMemoryBudget.noteBookLoaded
+
+
+    def forgetBook( self, BibleObject, BBB:str ) -> None:
+        """
+        Stops tracking the given book (if we were).
+        """
+        try: _BibleRef, numBytes = self._residentBooks.pop( (id(BibleObject),BBB) )
+        except KeyError: return
+        self.totalBytes -= numBytes
+    # end of InternalBibleBookMemoryBudget.forgetBook
+
+
+    def setMaxBytes( self, maxBytes:int ) -> None:
+        """
+        Changes the budget, unloading books if necessary.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookMemoryBudget.setMaxBytes( {maxBytes:,} )" )
+        assert maxBytes > 0
+
+        self.maxBytes = maxBytes
+        self._unloadBooksIfNecessary()
+    # end of InternalBibleBookMemoryBudget.setMaxBytes
+
+
+    def _unloadBooksIfNecessary( self ) -> None:
+        """
+        Unloads the least recently used books until we're within the budget
+            (but never the most recently used book, even if it's bigger than the budget by itself).
+        """
+        while self.totalBytes > self.maxBytes and len(self._residentBooks) > 1:
+            bookKey, (BibleRef, numBytes) = self._residentBooks.popitem( last=False )
+            self.totalBytes -= numBytes
+            BibleObject = BibleRef()
+            if BibleObject is not None: # the Bible hasn't been deleted
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"Unloading {bookKey[1]} ({numBytes:,} bytes) from {BibleObject.getAName( abbrevFirst=True )} to stay within {self.maxBytes:,} byte memory budget" )
+                BibleObject.unloadBook( bookKey[1] )
+                self._unloadedBooks.add( bookKey )
+                self.numEvictions += 1
+    # end of InternalBibleBookMemoryBudget._unloadBooksIfNecessary
+
+
+    def getStatistics( self ) -> dict[str,int]:
+        """
+        Returns a dictionary of the budget statistics.
+        """
+        return { 'maxBytes':self.maxBytes, 'totalBytes':self.totalBytes, 'numResidentBooks':len(self._residentBooks),
+                'numEvictions':self.numEvictions, 'numReloads':self.numReloads,
+                }
+    # end of InternalBibleBookMemoryBudget.getStatistics
+# end of class InternalBibleBookMemoryBudget
+
+
+processBookMemoryBudget = None
+
+def getProcessBookMemoryBudget() -> InternalBibleBookMemoryBudget|None:
+    """
+    Returns the memory budget shared by all InternalBibles in this process
+        (made from BibleOrgSysGlobals.bookMemoryBudget when first needed)
+        or None if there's no process-wide budget.
+    """
+    global processBookMemoryBudget
+    if processBookMemoryBudget is None and BibleOrgSysGlobals.bookMemoryBudget:
+        processBookMemoryBudget = InternalBibleBookMemoryBudget( BibleOrgSysGlobals.bookMemoryBudget, processWideFlag=True )
+    return processBookMemoryBudget
+# end of getProcessBookMemoryBudget
+
+
+
 class InternalBible:
     """
     Class to define and manipulate InternalBibles.
@@ -138,6 +618,10 @@ class InternalBible:
         self.divisions = {}
         self.checkResultsDictionary = {}
         self.checkResultsDictionary['Priority Errors'] = [] # Put this one first in the ordered dictionary
+        if BibleOrgSysGlobals.verseCacheSize: # See setVerseCacheSize()
+            self.verseCache = InternalBibleVerseCache( BibleOrgSysGlobals.verseCacheSize )
+        if BibleOrgSysGlobals.bookMemoryBudget: # See setBookMemoryBudget()
+            self.bookMemoryBudget = getProcessBookMemoryBudget()
     # end of InternalBible.__init__
 
 
@@ -404,9 +888,71 @@ class InternalBible:
             self.bookNeedsReloading[BBB] = False
         else: # didn't try loading the book
             dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"loadBookIfNecessary NOLOAD: {BBB} in_self.books={BBB in self.books} triedLoadingBook={BBB in self.triedLoadingBook} bookNeedsReloading={BBB in self.bookNeedsReloading} {self.bookNeedsReloading[BBB] if BBB in self.bookNeedsReloading else 'NONE'}" )
+            if 'bookMemoryBudget' in self.__dict__:
+                self.bookMemoryBudget.noteBookUsed( self, BBB )
     # end of InternalBible.loadBookIfNecessary
 
 
+    def unloadBook( self, BBB:str ) -> None:
+        """
+        Removes a loaded book from memory (e.g., to stay within the book memory budget)
+            and flags it as needing reloading
+            so that loadBookIfNecessary() will transparently reload it when it's next accessed.
+
+        NOTE: Any unsaved changes to the book are lost.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.unloadBook( {BBB} )" )
+
+        if BBB not in self.books: return
+        del self.books[BBB]
+        self.bookNeedsReloading[BBB] = True
+        self.loadedAllBooks = False
+        if 'verseCache' in self.__dict__: # the cached results refer to the book entries
+            self.verseCache.invalidateBook( BBB )
+        if 'bookMemoryBudget' in self.__dict__:
+            self.bookMemoryBudget.forgetBook( self, BBB )
+    # end of InternalBible.unloadBook
+
+
+    def setBookMemoryBudget( self, maxBytes:int, processWideFlag:bool=False ) -> None:
+        """
+        Sets the approximate maximum number of bytes to be used by the processed lines of the loaded books.
+            When the budget is exceeded, the least recently used books are unloaded
+            (and then transparently reloaded by loadBookIfNecessary() if they're needed again).
+
+        If processWideFlag is set, the budget is shared by all InternalBibles in this process
+            which have also set it (or which were created when BibleOrgSysGlobals.bookMemoryBudget was set).
+
+        A maxBytes of zero removes this Bible from the budget (so books are never unloaded).
+
+        NOTE: Only books loaded after this call are included.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.setBookMemoryBudget( {maxBytes:,}, {processWideFlag=} ) for {self.getAName()}" )
+
+        if 'bookMemoryBudget' in self.__dict__:
+            for BBB in self.books:
+                self.bookMemoryBudget.forgetBook( self, BBB )
+            del self.bookMemoryBudget
+        if maxBytes > 0:
+            if processWideFlag:
+                global processBookMemoryBudget
+                if processBookMemoryBudget is None:
+                    processBookMemoryBudget = InternalBibleBookMemoryBudget( maxBytes, processWideFlag=True )
+                else: processBookMemoryBudget.setMaxBytes( maxBytes )
+                self.bookMemoryBudget = processBookMemoryBudget
+            else: self.bookMemoryBudget = InternalBibleBookMemoryBudget( maxBytes )
+    # end of InternalBible.setBookMemoryBudget
+
+
+    def getBookMemoryStatistics( self ) -> dict[str,int]|None:
+        """
+        Returns the statistics (including the number of evictions and reloads) of the book memory budget
+            or None if there's no budget.
+        """
+        return self.bookMemoryBudget.getStatistics() if 'bookMemoryBudget' in self.__dict__ else None
+    # end of InternalBible.getBookMemoryStatistics
+
+
     def reloadBook( self, BBB:str ):
         """
         Tries to load or reload a book (perhaps because we changed it on disk).
@@ -437,12 +983,60 @@ class InternalBible:
             #if BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("reloadBook has no discoveryResults to delete") )
 
         if 'discoveryResults' in self.__dict__: # need to update them
-            # Need to double-check that this doesn't cause any double-ups …XXXXXXXXXXXXXXXXXXXXXX
-            self.discoveryResults[BBB] = self.books[BBB]._discover()
-            self.__aggregateDiscoveryResults()
+            oldBookResults = self.discoveryResults.get( BBB )
+            self.discoveryResults[BBB] = newBookResults = self.books[BBB]._discover()
+            if oldBookResults is not None and 'ALL' in self.discoveryResults:
+                # Adjust the (large) combined word count dictionaries rather than remaking them from every book
+                allResults = self.discoveryResults['ALL']
+                for key in set( oldBookResults ) | set( newBookResults ):
+                    if not key.endswith( 'WordCounts' ): continue
+                    allWordCounts = allResults.setdefault( key, {} )
+                    for word,count in oldBookResults.get( key, {} ).items():
+                        newCount = allWordCounts[word] - count
+                        if newCount: allWordCounts[word] = newCount
+                        else: del allWordCounts[word]
+                    for word,count in newBookResults.get( key, {} ).items():
+                        allWordCounts[word] = allWordCounts.get( word, 0 ) + count
+                self.__aggregateDiscoveryResults( aggregateWordCounts=False )
+            else: self.__aggregateDiscoveryResults()
+
+        if 'wordIndex' in self.__dict__ and self.wordIndex is not None: # it's now out-of-date for this book
+            self.wordIndex.invalidateBook( BBB ) # (It'll be automatically remade when next used)
+        if 'trigramIndex' in self.__dict__:
+            self.trigramIndex.invalidateBook( BBB )
+        if 'verseOrdinalIndex' in self.__dict__: # all the following ordinals might have changed
+            del self.verseOrdinalIndex # (It'll be automatically remade when next used)
+        if 'verseCache' in self.__dict__:
+            self.verseCache.invalidateBook( BBB )
     # end of InternalBible.reProcessBook
 
 
+    def replaceBookChapterLines( self, BBB:str, C:str, newRawLines:list[tuple[str,str]] ) -> bool:
+        """
+        Replace chapter C of the given book with the given raw (marker,text) 2-tuples
+            (starting with the 'c' line and going up to, but not including, the next 'c' line)
+            which is much faster than reloading or reprocessing the whole book after an edit.
+
+        See InternalBibleBook.replaceChapterLines() for the details.
+
+        Returns True if successful,
+            or False (and the book is unchanged) if it couldn't be done this way,
+                in which case the book should be reloaded.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.replaceBookChapterLines( {BBB}, {C}, ({len(newRawLines)}) )" )
+        self.loadBookIfNecessary( BBB )
+        bookObject = self.books[BBB]
+        hadSectionIndex = bookObject._indexedSectionsFlag
+        if not bookObject.replaceChapterLines( C, newRawLines ):
+            return False
+
+        self.reProcessBook( BBB )
+        if hadSectionIndex and not bookObject._indexedSectionsFlag and 'discoveryResults' in self.__dict__:
+            bookObject._makeBookSectionIndex() # Remake it (now that the discovery results are up-to-date)
+        return True
+    # end of InternalBible.replaceBookChapterLines
+
+
     def doPostLoadProcessing( self ):
         """
         This method should be called once all books are loaded to do critical book-keeping.
@@ -965,6 +1559,12 @@ class InternalBible:
                 logging.critical( _("stashBook: stashing already stashed {} book!").format( BBB ) )
         self.books[BBB] = bookData
         self.availableBBBs.add( BBB )
+        if 'verseCache' in self.__dict__: # in case we're replacing an earlier copy of the book
+            self.verseCache.invalidateBook( BBB )
+        if 'bookMemoryBudget' in self.__dict__ and callable( getattr( self, 'loadBook', None ) ): # we can reload it if we need to
+            self.bookMemoryBudget.noteBookLoaded( self, BBB,
+                    BibleOrgSysGlobals.totalSize( bookData._processedLines, handlers=ENTRY_LIST_SIZE_HANDLERS ) if bookData._processedFlag
+                        else BibleOrgSysGlobals.totalSize( bookData._rawLines ) )
 
         # Make up our book name dictionaries while we're at it
         assumedBookNames = bookData.getAssumedBookNames()
@@ -977,6 +1577,59 @@ class InternalBible:
     # end of InternalBible.stashBook
 
 
+    def _loadBooksMP( self, loadParameters:list ) -> list:
+        """
+        Multiprocessing version!
+
+        Calls our (format-specific) _loadBookMP( loadParameter ) for each of the given parameters
+            (either BBB or a (BBB,filename) 2-tuple) in the process-wide pool of worker processes
+            and returns the list of loaded books (or None where _loadBookMP returned None) in the same order.
+            Each book has its containerBibleObject set back to us, but isn't stashed yet.
+
+        Rather than pickling the Bible (with any books that are already loaded) into the tasks,
+            each task only gets a small payload (see _getBookLoadPayload()) from which the worker makes a book loader,
+            and the books are sent back without the Bible attached.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible._loadBooksMP( {len(loadParameters)} ) for {self.getAName()}" )
+
+        bookLoaderSettings = self._getBookLoaderSettings() # Only made once (and so only pickled once for each chunk of tasks)
+        bookLoadPayloads = []
+        for loadParameter in loadParameters:
+            BBB, filename = loadParameter if isinstance( loadParameter, tuple ) else (loadParameter, None)
+            bookLoadPayloads.append( self._getBookLoadPayload( BBB, filename, bookLoaderSettings ) )
+        results = BibleOrgSysGlobals.mapInWorkers( _loadBookFromPayloadMP, bookLoadPayloads ) # have the pool do our loads
+        assert len(results) == len(loadParameters)
+
+        for bookObject in results:
+            if bookObject is not None:
+                bookObject.containerBibleObject = self # Because the pickling and unpickling messes this up
+        return results
+    # end of InternalBible._loadBooksMP
+
+
+    def _getBookLoadPayload( self, BBB:str, filename:str|None=None, bookLoaderSettings:dict|None=None ) -> tuple:
+        """
+        Returns the (BibleClass, sourceFolder, BBB, filename, encoding, bookLoaderSettings) tuple
+            which is all that a worker process needs to load the book (see _loadBookFromPayloadMP()).
+        """
+        if bookLoaderSettings is None: bookLoaderSettings = self._getBookLoaderSettings()
+        return ( type(self), self.sourceFolder, BBB, filename, self.encoding, bookLoaderSettings )
+    # end of InternalBible._getBookLoadPayload
+
+
+    def _getBookLoaderSettings( self ) -> dict:
+        """
+        Returns a dictionary of the small attributes (see BOOK_LOADER_ATTRIBUTE_NAMES)
+            which a worker process needs to load one of our books.
+
+        Formats whose _loadBookMP() (or books) need other attributes override this
+            and add them to the dictionary.
+        """
+        return { attributeName:self.__dict__[attributeName] for attributeName in BOOK_LOADER_ATTRIBUTE_NAMES
+                                                            if attributeName in self.__dict__ }
+    # end of InternalBible._getBookLoaderSettings
+
+
     def pickle( self, filename:str=None, folderpath=None ) -> bool:
         """
         Writes the object to a .pickle file that can be easily loaded into a Python3 program.
@@ -1004,6 +1657,8 @@ class InternalBible:
         except AttributeError: pass
         try: del self.genericBOS # This is unpicklable for some reason
         except AttributeError: pass
+        if 'verseCache' in self.__dict__: # No need to save the cached results
+            self.verseCache.clear()
             # CRITICAL: BibleOrgSysGlobals: Unexpected error in pickleObject: <class '_pickle.PicklingError'> Can't pickle <class 'BibleOrgSys.Reference.BibleBooksNames.BibleBooksNamesSystems'>: it's not the same object as BibleOrgSys.Reference.BibleBooksNames.BibleBooksNamesSystems
             # CRITICAL: Can't pickle badAttribute='books' when pickling <class 'dict'> from <class 'BibleOrgSys.Formats.ZefaniaXMLBible.ZefaniaXMLBible'>
             # CRITICAL: Can't pickle badAttribute='genericBOS' when pickling <class 'BibleOrgSys.Reference.BibleOrganisationalSystems.BibleOrganisationalSystem'> from <class 'BibleOrgSys.Formats.ZefaniaXMLBible.ZefaniaXMLBible'>
@@ -1211,37 +1866,16 @@ class InternalBible:
     # end of InternalBible.getAddedUnits
 
 
-    """ The following is disabled until we solve this:
- File "/srv/Documents/FreelyGiven/OpenBibleData/createPages/../../BibleOrgSys/BibleOrgSys/Internals/InternalBible.py", line 1239, in discover
-    results = pool.map( self._discoverBookMP, [BBB for BBB in self.books] ) # have the pool do our loads
-              ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-  File "/usr/local/lib/python3.12/multiprocessing/pool.py", line 367, in map
-    return self._map_async(func, iterable, mapstar, chunksize).get()
-           ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-  File "/usr/local/lib/python3.12/multiprocessing/pool.py", line 774, in get
-    raise self._value
-  File "/usr/local/lib/python3.12/multiprocessing/pool.py", line 540, in _handle_tasks
-    put(task)
-  File "/usr/local/lib/python3.12/multiprocessing/connection.py", line 205, in send
-    self._send_bytes(_ForkingPickler.dumps(obj))
-                     ^^^^^^^^^^^^^^^^^^^^^^^^^^
-  File "/usr/local/lib/python3.12/multiprocessing/reduction.py", line 51, in dumps
-    cls(buf, protocol).dump(obj)
-_pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksNames.BibleBooksNamesSystems'>: it's not the same object as BibleOrgSys.Reference.BibleBooksNames.BibleBooksNamesSystems
-    """
-    # def _discoverBookMP( self, BBB:str ):
-    #     """
-    #     """
-    #     # TODO: Make this a lambda function
-    #     return self.books[BBB]._discover()
-    # # end of _discoverBookMP
-
-    def discover( self ) -> None:
+    def discover( self, parallelFlag:bool=False ) -> None:
         """
         Runs a series of checks and count on each book of the Bible
             in order to try to determine what are the normal standards.
+
+        If parallelFlag is set (and BibleOrgSysGlobals.maxProcesses > 1),
+            the books are done in forked worker processes (where available).
+            That's off by default because it has only been timed on a single CPU (where it's slower).
         """
-        fnPrint( DEBUGGING_THIS_MODULE, "InternalBible:discover()" )
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible:discover( {parallelFlag} )" )
         if 'discoveryResults' in self.__dict__:
             logging.warning( _("discover: We had done this already!") )
             if DEBUGGING_THIS_MODULE: halt
@@ -1257,23 +1891,16 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         #    typicalAddedUnits = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
 
         vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Running discover on {}…").format( self.name ) )
-        # NOTE: We can't pickle sqlite3.Cursor objects so can not use multiprocessing here for e-Sword Bibles or commentaries
-        # NOTE: Multiprocessing discover is considerably slower, hence disabled
+        # NOTE: The old multiprocessing discover (which had to pickle the entire Bible for every book) was considerably slower
         #           68 books 12 sec, but multithreaded 16s using 67s of processing!!!
-        # if self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible') \
-        # and BibleOrgSysGlobals.maxProcesses > 1 \
-        # and not BibleOrgSysGlobals.alreadyMultiprocessing: # Check all the books as quickly as possible
-        #     BibleOrgSysGlobals.alreadyMultiprocessing = True
-        #     vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Prechecking/“discover” {} books using {} processes…").format( len(self.books), BibleOrgSysGlobals.maxProcesses ) )
-        #     vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
-        #     with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-        #         results = pool.map( self._discoverBookMP, [BBB for BBB in self.books] ) # have the pool do our loads
-        #         assert len(results) == len(self.books)
-        #         for j,BBB in enumerate( self.books ):
-        #             self.discoveryResults[BBB] = results[j] # Saves them in the correct order
-        #     BibleOrgSysGlobals.alreadyMultiprocessing = False
-        # else: # Just single threaded
-        if 1: # Just single threaded
+        #       so now the worker processes are forked instead (and so only the BBB and the results are pickled)
+        if parallelFlag and BibleOrgSysGlobals.maxProcesses > 1 \
+        and len(self.books) > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing \
+        and 'fork' in multiprocessing.get_all_start_methods() \
+        and self._discoverBooksMP(): # Checked all the books as quickly as possible
+            pass
+        else: # Just single threaded
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, " " + _(f"Prechecking {self.getAName( abbrevFirst=True )} in single-threaded mode!") )
             for BBB in self.books: # Do individual book prechecks
                 vPrint( 'Info', DEBUGGING_THIS_MODULE, "  " + _("Prechecking {}…").format( BBB ) )
@@ -1289,15 +1916,56 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
     # end of InternalBible.discover
 
 
-    def __aggregateDiscoveryResults( self ):
+    def _discoverBooksMP( self ) -> bool:
+        """
+        Multiprocessing version!
+
+        Runs the discover on our books in forked worker processes
+            (which inherit the loaded Bible copy-on-write rather than having it pickled for them)
+            and saves the results (in our book order) into self.discoveryResults.
+
+        Returns False (without doing anything) if the worker processes can't be forked right now
+            (see BibleOrgSysGlobals.getForkedWorkerPool()).
+
+        The biggest books are sent out first so that the workers finish at about the same time.
+        """
+        global forkedBibleObject
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible._discoverBooksMP() for {self.getAName()}" )
+
+        for bookObject in self.books.values(): # Process them first, else each worker would do it (and then lose it)
+            if not bookObject._processedFlag:
+                bookObject.processLines()
+        discoverBBBs = sorted( self.books, key=lambda BBB: len(self.books[BBB]._processedLines), reverse=True )
+
+        numProcesses = min( len(discoverBBBs), BibleOrgSysGlobals.maxProcesses )
+        forkedBibleObject = self # Must be set before forking
+        try:
+            pool = BibleOrgSysGlobals.getForkedWorkerPool( numProcesses ) # start worker processes
+            if pool is None: return False
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Prechecking/“discover” {} books using {} processes…").format( len(discoverBBBs), numProcesses ) )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
+            with pool:
+                bookResultsDict = dict( zip( discoverBBBs, pool.imap( _discoverBookMP, discoverBBBs ) ) )
+        finally: forkedBibleObject = None
+        for BBB in self.books: # Save them in the correct order
+            self.discoveryResults[BBB] = bookResultsDict[BBB]
+        return True
+    # end of InternalBible._discoverBooksMP
+
+
+    def __aggregateDiscoveryResults( self, aggregateWordCounts:bool=True ):
         """
         Assuming that the individual discoveryResults have been collected for each book,
             puts them all together.
+
+        If aggregateWordCounts is False, the word count dictionaries in the existing 'ALL' results
+            are kept (because the caller has already updated them).
         """
-        fnPrint( DEBUGGING_THIS_MODULE, "InternalBible:__aggregateDiscoveryResults()" )
-        aggregateResults = {}
-        if BibleOrgSysGlobals.debugFlag: assert 'ALL' not in self.discoveryResults
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible:__aggregateDiscoveryResults( {aggregateWordCounts} )" )
+        aggregateResults = {} if aggregateWordCounts else \
+                            { key:value for key,value in self.discoveryResults['ALL'].items() if key.endswith( 'WordCounts' ) }
         for BBB in self.discoveryResults:
+            if BBB == 'ALL': continue # We're remaking these (after a book was reprocessed)
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "discoveryResults for", BBB, len(self.discoveryResults[BBB]), self.discoveryResults[BBB] )
             isOT = isNT = isDC = False
             if isOT:
@@ -1373,6 +2041,7 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
                 elif key == 'uniqueWordCount': pass # Makes no sense to aggregate this
                 elif key.endswith( 'WordCounts' ): # We need to combine these word count dictionaries
                     #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "wcGot", BBB, key )
+                    if not aggregateWordCounts: continue # Already done
                     if key not in aggregateResults: aggregateResults[key] = {}
                     assert isinstance( value, dict )
                     for word in value:
@@ -1510,17 +2179,14 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         # NOTE: Multiprocessing index build is considerably slower, hence disabled
         if 0 and BibleOrgSysGlobals.maxProcesses > 1 \
         and not BibleOrgSysGlobals.alreadyMultiprocessing:
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Making section index for {} books using {} processes…").format( len(self.books), BibleOrgSysGlobals.maxProcesses ) )
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( self._makeBookSectionIndexMP, [BBB for BBB in self.books] ) # have the pool do our loads
-                assert len(results) == len(self.books)
-                for j,BBB in enumerate( self.books ):
-                    self.sectionIndex[BBB] = results[j] # Saves them in the correct order
-                assert len(self.sectionIndex) == len(self.books)
+            results = BibleOrgSysGlobals.mapInWorkers( self._makeBookSectionIndexMP, [BBB for BBB in self.books] ) # have the pool do our loads
+            assert len(results) == len(self.books)
+            for j,BBB in enumerate( self.books ):
+                self.sectionIndex[BBB] = results[j] # Saves them in the correct order
+            assert len(self.sectionIndex) == len(self.books)
             # assert len(self.books) == 68
-            BibleOrgSysGlobals.alreadyMultiprocessing = False
         else: # Just single threaded
             from BibleOrgSys.Bible import Bible
             #dPrint( 'Info', DEBUGGING_THIS_MODULE, "makeSectionIndex2", id(self) )
@@ -1536,7 +2202,7 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
     # end of InternalBible.makeSectionIndex()
 
 
-    def check( self, givenBookList=None ):
+    def check( self, givenBookList=None, parallelFlag:bool=False ):
         """
         Runs self.discover() first if necessary.
 
@@ -1545,13 +2211,17 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
 
         If a book list is given, only checks those books.
 
+        If parallelFlag is set (and BibleOrgSysGlobals.maxProcesses > 1),
+            the books are checked in forked worker processes (where available).
+            That's off by default because it has only been timed on a single CPU (where it's slower).
+
         getCheckResults() must be called to request the results.
         """
         # Get our recommendations for added units -- only load this once per Bible
         if BibleOrgSysGlobals.verbosityLevel > 1:
             if givenBookList is None: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Checking {} Bible…").format( self.name ) )
             else: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("Checking {} Bible books {}…").format( self.name, givenBookList ) )
-        if 'discoveryResults' not in self.__dict__: self.discover()
+        if 'discoveryResults' not in self.__dict__: self.discover( parallelFlag )
 
         import pickle
         pickleFolder = os.path.join( os.path.dirname(__file__), 'DataFiles/', 'ScrapedFiles/' ) # Relative to module, not cwd
@@ -1568,15 +2238,59 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Running checks on {}…").format( self.name ) )
         if givenBookList is None:
             givenBookList = self.books.keys()
-        for BBB in givenBookList: # Do individual book checks
-            vPrint( 'Info', DEBUGGING_THIS_MODULE, "  " + _("Checking {}…").format( BBB ) )
-            self.books[BBB].checkBook( self.discoveryResults['ALL'], typicalAddedUnitData )
+        if parallelFlag and BibleOrgSysGlobals.maxProcesses > 1 \
+        and len(givenBookList) > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing \
+        and 'fork' in multiprocessing.get_all_start_methods() \
+        and self._checkBooksMP( givenBookList, typicalAddedUnitData ): # Checked all the books as quickly as possible
+            pass
+        else: # Just single threaded
+            for BBB in givenBookList: # Do individual book checks
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, "  " + _("Checking {}…").format( BBB ) )
+                self.books[BBB].checkBook( self.discoveryResults['ALL'], typicalAddedUnitData )
 
         # Do overall Bible checks here
         # xxxxxxxxxxxxxxxxx …
     # end of InternalBible.check
 
 
+    def _checkBooksMP( self, givenBookList, typicalAddedUnitData ) -> bool:
+        """
+        Multiprocessing version!
+
+        Runs the individual book checks in forked worker processes
+            (which inherit the loaded Bible copy-on-write rather than having it pickled for them)
+            and saves each returned check results dictionary back into its book
+            (so that getCheckResults() and makeErrorHTML() work as usual).
+
+        Returns False (without doing anything) if the worker processes can't be forked right now
+            (see BibleOrgSysGlobals.getForkedWorkerPool()).
+
+        The biggest books are sent out first so that the workers finish at about the same time.
+        """
+        global forkedBibleObject, forkedTypicalAddedUnitData
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible._checkBooksMP( {givenBookList} ) for {self.getAName()}" )
+
+        for BBB in givenBookList: # Process them first, else each worker would do it (and then lose it)
+            if not self.books[BBB]._processedFlag:
+                self.books[BBB].processLines()
+        checkBBBs = sorted( givenBookList, key=lambda BBB: len(self.books[BBB]._processedLines), reverse=True )
+
+        numProcesses = min( len(checkBBBs), BibleOrgSysGlobals.maxProcesses )
+        forkedBibleObject, forkedTypicalAddedUnitData = self, typicalAddedUnitData # Must be set before forking
+        try:
+            pool = BibleOrgSysGlobals.getForkedWorkerPool( numProcesses ) # start worker processes
+            if pool is None: return False
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Checking {} books using {} processes…").format( len(checkBBBs), numProcesses ) )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from checking various books may be interspersed." )
+            with pool:
+                for BBB,bookCheckResults in zip( checkBBBs, pool.imap( _checkBookMP, checkBBBs ) ):
+                    self.books[BBB].checkResultsDictionary = bookCheckResults
+        finally: forkedBibleObject = forkedTypicalAddedUnitData = None
+        return True
+    # end of InternalBible._checkBooksMP
+
+
     def doExtensiveChecks( self, givenOutputFolderName=None, ntFinished=None, otFinished=None, dcFinished=None, allFinished=None ):
         """
         If the output folder is specified, it is expected that it's already created.
@@ -2292,13 +3006,32 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
 
         if isinstance( BCVReference, tuple ): BBB = BCVReference[0]
         else: BBB = BCVReference.getBBB() # Assume it's a SimpleVerseKey object
+        if 'verseCache' not in self.__dict__:
+            return self._getContextVerseData( BBB, BCVReference, strict, complete )
+
+        cacheKey = (BBB, 'CVD', BCVReference if isinstance( BCVReference, tuple ) else BCVReference.getBCVS(), strict, complete)
+        result = self.verseCache.get( cacheKey )
+        if result is None:
+            result = self._getContextVerseData( BBB, BCVReference, strict, complete )
+            if result is None: return None
+            self.verseCache.put( cacheKey, (result[0], result[1].copy()) )
+        # Don't give out the cached list itself, because the caller might change it
+        verseEntryList, contextList = result
+        return InternalBibleEntryListView( verseEntryList, 0, len(verseEntryList) ), contextList.copy()
+    # end of InternalBible.getContextVerseData
+
+
+    def _getContextVerseData( self, BBB:str, BCVReference:SimpleVerseKey|tuple[str,str,str,str], strict:bool|None=False, complete:bool|None=False ) -> tuple[InternalBibleEntryList,list[str]]|None:
+        """
+        Does the actual work for getContextVerseData() (without using the cache).
+        """
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, " ", BBB in self.books )
         self.loadBookIfNecessary( BBB )
         if BBB in self.books:
             return self.books[BBB].getContextVerseData( BCVReference, strict, complete )
         else:
             logging.warning( f"InternalBible.getContextVerseData( {BCVReference} ): {self.name} doesn't have {BBB}" )
-    # end of InternalBible.getContextVerseData
+    # end of InternalBible._getContextVerseData
 
 
     def getContextVerseDataRange( self, startBCVReference:SimpleVerseKey|tuple[str,str,str,str], endBCVReference:SimpleVerseKey|tuple[str,str,str,str], strict=True ) -> tuple[InternalBibleEntryList,list[str]]|None:
@@ -2334,15 +3067,62 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         if startBBB in self.books and endBBB in self.books:
             if endBBB == startBBB: # most common case
                 return self.books[startBBB].getContextVerseDataRange( startBCVReference, endBCVReference, strict=strict )
-            else: # sometimes they can be different books
-                verseEntryList1, contextList1 = self.books[startBBB].getContextVerseDataRange( startBCVReference, (startBBB,'999','999'), strict=strict )
-                verseEntryList2, _contextList2 = self.books[startBBB].getContextVerseDataRange( (endBBB,'1','1'), endBCVReference, strict=strict )
-                return verseEntryList1+verseEntryList2, contextList1
+            else: # sometimes they can be different books (and there might be other books in between)
+                verseOrdinalIndex = self.getVerseOrdinalIndex()
+                startOrdinal, endOrdinal = verseOrdinalIndex.getOrdinal( startBCVReference ), verseOrdinalIndex.getOrdinal( endBCVReference )
+                return self.getContextVerseDataByOrdinals( startOrdinal, endOrdinal )
         else:
             logging.warning( f"InternalBible.getContextVerseDataRange( {startBCVReference}, {endBCVReference}, {strict=} ): {self.name} doesn't have {startBBB}{'' if endBBB==startBBB else f' or {endBBB}'}" )
     # end of InternalBible.getContextVerseDataRange
 
 
+    def getVerseOrdinalIndex( self ) -> InternalBibleVerseOrdinalIndex:
+        """
+        Returns the Bible-wide verse ordinal index for the loaded books
+            (making it first if necessary, or if the loaded books have changed).
+
+        The ordinal index numbers every C:V index entry in every book
+            so that verse ranges, sorting, and joins with other Bibles can be done with integers.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.getVerseOrdinalIndex() for {self.getAName()}" )
+
+        if 'verseOrdinalIndex' not in self.__dict__ \
+        or self.verseOrdinalIndex.bookCodes != list( self.books ):
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Making verse ordinal index for {} books of {}…").format( len(self.books), self.getAName() ) )
+            self.verseOrdinalIndex = InternalBibleVerseOrdinalIndex( self.getAName( abbrevFirst=True ) )
+            self.verseOrdinalIndex.makeIndex( self )
+        return self.verseOrdinalIndex
+    # end of InternalBible.getVerseOrdinalIndex
+
+
+    def getContextVerseDataByOrdinals( self, startOrdinal:int, endOrdinal:int ) -> tuple[InternalBibleEntryList,list[str]]:
+        """
+        Returns a 2-tuple containing
+            the Bible text (in a InternalBibleEntryList) for an inclusive range of verse ordinals
+            along with the context of the first verse.
+
+        The entries are sliced straight out of each book's processed lines
+            (using the verse ordinal index) so no C:V lookups are needed.
+
+        Raises an IndexError for an invalid ordinal range.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.getContextVerseDataByOrdinals( {startOrdinal}, {endOrdinal} ) for {self.getAName()}" )
+
+        verseOrdinalIndex = self.getVerseOrdinalIndex()
+        bookEntrySlices = verseOrdinalIndex.getBookEntrySlices( startOrdinal, endOrdinal )
+        if len(bookEntrySlices) == 1: # All in one book, so no need to copy the entries
+            BBB, startEntryIndex, endEntryIndex = bookEntrySlices[0]
+            verseEntryList = InternalBibleEntryListView( self.books[BBB]._processedLines, startEntryIndex, endEntryIndex-startEntryIndex )
+        else:
+            verseEntryList = InternalBibleEntryList()
+            for BBB,startEntryIndex,endEntryIndex in bookEntrySlices:
+                verseEntryList.extend( InternalBibleEntryListView( self.books[BBB]._processedLines, startEntryIndex, endEntryIndex-startEntryIndex ) )
+        BBB, C, V = verseOrdinalIndex.getBCV( startOrdinal )
+        contextList = self.books[BBB]._CVIndex[(C,V)].getContextList()
+        return verseEntryList, contextList
+    # end of InternalBible.getContextVerseDataByOrdinals
+
+
     def getVerseDataList( self, BCVReference:SimpleVerseKey|tuple[str,str,str,str] ) -> InternalBibleEntryList|None:
         """
         Return (USFM-like) verseData (InternalBibleEntryList -- a specialised list).
@@ -2382,7 +3162,26 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.getVerseText( {BCVReference}, {fullTextFlag=}, {includeNonCanonical=} )" )
 
-        result = self.getContextVerseData( BCVReference )
+        if 'verseCache' in self.__dict__:
+            BBB, refTuple = (BCVReference[0], BCVReference) if isinstance( BCVReference, tuple ) \
+                                else (BCVReference.getBBB(), BCVReference.getBCVS()) # Assume it's a SimpleVerseKey object
+            cacheKey = (BBB, 'VT', refTuple, fullTextFlag, includeNonCanonical)
+            verseText = self.verseCache.get( cacheKey )
+            if verseText is None:
+                verseText = self._getVerseText( BBB, BCVReference, fullTextFlag, includeNonCanonical )
+                if verseText is not None:
+                    self.verseCache.put( cacheKey, verseText )
+            return verseText
+        return self._getVerseText( BCVReference[0] if isinstance( BCVReference, tuple ) else BCVReference.getBBB(),
+                                    BCVReference, fullTextFlag, includeNonCanonical )
+    # end of InternalBible.getVerseText
+
+
+    def _getVerseText( self, BBB:str, BCVReference, fullTextFlag:bool, includeNonCanonical:bool ) -> str:
+        """
+        Does the actual work for getVerseText() (without using the cache).
+        """
+        result = self._getContextVerseData( BBB, BCVReference )
         if result is not None:
             verseData, _context = result
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "gVT", self.name, BCVReference, verseData )
@@ -2425,10 +3224,388 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
                     firstWord = False
                 else: logging.warning( f"InternalBible.getVerseText Unknown marker '{marker}'='{cleanText}'" )
             return verseText
-    # end of InternalBible.getVerseText function
+    # end of InternalBible._getVerseText function
+
+
+    def setVerseCacheSize( self, maxSize:int ) -> None:
+        """
+        Sets the maximum number of getContextVerseData() and getVerseText() results
+            to be kept in the least-recently-used verse cache.
+
+        A maxSize of zero discards the cache (so there's no caching).
+
+        (This is done automatically for new Bibles if BibleOrgSysGlobals.verseCacheSize is set.)
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.setVerseCacheSize( {maxSize} ) for {self.getAName()}" )
+
+        if maxSize > 0:
+            if 'verseCache' in self.__dict__: self.verseCache.setMaxSize( maxSize )
+            else: self.verseCache = InternalBibleVerseCache( maxSize )
+        elif 'verseCache' in self.__dict__:
+            del self.verseCache
+    # end of InternalBible.setVerseCacheSize
+
+
+    def clearVerseCache( self ) -> None:
+        """
+        Discards all the cached getContextVerseData() and getVerseText() results (if any).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.clearVerseCache() for {self.getAName()}" )
+        if 'verseCache' in self.__dict__:
+            self.verseCache.clear()
+    # end of InternalBible.clearVerseCache
+
+
+    def getVerseCacheStatistics( self ) -> dict[str,int|float]|None:
+        """
+        Returns the hit/miss/eviction statistics of the verse cache
+            or None if there's no verse cache.
+        """
+        return self.verseCache.getStatistics() if 'verseCache' in self.__dict__ else None
+    # end of InternalBible.getVerseCacheStatistics
+
+
+    def makeFoldedCleanTexts( self ) -> int:
+        """
+        Make (for all loaded books) the caseless and/or diacritic-insensitive copies of each cleanText
+            so that findText() doesn't have to refold every line for every search.
+
+        (This is done automatically as books are loaded if BibleOrgSysGlobals.foldedTextsFlag is set.)
+
+        Returns the approximate number of extra bytes used (see getFoldedCleanTextsSize()).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.makeFoldedCleanTexts() for {self.getAName()}" )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Making folded texts for {} books of {}…").format( len(self.books), self.getAName() ) )
+
+        for bookObject in self.books.values():
+            bookObject.makeFoldedCleanTexts()
+        totalBytes = self.getFoldedCleanTextsSize()
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Folded texts use about {totalBytes:,} extra bytes" )
+        return totalBytes
+    # end of InternalBible.makeFoldedCleanTexts
+
+
+    def discardFoldedCleanTexts( self ) -> None:
+        """
+        Free the memory used by makeFoldedCleanTexts().
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.discardFoldedCleanTexts() for {self.getAName()}" )
+        for bookObject in self.books.values():
+            bookObject.discardFoldedCleanTexts()
+    # end of InternalBible.discardFoldedCleanTexts
+
+
+    def getFoldedCleanTextsSize( self ) -> int:
+        """
+        Returns the approximate number of extra bytes used by the folded cleanTexts for all loaded books.
+        """
+        return sum( bookObject.getFoldedCleanTextsSize() for bookObject in self.books.values() )
+    # end of InternalBible.getFoldedCleanTextsSize
+
+
+    def makeColumnarEntryLists( self ) -> None:
+        """
+        Convert the processed lines of all loaded books into InternalBibleColumnarEntryLists
+            (which all share the one string table) to reduce memory use.
+
+        (This is done automatically (but without sharing the string table) as books are loaded
+            if BibleOrgSysGlobals.columnarEntriesFlag is set.)
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.makeColumnarEntryLists() for {self.getAName()}" )
+
+        textTable = InternalBibleStringTable()
+        for bookObject in self.books.values():
+            bookObject.makeColumnarProcessedLines( textTable )
+    # end of InternalBible.makeColumnarEntryLists
+
+
+    def getEntryListsMemorySize( self ) -> int:
+        """
+        Returns the approximate number of bytes used by the processed lines of all loaded books
+            (using BibleOrgSysGlobals.totalSize()).
+
+        Can be used to compare the memory used before and after makeColumnarEntryLists().
+        """
+        # NOTE: We measure them all together so that any shared strings are only counted once
+        return BibleOrgSysGlobals.totalSize( [bookObject._processedLines for bookObject in self.books.values() if bookObject._processedFlag],
+                                                handlers=ENTRY_LIST_SIZE_HANDLERS )
+    # end of InternalBible.getEntryListsMemorySize
+
+
+    def makeWordIndex( self, loadFlag:bool=True, saveFlag:bool=True ) -> InternalBibleWordIndex:
+        """
+        Make (or load from the BOSObjectCache folder) a word index for all loaded books
+            which is then used by findText() to speed up non-regex searches.
 
+        Any saved book indexes which no longer match the book contents are remade.
+        If saveFlag is set, the index is saved if any book indexes were (re)made.
 
-    def findText( self, optionsDict ):
+        Returns the InternalBibleWordIndex object (which is also stored in self.wordIndex).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.makeWordIndex( {loadFlag}, {saveFlag} ) for {self.getAName()}" )
+
+        wordIndex = InternalBibleWordIndex.load( self ) if loadFlag else None
+        if wordIndex is None:
+            wordIndex = InternalBibleWordIndex( self.getAName( abbrevFirst=True ) )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Making word index for {} books of {}…").format( len(self.books), self.getAName() ) )
+        numMade = wordIndex.makeIndex( self )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Made {numMade} book word indexes (reused {len(wordIndex)-numMade})" )
+        self.wordIndex = wordIndex
+
+        if saveFlag and numMade: self.saveWordIndex()
+        return wordIndex
+    # end of InternalBible.makeWordIndex
+
+
+    def saveWordIndex( self, folderpath=None ) -> bool:
+        """
+        Save the word index into the BOSObjectCache folder (by default)
+            so that it can be reloaded by makeWordIndex() next time.
+
+        Returns True if successful.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBible.saveWordIndex( {folderpath} ) for {self.getAName()}" )
+        if 'wordIndex' not in self.__dict__ or self.wordIndex is None:
+            logging.error( f"saveWordIndex: No word index has been made for {self.getAName()}" )
+            return False
+        self.wordIndex.makeIndex( self ) # Make sure that it's up-to-date
+        return self.wordIndex.save( self, folderpath )
+    # end of InternalBible.saveWordIndex
+
+
+    def getTrigramIndexStatistics( self ) -> dict[str,int|float]|None:
+        """
+        Returns a dictionary of statistics about how effective the regex prefilter has been
+            (or None if no regex searches have been done).
+        """
+        return self.trigramIndex.getStatistics() if 'trigramIndex' in self.__dict__ else None
+    # end of InternalBible.getTrigramIndexStatistics
+
+
+    def iterFindText( self, optionsDict, resultSummaryDict:dict|None=None, maxResults:int|None=None, cancelCallback=None, parallelFlag:bool=False ):
+        """
+        Search the internal Bible for the given text which is contained in a dictionary of options.
+            Search string must be in optionsDict['findText'].
+            (We add default options for any missing ones as well as updating the 'findHistoryList'.)
+
+        Assumes that all Bible books are already loaded.
+
+        Unlike findText(), this returns an iterator which yields the search results one at a time
+            (in book order) as they are found, i.e., the 4-tuples or 5-tuples as described in findText().
+        The optionsDict is checked and updated immediately (not when the iteration starts).
+
+        If a resultSummaryDict is given, it's updated as the search proceeds with:
+            searchedBookList, foundBookList, numResults, and
+            reachedMaxResults and cancelled flags.
+
+        If maxResults is given, the search stops after that many results.
+        If cancelCallback is given, it's called (with no parameters) before each book is searched
+            and after each result, and if it returns True, the search is stopped.
+
+        If parallelFlag is set (and BibleOrgSysGlobals.maxProcesses > 1),
+            the books are searched by a pool of worker processes
+            (unless we're already multiprocessing, or the Bible is sqlite based, or the word index can be used).
+            The results are still yielded in book order.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"iterFindText( {optionsDict}, {maxResults}, {parallelFlag} )" )
+        if BibleOrgSysGlobals.debugFlag or DEBUGGING_THIS_MODULE:
+            assert 'findText' in optionsDict
+            assert maxResults is None or maxResults > 0
+
+        ourFindText, compiledFindText, ourMarkerList, useWordIndex, regexLiteralQuery = self._prepareFindText( optionsDict )
+
+        if resultSummaryDict is None: resultSummaryDict = {}
+        resultSummaryDict.update( { 'searchedBookList':[], 'foundBookList':[], 'numResults':0, 'reachedMaxResults':False, 'cancelled':False, } )
+        return self._iterFindTextResults( optionsDict, resultSummaryDict, ourFindText, compiledFindText, ourMarkerList,
+                                            useWordIndex, regexLiteralQuery, maxResults, cancelCallback, parallelFlag )
+    # end of InternalBible.iterFindText
+
+
+    def _prepareFindText( self, optionsDict ) -> tuple[str,re.Pattern|None,list[str],bool,str|tuple|None]:
+        """
+        Check and update the findText() options
+            and decide which of our indexes can be used for the search.
+
+        Returns a 5-tuple with ourFindText, compiledFindText, ourMarkerList, useWordIndex, and regexLiteralQuery.
+        """
+        ourFindText, compiledFindText, ourMarkerList = prepareFindTextOptions( optionsDict, self.getAName( abbrevFirst=True ) )
+
+        # See if we can use a word index to reduce the number of lines that we have to search
+        #   (It only indexes the cleanText so can't help with marker or extras searches.)
+        useWordIndex = 'wordIndex' in self.__dict__ and self.wordIndex is not None \
+                        and not optionsDict['regexFlag'] and not ourMarkerList \
+                        and optionsDict['includeMainTextFlag'] \
+                        and not optionsDict['includeMarkerTextFlag'] and not optionsDict['includeExtrasFlag']
+
+        # For regex searches, we use a trigram index to prefilter the lines (if the regex contains some literal text)
+        regexLiteralQuery = None
+        if optionsDict['regexFlag']:
+            if 'trigramIndex' not in self.__dict__: # it's made lazily (one book at a time)
+                self.trigramIndex = InternalBibleTrigramIndex( self.getAName( abbrevFirst=True ) )
+            if optionsDict['includeMainTextFlag'] and not optionsDict['includeMarkerTextFlag']:
+                regexLiteralQuery = getCompiledRegexLiteralQuery( compiledFindText )
+
+        return ourFindText, compiledFindText, ourMarkerList, useWordIndex, regexLiteralQuery
+    # end of InternalBible._prepareFindText
+
+
+    def _iterFindTextResults( self, optionsDict, resultSummaryDict:dict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                    useWordIndex:bool, regexLiteralQuery, maxResults:int|None, cancelCallback, parallelFlag:bool ):
+        """
+        The generator which does the actual search for iterFindText().
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"_iterFindTextResults( {ourFindText!r}, {useWordIndex}, {regexLiteralQuery}, {maxResults}, {parallelFlag} )" )
+
+        searchBBBs = [BBB for BBB in self.books \
+                        if optionsDict['bookList'] is None or optionsDict['bookList']=='ALL' or BBB in optionsDict['bookList']]
+        prefilterCounts = { 'numLinesSearchable':0, 'numCandidateLines':0, 'numMatchedLines':0, }
+        if parallelFlag and not useWordIndex and self._canFindTextInWorkers() \
+        and len(searchBBBs) > 1 \
+        and BibleOrgSysGlobals.maxProcesses > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing: # Search the books in parallel
+            bookResultsSource = self._iterFindTextBookResultsMP( searchBBBs, optionsDict, ourFindText, compiledFindText, ourMarkerList,
+                                                                    regexLiteralQuery, prefilterCounts )
+        else: # Just single threaded
+            bookResultsSource = self._iterFindTextBookResults( searchBBBs, optionsDict, ourFindText, compiledFindText, ourMarkerList,
+                                                                    useWordIndex, regexLiteralQuery, prefilterCounts )
+        try:
+            for BBB,bookResults in bookResultsSource:
+                if cancelCallback is not None and cancelCallback():
+                    resultSummaryDict['cancelled'] = True
+                    return
+                resultSummaryDict['searchedBookList'].append( BBB )
+                for resultTuple in bookResults:
+                    if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+                    resultSummaryDict['numResults'] += 1
+                    yield resultTuple
+                    if maxResults is not None and resultSummaryDict['numResults'] >= maxResults:
+                        resultSummaryDict['reachedMaxResults'] = True
+                        return
+                    if cancelCallback is not None and cancelCallback():
+                        resultSummaryDict['cancelled'] = True
+                        return
+        finally: # we still want these even if the caller stopped iterating early
+            bookResultsSource.close() # Shuts down any worker processes
+            if optionsDict['regexFlag']:
+                self.trigramIndex.recordQuery( regexLiteralQuery is not None, **prefilterCounts )
+                vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  findText: regex prefilter {regexLiteralQuery} gave {prefilterCounts['numCandidateLines']:,}/{prefilterCounts['numLinesSearchable']:,} candidate lines with {prefilterCounts['numMatchedLines']:,} matching" )
+    # end of InternalBible._iterFindTextResults
+
+
+    def _canFindTextInWorkers( self ) -> bool:
+        """
+        Returns True if our books can be sent to worker processes to be searched.
+        """
+        # NOTE: We can't pickle sqlite3.Cursor objects so don't use multiprocessing for those types of Bibles
+        return self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible','MySword')
+    # end of InternalBible._canFindTextInWorkers
+
+
+    def _getFindTextCandidates( self, BBB:str, bookObject, optionsDict, regexLiteralQuery, prefilterCounts:dict[str,int] ) -> set[int]|None:
+        """
+        Use the trigram index to find which lines of the book might match the regex.
+
+        Returns None if there's no prefilter for this search.
+        """
+        if regexLiteralQuery is None: return None
+        candidateEntryIndexes = self.trigramIndex.getBookIndex( BBB, bookObject ).getCandidateEntryIndexes( regexLiteralQuery,
+                                optionsDict['includeExtrasFlag'], optionsDict['caselessFlag'], optionsDict['ignoreDiacriticsFlag'] )
+        prefilterCounts['numLinesSearchable'] += len( bookObject._processedLines )
+        prefilterCounts['numCandidateLines'] += len( candidateEntryIndexes )
+        return candidateEntryIndexes
+    # end of InternalBible._getFindTextCandidates
+
+
+    def _iterFindTextBookResults( self, searchBBBs:list[str], optionsDict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                    useWordIndex:bool, regexLiteralQuery, prefilterCounts:dict[str,int] ):
+        """
+        Yields 2-tuples with BBB and an iterator for the results from that book.
+
+        The books are only searched as the results are used.
+        """
+        for BBB in searchBBBs:
+            bookObject = self.books[BBB]
+            bookResults = None
+            if useWordIndex:
+                bookResults = self._iterFindTextInBookWithWordIndex( BBB, bookObject, optionsDict, ourFindText )
+            if bookResults is None: # need to scan the book
+                candidateEntryIndexes = self._getFindTextCandidates( BBB, bookObject, optionsDict, regexLiteralQuery, prefilterCounts )
+                bookResults = _iterFindTextInBookEntries( BBB, bookObject._processedLines, optionsDict, ourFindText, compiledFindText,
+                                                            ourMarkerList, candidateEntryIndexes, prefilterCounts,
+                                                            bookObject.getFoldedCleanTexts( optionsDict['caselessFlag'], optionsDict['ignoreDiacriticsFlag'] ) )
+            yield BBB, bookResults
+    # end of InternalBible._iterFindTextBookResults
+
+
+    def _iterFindTextBookResultsMP( self, searchBBBs:list[str], optionsDict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                    regexLiteralQuery, prefilterCounts:dict[str,int] ):
+        """
+        Multiprocessing version!
+
+        Yields 2-tuples with BBB and a list of the results from that book
+            (in the given book order, even though the books might be searched out of order).
+
+        Only the book entries (and the search parameters) are sent to the worker processes.
+        """
+        workerOptionsDict = { key:optionsDict[key] for key in FIND_TEXT_WORKER_OPTIONS } # Not things like parentWindow
+        parameters = [self._getFindTextMPParameters( BBB, optionsDict, workerOptionsDict, ourFindText, compiledFindText, ourMarkerList,
+                                                        regexLiteralQuery, prefilterCounts ) for BBB in searchBBBs]
+
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Searching {} books using {} processes…").format( len(searchBBBs), BibleOrgSysGlobals.maxProcesses ) )
+        workerResults = BibleOrgSysGlobals.imapInWorkers( _findTextInBookMP, parameters ) # keeps our book order
+        try:
+            for BBB,(compactBookResults,numMatchedLines) in zip( searchBBBs, workerResults ):
+                prefilterCounts['numMatchedLines'] += numMatchedLines
+                yield BBB, ( (SimpleVerseKey( BBB, *compactResult[0] ),) + compactResult[1:] for compactResult in compactBookResults )
+        finally: workerResults.close() # Any book searches already given to the pool will still finish
+    # end of InternalBible._iterFindTextBookResultsMP
+
+
+    def _getFindTextMPParameters( self, BBB:str, optionsDict, workerOptionsDict, ourFindText:str, compiledFindText, ourMarkerList:list[str],
+                                    regexLiteralQuery, prefilterCounts:dict[str,int] ) -> tuple:
+        """
+        Returns the parameters tuple needed for _findTextInBookMP() to search one of our books.
+        """
+        bookObject = self.books[BBB]
+        return (BBB, bookObject._processedLines, workerOptionsDict, ourFindText, compiledFindText, ourMarkerList,
+                self._getFindTextCandidates( BBB, bookObject, optionsDict, regexLiteralQuery, prefilterCounts ),
+                bookObject.getFoldedCleanTexts( optionsDict['caselessFlag'], optionsDict['ignoreDiacriticsFlag'] ))
+    # end of InternalBible._getFindTextMPParameters
+
+
+    def _iterFindTextInBookWithWordIndex( self, BBB:str, bookObject, optionsDict, ourFindText:str ):
+        """
+        Uses the word index to find the lines of the book that need to be searched.
+
+        Returns None if the word index can't narrow down the search (so the caller needs to scan the book)
+            otherwise a generator for the results.
+        """
+        bookWordIndex = self.wordIndex.getBookIndex( BBB, bookObject )
+        candidateRecords = bookWordIndex.getCandidateRecords( ourFindText, optionsDict['wordMode'],
+                                        optionsDict['caselessFlag'], optionsDict['ignoreDiacriticsFlag'] )
+        if candidateRecords is None: return None
+        foldedCleanTexts = bookObject.getFoldedCleanTexts( optionsDict['caselessFlag'], optionsDict['ignoreDiacriticsFlag'] )
+
+        def iterCandidateResults():
+            resultList = []
+            for recordNumber in candidateRecords:
+                entryIndex, C, V = bookWordIndex.getRecord( recordNumber )
+                if C=='-1' and not optionsDict['includeIntroFlag']: continue
+                if optionsDict['chapterList'] is None \
+                or C in optionsDict['chapterList'] \
+                or int(C) in optionsDict['chapterList']:
+                    lineEntry = bookObject._processedLines[entryIndex]
+                    findTextInEntry( BBB, C, V, lineEntry, lineEntry.getMarker(), lineEntry.getCleanText(), optionsDict, ourFindText, None, resultList,
+                                        None if foldedCleanTexts is None else foldedCleanTexts[entryIndex] )
+                    if resultList:
+                        yield from resultList
+                        resultList.clear()
+        # end of iterCandidateResults
+        return iterCandidateResults()
+    # end of InternalBible._iterFindTextInBookWithWordIndex
+
+
+    def findText( self, optionsDict, parallelFlag:bool=False ):
         """
         Search the internal Bible for the given text which is contained in a dictionary of options.
             Search string must be in optionsDict['findText'].
@@ -2439,7 +3616,7 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
         Always returns three values:.
             1/ The updated dictionary of all parameters, i.e., updated optionsDict
             2/ The result summary dict, containing the following entries:
-                searchedBookList, foundBookList
+                searchedBookList, foundBookList (and numResults, reachedMaxResults, cancelled)
             3/ A list with (zero or more) search results
                 being 4-tuples or 5-tuples for caseless searches.
 
@@ -2449,180 +3626,23 @@ _pickle.PicklingError: Can't pickle <class 'BibleOrgSys.Reference.BibleBooksName
             SimpleVerseKey, marker (none if v~), contextBefore, foundWordForm, contextAfter
 
         NOTE: ignoreDiacriticsFlag uses BibleOrgSysGlobals.removeAccents() which might not be general enough for all languages.
-        """
-        fnPrint( DEBUGGING_THIS_MODULE, f"findText( {optionsDict} )" )
-        if BibleOrgSysGlobals.debugFlag or DEBUGGING_THIS_MODULE:
-            assert 'findText' in optionsDict
 
-        optionsList = ( 'parentWindow', 'parentBox', 'givenBible', 'workName',
-                'findText', 'findHistoryList', 'wordMode', 'caselessFlag', 'ignoreDiacriticsFlag',
-                'includeIntroFlag', 'includeMainTextFlag', 'includeMarkerTextFlag', 'includeExtrasFlag',
-                'contextLength', 'bookList', 'chapterList', 'markerList', 'regexFlag',
-                'currentBCV', )
-        for someKey in optionsDict:
-            if someKey not in optionsList:
-                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "findText warning: unexpected {!r} option = {!r}".format( someKey, optionsDict[someKey] ) )
-                if DEBUGGING_THIS_MODULE: halt
-
-        # Go through all the given options
-        if 'workName' not in optionsDict: optionsDict['workName'] = self.getAName( abbrevFirst=True )
-        if 'findHistoryList' not in optionsDict: optionsDict['findHistoryList'] = [] # Oldest first
-        if 'wordMode' not in optionsDict: optionsDict['wordMode'] = 'Any' # or 'Whole' or 'EndsWord' or 'Begins' or 'EndsLine'
-        if 'caselessFlag' not in optionsDict: optionsDict['caselessFlag'] = True
-        if 'ignoreDiacriticsFlag' not in optionsDict: optionsDict['ignoreDiacriticsFlag'] = False
-        if 'includeIntroFlag' not in optionsDict: optionsDict['includeIntroFlag'] = True
-        if 'includeMainTextFlag' not in optionsDict: optionsDict['includeMainTextFlag'] = True
-        if 'includeMarkerTextFlag' not in optionsDict: optionsDict['includeMarkerTextFlag'] = False
-        if 'includeExtrasFlag' not in optionsDict: optionsDict['includeExtrasFlag'] = False
-        if 'contextLength' not in optionsDict: optionsDict['contextLength'] = 30 # each side
-        if 'bookList' not in optionsDict: optionsDict['bookList'] = 'ALL' # or BBB or a list
-        if 'chapterList' not in optionsDict: optionsDict['chapterList'] = None
-        if 'markerList' not in optionsDict: optionsDict['markerList'] = None
-        optionsDict['regexFlag'] = False
+        If makeWordIndex() has been called, the word index is used to find the lines to search
+            (except for regex, marker, and extras searches which still scan every line).
+        For regex searches, any literal text in the regex is used with self.trigramIndex
+            to skip lines which can't possibly match (see getTrigramIndexStatistics()).
+        If makeFoldedCleanTexts() has been called (or BibleOrgSysGlobals.foldedTextsFlag was set when loading),
+            the saved caseless/diacritic-insensitive copies of the cleanText are searched.
 
-        if BibleOrgSysGlobals.debugFlag:
-            if optionsDict['chapterList']: assert optionsDict['bookList'] is None or len(optionsDict['bookList']) == 1 \
-                                or optionsDict['chapterList'] == [0] # Only combinations that make sense
-            assert '\r' not in optionsDict['findText'] and '\n' not in optionsDict['findText']
-            assert optionsDict['wordMode'] in ( 'Any', 'Whole', 'Begins', 'EndsWord', 'EndsLine', )
-            if optionsDict['wordMode'] != 'Any': assert ' ' not in optionsDict['findText']
-            if optionsDict['markerList']:
-                assert isinstance( optionsDict['markerList'], list )
-                assert not optionsDict['includeIntroFlag']
-                assert not optionsDict['includeMainTextFlag']
-                assert not optionsDict['includeMarkerTextFlag']
-                assert not optionsDict['includeExtrasFlag']
-
-        ourMarkerList = []
-        if optionsDict['markerList']:
-            for marker in optionsDict['markerList']:
-                ourMarkerList.append( BibleOrgSysGlobals.loadedUSFMMarkers.toStandardMarker( marker ) )
-
-        ourFindText = optionsDict['findText']
-        # Save the search history (with the 'regex:' text still prefixed if applicable)
-        try: optionsDict['findHistoryList'].remove( ourFindText )
-        except ValueError: pass
-        optionsDict['findHistoryList'].append( ourFindText ) # Make sure it goes on the end
-
-        if ourFindText.lower().startswith( 'regex:' ):
-            optionsDict['regexFlag'] = True
-            ourFindText = ourFindText[6:]
-            compiledFindText = re.compile( ourFindText )
-        if optionsDict['ignoreDiacriticsFlag']: ourFindText = BibleOrgSysGlobals.removeAccents( ourFindText )
-        if optionsDict['caselessFlag']: ourFindText = ourFindText.lower()
-        searchLen = len( ourFindText )
-        if BibleOrgSysGlobals.debugFlag: assert searchLen
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Searching for {!r} in {} loaded books".format( ourFindText, len(self) ) )
+        If parallelFlag is set (and BibleOrgSysGlobals.maxProcesses > 1),
+            the books are searched in parallel (see iterFindText()).
 
-        # Now do the actual search
-        resultSummaryDict = { 'searchedBookList':[], 'foundBookList':[], }
-        resultList = [] # Contains 4-tuples or 5-tuples -- first entry is the SimpleVerseKey
-        for BBB,bookObject in self.books.items():
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  findText: got book {}").format( BBB ) )
-            if optionsDict['bookList'] is None or optionsDict['bookList']=='ALL' or BBB in optionsDict['bookList']:
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  findText: will search book {}").format( BBB ) )
-                #self.loadBookIfNecessary( BBB )
-                resultSummaryDict['searchedBookList'].append( BBB )
-                C, V = '-1', '-1' # So first/id line starts at -1:0
-                marker = None
-                for lineEntry in bookObject:
-                    if marker in BibleOrgSysGlobals.USFMParagraphMarkers:
-                        lastParagraphMarker = marker
-
-                    marker, cleanText = lineEntry.getMarker(), lineEntry.getCleanText()
-                    if marker[0] == '¬': continue # we'll always ignore these added lines
-                    if marker in ('headers','intro','chapters'): continue # we'll always ignore these added lines
-                    if marker == 'c': C, V = cleanText, '0'
-                    elif marker == 'v': V = cleanText
-                    elif C == '-1' and marker not in ('headers','intro'): V = str( int(V) + 1 )
-                    if ourMarkerList:
-                        if marker not in ourMarkerList and not (marker in ('v~','p~') and lastParagraphMarker in ourMarkerList):
-                            continue
-                    elif C=='-1' and not optionsDict['includeIntroFlag']: continue
-                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Searching in {} {}:{} {} = {}".format( BBB, C, V, marker, cleanText ) )
-
-                    if optionsDict['chapterList'] is None \
-                    or C in optionsDict['chapterList'] \
-                    or int(C) in optionsDict['chapterList']:
-                        #if optionsDict['chapterList'] and V=='0':
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  findText: will search {} chapter {}").format( BBB, C ) )
-
-                        # Get our text to search
-                        origTextToBeSearched = lineEntry.getFullText() if optionsDict['includeExtrasFlag'] else cleanText
-                        if C != '0' and not optionsDict['includeMainTextFlag']:
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got {!r} but  don't include main text".format( origTextToBeSearched ) )
-                            if marker in ('v~','p~') or marker in BibleOrgSysGlobals.USFMParagraphMarkers:
-                                origTextToBeSearched = ''
-                                if origTextToBeSearched != cleanText: # we must have extras -- we need to remove the main text
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Got extras" )
-                                    assert optionsDict['includeExtrasFlag']
-                                    origTextToBeSearched = ''
-                                    for extra in lineEntry.getExtras():
-                                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "extra", extra )
-                                        extraStart = ''
-                                        if optionsDict['includeMarkerTextFlag']:
-                                            eTypeIndex = BOS_EXTRA_TYPES.index( extra.getType() )
-                                            extraStart = '\\{} '.format( BOS_EXTRA_MARKERS[eTypeIndex] )
-                                        origTextToBeSearched += ' ' if origTextToBeSearched else '' + extraStart + extra.getText()
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Now", repr(origTextToBeSearched) )
-                        if optionsDict['includeMarkerTextFlag']:
-                            origTextToBeSearched = '\\{} {}'.format( marker, origTextToBeSearched )
-                        if not origTextToBeSearched: continue
-                        textToBeSearched = origTextToBeSearched
-                        if optionsDict['ignoreDiacriticsFlag']: textToBeSearched = BibleOrgSysGlobals.removeAccents( textToBeSearched )
-                        if optionsDict['caselessFlag']: textToBeSearched = textToBeSearched.lower()
-                        textLen = len( textToBeSearched )
-
-                        if optionsDict['regexFlag']: # ignores wordMode flag
-                            for match in compiledFindText.finditer( textToBeSearched ):
-                                ix, ixAfter = match.span()
-
-                                if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
-                                    contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
-                                    contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
-                                else: contextBefore = contextAfter = None
-
-                                ixHyphen = V.find( '-' )
-                                if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
-                                resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
-                                                                    origTextToBeSearched[ix:ixAfter], contextAfter, ) \
-                                            if optionsDict['caselessFlag'] else \
-                                                (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
-                                resultList.append( resultTuple )
-                                if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
-                        else: # not regExp
-                            ix = -1
-                            while True:
-                                ix = textToBeSearched.find( ourFindText, ix+1 )
-                                if ix == -1: break
-                                ixAfter = ix + searchLen
-                                if optionsDict['wordMode'] == 'Whole':
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "BF", repr(textToBeSearched[ix-1]) )
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "AF", repr(textToBeSearched[ixAfter]) )
-                                    if ix>0 and textToBeSearched[ix-1].isalpha(): continue
-                                    if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'Begins':
-                                    if ix>0 and textToBeSearched[ix-1].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'EndsWord':
-                                    if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'EndsLine':
-                                    if ixAfter<textLen: continue
-
-                                if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
-                                    contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
-                                    contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
-                                else: contextBefore = contextAfter = None
-
-                                ixHyphen = V.find( '-' )
-                                if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
-                                #adjMarker = None if marker=='v~' else marker # most markers are v~ -- ignore them (for space)
-                                resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
-                                                                    origTextToBeSearched[ix:ixAfter], contextAfter, ) \
-                                            if optionsDict['caselessFlag'] else \
-                                                (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
-                                resultList.append( resultTuple )
-                                if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+        See iterFindText() for a version which yields the results as they are found.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"findText( {optionsDict}, {parallelFlag} )" )
 
+        resultSummaryDict = {}
+        resultList = list( self.iterFindText( optionsDict, resultSummaryDict, parallelFlag=parallelFlag ) ) # Contains 4-tuples or 5-tuples -- first entry is the SimpleVerseKey
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("findText: returning {}").format( resultList ) )
         return optionsDict, resultSummaryDict, resultList
     # end of InternalBible.findText
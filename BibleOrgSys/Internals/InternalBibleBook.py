@@ -58,12 +58,25 @@ CHANGELOG:
     2024-11-13 Added a warning if text is appended to an existing line with no apparent space between words
     2025-02-25 Don't add 'intro' section if 'iex' occurs under 'c'
     2025-03-04 Insert space if it appears that we might be appending text to the end of a verse number
+    2025-06-07 Added optional folded (caseless/diacritic-insensitive) cleanText lists for faster searching
+    2025-06-13 Added makeColumnarProcessedLines() to store the processed lines in less memory
+    2025-06-14 Use marker flag bit tests in processLines() and _discover()
+    2025-06-16 Added getSortedCVIndex() and use it in getContextVerseDataRange()
+    2025-06-17 getContextVerseDataRange() returns an InternalBibleEntryListView (rather than a copy) where possible
+    2025-06-20 Optionally cache _discover() and checkBook() results (keyed by a hash of the raw lines) in the BOSObjectCache folder
+    2025-06-22 Added replaceChapterLines() to reprocess and reindex just one edited chapter
+                (and keep the _discover() counts so that they can be updated rather than remade)
+    2025-06-23 _processLineFix() now tokenizes (well-formed) lines once and builds the texts and extras from the tokens
+    2025-06-26 replaceChapterLines() replaces (rather than adds to) the chapter's fix text errors
+    2025-06-26 processLines() only hashes the raw lines if bookResultsCacheFlag is set
 """
 from gettext import gettext as _
 import os
+import sys
 from pathlib import Path
 import logging
 import re
+import hashlib
 import unicodedata
 
 # BibleOrgSys imports
@@ -78,17 +91,21 @@ from BibleOrgSys.Reference.USFM3Markers import USFM_ALL_INTRODUCTION_MARKERS, US
     USFM_ALL_BIBLE_PARAGRAPH_MARKERS
 from BibleOrgSys.Internals.InternalBibleInternals import BOS_CUSTOM_CONTENT_MARKERS, BOS_CUSTOM_NESTING_MARKERS, \
     BOS_END_MARKERS, BOS_ALL_CUSTOM_MARKERS, BOS_EXTRA_TYPES, BOS_PRINTABLE_MARKERS, \
-    InternalBibleEntryList, InternalBibleEntry, InternalBibleExtra, InternalBibleExtraList, \
-    parseWordAttributes, parseFigureAttributes, getLeadingInt
-from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleBookCVIndex, InternalBibleBookSectionIndex
+    InternalBibleEntryList, InternalBibleEntryListView, InternalBibleEntry, InternalBibleExtra, InternalBibleExtraList, \
+    InternalBibleColumnarEntryList, InternalBibleStringTable, \
+    getMarkerFlags, MARKER_FLAG_PARAGRAPH, MARKER_FLAG_PRINTABLE, MARKER_FLAG_END, \
+    parseWordAttributes, parseFigureAttributes, getLeadingInt, tokenizeUSFMLine, USFM_LINE_TOKEN_REGEX, BOS_EXTRA_MARKERS, \
+    USFM_TOKEN_TEXT, USFM_TOKEN_OPEN_MARKER, USFM_TOKEN_CLOSE_MARKER, USFM_TOKEN_NOTE_START, USFM_TOKEN_NOTE_END, USFM_TOKEN_ATTRIBUTES
+from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleBookCVIndex, InternalBibleBookSortedCVIndex, InternalBibleBookSectionIndex
+from BibleOrgSys.Internals.InternalBibleSearchIndexes import foldText
 from BibleOrgSys.Reference.BibleReferences import BibleAnchorReference
 from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
 
 
-LAST_MODIFIED_DATE = '2025-03-04' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "InternalBibleBook"
 PROGRAM_NAME = "Internal Bible book handler"
-PROGRAM_VERSION = '0.99'
+PROGRAM_VERSION = '1.02'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -99,6 +116,17 @@ BCV_VERSION = '1.0'
 MAX_NONCRITICAL_ERRORS_PER_BOOK_NORMAL = 3
 MAX_NONCRITICAL_ERRORS_PER_BOOK_VERBOSE = 5
 
+BOOK_RESULTS_CACHE_FOLDERPATH = BibleOrgSysGlobals.DEFAULT_WRITEABLE_CACHE_FOLDERPATH.joinpath( 'BookResults/' )
+CHECK_DISCOVERY_KEYS = ( 'crossReferencesPeriodFlag', 'footnotesPeriodFlag', 'haveCrossReferenceOrigins', 'haveFootnoteOrigins',
+                'haveIntroductoryText', 'haveMainHeadings', 'notStarted', 'partlyDone', 'percentageProgress',
+                'sectionReferencesParenthesisFlag', 'seemsFinished', ) # The (Bible-wide) discovery results that checkBook() uses
+
+TOKENIZE_LINES_FLAG = True # Set to False to always use the older step-by-step code in _processLineFix() (e.g., to compare speeds)
+# These are removed from footnotes and cross-references (along with BibleOrgSysGlobals.internal_SFMs_to_remove) to make the cleaned note text
+NOTE_INTERNAL_MARKERS_TO_REMOVE = ( '\\xo*','\\xo ', '\\xt*','\\xt ', '\\xta*','\\xta ', '\\xk*','\\xk ', '\\xq*','\\xq ', '\\xop*','\\xop ',
+                            '\\xot*','\\xot ', '\\xnt*','\\xnt ', '\\xdc*','\\xdc ',
+                            '\\fr*','\\fr ','\\ft*','\\ft ','\\fqa*','\\fqa ','\\fq*','\\fq ',
+                            '\\fv*','\\fv ','\\fk*','\\fk ','\\fl*','\\fl ','\\fdc*','\\fdc ', )
 
 
 def hasClosingPeriod( text:str ) -> bool:
@@ -287,6 +315,57 @@ OUR_INTRO_OUTLINE_MARKERS = ( 'io','io1','io2','io3','io4' )
 OUR_INTRO_LIST_MARKERS = ( 'ili','ili1','ili2','ili3','ili4' )
 OUR_MAIN_TEXT_LIST_MARKERS = ( 'li','li1','li2','li3','li4' )
 
+FOLDED_TEXT_TYPES = ( (True,False), (False,True), (True,True) ) # (caselessFlag,ignoreDiacriticsFlag) for makeFoldedCleanTexts()
+
+# The counts made by InternalBibleBook._countDiscoveryTallies()
+DISCOVERY_TALLY_COUNT_KEYS = ( 'chapterCount', 'implicitChapterCount', 'verseCount', 'completedVerseCount', 'unfinishedVerseCount',
+            'paragraphMarkersCount', 'introductoryMarkersCount', 'introductoryTextCount', 'verseTextCount',
+            'mainHeadingsCount', 'sectionHeadingsCount', 'sectionReferencesCount', 'sectionRefParenthCount',
+            'tablesCount', 'listsCount', 'figuresCount', 'nestedUSFMarkersCount',
+            'footnotesCount', 'footnoteOriginsCount', 'footnotesPeriodCount',
+            'crossReferencesCount', 'crossReferenceOriginsCount', 'xrefsPeriodCount', 'wordCount' )
+DISCOVERY_TALLY_WORD_COUNT_KEYS = ( 'allWordCounts', 'allCaseInsensitiveWordCounts', 'mainTextWordCounts', 'mainTextCaseInsensitiveWordCounts' )
+
+
+def adjustDiscoveryTallies( tallies:dict[str,int|dict[str,int]], minusTallies:dict[str,int|dict[str,int]], plusTallies:dict[str,int|dict[str,int]] ) \
+                                                                                    -> dict[str,int|dict[str,int]]:
+    """
+    Returns new tallies (see InternalBibleBook._countDiscoveryTallies())
+        made by subtracting minusTallies (e.g., for the old chapter) from tallies (e.g., for the book)
+        and then adding plusTallies (e.g., for the new chapter).
+
+    The given tallies aren't changed.
+    """
+    newTallies = { tallyKey:tallies[tallyKey]-minusTallies[tallyKey]+plusTallies[tallyKey] for tallyKey in DISCOVERY_TALLY_COUNT_KEYS }
+    for tallyKey in DISCOVERY_TALLY_WORD_COUNT_KEYS:
+        newWordCounts = tallies[tallyKey].copy()
+        for word,count in minusTallies[tallyKey].items():
+            newCount = newWordCounts[word] - count
+            if newCount: newWordCounts[word] = newCount
+            else: del newWordCounts[word]
+        for word,count in plusTallies[tallyKey].items():
+            newWordCounts[word] = newWordCounts.get( word, 0 ) + count
+        newTallies[tallyKey] = newWordCounts
+    return newTallies
+# end of adjustDiscoveryTallies
+
+
+_removableNoteMarkerTokens:set[str] = set()
+
+def _getRemovableNoteMarkerTokens() -> set[str]:
+    """
+    Returns the set of complete marker tokens (e.g., '\\ft ' or '\\+bd*')
+        that _processLineFix() removes from a note to make the cleaned note text.
+
+    The set is made the first time it's needed
+        because BibleOrgSysGlobals.internal_SFMs_to_remove is only filled by preloadCommonData().
+    """
+    if not _removableNoteMarkerTokens:
+        _removableNoteMarkerTokens.update( NOTE_INTERNAL_MARKERS_TO_REMOVE )
+        _removableNoteMarkerTokens.update( marker for marker in BibleOrgSysGlobals.internal_SFMs_to_remove if marker[-1] in ' *' )
+    return _removableNoteMarkerTokens
+# end of _getRemovableNoteMarkerTokens
+
 
 class InternalBibleBook:
     """
@@ -323,6 +402,7 @@ class InternalBibleBook:
 
         self._rawLines = [] # Contains 2-tuples (marker,text) which contain the actual Bible text -- see addLine below
         self._processedFlag = self._indexedCVFlag = self._indexedSectionsFlag = False
+        self._sortedCVIndex = None # Made when first needed -- see getSortedCVIndex below
         self.notices = [] # Contains 6-tuples (priority, message, BBB, C, V, options)
         self.checkResultsDictionary = {}
         self.checkResultsDictionary['Priority Errors'] = [] # Put this one first in the ordered dictionary
@@ -784,6 +864,11 @@ class InternalBibleBook:
                 self.addPriorityError( 11, C, V, _("Contains straight-quote(s)") )
                 #adjText = adjText.replace( '"', '&quot;' )
 
+        if TOKENIZE_LINES_FLAG and self.objectTypeString != 'SwordBibleModule':
+            tokenizedResult = self._processLineFixTokens( C, V, originalMarker, adjText, lineLocation, fixErrors )
+            if tokenizedResult is not None: return tokenizedResult
+            # Otherwise there's something unusual in the line, so use the step-by-step code below
+
         # \w fields can indicate glossary entries.
         # However, it's also a way to assign attributes to a word (after a |).
         # Adjust \w or \+w ('w') fields to remove attributes (and copy the word and place the attributes) into a separate \ww ('ww') field
@@ -1099,12 +1184,7 @@ class InternalBibleBook:
                             .replace( '&quot;', '"' ) # Undo any replacements above
             for sign in ('- ', '+ '): # Remove common leader characters (and the following space)
                 cleanedNote = cleanedNote.replace( sign, '' )
-            # TODO: This is bad having a list like this inside the code!!!
-            for marker in ['\\xo*','\\xo ', '\\xt*','\\xt ', '\\xta*','\\xta ', '\\xk*','\\xk ', '\\xq*','\\xq ', '\\xop*','\\xop ', 
-                            '\\xot*','\\xot ', '\\xnt*','\\xnt ', '\\xdc*','\\xdc ',
-                            '\\fr*','\\fr ','\\ft*','\\ft ','\\fqa*','\\fqa ','\\fq*','\\fq ',
-                            '\\fv*','\\fv ','\\fk*','\\fk ','\\fl*','\\fl ','\\fdc*','\\fdc ',] \
-                                + BibleOrgSysGlobals.internal_SFMs_to_remove:
+            for marker in NOTE_INTERNAL_MARKERS_TO_REMOVE + tuple( BibleOrgSysGlobals.internal_SFMs_to_remove ):
                 cleanedNote = cleanedNote.replace( marker, '' )
             if '\\z' in cleanedNote:
                 fixErrors.append( lineLocationSpace + _("Found custom marker in {}: {}").format( thisOne, cleanedNote ) )
@@ -1396,6 +1476,100 @@ class InternalBibleBook:
     # end of InternalBibleBook.processLines._processLineFix
 
 
+    def _processLineFixTokens( self, C:str,V:str, originalMarker:str, adjText:str, lineLocation:str, fixErrors:list[str] ) \
+                                                                        -> tuple[str,str,InternalBibleExtraList]|None:
+        """
+        Called by _processLineFix (after any quote marks, etc. have been fixed)
+            to lex the line just once (using tokenizeUSFMLine)
+            and then build adjText, cleanText and the extras from the tokens.
+
+        This only handles well-formed lines, so it returns None (without changing anything or giving any errors)
+            if there's anything in the line that _processLineFix would fix or complain about
+            (or if it contains any figures or \\vp fields),
+            and then the step-by-step code in _processLineFix handles (and reports on) the line as before.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBook._processLineFixTokens( {C}:{V}, {originalMarker}, '{adjText}' ) for {self.BBB}" )
+
+        tokens = tokenizeUSFMLine( adjText )
+        if tokens is None: return None # e.g., an UPPERCASE marker
+        numTokens = len( tokens )
+
+        if '|' in adjText: # All attributes must be in simple \\w word|attributes\\w* (or \\+w) fields
+            for j,(tokenType,marker,_tokenText) in enumerate( tokens ):
+                if tokenType == USFM_TOKEN_OPEN_MARKER and marker in ('w','+w'):
+                    if j+2 >= numTokens or tokens[j+1][0] != USFM_TOKEN_TEXT: return None
+                    closeIx = j+3 if tokens[j+2][0] == USFM_TOKEN_ATTRIBUTES else j+2
+                    if closeIx >= numTokens or tokens[closeIx][0] != USFM_TOKEN_CLOSE_MARKER or tokens[closeIx][1] != marker: return None
+                elif tokenType == USFM_TOKEN_ATTRIBUTES:
+                    if j < 2 or tokens[j-2][0] != USFM_TOKEN_OPEN_MARKER or tokens[j-2][1] not in ('w','+w'): return None
+
+        adjTextParts:list[str] = []
+        cleanTextParts:list[str] = []
+        adjLength = 0
+        noteInfos:list[tuple[str,int,str]] = [] # extraType, extraIndex, note
+        j = 0
+        while j < numTokens:
+            tokenType, marker, tokenText = tokens[j]
+            if tokenType == USFM_TOKEN_TEXT:
+                adjTextParts.append( tokenText )
+                cleanTextParts.append( tokenText )
+                adjLength += len( tokenText )
+            elif tokenType == USFM_TOKEN_OPEN_MARKER or tokenType == USFM_TOKEN_CLOSE_MARKER:
+                if j+2 < numTokens and tokens[j+2][0] == USFM_TOKEN_ATTRIBUTES: # it's \\w word|attributes\\w* (checked above)
+                    # The \\w markers are removed, and the word and attributes are moved out to a 'ww' extra (after the word)
+                    word = tokens[j+1][2]
+                    note = word + tokens[j+2][2]
+                    if note[0].isspace() or note[-1].isspace() or len(note) < 6: return None
+                    adjTextParts.append( word )
+                    cleanTextParts.append( word )
+                    adjLength += len( word )
+                    noteInfos.append( ('ww', adjLength, note) )
+                    j += 4
+                    continue
+                adjTextParts.append( tokenText ) # Character markers stay in adjText (but not in cleanText)
+                adjLength += len( tokenText )
+            elif tokenType == USFM_TOKEN_NOTE_START:
+                if marker not in ('f','fe','x','str','sem'): return None # \\fig and \\vp have side-effects (and we make any \\ww fields)
+                if marker in ('f','fe') and adjLength and adjTextParts[-1][-1] == ' ': return None # Note is preceded by a space
+                endIx = j + 1
+                while endIx < numTokens and tokens[endIx][0] in (USFM_TOKEN_TEXT, USFM_TOKEN_OPEN_MARKER, USFM_TOKEN_CLOSE_MARKER):
+                    endIx += 1
+                if endIx == numTokens or tokens[endIx][0] != USFM_TOKEN_NOTE_END or tokens[endIx][1] != marker: return None # Unmatched or nested
+                note = ''.join( noteToken[2] for noteToken in tokens[j+1:endIx] )
+                if not note or note[0].isspace() or note[-1].isspace() or len(note) < (2 if marker=='str' else 6): return None
+                if marker in ('f','fe','x'): # Should have a caller and then marked internal fields
+                    if note[0] == '\\' or note.startswith( '- ' ) or (len(note)>2 and note[0] in '+-' and note[1] == '\\'): return None
+                    noteBits = note.split( None, 1 )
+                    if len(noteBits) < 2 or noteBits[1][0] != '\\': return None
+                removableNoteMarkerTokens = _getRemovableNoteMarkerTokens()
+                for noteTokenType,_noteMarker,noteTokenText in tokens[j+1:endIx]:
+                    if noteTokenType != USFM_TOKEN_TEXT and noteTokenText not in removableNoteMarkerTokens: return None
+                noteInfos.append( (BOS_EXTRA_TYPES[BOS_EXTRA_MARKERS.index(marker)], adjLength, note) )
+                j = endIx
+            else: return None # Unmatched note end or attributes
+            j += 1
+
+        adjText = ''.join( adjTextParts )
+        if adjText and adjText[-1].isspace(): return None # Trailing space before a note
+
+        # Everything's ok, so we can now make the cleanText and the extras
+        if '&' in adjText: # Undo any replacements (before removing the character markers, like _processLineFix does)
+            cleanText = adjText.replace( '&amp;', '&' ).replace( '&#39;', "'" ).replace( '&lt;', '<' ).replace( '&gt;', '>' ).replace( '&quot;', '"' )
+            if '\\' in cleanText: cleanText = USFM_LINE_TOKEN_REGEX.sub( '', cleanText )
+        else: cleanText = ''.join( cleanTextParts )
+        extras = InternalBibleExtraList()
+        for extraType, extraIndex, note in noteInfos:
+            if extraType == 'ww':
+                parseWordAttributes( self.workName, self.BBB, C, V, note.replace( '&quot;', '"' ), fixErrors )
+                # (returned dictionary above is just ignored here)
+            cleanedNote = note.replace( '&amp;', '&' ).replace( '&#39;', "'" ).replace( '&lt;', '<' ).replace( '&gt;', '>' ).replace( '&quot;', '"' ) \
+                                .replace( '- ', '' ).replace( '+ ', '' ) # Remove common leader characters (and the following space)
+            if '\\' in cleanedNote: cleanedNote = USFM_LINE_TOKEN_REGEX.sub( '', cleanedNote ) # All the markers are removable (checked above)
+            extras.append( InternalBibleExtra( extraType, extraIndex, note, cleanedNote, lineLocation ) )
+        return adjText, cleanText, extras
+    # end of InternalBibleBook._processLineFixTokens
+
+
     def _addNestingMarkers( self ) -> None:
         """
         Or 'addEndMarkers'. End/Closing markers start with not sign ¬.
@@ -2252,7 +2426,7 @@ class InternalBibleBook:
                 logging.error( "doAppendEntry: " + _("Illegal text for {!r} paragraph marker {} {}:{}").format( originalMarker, self.BBB, C, V ) )
                 self.addPriorityError( 97, C, V, _("Should not have text following character marker '{}").format( originalMarker ) )
 
-            if (adjMarker=='b' or adjMarker in BibleOrgSysGlobals.USFMParagraphMarkers) and text:
+            if (adjMarker=='b' or getMarkerFlags( adjMarker ) & MARKER_FLAG_PARAGRAPH) and text:
                 # Separate the verse text from the paragraph markers
                 self._processedLines.append( InternalBibleEntry(adjMarker, originalMarker, '', '', None, '') )
                 adjMarker = 'p~'
@@ -2678,7 +2852,14 @@ class InternalBibleBook:
         self.addVerseStartMarkers()
         if DEBUGGING_THIS_MODULE and BibleOrgSysGlobals.debugFlag: self.displayProcessedLines( "After adding start markers" )
 
-        # Get rid of data that we don't need
+        # Get rid of data that we don't need (but remember what it was, so that we can reuse cached results)
+        self.__dict__.pop( '_discoveryTallies', None ) # They were for the previous lines
+        if BibleOrgSysGlobals.bookResultsCacheFlag: # Only worth the time if we might use cached results
+            hasher = hashlib.md5( f'{PROGRAM_VERSION}\n{LAST_MODIFIED_DATE}\n{self.objectTypeString}\n{self.BBB}\n'.encode( 'utf-8' ) )
+            for marker,text in self._rawLines:
+                hasher.update( f'{marker}\n{text}\n'.encode( 'utf-8', errors='surrogatepass' ) )
+            self._contentHash = hasher.hexdigest()
+        else: self.__dict__.pop( '_contentHash', None )
         #if not BibleOrgSysGlobals.debugFlag:
         del self._rawLines # if short of memory
         try: del self.XMLTree # for xml Bible types (some Bible books caused a segfault when pickled with this data)
@@ -2686,11 +2867,105 @@ class InternalBibleBook:
 
         if fixErrors: self.checkResultsDictionary['Fix Text Errors'] = fixErrors
         self._processedFlag = True
+        if BibleOrgSysGlobals.columnarEntriesFlag:
+            self.makeColumnarProcessedLines()
         self.makeBookCVIndex()
         #self._makeBookSectionIndex() # Not created by default
+        if BibleOrgSysGlobals.foldedTextsFlag or '_foldedCleanTexts' in self.__dict__: # (re)make them
+            self.makeFoldedCleanTexts()
     # end of InternalBibleBook.processLines
 
 
+    def makeColumnarProcessedLines( self, textTable:InternalBibleStringTable|None=None ) -> None:
+        """
+        Convert self._processedLines into an InternalBibleColumnarEntryList
+            which uses much less memory (but is a little slower to access).
+
+        textTable can be given so that all the books of a Bible can share the same stored strings.
+
+        Any existing C:V and section indexes are updated to use the new list.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBook.makeColumnarProcessedLines() for {self.BBB}" )
+        if not self._processedFlag:
+            logging.critical( f"makeColumnarProcessedLines: {self.BBB} lines haven't been processed yet" )
+            return
+        if isinstance( self._processedLines, InternalBibleColumnarEntryList ): return # Already done
+
+        self._processedLines = InternalBibleColumnarEntryList( self._processedLines, textTable )
+        if self._indexedCVFlag: self._CVIndex.givenBibleEntries = self._processedLines
+        if self._sortedCVIndex is not None: self._sortedCVIndex.givenBibleEntries = self._processedLines
+        if self._indexedSectionsFlag: self._SectionIndex._givenBibleEntries = self._processedLines
+    # end of InternalBibleBook.makeColumnarProcessedLines
+
+
+    def makeFoldedCleanTexts( self, foldTypes=FOLDED_TEXT_TYPES ) -> None:
+        """
+        Make lists (parallel to self._processedLines) of the cleanText of each entry
+            adjusted for caseless and/or diacritic-insensitive searching
+            so that findText() doesn't need to redo it for every search.
+
+        foldTypes is a sequence of 2-tuples (caselessFlag,ignoreDiacriticsFlag).
+
+        Where folding doesn't change the text, the original string is reused (to save memory).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBook.makeFoldedCleanTexts( {foldTypes} ) for {self.BBB}" )
+        if not self._processedFlag:
+            logging.critical( f"makeFoldedCleanTexts: {self.BBB} lines haven't been processed yet" )
+            return
+
+        cleanTexts = [entry.getCleanText() for entry in self._processedLines]
+        self._foldedCleanTexts = {}
+        for caselessFlag,ignoreDiacriticsFlag in foldTypes:
+            if not caselessFlag and not ignoreDiacriticsFlag: continue # That's just the cleanText
+            foldedCleanTexts = []
+            for cleanText in cleanTexts:
+                foldedCleanText = foldText( cleanText, caselessFlag, ignoreDiacriticsFlag )
+                foldedCleanTexts.append( cleanText if foldedCleanText == cleanText else foldedCleanText )
+            self._foldedCleanTexts[(caselessFlag,ignoreDiacriticsFlag)] = foldedCleanTexts
+    # end of InternalBibleBook.makeFoldedCleanTexts
+
+
+    def getFoldedCleanTexts( self, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> list[str]|None:
+        """
+        Returns the list (parallel to self._processedLines) of folded cleanTexts
+            or None if they haven't been made (or aren't valid any more).
+        """
+        if '_foldedCleanTexts' not in self.__dict__: return None
+        foldedCleanTexts = self._foldedCleanTexts.get( (caselessFlag,ignoreDiacriticsFlag) )
+        if foldedCleanTexts is not None and len(foldedCleanTexts) != len(self._processedLines): # Lines must have been changed
+            logging.warning( f"getFoldedCleanTexts: Discarding out-of-date folded texts for {self.BBB}" )
+            del self._foldedCleanTexts
+            return None
+        return foldedCleanTexts
+    # end of InternalBibleBook.getFoldedCleanTexts
+
+
+    def discardFoldedCleanTexts( self ) -> None:
+        """
+        Free the memory used by makeFoldedCleanTexts().
+        """
+        try: del self._foldedCleanTexts
+        except AttributeError: pass # we didn't have any
+    # end of InternalBibleBook.discardFoldedCleanTexts
+
+
+    def getFoldedCleanTextsSize( self ) -> int:
+        """
+        Returns the approximate number of extra bytes used by makeFoldedCleanTexts()
+            (not counting any strings shared with the original cleanTexts).
+        """
+        if '_foldedCleanTexts' not in self.__dict__: return 0
+        cleanTextIds = { id(entry.getCleanText()) for entry in self._processedLines }
+        totalBytes = sys.getsizeof( self._foldedCleanTexts )
+        for foldedCleanTexts in self._foldedCleanTexts.values():
+            totalBytes += sys.getsizeof( foldedCleanTexts )
+            for foldedCleanText in foldedCleanTexts:
+                if id(foldedCleanText) not in cleanTextIds:
+                    totalBytes += sys.getsizeof( foldedCleanText )
+        return totalBytes
+    # end of InternalBibleBook.getFoldedCleanTextsSize
+
+
     def makeBookCVIndex( self ) -> None:
         """
         Index the InternalBibleBook processed lines InternalBibleEntryList for faster reference.
@@ -2706,6 +2981,7 @@ class InternalBibleBook:
         vPrint( 'Info', DEBUGGING_THIS_MODULE, "  " + _("Indexing {} {!r} {} text…").format( self.objectNameString, self.workName, self.BBB ) )
         self._CVIndex = InternalBibleBookCVIndex( self.workName, self.BBB )
         self._CVIndex.makeBookCVIndex( self._processedLines )
+        self._sortedCVIndex = None # It would be out of date now
 
         #if self.BBB=='GEN':
             #for j, entry in enumerate( self._processedLines):
@@ -2729,6 +3005,21 @@ class InternalBibleBook:
     # end of InternalBibleBook.makeBookCVIndex
 
 
+    def getSortedCVIndex( self ) -> InternalBibleBookSortedCVIndex:
+        """
+        Returns the sorted (array-based) version of the C:V index
+            which is made (from the C:V index) the first time it's needed.
+        """
+        if self._sortedCVIndex is None:
+            if not self._processedFlag:
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"InternalBibleBook '{self.workName}' {self.BBB}: processing lines called from 'getSortedCVIndex'" )
+                self.processLines()
+            self._sortedCVIndex = InternalBibleBookSortedCVIndex( self.workName, self.BBB )
+            self._sortedCVIndex.makeIndex( self._CVIndex )
+        return self._sortedCVIndex
+    # end of InternalBibleBook.getSortedCVIndex
+
+
     def _makeBookSectionIndex( self ) -> None:
         """
         Index the InternalBibleBook processed lines InternalBibleEntryList for faster reference.
@@ -2759,6 +3050,171 @@ class InternalBibleBook:
     # end of InternalBibleBook._makeBookSectionIndex
 
 
+    def replaceChapterLines( self, C:str, newRawLines:list[tuple[str,str]] ) -> bool:
+        """
+        Replace chapter C of the book with the given raw (marker,text) 2-tuples
+            (starting with the 'c' line and going up to, but not including, the next 'c' line)
+            without needing to reprocess and reindex the whole book
+            (e.g., after a verse has been edited in an editor).
+
+        Only the new lines are processed (in a temporary book) and then spliced into self._processedLines.
+            If the edit hasn't changed the structure of the chapter (i.e., only the verse/paragraph texts have changed),
+                the C:V index is still correct,
+            otherwise the C:V index entries for the chapter are replaced and the following ones moved.
+            Any sorted C:V index is remade when next needed,
+                and any section index is discarded (call _makeBookSectionIndex() to remake it).
+
+        Returns True if successful,
+            or False (and the book is unchanged) if it couldn't be done this way
+                (e.g., the new chapter would change the nesting of the rest of the book,
+                    or a paragraph is left open right through the chapter from an earlier one),
+                in which case the book should be reloaded.
+
+        Note: if the book belongs to a Bible, use InternalBible.replaceBookChapterLines()
+                so that the Bible's discovery results, caches, and indexes are also updated.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBook.replaceChapterLines( {C}, ({len(newRawLines)}) ) for {self.BBB}" )
+
+        def _getChapterStartMarkers( entries:InternalBibleEntryList, startIndex:int ) -> list[str]:
+            """
+            Returns the markers from startIndex up to (and including) the first v, v~ or p~ marker,
+                i.e., what _addNestingMarkers() looks ahead at when it gets to the end of the previous chapter.
+            """
+            startMarkers:list[str] = []
+            for k in range( startIndex, len(entries) ):
+                marker = entries[k].getMarker()
+                startMarkers.append( marker )
+                if marker in ('v','v~','p~'): break
+            return startMarkers
+        # end of replaceChapterLines._getChapterStartMarkers
+
+        if not newRawLines or newRawLines[0][0] != 'c' or newRawLines[0][1].strip() != C \
+        or any( marker=='c' for marker,_text in newRawLines[1:] ):
+            logging.critical( f"replaceChapterLines: {self.BBB} {C} new lines must contain exactly one chapter (starting with a 'c' line)" )
+            return False
+        if not BibleOrgSysGlobals.loadedBibleBooksCodes.isChapterVerseBook( self.BBB ):
+            logging.warning( f"replaceChapterLines: can't replace {C} in {self.workName} {self.BBB} (not a chapter/verse book)" )
+            return False
+
+        if not self._processedFlag: # Easy -- we still have the raw lines
+            startIndex = endIndex = None
+            for j,(marker,text) in enumerate( self._rawLines ):
+                if marker == 'c':
+                    if startIndex is not None: endIndex = j; break
+                    if text.strip() == C: startIndex = j
+            if startIndex is None:
+                logging.warning( f"replaceChapterLines: no chapter {C} in {self.workName} {self.BBB}" )
+                return False
+            self._rawLines[startIndex:len(self._rawLines) if endIndex is None else endIndex] = newRawLines
+            return True
+
+        # Find the existing chapter entries
+        try: startIndex = self._CVIndex[(C,'0')].getEntryIndex()
+        except KeyError:
+            logging.warning( f"replaceChapterLines: no chapter {C} in {self.workName} {self.BBB}" )
+            return False
+        endIndex = startIndex + 1
+        numEntries = len( self._processedLines )
+        while endIndex < numEntries and self._processedLines[endIndex].getMarker() != 'c':
+            endIndex += 1
+        nextC = self._processedLines[endIndex].getCleanText() if endIndex < numEntries else None
+
+        # Process the new chapter lines in a temporary book
+        #   followed by the start of the next chapter (if any), so that the chapter ends in the same way
+        nextChapterStartLines:list[tuple[str,str]] = []
+        if nextC is not None:
+            nextChapterStartLines.append( ('c',nextC) )
+            for k,marker in enumerate( _getChapterStartMarkers( self._processedLines, endIndex )[1:], start=endIndex+1 ):
+                if marker[0]=='¬' or marker in ('v=','c#','v~','p~') or marker in BOS_CUSTOM_NESTING_MARKERS: continue # These get added
+                nextChapterStartLines.append( (marker, f'{self._processedLines[k].getCleanText()} -' if marker=='v' else self._processedLines[k].getOriginalText() or '') )
+        tempBook = InternalBibleBook( self.workName if self.containerBibleObject is None else self.containerBibleObject, self.BBB )
+        tempBook.objectNameString, tempBook.objectTypeString = self.objectNameString, self.objectTypeString
+        tempBook.replaceAngleBracketsFlag, tempBook.replaceStraightDoubleQuotesFlag = self.replaceAngleBracketsFlag, self.replaceStraightDoubleQuotesFlag
+        tempBook._rawLines = [('id',self.BBB)] + list( newRawLines ) + nextChapterStartLines
+        tempBook.processLines()
+        try:
+            tempStartIndex = tempBook._CVIndex[(C,'0')].getEntryIndex()
+            tempEndIndex = len(tempBook._processedLines) if nextC is None else tempBook._CVIndex[(nextC,'0')].getEntryIndex()
+            # The book introduction might still be open (but that doesn't affect the chapter if it has no introduction markers)
+            tempStartContext = tempBook._CVIndex[(C,'0')].getContextList()
+            outerContext = self._CVIndex[(C,'0')].getContextList()[:-len(tempStartContext)]
+            # The nesting (and hence the processed lines) of the rest of the book mustn't be changed by the edit
+            sameNesting = outerContext + tempStartContext == self._CVIndex[(C,'0')].getContextList() \
+                and (not outerContext or (outerContext == ['intro'] and not any( marker in USFM_ALL_INTRODUCTION_MARKERS for marker,_text in newRawLines ))) \
+                and _getChapterStartMarkers( tempBook._processedLines, tempStartIndex ) == _getChapterStartMarkers( self._processedLines, startIndex ) \
+                and (nextC is None
+                     or (outerContext + tempBook._CVIndex[(nextC,'0')].getContextList() == self._CVIndex[(nextC,'0')].getContextList()
+                         and _getChapterStartMarkers( tempBook._processedLines, tempEndIndex ) == _getChapterStartMarkers( self._processedLines, endIndex ))) \
+                and (nextC is not None # The outer context must be closed at the end of the book
+                     or [self._processedLines[k].getMarker() for k in range( numEntries-len(outerContext), numEntries )] == ['¬'+marker for marker in reversed(outerContext)])
+        except KeyError: sameNesting = False
+        if not sameNesting:
+            logging.warning( f"replaceChapterLines: unable to replace {self.workName} {self.BBB} {C} by itself" )
+            return False
+        newEntries = tempBook._processedLines[tempStartIndex:tempEndIndex]
+        if nextC is None and outerContext: # Our temporary book didn't have the closing markers for the outer context
+            newEntries = newEntries + self._processedLines[numEntries-len(outerContext):]
+
+        # See if only the texts (which aren't indexed) have changed
+        sameStructure = len(newEntries) == endIndex - startIndex
+        if sameStructure:
+            for oldEntry,newEntry in zip( self._processedLines[startIndex:endIndex], newEntries ):
+                marker = oldEntry.getMarker()
+                if marker != newEntry.getMarker() \
+                or (marker not in ('v~','p~') and oldEntry.getCleanText() != newEntry.getCleanText()):
+                    sameStructure = False; break
+
+        # Now splice in the new entries and update (or discard) everything that depended on the old ones
+        haveDiscoveryTallies = '_discoveryTallies' in self.__dict__ and self._discoveryTallies[0] == self.getContentHash()
+        if haveDiscoveryTallies: oldChapterTallies = self._countDiscoveryTallies( startIndex, endIndex )
+        self._processedLines.replaceEntries( startIndex, endIndex, newEntries )
+        if haveDiscoveryTallies: newChapterTallies = self._countDiscoveryTallies( startIndex, startIndex+len(newEntries) )
+        if not sameStructure:
+            self._CVIndex.replaceChapterIndexEntries( C, tempBook._CVIndex, startIndex-tempStartIndex, endIndex, len(newEntries)-(endIndex-startIndex), outerContext )
+            if nextC is None and outerContext: # The last index entry also includes those closing markers
+                self._CVIndex[list(tempBook._CVIndex)[-1]].entryCount += len(outerContext)
+            self._sortedCVIndex = None # It would be out of date now
+            if self._indexedSectionsFlag:
+                del self._SectionIndex
+                self._indexedSectionsFlag = False
+        if '_foldedCleanTexts' in self.__dict__:
+            for (caselessFlag,ignoreDiacriticsFlag),foldedCleanTexts in self._foldedCleanTexts.items():
+                newFoldedCleanTexts = []
+                for newEntry in newEntries:
+                    cleanText = newEntry.getCleanText()
+                    foldedCleanText = foldText( cleanText, caselessFlag, ignoreDiacriticsFlag )
+                    newFoldedCleanTexts.append( cleanText if foldedCleanText == cleanText else foldedCleanText )
+                foldedCleanTexts[startIndex:endIndex] = newFoldedCleanTexts
+        # Replace the fix errors for the old chapter with the ones for the new chapter
+        #   (but not any from the temporary book's 'id' line or the start of the next chapter)
+        def _getFixErrorChapter( fixError:str ) -> str:
+            """ The fix errors start with BBB_C:V or BBB C:V """
+            return fixError[len(self.BBB)+1:fixError.find(':')] if fixError[len(self.BBB):len(self.BBB)+1] in ('_',' ') else ''
+        newFixErrors = [fixError for fixError in tempBook.checkResultsDictionary.get( 'Fix Text Errors', [] ) if _getFixErrorChapter( fixError ) == C]
+        if 'Fix Text Errors' in self.checkResultsDictionary or newFixErrors:
+            fixErrors, intC = [], int( C )
+            for fixError in self.checkResultsDictionary.get( 'Fix Text Errors', [] ):
+                errorC = _getFixErrorChapter( fixError )
+                if errorC == C: continue # Discard the old ones for this chapter
+                if newFixErrors and errorC.isdigit() and int(errorC) > intC: # Keep them in the same order as processLines() would
+                    fixErrors += newFixErrors; newFixErrors = []
+                fixErrors.append( fixError )
+            fixErrors += newFixErrors
+            if fixErrors: self.checkResultsDictionary['Fix Text Errors'] = fixErrors
+            else: del self.checkResultsDictionary['Fix Text Errors']
+
+        # The content has changed, so any cached results can't be used (but results for this same edit can be)
+        if self.getContentHash() is not None:
+            hasher = hashlib.md5( f'{self.getContentHash()}\n{C}\n'.encode( 'utf-8' ) )
+            for marker,text in newRawLines:
+                hasher.update( f'{marker}\n{text}\n'.encode( 'utf-8', errors='surrogatepass' ) )
+            self._contentHash = hasher.hexdigest()
+        if haveDiscoveryTallies: # so _discover() doesn't have to recount the whole book
+            self._discoveryTallies = ( self.getContentHash(), adjustDiscoveryTallies( self._discoveryTallies[1], oldChapterTallies, newChapterTallies ) )
+        return True
+    # end of InternalBibleBook.replaceChapterLines
+
+
     def debugPrint( self ) -> None:
         """
         """
@@ -3144,49 +3600,138 @@ class InternalBibleBook:
     # end of InternalBibleBook.getVersificationIfNecessary
 
 
+    def getContentHash( self ) -> str|None:
+        """
+        Returns a hash of the raw lines of the book (made by processLines())
+            or None if the book hasn't been processed yet
+            (or if BibleOrgSysGlobals.bookResultsCacheFlag wasn't set when it was, in which case nothing is cached).
+
+        This is used to tell if previously cached results (e.g., from _discover() or checkBook()) are still valid.
+        """
+        return self.__dict__.get( '_contentHash' )
+    # end of InternalBibleBook.getContentHash
+
+
+    def _getCachedResultsFilename( self, resultsType:str, extraKey:str|None=None ) -> str|None:
+        """
+        Returns the filename (in BOOK_RESULTS_CACHE_FOLDERPATH) for the given type of cached results
+            or None if the book doesn't have a content hash.
+        """
+        contentHash = self.getContentHash()
+        if contentHash is None: return None
+        return f'{self.BBB}_{contentHash}{"" if extraKey is None else f"_{extraKey}"}.{resultsType}.pickle'
+    # end of InternalBibleBook._getCachedResultsFilename
+
+
+    def _loadCachedResults( self, resultsType:str, extraKey:str|None=None ):
+        """
+        Returns previously saved results for this book (with these exact raw lines) from the BOSObjectCache folder
+            or None if there aren't any.
+        """
+        filename = self._getCachedResultsFilename( resultsType, extraKey )
+        if filename is None or not BOOK_RESULTS_CACHE_FOLDERPATH.joinpath( filename ).is_file(): return None
+        try: results = BibleOrgSysGlobals.unpickleObject( filename, BOOK_RESULTS_CACHE_FOLDERPATH )
+        except Exception as err:
+            logging.warning( f"Unable to load cached {resultsType} results for {self.workName} {self.BBB}: {err}" )
+            return None
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Using cached {resultsType} results for {self.workName} {self.BBB}" )
+        return results
+    # end of InternalBibleBook._loadCachedResults
+
+
+    def _saveCachedResults( self, resultsType:str, results, extraKey:str|None=None ) -> bool:
+        """
+        Saves the results for this book into the BOSObjectCache folder
+            so that they can be reused if the book hasn't changed.
+
+        Returns True if successful.
+        """
+        filename = self._getCachedResultsFilename( resultsType, extraKey )
+        if filename is None: return False
+        try: return BibleOrgSysGlobals.pickleObject( results, filename, BOOK_RESULTS_CACHE_FOLDERPATH )
+        except Exception as err:
+            logging.warning( f"Unable to save cached {resultsType} results for {self.workName} {self.BBB}: {err}" )
+            return False
+    # end of InternalBibleBook._saveCachedResults
+
+
     def _discover( self ):
         """
         Do a precheck on the book to try to determine its features.
 
+        If BibleOrgSysGlobals.bookResultsCacheFlag is set, the results are cached in the BOSObjectCache folder
+            so that they don't need to be remade if the book hasn't changed.
+        If the book has already been discovered, the results are remade from the kept counts.
+
+        Returns a dictionary containing the results for the book.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"_discover() for {self.BBB}" )
+        if '_discoveryTallies' in self.__dict__ and self._discoveryTallies[0] == self.getContentHash():
+            # We've already counted everything (or replaceChapterLines() has kept the counts up-to-date)
+            return self._finaliseDiscoveryResults( self._discoveryTallies[1] )
+        if not BibleOrgSysGlobals.bookResultsCacheFlag:
+            return self._makeDiscoveryResults()
+
+        if not self._processedFlag:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"InternalBibleBook '{self.workName}' {self.BBB}: processing lines called from 'discover'" )
+            self.processLines()
+        try: uwaFlag = self.containerBibleObject.uWencoded
+        except AttributeError: uwaFlag = False
+        extraKey = 'uW' if uwaFlag else None
+        bkDict = self._loadCachedResults( 'discover', extraKey )
+        if bkDict is None:
+            bkDict = self._makeDiscoveryResults()
+            self._saveCachedResults( 'discover', bkDict, extraKey )
+        return bkDict
+    # end of InternalBibleBook._discover
+
+
+    def _makeDiscoveryResults( self ):
+        """
+        Do a precheck on the book to try to determine its features.
+
         We later use these discoveries to note when the translation veers from their norm.
 
         Called from InternalBible.py (which first creates the Bible-wide dictionary
             and then consolidates the individual results).
 
+        The counts are kept (in self._discoveryTallies) so that replaceChapterLines() can update them.
+
         Returns a dictionary containing the results for the book.
             Note: Because this function can run in multiprocessing,
                     saving class variables won't persist.
         """
-        fnPrint( DEBUGGING_THIS_MODULE, f"_discover() for {self.BBB}" )
+        fnPrint( DEBUGGING_THIS_MODULE, f"_makeDiscoveryResults() for {self.BBB}" )
         if not self._processedFlag:
             vPrint( 'Info', DEBUGGING_THIS_MODULE, f"InternalBibleBook '{self.workName}' {self.BBB}: processing lines called from 'discover'" )
             self.processLines()
         if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: assert self._processedLines
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, f"InternalBibleBook._discover() for {self.BBB}…" )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, f"InternalBibleBook._makeDiscoveryResults() for {self.BBB}…" )
 
-        bkDict = {}
-        bkDict['chapterCount'] = bkDict['verseCount'] = bkDict['percentageProgress'] = None
-        bkDict['completedVerseCount'] = 0
-        bkDict['havePopulatedCVmarkers'] = bkDict['haveParagraphMarkers'] = bkDict['haveIntroductoryMarkers'] = False
-        bkDict['haveMainHeadings'] = False; bkDict['mainHeadingsCount'] = 0
-        bkDict['haveSectionHeadings'] = False; bkDict['sectionHeadingsCount'] = 0
-        bkDict['haveSectionReferences'] = False
-        bkDict['haveTables'] = bkDict['haveLists'] = False
-        bkDict['figuresCount'] = 0
-        bkDict['haveFootnotes'] = bkDict['haveFootnoteOrigins'] = False
-        bkDict['haveCrossReferences'] = bkDict['haveCrossReferenceOrigins'] = False
-        bkDict['sectionReferencesCount'] = bkDict['footnotesCount'] = bkDict['crossReferencesCount'] = 0
-        bkDict['sectionReferencesParenthesisRatio'] = bkDict['footnotesPeriodRatio'] = bkDict['crossReferencesPeriodRatio'] = -1.0
-        bkDict['haveIntroductoryText'] = bkDict['haveVerseText'] = False
-        bkDict['haveNestedUSFMarkers'] = False
-        bkDict['seemsFinished'] = None
+        tallies = self._countDiscoveryTallies()
+        self._discoveryTallies = ( self.getContentHash(), tallies )
+        return self._finaliseDiscoveryResults( tallies )
+    # end of InternalBibleBook._makeDiscoveryResults
+
+
+    def _countDiscoveryTallies( self, startIndex:int=0, endIndex:int|None=None ) -> dict[str,int|dict[str,int]]:
+        """
+        Count the features of the processed lines from startIndex up to (but not including) endIndex
+            (the whole book by default, or one chapter for replaceChapterLines()).
 
-        sectionRefParenthCount = footnotesPeriodCount = xrefsPeriodCount = 0
+        Everything is counted (even things that only end up as flags)
+            so that the tallies for a chapter can be subtracted from (or added to) the tallies for the book
+            -- see adjustDiscoveryTallies().
+        A verse with no text is counted with the 'v' entry (even if the next entry is in the next chapter).
 
-        # Initialise all our word counters
-        bkDict['wordCount'] = 0 #bkDict['uniqueWordCount'] = 0
-        bkDict['allWordCounts'], bkDict['allCaseInsensitiveWordCounts'] = {}, {}
-        bkDict['mainTextWordCounts'], bkDict['mainTextCaseInsensitiveWordCounts'] = {}, {}
+        Returns a dictionary of counts (including the word count dictionaries).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"_countDiscoveryTallies( {startIndex}, {endIndex} ) for {self.BBB}" )
+        numEntries = len( self._processedLines )
+        if endIndex is None: endIndex = numEntries
+
+        tallies = { tallyKey:0 for tallyKey in DISCOVERY_TALLY_COUNT_KEYS }
+        for tallyKey in DISCOVERY_TALLY_WORD_COUNT_KEYS: tallies[tallyKey] = {}
 
 
         def countWordsForDiscover( marker:str, segment:str, location:str ) -> None:
@@ -3244,74 +3789,68 @@ class InternalBibleBook:
                     #     if not char.isdigit() and char not in ':-,.': isAReferenceOrNumber = False; break
                     # if not isAReferenceOrNumber:
                     if any(map(lambda x:not x.isdigit() and x not in ':-,.', word )): # not a reference or number
-                        bkDict['wordCount'] += 1
-                        #if word not in bkDict['allWordCounts']:
-                            #bkDict['uniqueWordCount'] += 1
-                            #bkDict['allWordCounts'][word] = 1
-                        #else: bkDict['allWordCounts'][word] += 1
-                        bkDict['allWordCounts'][word] = 1 if word not in bkDict['allWordCounts'] else bkDict['allWordCounts'][word] + 1
-                        bkDict['allCaseInsensitiveWordCounts'][lcWord] = 1 if lcWord not in bkDict['allCaseInsensitiveWordCounts'] else bkDict['allCaseInsensitiveWordCounts'][lcWord] + 1
+                        tallies['wordCount'] += 1
+                        #if word not in tallies['allWordCounts']:
+                            #tallies['uniqueWordCount'] += 1
+                            #tallies['allWordCounts'][word] = 1
+                        #else: tallies['allWordCounts'][word] += 1
+                        tallies['allWordCounts'][word] = 1 if word not in tallies['allWordCounts'] else tallies['allWordCounts'][word] + 1
+                        tallies['allCaseInsensitiveWordCounts'][lcWord] = 1 if lcWord not in tallies['allCaseInsensitiveWordCounts'] else tallies['allCaseInsensitiveWordCounts'][lcWord] + 1
                         if location == 'main':
-                            bkDict['mainTextWordCounts'][word] = 1 if word not in bkDict['mainTextWordCounts'] else bkDict['mainTextWordCounts'][word] + 1
-                            bkDict['mainTextCaseInsensitiveWordCounts'][lcWord] = 1 if lcWord not in bkDict['mainTextCaseInsensitiveWordCounts'] else bkDict['mainTextCaseInsensitiveWordCounts'][lcWord] + 1
+                            tallies['mainTextWordCounts'][word] = 1 if word not in tallies['mainTextWordCounts'] else tallies['mainTextWordCounts'][word] + 1
+                            tallies['mainTextCaseInsensitiveWordCounts'][lcWord] = 1 if lcWord not in tallies['mainTextCaseInsensitiveWordCounts'] else tallies['mainTextCaseInsensitiveWordCounts'][lcWord] + 1
                     #else: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "excluded reference or number", word )
         # end of countWordsForDiscover
 
 
-        # _discover() main code
-        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  _discover() for {self.BBB} started…" )
+        # _countDiscoveryTallies() main code
+        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  _countDiscoveryTallies() for {self.BBB} started…" )
         C, V = '-1', '-1' # So first/id line starts at -1:0
         lastMarker = None
-        for entry in self._processedLines:
-            marker = entry.getMarker()
-            if '¬' in marker: continue # Just ignore end markers -- not needed here
+        for j in range( startIndex, endIndex ):
+            entry = self._processedLines[j]
+            marker, markerFlags = entry.getMarker(), entry.getMarkerFlags()
+            if markerFlags & MARKER_FLAG_END: continue # Just ignore end markers -- not needed here
             text, cleanText, extras = entry.getText(), entry.getCleanText(), entry.getExtras()
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Discover {self.BBB}_{C}:{V} {marker}={text}")
 
             # Keep track of where we are for more helpful error messages
             if marker=='c' and text:
                 C, V = text.split()[0], '0'
-                if bkDict['chapterCount'] is None: bkDict['chapterCount'] = 1
-                else: bkDict['chapterCount'] += 1
+                tallies['chapterCount'] += 1
             elif marker=='v' and text:
                 V = text.split()[0]
-                if bkDict['verseCount'] is None: bkDict['verseCount'] = 1
-                else: bkDict['verseCount'] += 1
-                if bkDict['chapterCount'] is None: # Some single chapter books don't have \c 1 explicitly encoded
+                tallies['verseCount'] += 1
+                if not tallies['chapterCount'] and not tallies['implicitChapterCount']: # Some single chapter books don't have \c 1 explicitly encoded
                     if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: assert C == '-1'
                     C = '1'
-                    bkDict['chapterCount'] = 1
-                bkDict['havePopulatedCVmarkers'] = True
-                if bkDict['seemsFinished'] is None: bkDict['seemsFinished'] = True
+                    tallies['implicitChapterCount'] = 1
             elif marker=='v~' and text:
-                bkDict['haveVerseText'] = True
-                bkDict['completedVerseCount'] += 1
+                tallies['verseTextCount'] += 1
+                tallies['completedVerseCount'] += 1
             elif marker in ('mt1','mt2','mt3','mt4'):
-                bkDict['haveMainHeadings'] = True
-                bkDict['mainHeadingsCount'] += 1
+                tallies['mainHeadingsCount'] += 1
             elif marker in ('s1','s2','s3','s4', 'qa'):
-                bkDict['haveSectionHeadings'] = True
-                bkDict['sectionHeadingsCount'] += 1
+                tallies['sectionHeadingsCount'] += 1
             elif marker=='r' and text:
-                bkDict['haveSectionReferences'] = True
-                bkDict['sectionReferencesCount'] += 1
-                if cleanText[0]=='(' and cleanText[-1]==')': sectionRefParenthCount += 1
-            elif marker in BibleOrgSysGlobals.USFMParagraphMarkers:
-                bkDict['haveParagraphMarkers'] = True
-                if text: bkDict['haveVerseText'] = True
+                tallies['sectionReferencesCount'] += 1
+                if cleanText[0]=='(' and cleanText[-1]==')': tallies['sectionRefParenthCount'] += 1
+            elif markerFlags & MARKER_FLAG_PARAGRAPH:
+                tallies['paragraphMarkersCount'] += 1
+                if text: tallies['verseTextCount'] += 1
             elif marker in ('is1','ip','iot','io1'):
-                bkDict['haveIntroductoryMarkers'] = True
-                if text: bkDict['haveIntroductoryText'] = True
+                tallies['introductoryMarkersCount'] += 1
+                if text: tallies['introductoryTextCount'] += 1
             elif marker == 'tr':
-                bkDict['haveTables'] = True
+                tallies['tablesCount'] += 1
             elif marker == 'li1':
-                bkDict['haveLists'] = True
+                tallies['listsCount'] += 1
 
-            if lastMarker=='v' and (marker!='v~' or not text): bkDict['seemsFinished'] = False
+            if lastMarker=='v' and (marker!='v~' or not text): tallies['unfinishedVerseCount'] += 1
             if text:
-                if '\\+' in text: bkDict['haveNestedUSFMarkers'] = True
-                bkDict['figuresCount'] += text.count( '\\fig ' )
-                if marker in BOS_PRINTABLE_MARKERS: # process this main text
+                if '\\+' in text: tallies['nestedUSFMarkersCount'] += 1
+                tallies['figuresCount'] += text.count( '\\fig ' )
+                if markerFlags & MARKER_FLAG_PRINTABLE: # process this main text
                     countWordsForDiscover( marker, cleanText, 'main' )
                 #else: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Ignoring {} {}:{} {}={}".format( self.BBB, C, V, marker, repr(text) ) )
 
@@ -3326,24 +3865,69 @@ class InternalBibleBook:
                         #assert 0 <= extraIndex <= len(text)+3
                         assert extraType in BOS_EXTRA_TYPES
                     if extraType=='fn':
-                        bkDict['haveFootnotes'] = True
-                        bkDict['footnotesCount'] += 1
-                        if '\\fr' in extraText: bkDict['haveFootnoteOrigins'] = True
+                        tallies['footnotesCount'] += 1
+                        if '\\fr' in extraText: tallies['footnoteOriginsCount'] += 1
                         if cleanExtraText and cleanExtraText[-1] in '.።' or cleanExtraText.endswith('.”'):
-                            footnotesPeriodCount += 1
+                            tallies['footnotesPeriodCount'] += 1
                     elif extraType=='xr':
-                        bkDict['haveCrossReferences'] = True
-                        bkDict['crossReferencesCount'] += 1
-                        if '\\xo' in extraText: bkDict['haveCrossReferenceOrigins'] = True
+                        tallies['crossReferencesCount'] += 1
+                        if '\\xo' in extraText: tallies['crossReferenceOriginsCount'] += 1
                         if cleanExtraText and cleanExtraText[-1] in '.።' or cleanExtraText.endswith('.”'):
-                            xrefsPeriodCount += 1
+                            tallies['xrefsPeriodCount'] += 1
                     if extraType not in ('fig','ww'): # No useful words in those two extra types
                         countWordsForDiscover( extraType, cleanExtraText, 'extra' )
             lastMarker = marker
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'wordCount', self.BBB, bkDict['wordCount'] )
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'uniqueWordCount', self.BBB, bkDict['uniqueWordCount'] )
+
+        if lastMarker == 'v': # Need to look at the next entry (after our range) to see if this verse has text
+            for j in range( endIndex, numEntries ):
+                entry = self._processedLines[j]
+                if entry.getMarkerFlags() & MARKER_FLAG_END: continue
+                if entry.getMarker()!='v~' or not entry.getText(): tallies['unfinishedVerseCount'] += 1
+                break
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'wordCount', self.BBB, tallies['wordCount'] )
+        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"    _countDiscoveryTallies() for {self.BBB} done word counts." )
+        return tallies
+    # end of InternalBibleBook._countDiscoveryTallies
+
+
+    def _finaliseDiscoveryResults( self, tallies:dict[str,int|dict[str,int]] ) -> dict:
+        """
+        Make the discovery results dictionary for the book from the tallies made by _countDiscoveryTallies().
+
+        Note that the word count dictionaries are used (not copied).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"_finaliseDiscoveryResults() for {self.BBB}" )
+        numChapters = tallies['chapterCount'] + tallies['implicitChapterCount']
+
+        bkDict = {}
+        bkDict['chapterCount'] = numChapters if numChapters else None
+        bkDict['verseCount'] = tallies['verseCount'] if tallies['verseCount'] else None
+        bkDict['percentageProgress'] = None
+        bkDict['completedVerseCount'] = tallies['completedVerseCount']
+        bkDict['havePopulatedCVmarkers'] = tallies['verseCount'] > 0
+        bkDict['haveParagraphMarkers'] = tallies['paragraphMarkersCount'] > 0
+        bkDict['haveIntroductoryMarkers'] = tallies['introductoryMarkersCount'] > 0
+        bkDict['haveMainHeadings'] = tallies['mainHeadingsCount'] > 0; bkDict['mainHeadingsCount'] = tallies['mainHeadingsCount']
+        bkDict['haveSectionHeadings'] = tallies['sectionHeadingsCount'] > 0; bkDict['sectionHeadingsCount'] = tallies['sectionHeadingsCount']
+        bkDict['haveSectionReferences'] = tallies['sectionReferencesCount'] > 0
+        bkDict['haveTables'] = tallies['tablesCount'] > 0
+        bkDict['haveLists'] = tallies['listsCount'] > 0
+        bkDict['figuresCount'] = tallies['figuresCount']
+        bkDict['haveFootnotes'] = tallies['footnotesCount'] > 0
+        bkDict['haveFootnoteOrigins'] = tallies['footnoteOriginsCount'] > 0
+        bkDict['haveCrossReferences'] = tallies['crossReferencesCount'] > 0
+        bkDict['haveCrossReferenceOrigins'] = tallies['crossReferenceOriginsCount'] > 0
+        bkDict['sectionReferencesCount'] = tallies['sectionReferencesCount']
+        bkDict['footnotesCount'] = tallies['footnotesCount']
+        bkDict['crossReferencesCount'] = tallies['crossReferencesCount']
+        bkDict['sectionReferencesParenthesisRatio'] = bkDict['footnotesPeriodRatio'] = bkDict['crossReferencesPeriodRatio'] = -1.0
+        bkDict['haveIntroductoryText'] = tallies['introductoryTextCount'] > 0
+        bkDict['haveVerseText'] = tallies['verseTextCount'] > 0
+        bkDict['haveNestedUSFMarkers'] = tallies['nestedUSFMarkersCount'] > 0
+        bkDict['seemsFinished'] = False if tallies['unfinishedVerseCount'] else (True if tallies['verseCount'] else None)
+        bkDict['wordCount'] = tallies['wordCount']
+        for tallyKey in DISCOVERY_TALLY_WORD_COUNT_KEYS: bkDict[tallyKey] = tallies[tallyKey]
         bkDict['uniqueWordCount'] = len( bkDict['allWordCounts'] )
-        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"    _discover() for {self.BBB} done word counts." )
 
         if bkDict['verseCount'] is None: # Things like front and end matter (don't have verse numbers)
             for aKey in ('verseCount','seemsFinished','chapterCount','percentageProgress'):
@@ -3371,19 +3955,19 @@ class InternalBibleBook:
             bkDict['partlyDone'] = bkDict['haveVerseText'] and not bkDict['seemsFinished']
 
         if bkDict['sectionReferencesCount']:
-            bkDict['sectionReferencesParenthesisRatio'] = round( sectionRefParenthCount / bkDict['sectionReferencesCount'], 2 )
+            bkDict['sectionReferencesParenthesisRatio'] = round( tallies['sectionRefParenthCount'] / bkDict['sectionReferencesCount'], 2 )
             bkDict['sectionReferencesParenthesisFlag'] = bkDict['sectionReferencesParenthesisRatio'] > 0.8
         if bkDict['footnotesCount']:
-            bkDict['footnotesPeriodRatio'] = round( footnotesPeriodCount / bkDict['footnotesCount'], 2 )
+            bkDict['footnotesPeriodRatio'] = round( tallies['footnotesPeriodCount'] / bkDict['footnotesCount'], 2 )
             bkDict['footnotesPeriodFlag'] = bkDict['footnotesPeriodRatio'] > 0.7
         if bkDict['crossReferencesCount']:
-            bkDict['crossReferencesPeriodRatio'] = round( xrefsPeriodCount / bkDict['crossReferencesCount'], 2 )
+            bkDict['crossReferencesPeriodRatio'] = round( tallies['xrefsPeriodCount'] / bkDict['crossReferencesCount'], 2 )
             bkDict['crossReferencesPeriodFlag'] = bkDict['crossReferencesPeriodRatio'] > 0.7
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, self.BBB, bkDict['sectionReferencesParenthesisRatio'] )
 
-        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"    _discover() for {self.BBB} finished." )
+        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"    _finaliseDiscoveryResults() for {self.BBB} finished." )
         return bkDict
-    # end of InternalBibleBook._discover
+    # end of InternalBibleBook._finaliseDiscoveryResults
 
 
     def getAddedUnits( self ):
@@ -5080,6 +5664,9 @@ class InternalBibleBook:
     def checkBook( self, discoveryDict=None, typicalAddedUnitData=None ) -> None:
         """
         Runs a number of checks on the book and returns the error dictionary.
+
+        If BibleOrgSysGlobals.bookResultsCacheFlag is set, the results are cached in the BOSObjectCache folder
+            so that the checks don't need to be redone if the book (and the relevant discovery results) haven't changed.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "checkBook()" )
         if not self._processedFlag:
@@ -5087,6 +5674,15 @@ class InternalBibleBook:
             self.processLines()
         if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: assert self._processedLines
 
+        if BibleOrgSysGlobals.bookResultsCacheFlag:
+            checkKey = hashlib.md5( repr( ( [discoveryDict.get( key ) for key in CHECK_DISCOVERY_KEYS] if discoveryDict else None,
+                                            typicalAddedUnitData is None, self.checkAddedUnitsFlag, self.checkUSFMSequencesFlag,
+                                            self.doExtraChecking, BibleOrgSysGlobals.strictCheckingFlag ) ).encode( 'utf-8' ) ).hexdigest()
+            cachedResults = self._loadCachedResults( 'check', checkKey )
+            if cachedResults is not None:
+                self.checkResultsDictionary = cachedResults
+                return
+
         # Ignore the result of these next ones -- just use any errors collected
         #self.getVersification() # This checks CV ordering, etc. at the same time
         # Further checks
@@ -5108,6 +5704,9 @@ class InternalBibleBook:
                 with open( filepath, 'rb' ) as pickleFile:
                     typicalAddedUnitData = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
             self.doCheckAddedUnits( typicalAddedUnitData )
+
+        if BibleOrgSysGlobals.bookResultsCacheFlag:
+            self._saveCachedResults( 'check', self.checkResultsDictionary, checkKey )
     # end of InternalBibleBook.checkBook
 
 
@@ -5239,15 +5838,24 @@ class InternalBibleBook:
         assert self.BBB == endBCVReference[0] if isinstance( endBCVReference, tuple ) else endBCVReference.getBBB()
         # dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  InternalBibleBook.getContextVerseData  {startBCVReference} to {endBCVReference}) {strict=} for {self.workName} {self.BBB}" )
 
-        verseEntryList, contextList = self.getContextVerseData( startBCVReference, strict=True )
-        assert isinstance( verseEntryList, InternalBibleEntryList )
-
-        # Now concatenate the verse lists for the following verses
         startC = startBCVReference[1] if isinstance( startBCVReference, tuple ) else startBCVReference.getC()
         startV = startBCVReference[2] if isinstance( startBCVReference, tuple ) else startBCVReference.getV()
         endC = endBCVReference[1] if isinstance( endBCVReference, tuple ) else endBCVReference.getC()
         endV = endBCVReference[2] if isinstance( endBCVReference, tuple ) else endBCVReference.getV()
 
+        # Usually the verses are all in order in the book, so we can find the whole range with a binary search
+        sortedCVIndex = self.getSortedCVIndex()
+        entryIndexes = sortedCVIndex.getVerseRangeEntryIndexes( (startC,startV), (endC,endV), self.getNumVerses )
+        if entryIndexes is not None:
+            startIndex, endIndex, contextList = entryIndexes
+            return InternalBibleEntryListView( sortedCVIndex.givenBibleEntries, startIndex, endIndex-startIndex ), contextList
+        # else we have to look up each verse (and handle any errors)
+
+        verseEntryList, contextList = self.getContextVerseData( startBCVReference, strict=True )
+        assert isinstance( verseEntryList, InternalBibleEntryList )
+
+        # Now concatenate the verse lists for the following verses
+
         # dPrint( 'Info', DEBUGGING_THIS_MODULE, f"InternalBibleBook.getContextVerseData concatenating {self.workName} {self.BBB} from {startC}:{startV} to {endC}:{endV} {strict=}" )
         intC = int(startC)
         intV = getLeadingInt(startV) + 1 # Handles strings like '4b'
@@ -5434,6 +6042,25 @@ def fullDemo() -> None:
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, UBErrors['Priority Errors'] )
     # end of demoFile
 
+    if 1: # Microbenchmark the tokenized _processLineFix code against the older step-by-step code
+        import time
+        from BibleOrgSys.Internals import InternalBibleBook as InternalBibleBookModule # (not __main__) since USFMBibleBook uses this one
+        testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFM3AllMarkersProject/' )
+        UBB = USFMBibleBook( 'USFM3Test', 'MAT' )
+        UBB.load( '70-MATeng-amp.usfm', testFolder, 'utf-8' )
+        UBB.rtsCount = UBB.fwmifCount = UBB.fswncCount = -1 # Don't repeat these warnings for every loop
+        testLines = [(marker,text) for marker,text in UBB._rawLines if text and '\\vp ' not in text] # \\vp fields adjust the previous entry
+        results, timings = {}, {}
+        for tokenizeFlag in (False, True):
+            InternalBibleBookModule.TOKENIZE_LINES_FLAG = tokenizeFlag
+            startTime = time.perf_counter()
+            for _loop in range( 10 ):
+                results[tokenizeFlag] = [UBB._processLineFix( '1', '1', marker, text, [] ) for marker,text in testLines]
+            timings[tokenizeFlag] = (time.perf_counter() - startTime) / 10
+            results[tokenizeFlag] = [(adjText, cleanText, [(extra.myType, extra.index, extra.noteText, extra.cleanNoteText) for extra in extras])
+                                                for adjText, cleanText, extras in results[tokenizeFlag]] # so we can compare them
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"_processLineFix on {len(testLines):,} lines: step-by-step {timings[False]*1000:.1f}ms, tokenized {timings[True]*1000:.1f}ms ({'same' if results[True]==results[False] else 'DIFFERENT'} results)" )
+
     from BibleOrgSys.InputOutput import USFMFilenames
     if 1: # Test a whole folder full of files
         name, encoding, testFolder = "Matigsalug", 'utf-8', Path( '/mnt/SSDs/Matigsalug/Bible/MBTV/' ) # You can put your test folder here
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# InternalBibleConcordance.py
+#
+# Module handling word concordances for internal Bibles
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module for making and reading word concordances for a whole Bible.
+
+A concordance maps each word (a maximal alphabetic run in the verse text,
+    folded for case and/or diacritics as requested)
+    to the sorted list of the verse ordinals that contain it.
+
+The verse ordinals are those of the Bible's InternalBibleVerseOrdinalIndex (see InternalBible.getVerseOrdinalIndex()),
+    i.e., they number every entry in each book's C:V index,
+    starting from zero, and going through the books in the Bible's book order.
+
+    writeConcordance( BibleObject, filepath, caselessFlag=True, ignoreDiacriticsFlag=False )
+        makes the postings and writes them into a single binary file.
+    BibleConcordance( filepath )
+        memory-maps the file and answers word frequency, co-occurrence
+        and "all verses containing X and Y" queries.
+
+The file contains:
+    8-byte magic string, 4-byte header length, JSON header
+        (with the work name, flags, book and verse keys, and the sorted term list),
+    then (4-byte aligned) arrays of the term postings offsets, verse counts, word counts,
+        and delta widths (1, 2 or 4 bytes),
+    then the postings themselves, each delta-encoded (from the previous verse ordinal)
+        and stored in the smallest width that holds its largest delta.
+
+The postings are decoded straight out of the memory-mapped file
+    (with memoryview.cast() and itertools.accumulate()) so nothing is unpacked until it's needed.
+"""
+from gettext import gettext as _
+from pathlib import Path
+import sys
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+if __name__ == '__main__':
+    import os.path
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint
+from BibleOrgSys.Internals.InternalBibleSearchIndexes import WORD_CHARACTERS_REGEX, getAlphaRuns, foldText
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+SHORT_PROGRAM_NAME = "BibleConcordance"
+PROGRAM_NAME = "Bible concordance handler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+CONCORDANCE_MAGIC = b'BOSConc\x01' # Change the last byte if the file format changes
+CONCORDANCE_FILENAME_ENDING = '.BOSConcordance'
+CONCORDANCE_TEXT_MARKERS = ('v~','p~') # The (processed) markers that contain the actual verse text
+DELTA_TYPECODES = { 1:'B', 2:'H', 4:'I' } # Delta width in bytes to array typecode
+
+
+
+def _getAlignedLength( length:int, alignment:int=4 ) -> int:
+    return (length + alignment - 1) // alignment * alignment
+
+
+
+def writeConcordance( BibleObject, filepath, caselessFlag:bool=True, ignoreDiacriticsFlag:bool=False ) -> bool:
+    """
+    Make the concordance postings for the (loaded) Bible
+        and write them to the given filepath.
+
+    Returns True if successful.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"writeConcordance( {BibleObject.getAName()}, {filepath}, {caselessFlag}, {ignoreDiacriticsFlag} )" )
+
+    bookList, verseKeys = [], []
+    postings, wordCounts = {}, {}
+    verseOrdinalIndex = BibleObject.getVerseOrdinalIndex() # Also processes the lines of the books if necessary
+    for BBB in verseOrdinalIndex.bookCodes:
+        bookEntries = BibleObject.books[BBB]._processedLines
+        bookOrdinalRange = verseOrdinalIndex.getBookOrdinalRange( BBB )
+        bookList.append( (BBB, bookOrdinalRange.start, len(bookOrdinalRange)) )
+        for ordinal in bookOrdinalRange:
+            _BBB, C, V = verseOrdinalIndex.getBCV( ordinal )
+            verseKeys.append( f'{C}:{V}' )
+            verseWords = set()
+            for entryIndex in verseOrdinalIndex.getEntryRange( ordinal ):
+                lineEntry = bookEntries[entryIndex]
+                if lineEntry.getMarker() not in CONCORDANCE_TEXT_MARKERS: continue
+                for run in WORD_CHARACTERS_REGEX.findall( foldText( lineEntry.getCleanText(), caselessFlag, ignoreDiacriticsFlag ) ):
+                    words = (run,) if run.isalpha() else [word for _startIx,_endIx,word in getAlphaRuns( run )]
+                    for word in words:
+                        wordCounts[word] = wordCounts.get( word, 0 ) + 1
+                        if word not in verseWords:
+                            verseWords.add( word )
+                            try: postings[word].append( ordinal )
+                            except KeyError: postings[word] = array( 'I', (ordinal,) )
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  writeConcordance found {len(postings):,} words in {len(verseOrdinalIndex):,} verses of {BibleObject.getAName()}" )
+
+    # Delta-encode the postings (which are already in ascending order)
+    sortedTerms = sorted( postings )
+    offsets, verseCounts, termWordCounts, widths = array( 'I' ), array( 'I' ), array( 'I' ), array( 'B' )
+    postingsBlob = bytearray()
+    for term in sortedTerms:
+        termPostings = postings[term]
+        deltas = array( 'I', (termPostings[0],) )
+        deltas.extend( termPostings[j] - termPostings[j-1] for j in range( 1, len(termPostings) ) )
+        maxDelta = max( deltas )
+        width = 1 if maxDelta < 0x100 else 2 if maxDelta < 0x10000 else 4
+        postingsBlob.extend( bytes( _getAlignedLength( len(postingsBlob), width ) - len(postingsBlob) ) ) # Pad to the alignment
+        offsets.append( len(postingsBlob) )
+        verseCounts.append( len(termPostings) )
+        termWordCounts.append( wordCounts[term] )
+        widths.append( width )
+        postingsBlob.extend( deltas.tobytes() if width == 4 else array( DELTA_TYPECODES[width], deltas ).tobytes() )
+
+    header = { 'workName':BibleObject.getAName( abbrevFirst=True ), 'createdBy':PROGRAM_NAME_VERSION,
+                'byteOrder':sys.byteorder, 'caselessFlag':caselessFlag, 'ignoreDiacriticsFlag':ignoreDiacriticsFlag,
+                'numWords':sum( wordCounts.values() ),
+                'books':bookList, 'verseKeys':verseKeys, 'terms':sortedTerms, }
+    headerBytes = json.dumps( header, ensure_ascii=False, separators=(',',':') ).encode( 'utf-8' )
+    filepath = Path( filepath )
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, '  writeConcordance: ' + _("Writing {:,} words to {!r}…").format( len(sortedTerms), filepath ) )
+    with open( filepath, 'wb' ) as concordanceFile:
+        concordanceFile.write( CONCORDANCE_MAGIC )
+        concordanceFile.write( struct.pack( '<I', len(headerBytes) ) )
+        concordanceFile.write( headerBytes )
+        for someArray in (offsets, verseCounts, termWordCounts, widths):
+            position = concordanceFile.tell()
+            concordanceFile.write( bytes( _getAlignedLength( position ) - position ) )
+            concordanceFile.write( someArray.tobytes() )
+        position = concordanceFile.tell()
+        concordanceFile.write( bytes( _getAlignedLength( position ) - position ) )
+        concordanceFile.write( postingsBlob )
+    return True
+# end of writeConcordance
+
+
+
+class BibleConcordance:
+    """
+    Class to answer word queries from a concordance file (as written by writeConcordance()).
+
+    The file is memory-mapped and the postings are only decoded when they're needed.
+    Queries are folded in the same way as the concordance words were.
+    """
+    def __init__( self, filepath ) -> None:
+        """
+        Open and memory-map the concordance file.
+
+        Raises a ValueError if it's not a usable concordance file.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleConcordance.__init__( {filepath} )" )
+        self.filepath = Path( filepath )
+        with open( self.filepath, 'rb' ) as concordanceFile:
+            self._mmap = mmap.mmap( concordanceFile.fileno(), 0, access=mmap.ACCESS_READ )
+        if self._mmap[:len(CONCORDANCE_MAGIC)] != CONCORDANCE_MAGIC:
+            self._mmap.close()
+            raise ValueError( f"{self.filepath} isn't a {PROGRAM_NAME_VERSION} concordance file" )
+        position = len(CONCORDANCE_MAGIC)
+        headerLength, = struct.unpack_from( '<I', self._mmap, position )
+        position += 4
+        header = json.loads( self._mmap[position:position+headerLength].decode( 'utf-8' ) )
+        if header['byteOrder'] != sys.byteorder:
+            self._mmap.close()
+            raise ValueError( f"{self.filepath} concordance was written on a {header['byteOrder']}-endian system" )
+        position += headerLength
+
+        self.workName = header['workName']
+        self.caselessFlag, self.ignoreDiacriticsFlag = header['caselessFlag'], header['ignoreDiacriticsFlag']
+        self.numWords = header['numWords']
+        self.verseKeys = header['verseKeys']
+        self.bookList = [BBB for BBB,_firstOrdinal,_numVerses in header['books']]
+        self._bookFirstOrdinals = [firstOrdinal for _BBB,firstOrdinal,_numVerses in header['books']]
+        self.terms = header['terms']
+        self._termIndexes = { term:j for j,term in enumerate( self.terms ) }
+
+        self._memoryview = memoryview( self._mmap )
+        numTerms = len(self.terms)
+        arrays = []
+        for typecode,itemSize in (('I',4), ('I',4), ('I',4), ('B',1)):
+            position = _getAlignedLength( position )
+            arrays.append( self._memoryview[position:position+numTerms*itemSize].cast( typecode ) )
+            position += numTerms * itemSize
+        self._offsets, self._verseCounts, self._wordCounts, self._widths = arrays
+        self._postingsStart = _getAlignedLength( position )
+    # end of BibleConcordance.__init__
+
+
+    def __str__( self ) -> str:
+        """
+        This method returns the string representation of a Bible concordance.
+        """
+        result = f"BibleConcordance object for {self.workName}"
+        result += f"\n  {len(self.terms):,} different words ({self.numWords:,} total) in {len(self.verseKeys):,} verses of {len(self.bookList)} books"
+        result += f"\n  caseless={self.caselessFlag} ignoreDiacritics={self.ignoreDiacriticsFlag} from {self.filepath}"
+        return result
+    # end of BibleConcordance.__str__
+
+    def __len__( self ) -> int:
+        return len( self.terms )
+
+    def __contains__( self, word:str ) -> bool:
+        return foldText( word, self.caselessFlag, self.ignoreDiacriticsFlag ) in self._termIndexes
+
+
+    def close( self ) -> None:
+        """
+        Release the memory-mapped file.
+        """
+        for someArray in (self._offsets, self._verseCounts, self._wordCounts, self._widths):
+            someArray.release()
+        self._memoryview.release()
+        self._mmap.close()
+    # end of BibleConcordance.close
+
+
+    def _getTermIndex( self, word:str ) -> int|None:
+        return self._termIndexes.get( foldText( word, self.caselessFlag, self.ignoreDiacriticsFlag ) )
+
+
+    def getWordFrequency( self, word:str ) -> tuple[int,int]:
+        """
+        Returns a 2-tuple with the number of times the word occurs
+            and the number of verses that it occurs in
+            (both zero if the word isn't in the concordance).
+        """
+        termIndex = self._getTermIndex( word )
+        if termIndex is None: return 0, 0
+        return self._wordCounts[termIndex], self._verseCounts[termIndex]
+    # end of BibleConcordance.getWordFrequency
+
+
+    def getMostFrequentWords( self, maxResults:int=20 ) -> list[tuple[str,int]]:
+        """
+        Returns a list of up to maxResults 2-tuples (word, wordCount), most frequent first.
+        """
+        wordCounts = self._wordCounts
+        termIndexes = sorted( range( len(self.terms) ), key=lambda j: -wordCounts[j] )[:maxResults]
+        return [(self.terms[j], wordCounts[j]) for j in termIndexes]
+    # end of BibleConcordance.getMostFrequentWords
+
+
+    def getOrdinals( self, word:str ) -> array:
+        """
+        Returns an array of the (ascending) verse ordinals containing the word.
+        """
+        termIndex = self._getTermIndex( word )
+        if termIndex is None: return array( 'I' )
+        width, count = self._widths[termIndex], self._verseCounts[termIndex]
+        start = self._postingsStart + self._offsets[termIndex]
+        deltas = self._memoryview[start:start+count*width].cast( DELTA_TYPECODES[width] )
+        try: return array( 'I', accumulate( deltas ) )
+        finally: deltas.release()
+    # end of BibleConcordance.getOrdinals
+
+
+    def getOrdinalsWithAll( self, words:list[str] ) -> list[int]:
+        """
+        Returns a sorted list of the ordinals of the verses which contain all of the given words.
+        """
+        postingsList = sorted( (self.getOrdinals( word ) for word in words), key=len )
+        if not postingsList: return []
+        if len(postingsList) == 1: return list( postingsList[0] )
+        results = set( postingsList[0] ) # Start with the rarest word
+        for postings in postingsList[1:]:
+            results.intersection_update( postings )
+            if not results: return []
+        return sorted( results )
+    # end of BibleConcordance.getOrdinalsWithAll
+
+
+    def getCoOccurrenceCount( self, word1:str, word2:str ) -> int:
+        """
+        Returns the number of verses that contain both of the words.
+        """
+        return len( self.getOrdinalsWithAll( [word1, word2] ) )
+    # end of BibleConcordance.getCoOccurrenceCount
+
+
+    def getOrdinalKey( self, ordinal:int ) -> tuple[str,str,str]:
+        """
+        Returns the (BBB,C,V) 3-tuple for the verse ordinal
+            (where V might be a verse range as used in the C:V index).
+        """
+        bookIndex = bisect_left( self._bookFirstOrdinals, ordinal+1 ) - 1
+        C, V = self.verseKeys[ordinal].split( ':', 1 )
+        return self.bookList[bookIndex], C, V
+    # end of BibleConcordance.getOrdinalKey
+
+
+    def findVersesWithAll( self, words:list[str] ) -> list[SimpleVerseKey]:
+        """
+        Returns a list of SimpleVerseKeys for the verses which contain all of the given words.
+
+        Note that any verse bridges are removed, i.e., the key is for the first verse.
+        """
+        results = []
+        for ordinal in self.getOrdinalsWithAll( words ):
+            BBB, C, V = self.getOrdinalKey( ordinal )
+            ixHyphen = V.find( '-' )
+            if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+            results.append( SimpleVerseKey( BBB, C, V ) )
+        return results
+    # end of BibleConcordance.findVersesWithAll
+# end of class BibleConcordance
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest2/' )
+    UB = USFMBible( testFolder, "Matigsalug", 'MBTV' )
+    UB.load()
+    outputFolderpath = BibleOrgSysGlobals.DEFAULT_WRITEABLE_OUTPUT_FOLDERPATH.joinpath( 'BOS_Concordance_Export/' )
+    UB.toConcordance( outputFolderpath )
+
+    concordance = BibleConcordance( outputFolderpath.joinpath( f'MBTV{CONCORDANCE_FILENAME_ENDING}' ) )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, concordance )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Most frequent words: {concordance.getMostFrequentWords( 10 )}" )
+    for word in ( 'kandin', 'Manama', 'Hisus', ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {word!r} frequency is {concordance.getWordFrequency( word )}" )
+    verseKeys = concordance.findVersesWithAll( ['Hisus','Manama'] )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Found 'Hisus' and 'Manama' in {len(verseKeys):,} verses: {[verseKey.getShortText() for verseKey in verseKeys[:10]]}…" )
+    concordance.close()
+# end of InternalBibleConcordance.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of InternalBibleConcordance.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of InternalBibleConcordance.py
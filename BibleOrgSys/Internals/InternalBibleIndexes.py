@@ -35,10 +35,17 @@ Module for defining and manipulating Bible indexes including:
             and each successive line has a successive verse number.
         Everything before verse 1 in regular chapters
             is considered as verse 0, e.g., many section headings, etc.
+    InternalBibleBookSortedCVIndex
+        The same C:V index entries held in sorted integer arrays
+            for binary searching of verse ranges, etc.
 
     InternalBibleBookSectionIndexEntry
     InternalBibleBookSectionIndex
 
+    InternalBibleVerseOrdinalIndex
+        Numbers every C:V index entry across all the books of a Bible
+            with a dense integer (starting from zero).
+
 Some notes about internal formats:
     The BibleOrgSys internal format is based on
         ESFM (see https://Freely-Given.org/Software/BibleDropBox/ESFMBibles.html )
@@ -74,10 +81,20 @@ CHANGELOG:
     2023-04-13 Put verse ranges and suffixes back into CV index entries -- this might be a breaking change for some applications???
     2023-06-02 Allow finding all verses and verse ranges (esp. for notes, commentaries)
     2025-05-21 Combine c/ms1/s1 section headings in section heading index for Psalms
+    2025-06-12 Added InternalBibleVerseOrdinalIndex (Bible-wide verse ordinals)
+    2025-06-16 Added InternalBibleBookSortedCVIndex (bisect searches)
+    2025-06-17 Return InternalBibleEntryListViews (rather than copies) of the book entries
+    2025-06-18 Added InternalBibleVerseCache (LRU cache of verse lookups)
+    2025-06-22 Added InternalBibleBookCVIndex.replaceChapterIndexEntries() for patching the index after a chapter is edited
+    2025-06-26 Added InternalBibleVerseOrdinalIndex.getEntryRange() (so that writeConcordance() can use the same verse ordinals)
 """
+from __future__ import annotations # So we can use typing -> ClassName (before Python 3.10)
 from gettext import gettext as _
 from pathlib import Path
 import logging
+from array import array
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
 
 if __name__ == '__main__':
     import os.path
@@ -87,13 +104,14 @@ if __name__ == '__main__':
         sys.path.insert( 0, aboveAboveFolderpath )
 from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
-from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList, BOS_NESTING_MARKERS, BOS_END_MARKERS, getLeadingInt
+from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntryList, InternalBibleEntryListView, \
+    BOS_NESTING_MARKERS, BOS_END_MARKERS, getLeadingInt
 
 
-LAST_MODIFIED_DATE = '2025-05-22' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "BibleIndexes"
 PROGRAM_NAME = "Bible indexes handler"
-PROGRAM_VERSION = '0.94'
+PROGRAM_VERSION = '0.98'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -260,9 +278,7 @@ class InternalBibleBookCVIndex:
                     indexEntry = self.__indexData[someCVkey]
                     break
             else: raise k
-        result = self.givenBibleEntries[indexEntry.getEntryIndex():indexEntry.getNextEntryIndex()]
-        assert isinstance( result, InternalBibleEntryList )
-        return result
+        return InternalBibleEntryListView( self.givenBibleEntries, indexEntry.getEntryIndex(), indexEntry.getEntryCount() )
     # end of InternalBibleBookCVIndex.getVerseEntries
 
 
@@ -275,9 +291,9 @@ class InternalBibleBookCVIndex:
         firstIndexEntry = self.__indexData[(C,'0')]
         try:
             nextIndexEntry = self.__indexData[(str(int(C)+1),'0')]
-            return self.givenBibleEntries[firstIndexEntry.getEntryIndex():nextIndexEntry.getEntryIndex()]
+            return InternalBibleEntryListView( self.givenBibleEntries, firstIndexEntry.getEntryIndex(), nextIndexEntry.getEntryIndex()-firstIndexEntry.getEntryIndex() )
         except KeyError: # presumably no more chapters
-            return self.givenBibleEntries[firstIndexEntry.getEntryIndex():]
+            return InternalBibleEntryListView( self.givenBibleEntries, firstIndexEntry.getEntryIndex(), len(self.givenBibleEntries)-firstIndexEntry.getEntryIndex() )
     # end of InternalBibleBookCVIndex.getChapterEntries
 
 
@@ -391,10 +407,13 @@ class InternalBibleBookCVIndex:
         # if len(indexEntries) > 1:
         #     print( f"InternalBibleBookCVIndex.getVerseEntriesWithContext {self.workName} {self.BBB} got {len(indexEntries)} results for {CVkey} {strict=} {complete=}")
         #     print( f"{indexEntries}" )
-        verseEntryList = InternalBibleEntryList()
-        for ii,indexEntry in enumerate( indexEntries ):       
-            # print( f"{ii}: {indexEntry}" )
-            verseEntryList += InternalBibleEntryList( self.givenBibleEntries[indexEntry.getEntryIndex():indexEntry.getNextEntryIndex()] )
+        if len(indexEntries) == 1: # the usual case -- no need to copy the entries
+            verseEntryList = InternalBibleEntryListView( self.givenBibleEntries, indexEntries[0].getEntryIndex(), indexEntries[0].getEntryCount() )
+        else:
+            verseEntryList = InternalBibleEntryList()
+            for ii,indexEntry in enumerate( indexEntries ):
+                # print( f"{ii}: {indexEntry}" )
+                verseEntryList += InternalBibleEntryListView( self.givenBibleEntries, indexEntry.getEntryIndex(), indexEntry.getEntryCount() )
 
         # Just clean up if we have a single meaningless entry
         # Hmmh, doesn't work well -- we don't want to return an empty list
@@ -428,18 +447,19 @@ class InternalBibleBookCVIndex:
         except KeyError as err:
             (logging.warning if C=='0' else logging.error)( f"getChapterEntriesWithContext {self.workName} couldn't get {self.BBB} ({C},0){f' from {self.__indexData.keys()}' if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag else ''}")
             raise err
+        firstEntryIndex = firstIndexEntry.getEntryIndex()
         try:
             nextIndexEntry = self.__indexData[(str(int(C)+1),'0')]
-            return InternalBibleEntryList( self.givenBibleEntries[firstIndexEntry.getEntryIndex():nextIndexEntry.getEntryIndex()] ), firstIndexEntry.getContextList()
+            return InternalBibleEntryListView( self.givenBibleEntries, firstEntryIndex, nextIndexEntry.getEntryIndex()-firstEntryIndex ), firstIndexEntry.getContextList()
         except KeyError: # Couldn't find the next chapter
             if C != '-1': # presumably no more chapters
-                return InternalBibleEntryList( self.givenBibleEntries[firstIndexEntry.getEntryIndex():] ), firstIndexEntry.getContextList()
+                return InternalBibleEntryListView( self.givenBibleEntries, firstEntryIndex, len(self.givenBibleEntries)-firstEntryIndex ), firstIndexEntry.getContextList()
             # else it's a bit more complicated finding the introduction because mostly there's no chapter zero
             try:
                 nextIndexEntry = self.__indexData[('1','0')]
-                return InternalBibleEntryList( self.givenBibleEntries[firstIndexEntry.getEntryIndex():nextIndexEntry.getEntryIndex()] ), firstIndexEntry.getContextList()
+                return InternalBibleEntryListView( self.givenBibleEntries, firstEntryIndex, nextIndexEntry.getEntryIndex()-firstEntryIndex ), firstIndexEntry.getContextList()
             except KeyError: # give up and just return everything
-                return InternalBibleEntryList( self.givenBibleEntries[firstIndexEntry.getEntryIndex():] ), firstIndexEntry.getContextList()
+                return InternalBibleEntryListView( self.givenBibleEntries, firstEntryIndex, len(self.givenBibleEntries)-firstEntryIndex ), firstIndexEntry.getContextList()
     # end of InternalBibleBookCVIndex.getChapterEntriesWithContext
 
 
@@ -758,6 +778,44 @@ class InternalBibleBookCVIndex:
     # end of InternalBibleBookCVIndex.makeBookCVIndex
 
 
+    def replaceChapterIndexEntries( self, C:str, newChapterCVIndex:InternalBibleBookCVIndex, offset:int, oldEndIndex:int, delta:int,
+                                        outerContext:list[str]|None=None ) -> None:
+        """
+        Patch the index after the entries for chapter C have been replaced (in self.givenBibleEntries).
+
+        The new index entries for chapter C are taken from newChapterCVIndex
+            (which was made from a separate list of entries, so offset is added to their entry indexes),
+            and the entries at or after oldEndIndex (i.e., for the following chapters) are moved by delta.
+        outerContext (e.g., ['intro']) is put before the new contextMarkerLists if given.
+
+        The caller must have checked that the contextMarkerLists at the start and end of the chapter haven't changed.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookCVIndex.replaceChapterIndexEntries( {C}, {newChapterCVIndex}, {offset}, {oldEndIndex}, {delta}, {outerContext} ) for {self.BBB}" )
+        assert self._indexedFlag
+        assert C != '-1' # Can't do the book introduction this way
+
+        newIndexData:dict[tuple[str,str],InternalBibleBookCVIndexEntry] = {}
+        addedNewChapter = False
+        for CVKey, indexEntry in self.__indexData.items():
+            if CVKey[0] == C: # Replace all of the old chapter entries at once
+                if not addedNewChapter:
+                    for newCVKey, newIndexEntry in newChapterCVIndex.items():
+                        if newCVKey[0] == C:
+                            newIndexData[newCVKey] = InternalBibleBookCVIndexEntry( newIndexEntry.entryIndex+offset, newIndexEntry.entryCount,
+                                                            outerContext + newIndexEntry.context if outerContext else newIndexEntry.context )
+                    addedNewChapter = True
+                continue
+            if delta and indexEntry.entryIndex >= oldEndIndex: # It's in a following chapter
+                indexEntry = InternalBibleBookCVIndexEntry( indexEntry.entryIndex+delta, indexEntry.entryCount, indexEntry.context )
+            newIndexData[CVKey] = indexEntry
+        assert addedNewChapter
+        self.__indexData = newIndexData
+
+        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag or DEBUGGING_THIS_MODULE:
+            self.checkBookCVIndex() # Make sure our code above worked properly
+    # end of InternalBibleBookCVIndex.replaceChapterIndexEntries
+
+
     def checkBookCVIndex( self ) -> None:
         """
         Just run a quick internal check on the index.
@@ -956,6 +1014,364 @@ class InternalBibleBookCVIndex:
 
 
 
+def _parseVerseSpan( V:str ) -> tuple[int,int]:
+    """
+    Given a verse string like '7', '7b', '7-9', or '7,9',
+        returns the first and last verse numbers (as integers).
+
+    Raises ValueError if there's no valid verse number(s).
+    """
+    if '-' in V: # a verse range (bridge)
+        V1, V2 = V.split( '-' )
+        return getLeadingInt(V1), getLeadingInt(V2)
+    if ',' in V: # a list of verses
+        intVerses = [int(Vx) for Vx in V.split( ',' )]
+        return min(intVerses), max(intVerses)
+    intV = getLeadingInt( V ) # Handles suffixes like '7b'
+    return intV, intV
+# end of _parseVerseSpan
+
+
+class InternalBibleBookSortedCVIndex:
+    """
+    An alternative C:V index for an internal Bible book,
+        made from the (dictionary-based) InternalBibleBookCVIndex.
+
+    The index entries are held in parallel integer arrays
+        sorted by chapter number and then by the first verse number (then by entry index).
+    So exact verses, verse ranges (bridges) and lists, verses with letter suffixes,
+        and chapter ranges can all be found by binary search (rather than by scanning all the keys).
+
+    The get functions give the same results as the InternalBibleBookCVIndex ones.
+    """
+    __slots__ = ('workName','BBB','givenBibleEntries',
+                 '_sortKeys','_chapters','_verseStarts','_verseEnds','_entryIndexes','_entryCounts',
+                 '_CVKeys','_contextLists','_otherIndexEntries','_maxVerseSpan') # Define allowed self variables (more efficient than a dict when have many instances)
+
+    SORT_KEY_MULTIPLIER = 1 << 20 # Must be much bigger than any verse (or introduction line) number
+
+
+    def __init__( self, workName, BBB ) -> None:
+        """
+        Creates an empty sorted index object for a Bible book.
+        """
+        self.workName, self.BBB = workName, BBB
+        self.givenBibleEntries = None
+        self._sortKeys = array( 'q' ) # Made from the chapter and the first verse number -- used for bisecting
+        self._chapters, self._verseStarts, self._verseEnds = array( 'i' ), array( 'i' ), array( 'i' )
+        self._entryIndexes, self._entryCounts = array( 'I' ), array( 'I' ) # Into givenBibleEntries
+        self._CVKeys:list[tuple[str,str]] = [] # Shares the actual key tuples from the C:V index
+        self._contextLists:list[list[str]] = [] # Shares the actual context lists from the C:V index
+        self._otherIndexEntries:dict[tuple[str,str],InternalBibleBookCVIndexEntry] = {} # For any keys that we couldn't convert to integers
+        self._maxVerseSpan = 0 # The largest number of extra verses in any verse range or list
+    # end of InternalBibleBookSortedCVIndex.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index.
+        """
+        return f"InternalBibleBookSortedCVIndex object for {self.BBB}: {len(self):,} index entries"
+    # end of InternalBibleBookSortedCVIndex.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self._CVKeys ) + len( self._otherIndexEntries )
+
+    def __contains__( self, keyStartCVDuple:tuple[str,str] ) -> bool:
+        return self._findRow( keyStartCVDuple ) is not None or keyStartCVDuple in self._otherIndexEntries
+    def __getitem__( self, keyStartCVDuple:tuple[str,str] ) -> InternalBibleBookCVIndexEntry:
+        row = self._findRow( keyStartCVDuple )
+        if row is None: return self._otherIndexEntries[keyStartCVDuple] # Gives a KeyError if not found
+        return InternalBibleBookCVIndexEntry( self._entryIndexes[row], self._entryCounts[row], self._contextLists[row] )
+
+
+    def makeIndex( self, CVIndex:InternalBibleBookCVIndex ) -> None:
+        """
+        Makes the sorted arrays from the given (already made) C:V index.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookSortedCVIndex.makeIndex( {CVIndex} ) for {self.workName} {self.BBB}" )
+
+        self.__init__( self.workName, self.BBB ) # Clear out any earlier data
+        self.givenBibleEntries = CVIndex.givenBibleEntries
+        rows = []
+        for CVKey,indexEntry in CVIndex.items():
+            C, V = CVKey
+            try: intC, (verseStart, verseEnd) = int(C), _parseVerseSpan( V )
+            except ValueError:
+                logging.error( f"InternalBibleBookSortedCVIndex.makeIndex {self.workName} {self.BBB} couldn't sort {C}:{V} index entry" )
+                self._otherIndexEntries[CVKey] = indexEntry
+                continue
+            rows.append( (intC, verseStart, indexEntry.getEntryIndex(), verseEnd, CVKey, indexEntry) )
+        rows.sort() # The entry indexes are unique, so the keys and entries themselves never get compared
+
+        for intC, verseStart, entryIndex, verseEnd, CVKey, indexEntry in rows:
+            self._sortKeys.append( intC * InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER + verseStart )
+            self._chapters.append( intC )
+            self._verseStarts.append( verseStart )
+            self._verseEnds.append( verseEnd )
+            self._entryIndexes.append( entryIndex )
+            self._entryCounts.append( indexEntry.getEntryCount() )
+            self._CVKeys.append( CVKey )
+            self._contextLists.append( indexEntry.getContextList() )
+            if verseEnd - verseStart > self._maxVerseSpan: self._maxVerseSpan = verseEnd - verseStart
+    # end of InternalBibleBookSortedCVIndex.makeIndex
+
+
+    def _getRowRange( self, intC:int, firstVint:int, lastVint:int ) -> range:
+        """
+        Returns the range of rows (in sorted order)
+            for chapter intC with first verse numbers from firstVint to lastVint (inclusive).
+        """
+        return range( bisect_left( self._sortKeys, intC * InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER + firstVint ),
+                        bisect_right( self._sortKeys, intC * InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER + lastVint ) )
+    # end of InternalBibleBookSortedCVIndex._getRowRange
+
+
+    def _findRow( self, CVKey:tuple[str,str] ) -> int|None:
+        """
+        Returns the row for the exact C:V key or None if it's not there.
+        """
+        try: intC, (verseStart, _verseEnd) = int(CVKey[0]), _parseVerseSpan( CVKey[1] )
+        except ValueError: return None
+        for row in self._getRowRange( intC, verseStart, verseStart ):
+            if self._CVKeys[row] == CVKey: return row
+        return None
+    # end of InternalBibleBookSortedCVIndex._findRow
+
+
+    def _getRowEntries( self, row:int ) -> InternalBibleEntryList:
+        """
+        Returns the InternalBibleEntryList for the given row (or InternalBibleBookCVIndexEntry for any odd keys).
+        """
+        if isinstance( row, InternalBibleBookCVIndexEntry ):
+            return InternalBibleEntryListView( self.givenBibleEntries, row.getEntryIndex(), row.getEntryCount() )
+        return InternalBibleEntryListView( self.givenBibleEntries, self._entryIndexes[row], self._entryCounts[row] )
+    # end of InternalBibleBookSortedCVIndex._getRowEntries
+
+
+    def _findExactRowOrEntry( self, CVKey:tuple[str,str] ) -> int|InternalBibleBookCVIndexEntry:
+        """
+        Returns the row for the exact C:V key
+            or else the InternalBibleBookCVIndexEntry if it's one of the keys that we couldn't sort.
+
+        Raises a KeyError if the CV key doesn't exist.
+        """
+        row = self._findRow( CVKey )
+        if row is None: return self._otherIndexEntries[CVKey] # Gives a KeyError if not found
+        return row
+    # end of InternalBibleBookSortedCVIndex._findExactRowOrEntry
+
+
+    def _findIncludingRows( self, C:str, desiredVint:int, complete:bool ) -> list[int]:
+        """
+        Returns the rows (in text order) for the verse ranges, verse lists, and suffixed verses (like '50a')
+            in chapter C that include the desired verse number.
+
+        Only the rows that can possibly include the desired verse are checked.
+
+        If complete is not set, we stop after finding a verse range or suffixed verse
+            (same as InternalBibleBookCVIndex.getVerseEntriesWithContext).
+        """
+        rows = []
+        for row in sorted( self._getRowRange( int(C), desiredVint-self._maxVerseSpan, desiredVint ), key=self._entryIndexes.__getitem__ ):
+            ixC, ixV = self._CVKeys[row]
+            if ixC == C:
+                if '-' in ixV: # must include a verse range
+                    if self._verseStarts[row] <= desiredVint <= self._verseEnds[row]:
+                        rows.append( row )
+                        if not complete: break # we found a range that includes the verse we're looking for
+                elif ',' in ixV:
+                    for ixVx in ixV.split( ',' ):
+                        if desiredVint == int(ixVx):
+                            rows.append( row )
+                            if not complete: break # we found a list of verses that includes the verse we're looking for
+                elif not ixV.isdigit(): # not a verse range, so might be something like '50a'
+                    if desiredVint == self._verseStarts[row]:
+                        rows.append( row )
+                        if not complete: break # we found a partial verse that includes the verse we're looking for
+        return rows
+    # end of InternalBibleBookSortedCVIndex._findIncludingRows
+
+
+    def getVerseEntries( self, CVkey:tuple[str,str], strict=True ) -> InternalBibleEntryList:
+        """
+        Given C:V, return the InternalBibleEntryList containing the InternalBibleEntries for this verse.
+
+        Raises a KeyError if the CV key doesn't exist.
+
+        If strict is false, after failing to find the exact key,
+            it will also look for bridged verses starting with that verse.
+        """
+        try: return self._getRowEntries( self._findExactRowOrEntry( CVkey ) )
+        except KeyError as k:
+            if strict: raise k
+            C, V = CVkey
+            try: intC, intV = int(C), getLeadingInt(V)
+            except ValueError: raise k
+            searchVString = f'{V}-'
+            for row in sorted( self._getRowRange( intC, intV, intV ), key=self._entryIndexes.__getitem__ ):
+                ixC, ixV = self._CVKeys[row]
+                if ixC == C and ixV.startswith( searchVString ): # Yes, it's there but bridged
+                    return self._getRowEntries( row )
+            raise k
+    # end of InternalBibleBookSortedCVIndex.getVerseEntries
+
+
+    def getChapterEntries( self, C:str ) -> InternalBibleEntryList:
+        """
+        Given C, return the InternalBibleEntryList containing the InternalBibleEntries for this chapter.
+
+        Raises a KeyError if the C key doesn't exist.
+        """
+        firstEntryIndex = self[(C,'0')].getEntryIndex()
+        try: nextEntryIndex = self[(str(int(C)+1),'0')].getEntryIndex()
+        except KeyError: nextEntryIndex = len( self.givenBibleEntries ) # presumably no more chapters
+        return InternalBibleEntryListView( self.givenBibleEntries, firstEntryIndex, nextEntryIndex-firstEntryIndex )
+    # end of InternalBibleBookSortedCVIndex.getChapterEntries
+
+
+    def getVerseEntriesWithContext( self, CVkey:tuple[str,str], strict:bool|None=False, complete:bool|None=False ) -> tuple[InternalBibleEntryList,list[str]]:
+        """
+        Given C:V, return a 2-tuple containing
+            the InternalBibleEntryList containing the InternalBibleEntries for this verse,
+            along with the context for this verse.
+
+        Raises a KeyError if the CV key doesn't exist.
+
+        If the strict flag is not set, we try to remove any letter suffix
+            and/or to search verse ranges for a match.
+
+        If complete flag is set, try to find every reference with that verse.
+        """
+        C, V = CVkey
+        int( C ) # Gives a ValueError for a bad chapter number (same as InternalBibleBookCVIndex)
+        desiredVint = getLeadingInt( V )
+        rowsOrEntries = self._findIncludingRows( C, desiredVint, complete=True ) if complete else []
+
+        # Now look for specific verses that match
+        try: rowsOrEntries.append( self._findExactRowOrEntry( CVkey ) )
+        except KeyError:
+            if strict or C=='-1': # strict selection or else in the introduction (no verse ranges there)
+                raise KeyError
+            if not V.isdigit():
+                try: rowsOrEntries.append( self._findExactRowOrEntry( (C,str(desiredVint)) ) )
+                except KeyError: pass # no, that didn't work either
+            if not rowsOrEntries and not complete: # look for a verse range that would match
+                rowsOrEntries = self._findIncludingRows( C, desiredVint, complete=False )
+        if not rowsOrEntries: # we just couldn't find it anywhere
+            raise KeyError
+
+        if len(rowsOrEntries) == 1: # the usual case -- no need to copy the entries
+            verseEntryList = self._getRowEntries( rowsOrEntries[0] )
+        else:
+            verseEntryList = InternalBibleEntryList()
+            for rowOrEntry in rowsOrEntries:
+                verseEntryList += self._getRowEntries( rowOrEntry )
+        assert verseEntryList # We don't want to return an empty list
+        firstRowOrEntry = rowsOrEntries[0]
+        return verseEntryList, firstRowOrEntry.getContextList() if isinstance( firstRowOrEntry, InternalBibleBookCVIndexEntry ) \
+                                    else self._contextLists[firstRowOrEntry]
+    # end of InternalBibleBookSortedCVIndex.getVerseEntriesWithContext
+
+
+    def getChapterEntriesWithContext( self, C:str ) -> tuple[InternalBibleEntryList,list[str]]:
+        """
+        Given C, return a 2-tuple containing
+            the InternalBibleEntryList containing the InternalBibleEntries for this chapter,
+            along with the context for this chapter.
+
+        Raises a KeyError if the C key doesn't exist.
+        """
+        assert isinstance( C, str )
+        try: firstIndexEntry = self[(C,'0')]
+        except KeyError as err:
+            (logging.warning if C=='0' else logging.error)( f"getChapterEntriesWithContext {self.workName} couldn't get {self.BBB} ({C},0)" )
+            raise err
+        for nextCVKey in ( (str(int(C)+1),'0'), ('1','0') ) if C=='-1' else ( (str(int(C)+1),'0'), ): # mostly there's no chapter zero after the introduction
+            try: nextEntryIndex = self[nextCVKey].getEntryIndex()
+            except KeyError: continue
+            break
+        else: nextEntryIndex = len( self.givenBibleEntries ) # Couldn't find the next chapter, so presumably no more chapters
+        return InternalBibleEntryListView( self.givenBibleEntries, firstIndexEntry.getEntryIndex(), nextEntryIndex-firstIndexEntry.getEntryIndex() ), firstIndexEntry.getContextList()
+    # end of InternalBibleBookSortedCVIndex.getChapterEntriesWithContext
+
+
+    def getChapterRangeEntryIndexes( self, startC:str, endC:str ) -> tuple[int,int]:
+        """
+        Given an inclusive range of chapters,
+            returns the (start, end) indexes into givenBibleEntries (end is exclusive).
+
+        Raises a KeyError if there are no index entries in those chapters.
+        """
+        rowRange = range( bisect_left( self._sortKeys, int(startC) * InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER - InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER//2 ),
+                            bisect_left( self._sortKeys, (int(endC)+1) * InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER - InternalBibleBookSortedCVIndex.SORT_KEY_MULTIPLIER//2 ) )
+        if not rowRange: raise KeyError
+        return min( self._entryIndexes[row] for row in rowRange ), \
+                max( self._entryIndexes[row]+self._entryCounts[row] for row in rowRange )
+    # end of InternalBibleBookSortedCVIndex.getChapterRangeEntryIndexes
+
+
+    def getVerseRangeEntryIndexes( self, startCVKey:tuple[str,str], endCVKey:tuple[str,str], getNumVersesFunction ) -> tuple[int,int,list[str]]|None:
+        """
+        Given an inclusive range of consecutive verses, starting with an exact C:V key,
+            walks through the sorted entries (the same way that InternalBibleBook.getContextVerseDataRange
+            looks up one verse after another) and checks that they're all contiguous in the book.
+
+        getNumVersesFunction(C) must return the number of verses in chapter C
+            (used to decide when to move onto the next chapter, as in getContextVerseDataRange).
+
+        Returns a 3-tuple with the (start, end) indexes into givenBibleEntries (end is exclusive)
+            and the context list of the first verse,
+            or None if the verses can't be simply found in order (e.g., because of verse bridges)
+                in which case the caller should look up one verse at a time.
+        """
+        startRow = self._findRow( startCVKey )
+        if startRow is None: return None
+        startC, startV = startCVKey
+        endC, endV = endCVKey
+        try: intC, intV, endCint, endVint = int(startC), getLeadingInt(startV)+1, int(endC), getLeadingInt(endV)
+        except ValueError: return None
+        numRows = len( self._CVKeys )
+        row = startRow
+        startEntryIndex = self._entryIndexes[startRow]
+        nextEntryIndex = startEntryIndex + self._entryCounts[startRow]
+        for _safetyCount in range( 1000 ): # Same limit as getContextVerseDataRange
+            if intC > endCint \
+            or (intC==endCint and intV > endVint):
+                break
+            expectedCVKey = (str(intC), str(intV))
+            if row+1 >= numRows or self._CVKeys[row+1] != expectedCVKey:
+                # The next sorted entry isn't the verse that we need
+                try:
+                    self.getVerseEntries( expectedCVKey, strict=False )
+                    return None # It's somewhere else -- too hard
+                except KeyError: pass
+                if startC == '-1': # This is expected, because LV doesn't have intros, so endV will be excessive
+                    if endC != '-1' or intV <= 0: return None
+                    break
+                if startC == endC: return None
+                # We're in a chapter and may have reached the end
+                numVerses = getNumVersesFunction( expectedCVKey[0] )
+                if numVerses is None or intV <= numVerses: return None
+                intC += 1
+                intV = 0
+                expectedCVKey = (str(intC), '0') # Try again with the first verse of the next chapter
+                if row+1 >= numRows or self._CVKeys[row+1] != expectedCVKey: return None
+            row += 1
+            if self._entryIndexes[row] != nextEntryIndex: return None # Not contiguous
+            nextEntryIndex += self._entryCounts[row]
+            intV += 1
+        else: return None
+
+        return startEntryIndex, nextEntryIndex, self._contextLists[startRow]
+    # end of InternalBibleBookSortedCVIndex.getVerseRangeEntryIndexes
+# end of class InternalBibleBookSortedCVIndex
+
+
+
 class InternalBibleBookSectionIndexEntry:
     """
     Holds the following information:
@@ -1777,6 +2193,348 @@ class InternalBibleBookSectionIndex:
 
 
 
+class InternalBibleVerseOrdinalIndex:
+    """
+    Handles a Bible-wide index which numbers every C:V index entry of every loaded book
+        with a dense integer (the verse ordinal),
+        starting from zero, and going through the books in the Bible's book order.
+
+    It's made from the existing book C:V indexes.
+    writeConcordance() also numbers the verses with this index
+        so the concordance postings use these same ordinals.
+
+    The per-ordinal data is kept in compact arrays
+        so that range queries, sorting, slicing, and joins between Bibles
+        can all be done with integers.
+    """
+    __slots__ = ('workName','bookCodes','_bookNumberDict','_bookStartOrdinals',
+                 '_CVKeys','_entryStartIndexes','_entryEndIndexes',
+                 '_bookOrdinalDicts','_bookChapterRangeDicts') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, workName:str ) -> None:
+        """
+        Creates an empty ordinal index object for a Bible.
+        """
+        self.workName = workName
+        self.bookCodes:list[str] = []
+        self._bookNumberDict:dict[str,int] = {}
+        self._bookStartOrdinals = array( 'I', (0,) ) # One extra entry at the end for the total
+        self._CVKeys:list[tuple[str,str]] = [] # Shares the actual key tuples from the book C:V indexes
+        self._entryStartIndexes, self._entryEndIndexes = array( 'I' ), array( 'I' ) # Into each book's _processedLines
+        self._bookOrdinalDicts:dict[str,dict[tuple[str,str],int]] = {}
+        self._bookChapterRangeDicts:dict[str,dict[str,tuple[int,int]]] = {}
+    # end of InternalBibleVerseOrdinalIndex.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index.
+        """
+        return f"InternalBibleVerseOrdinalIndex object for {self.workName}: {len(self._CVKeys):,} verse ordinals in {len(self.bookCodes)} books"
+    # end of InternalBibleVerseOrdinalIndex.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self._CVKeys )
+
+    def __contains__( self, BCVReference ) -> bool:
+        try: self.getOrdinal( BCVReference )
+        except KeyError: return False
+        return True
+
+
+    def makeIndex( self, BibleObject ) -> None:
+        """
+        Makes the ordinal index from the C:V indexes of the (loaded) books of the given Bible.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleVerseOrdinalIndex.makeIndex( {BibleObject.getAName()} )" )
+
+        self.__init__( self.workName ) # Clear out any earlier data
+        ordinal = 0
+        for BBB,bookObject in BibleObject.books.items():
+            if not bookObject._processedFlag: bookObject.processLines()
+            self._bookNumberDict[BBB] = len( self.bookCodes )
+            self.bookCodes.append( BBB )
+            bookOrdinalDict, bookChapterRangeDict = {}, {}
+            lastC = None
+            for CVKey,indexEntry in bookObject._CVIndex.items():
+                C = CVKey[0]
+                if C != lastC:
+                    if lastC is not None:
+                        bookChapterRangeDict[lastC] = (chapterStartOrdinal, ordinal)
+                    chapterStartOrdinal, lastC = ordinal, C
+                bookOrdinalDict[CVKey] = ordinal
+                self._CVKeys.append( CVKey )
+                self._entryStartIndexes.append( indexEntry.getEntryIndex() )
+                self._entryEndIndexes.append( indexEntry.getNextEntryIndex() )
+                ordinal += 1
+            if lastC is not None:
+                bookChapterRangeDict[lastC] = (chapterStartOrdinal, ordinal)
+            self._bookOrdinalDicts[BBB] = bookOrdinalDict
+            self._bookChapterRangeDicts[BBB] = bookChapterRangeDict
+            self._bookStartOrdinals.append( ordinal )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  InternalBibleVerseOrdinalIndex.makeIndex made {ordinal:,} verse ordinals for {len(self.bookCodes)} books of {self.workName}" )
+    # end of InternalBibleVerseOrdinalIndex.makeIndex
+
+
+    def getOrdinal( self, BCVReference ) -> int:
+        """
+        Given a SimpleVerseKey or a (BBB,C,V) or (BBB,C,V,S) tuple,
+            returns the verse ordinal.
+
+        Raises a KeyError if there is no such C:V index entry.
+        """
+        BBB, C, V = BCVReference[:3] if isinstance( BCVReference, tuple ) else BCVReference.getBCV()
+        return self._bookOrdinalDicts[BBB][(C,V)]
+    # end of InternalBibleVerseOrdinalIndex.getOrdinal
+
+
+    def getBCV( self, ordinal:int ) -> tuple[str,str,str]:
+        """
+        Returns the (BBB,C,V) 3-tuple for the verse ordinal.
+
+        Raises an IndexError for an invalid ordinal.
+        """
+        if ordinal < 0: raise IndexError( f"Invalid verse ordinal {ordinal}" )
+        C, V = self._CVKeys[ordinal]
+        return self.bookCodes[bisect_right( self._bookStartOrdinals, ordinal ) - 1], C, V
+    # end of InternalBibleVerseOrdinalIndex.getBCV
+
+
+    def getEntryRange( self, ordinal:int ) -> range:
+        """
+        Returns the range of indexes into the book's _processedLines for the verse ordinal.
+        """
+        if ordinal < 0: raise IndexError( f"Invalid verse ordinal {ordinal}" )
+        return range( self._entryStartIndexes[ordinal], self._entryEndIndexes[ordinal] )
+    # end of InternalBibleVerseOrdinalIndex.getEntryRange
+
+
+    def getBookCode( self, ordinal:int ) -> str:
+        """
+        Returns the BBB book code for the verse ordinal.
+        """
+        if not 0 <= ordinal < len(self._CVKeys): raise IndexError( f"Invalid verse ordinal {ordinal}" )
+        return self.bookCodes[bisect_right( self._bookStartOrdinals, ordinal ) - 1]
+    # end of InternalBibleVerseOrdinalIndex.getBookCode
+
+
+    def getBookOrdinalRange( self, BBB:str ) -> range:
+        """
+        Returns the range of verse ordinals for the book.
+
+        Raises a KeyError if the book isn't in the index.
+        """
+        bookNumber = self._bookNumberDict[BBB]
+        return range( self._bookStartOrdinals[bookNumber], self._bookStartOrdinals[bookNumber+1] )
+    # end of InternalBibleVerseOrdinalIndex.getBookOrdinalRange
+
+
+    def getChapterOrdinalRange( self, BBB:str, C:str ) -> range:
+        """
+        Returns the range of verse ordinals for the chapter.
+
+        Raises a KeyError if the book or chapter isn't in the index.
+        """
+        return range( *self._bookChapterRangeDicts[BBB][C] )
+    # end of InternalBibleVerseOrdinalIndex.getChapterOrdinalRange
+
+
+    def getOrdinalRange( self, startBCVReference, endBCVReference ) -> range:
+        """
+        Returns the range of verse ordinals for an inclusive range of verses
+            (which can cross book boundaries).
+
+        Raises a KeyError if either reference isn't found.
+        """
+        return range( self.getOrdinal( startBCVReference ), self.getOrdinal( endBCVReference ) + 1 )
+    # end of InternalBibleVerseOrdinalIndex.getOrdinalRange
+
+
+    def getBookEntrySlices( self, startOrdinal:int, endOrdinal:int ) -> list[tuple[str,int,int]]:
+        """
+        Given an inclusive range of verse ordinals,
+            returns a list of (BBB, startEntryIndex, endEntryIndex) 3-tuples
+            which give the slice of each book's _processedLines for the range.
+        """
+        if not 0 <= startOrdinal <= endOrdinal < len(self._CVKeys):
+            raise IndexError( f"Invalid verse ordinal range {startOrdinal}-{endOrdinal}" )
+        bookNumber = bisect_right( self._bookStartOrdinals, startOrdinal ) - 1
+        results = []
+        while startOrdinal <= endOrdinal:
+            lastBookOrdinal = min( endOrdinal, self._bookStartOrdinals[bookNumber+1] - 1 )
+            results.append( (self.bookCodes[bookNumber], self._entryStartIndexes[startOrdinal], self._entryEndIndexes[lastBookOrdinal]) )
+            startOrdinal = lastBookOrdinal + 1
+            bookNumber += 1
+        return results
+    # end of InternalBibleVerseOrdinalIndex.getBookEntrySlices
+
+
+    def sortReferences( self, BCVReferences ) -> list:
+        """
+        Returns a new list of the given references (SimpleVerseKeys or BCV tuples)
+            sorted into verse ordinal order.
+
+        Raises a KeyError if any reference isn't found.
+        """
+        return sorted( BCVReferences, key=self.getOrdinal )
+    # end of InternalBibleVerseOrdinalIndex.sortReferences
+
+
+    def getOrdinalMap( self, otherOrdinalIndex:InternalBibleVerseOrdinalIndex ) -> array:
+        """
+        Used for joins between Bibles.
+
+        Returns an array (the same length as this index)
+            containing the verse ordinal in the other index of each of our verses,
+            or -1 if the other Bible doesn't have that C:V index entry.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleVerseOrdinalIndex.getOrdinalMap( {otherOrdinalIndex.workName} ) for {self.workName}" )
+        ordinalMap = array( 'i' )
+        for bookNumber,BBB in enumerate( self.bookCodes ):
+            bookRange = range( self._bookStartOrdinals[bookNumber], self._bookStartOrdinals[bookNumber+1] )
+            try: otherBookOrdinalDict = otherOrdinalIndex._bookOrdinalDicts[BBB]
+            except KeyError: # the other Bible doesn't have this book
+                ordinalMap.extend( [-1] * len(bookRange) )
+                continue
+            CVKeys = self._CVKeys
+            ordinalMap.extend( otherBookOrdinalDict.get( CVKeys[ordinal], -1 ) for ordinal in bookRange )
+        return ordinalMap
+    # end of InternalBibleVerseOrdinalIndex.getOrdinalMap
+# end of class InternalBibleVerseOrdinalIndex
+
+
+
+class InternalBibleVerseCache:
+    """
+    A bounded, least-recently-used cache of InternalBible verse lookup results
+        (e.g., from getContextVerseData() and getVerseText())
+        with hit, miss, and eviction counters.
+
+    The cache keys are tuples starting with the BBB
+        so that all the results for an edited or reloaded book can be invalidated.
+    None is never stored as a result value.
+    """
+    __slots__ = ('maxSize','_cache',
+                 'numHits','numMisses','numEvictions','numInvalidations') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, maxSize:int ) -> None:
+        """
+        Creates an empty cache which will hold up to maxSize results.
+        """
+        assert maxSize > 0
+        self.maxSize = maxSize
+        self._cache:OrderedDict[tuple,object] = OrderedDict() # Least recently used first
+        self.numHits = self.numMisses = self.numEvictions = self.numInvalidations = 0
+    # end of InternalBibleVerseCache.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the cache.
+        """
+        return f"InternalBibleVerseCache object: {len(self._cache):,}/{self.maxSize:,} results ({self.numHits:,} hits, {self.numMisses:,} misses, {self.numEvictions:,} evictions)"
+    # end of InternalBibleVerseCache.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self._cache )
+
+    def __contains__( self, key:tuple ) -> bool:
+        return key in self._cache
+
+
+    def get( self, key:tuple ):
+        """
+        Returns the cached result for the key (and marks it as most recently used)
+            or None if it's not in the cache.
+        """
+        try: result = self._cache[key]
+        except KeyError:
+            self.numMisses += 1
+            return None
+        self._cache.move_to_end( key )
+        self.numHits += 1
+        return result
+    # end of InternalBibleVerseCache.get
+
+
+    def put( self, key:tuple, result ) -> None:
+        """
+        Saves the result for the key,
+            discarding the least recently used result(s) if the cache is full.
+        """
+        if BibleOrgSysGlobals.debugFlag: assert result is not None
+        self._cache[key] = result
+        self._cache.move_to_end( key )
+        while len(self._cache) > self.maxSize:
+            self._cache.popitem( last=False )
+            self.numEvictions += 1
+    # end of InternalBibleVerseCache.put
+
+
+    def setMaxSize( self, maxSize:int ) -> None:
+        """
+        Changes the maximum number of cached results,
+            discarding the least recently used results if necessary.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleVerseCache.setMaxSize( {maxSize} )" )
+        assert maxSize > 0
+
+        self.maxSize = maxSize
+        while len(self._cache) > self.maxSize:
+            self._cache.popitem( last=False )
+            self.numEvictions += 1
+    # end of InternalBibleVerseCache.setMaxSize
+
+
+    def invalidateBook( self, BBB:str ) -> int:
+        """
+        Discards any cached results for the given book (e.g., because it was edited or reloaded).
+
+        Returns the number of results discarded.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleVerseCache.invalidateBook( {BBB} )" )
+
+        bookKeys = [key for key in self._cache if key[0] == BBB]
+        for key in bookKeys:
+            del self._cache[key]
+        self.numInvalidations += len(bookKeys)
+        return len(bookKeys)
+    # end of InternalBibleVerseCache.invalidateBook
+
+
+    def clear( self ) -> None:
+        """
+        Discards all the cached results (but keeps the counters).
+        """
+        self.numInvalidations += len(self._cache)
+        self._cache.clear()
+    # end of InternalBibleVerseCache.clear
+
+
+    def getStatistics( self ) -> dict[str,int|float]:
+        """
+        Returns a dictionary of cache statistics including:
+            hitRate: the proportion of lookups that were answered from the cache
+        """
+        numLookups = self.numHits + self.numMisses
+        return { 'size':len(self._cache), 'maxSize':self.maxSize,
+                'numHits':self.numHits, 'numMisses':self.numMisses,
+                'numEvictions':self.numEvictions, 'numInvalidations':self.numInvalidations,
+                'hitRate':round( self.numHits / numLookups, 4 ) if numLookups else None,
+                }
+    # end of InternalBibleVerseCache.getStatistics
+# end of class InternalBibleVerseCache
+
+
+
 def briefDemo() -> None:
     """
     Demonstrate reading and processing some Bible databases.
@@ -6,7 +6,7 @@
 #
 # Module handling the internal objects for Bible books
 #
-# Copyright (C) 2010-2024 Robert Hunt
+# Copyright (C) 2010-2025 Robert Hunt
 # Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
 # License: See gpl-3.0.txt
 #
@@ -37,6 +37,15 @@ Module for defining and manipulating internal Bible objects including:
         A list of InternalBibleEntries
             with internal data validation functions
             and with a str() function useful for debugging.
+    InternalBibleEntryListView
+        An InternalBibleEntryList which is a window onto part of another one (without copying the entries).
+
+    InternalBibleStringTable
+    InternalBibleEntryView
+    InternalBibleColumnarEntryList
+        An alternative InternalBibleEntryList which stores the entry fields
+            in arrays of codes (into string tables) to save memory,
+            and hands out InternalBibleEntry-compatible views.
 
 Some notes about internal formats:
     The BibleOrgSys internal format is based on
@@ -63,10 +72,22 @@ Some notes about internal formats:
 
     The introduction is stored as chapter '-1'. (All our chapter and verse "numbers" are stored as strings.)
         (We allow for some rare printed Roman Catholic Bibles that have an actual chapter 0.)
+
+CHANGELOG:
+    2025-06-13 Added InternalBibleColumnarEntryList (and getEntryListMemorySize())
+    2025-06-14 Added marker codes and MARKER_FLAG_xxx category bitflags (stored in each InternalBibleEntry)
+    2025-06-16 Added InternalBibleEntryListView
+    2025-06-22 Added replaceEntries() to the entry lists (for splicing in edited chapters)
+    2025-06-23 Added tokenizeUSFMLine()
+    2025-06-26 Made InternalBibleColumnarEntryList.data a (read-only) tuple
+    2025-06-26 Look up the marker codes and flags in the registry (rather than storing them in each InternalBibleEntry)
+                and don't add unregistered markers to the registry
 """
+from __future__ import annotations # So we can use typing -> ClassName (before Python 3.10)
 from gettext import gettext as _
 import logging
 import re
+from array import array
 
 if __name__ == '__main__':
     import os.path
@@ -77,14 +98,14 @@ if __name__ == '__main__':
 from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.Reference.USFM3Markers import USFM_ALL_TITLE_MARKERS, USFM_ALL_INTRODUCTION_MARKERS, \
-                        USFM_ALL_SECTION_HEADING_MARKERS, USFM_BIBLE_PARAGRAPH_MARKERS # OFTEN_IGNORED_USFM_HEADER_MARKERS
+                        USFM_ALL_SECTION_HEADING_MARKERS, USFM_BIBLE_PARAGRAPH_MARKERS, OFTEN_IGNORED_USFM_HEADER_MARKERS
 #from BibleReferences import BibleAnchorReference
 
 
-LAST_MODIFIED_DATE = '2024-11-08' # by RJH
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
 SHORT_PROGRAM_NAME = "BibleInternals"
 PROGRAM_NAME = "Bible internals handler"
-PROGRAM_VERSION = '0.88'
+PROGRAM_VERSION = '0.92'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -165,6 +186,102 @@ BOS_EXTRA_MARKERS = ( 'f', 'fe', 'x', 'fig', 'str', 'sem', 'ww', 'vp', )
 assert len(BOS_EXTRA_TYPES) == len(BOS_EXTRA_MARKERS)
 
 
+# Marker category bitflags (precomputed for each marker by getMarkerCodeAndFlags())
+#   so that hot loops can do bit tests rather than searching lists of marker strings
+MARKER_FLAG_NEWLINE      = 0x0001 # A USFM newline marker, e.g., p, q1, s1, c, v
+MARKER_FLAG_PARAGRAPH    = 0x0002 # Same as BibleOrgSysGlobals.USFMParagraphMarkers (canonical text newline markers except qa and qc)
+MARKER_FLAG_CHARACTER    = 0x0004 # Same as BibleOrgSysGlobals.USFMAllExpandedCharacterMarkers, e.g., add, nd, wj
+MARKER_FLAG_NOTE         = 0x0008 # A USFM footnote or cross-reference marker, e.g., f, fr, ft, x, xo
+MARKER_FLAG_HEADING      = 0x0010 # USFM_ALL_SECTION_HEADING_MARKERS
+MARKER_FLAG_TITLE        = 0x0020 # USFM_ALL_TITLE_MARKERS
+MARKER_FLAG_INTRODUCTION = 0x0040 # USFM_ALL_INTRODUCTION_MARKERS
+MARKER_FLAG_HEADER       = 0x0080 # OFTEN_IGNORED_USFM_HEADER_MARKERS, e.g., id, h, toc1
+MARKER_FLAG_PRINTABLE    = 0x0100 # BOS_PRINTABLE_MARKERS
+MARKER_FLAG_VERSE_TEXT   = 0x0200 # v~ and p~
+MARKER_FLAG_BOS_CUSTOM   = 0x0400 # BOS_ALL_CUSTOM_MARKERS, e.g., v~, c#, intro, chapters
+MARKER_FLAG_NESTING      = 0x0800 # BOS_NESTING_MARKERS
+MARKER_FLAG_END          = 0x1000 # Our added end markers, e.g., ¬v, ¬intro
+MARKER_FLAG_BIBLE_PARAGRAPH = 0x2000 # USFM_BIBLE_PARAGRAPH_MARKERS, e.g., p, q1, li1 (but not the introduction paragraph markers)
+
+_markerRegistryDict:dict[str,tuple[int,int]] = {} # marker -> (markerCode, markerFlags)
+_markerRegistryList:list[str|None] = [] # markerCode -> marker (code 0 is for unregistered markers)
+_UNREGISTERED_MARKER_CODE_AND_FLAGS, _UNREGISTERED_END_MARKER_CODE_AND_FLAGS = (0, 0), (0, MARKER_FLAG_END)
+
+def _makeMarkerRegistry() -> None:
+    """
+    Assign small integer codes and category bitflags to all of the USFM3 and BOS markers.
+
+    The codes are assigned in sorted order (from the loaded USFM3Markers data)
+        so that they're the same in every process.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "_makeMarkerRegistry()" )
+    if not BibleOrgSysGlobals.USFMParagraphMarkers: # Might not be set if processes are spawned rather than forked
+        BibleOrgSysGlobals.preloadCommonData()
+
+    flagLists = ( (MARKER_FLAG_NEWLINE, BibleOrgSysGlobals.loadedUSFMMarkers.getNewlineMarkersList( 'Combined' )),
+                  (MARKER_FLAG_PARAGRAPH, BibleOrgSysGlobals.USFMParagraphMarkers),
+                  (MARKER_FLAG_CHARACTER, BibleOrgSysGlobals.USFMAllExpandedCharacterMarkers),
+                  (MARKER_FLAG_NOTE, BibleOrgSysGlobals.loadedUSFMMarkers.getNoteMarkersList()),
+                  (MARKER_FLAG_HEADING, USFM_ALL_SECTION_HEADING_MARKERS),
+                  (MARKER_FLAG_TITLE, USFM_ALL_TITLE_MARKERS),
+                  (MARKER_FLAG_INTRODUCTION, USFM_ALL_INTRODUCTION_MARKERS),
+                  (MARKER_FLAG_HEADER, OFTEN_IGNORED_USFM_HEADER_MARKERS),
+                  (MARKER_FLAG_PRINTABLE, BOS_PRINTABLE_MARKERS),
+                  (MARKER_FLAG_VERSE_TEXT, ('v~','p~')),
+                  (MARKER_FLAG_BOS_CUSTOM, BOS_ALL_CUSTOM_MARKERS),
+                  (MARKER_FLAG_NESTING, BOS_NESTING_MARKERS),
+                  (MARKER_FLAG_END, BOS_END_MARKERS),
+                  (MARKER_FLAG_BIBLE_PARAGRAPH, USFM_BIBLE_PARAGRAPH_MARKERS),
+                )
+    markerFlagsDict = {}
+    for flag,markerList in flagLists:
+        for marker in markerList:
+            markerFlagsDict[marker] = markerFlagsDict.get( marker, 0 ) | flag
+
+    _markerRegistryList.clear()
+    _markerRegistryList.append( None ) # for code 0
+    _markerRegistryDict.clear()
+    for markerCode,marker in enumerate( sorted( markerFlagsDict ), start=1 ):
+        _markerRegistryList.append( marker )
+        _markerRegistryDict[marker] = (markerCode, markerFlagsDict[marker])
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"_makeMarkerRegistry registered {len(_markerRegistryDict)} markers" )
+# end of _makeMarkerRegistry function
+
+
+def getMarkerCodeAndFlags( marker:str ) -> tuple[int,int]:
+    """
+    Returns a 2-tuple with the small integer code and the MARKER_FLAG_xxx bitflags for the marker.
+
+    Unregistered markers get code 0
+        (but still get MARKER_FLAG_END if they start with ¬).
+        They're not added to the registry (so codes stay the same in every process,
+            and so that it can't keep growing with misspelt markers from the files).
+    """
+    try: return _markerRegistryDict[marker]
+    except KeyError:
+        if not _markerRegistryList: # we haven't made the registry yet
+            _makeMarkerRegistry()
+            return getMarkerCodeAndFlags( marker )
+        return _UNREGISTERED_END_MARKER_CODE_AND_FLAGS if marker and marker[0]=='¬' else _UNREGISTERED_MARKER_CODE_AND_FLAGS
+# end of getMarkerCodeAndFlags function
+
+def getMarkerFlags( marker:str ) -> int:
+    """
+    Returns the MARKER_FLAG_xxx bitflags for the marker.
+    """
+    try: return _markerRegistryDict[marker][1]
+    except KeyError: return getMarkerCodeAndFlags( marker )[1]
+# end of getMarkerFlags function
+
+def getMarkerFromCode( markerCode:int ) -> str|None:
+    """
+    Returns the marker for the code (or None for code 0).
+    """
+    if not _markerRegistryList: _makeMarkerRegistry()
+    return _markerRegistryList[markerCode]
+# end of getMarkerFromCode function
+
+
 def getLeadingInt( someString:str ) -> int:
     """
     Especially used for verse numbers like '17a' and ranges like 17-25
@@ -180,6 +297,47 @@ def getLeadingInt( someString:str ) -> int:
 # end of getLeadingInt function
 
 
+# Token types returned by tokenizeUSFMLine()
+USFM_TOKEN_TEXT = 0         # Plain text between markers
+USFM_TOKEN_OPEN_MARKER = 1  # e.g., \\nd or \\+w (followed by a space)
+USFM_TOKEN_CLOSE_MARKER = 2 # e.g., \\nd* or \\+w*
+USFM_TOKEN_NOTE_START = 3   # One of BOS_EXTRA_MARKERS (followed by a space), e.g., \\f or \\x
+USFM_TOKEN_NOTE_END = 4     # One of BOS_EXTRA_MARKERS closed, e.g., \\f* or \\x*
+USFM_TOKEN_ATTRIBUTES = 5   # Vertical bar and everything up to the next marker, e.g., |strong="H1234"
+
+# One master pattern (with alternatives) so that each line only has to be scanned once
+USFM_LINE_TOKEN_REGEX = re.compile( r'\\(\+?[a-z0-9]+)([ *])|\|[^\\]*' )
+
+def tokenizeUSFMLine( line:str ) -> list[tuple[int,str|None,str]]|None:
+    """
+    Lex the text of a USFM line (i.e., after the newline marker) into a list of 3-tuples:
+        (USFM_TOKEN_xxx tokenType, marker (or None for text and attributes), tokenText)
+        where joining all the tokenTexts gives back the original line.
+
+    Returns None if the line contains a backslash which isn't part of a simple lowercase marker,
+        e.g., \\W (uppercase), \\qt-s (milestone), \\* or a marker right at the end of the line,
+        so that the caller can fall back to slower, more forgiving code.
+    """
+    tokens:list[tuple[int,str|None,str]] = []
+    numMarkers = ix = 0
+    for match in USFM_LINE_TOKEN_REGEX.finditer( line ):
+        startIx = match.start()
+        if startIx > ix: tokens.append( (USFM_TOKEN_TEXT, None, line[ix:startIx]) )
+        marker = match.group( 1 )
+        if marker is None: # it's a vertical bar
+            tokens.append( (USFM_TOKEN_ATTRIBUTES, None, match.group()) )
+        else:
+            numMarkers += 1
+            if marker in BOS_EXTRA_MARKERS:
+                tokens.append( (USFM_TOKEN_NOTE_START if match.group(2)==' ' else USFM_TOKEN_NOTE_END, marker, match.group()) )
+            else:
+                tokens.append( (USFM_TOKEN_OPEN_MARKER if match.group(2)==' ' else USFM_TOKEN_CLOSE_MARKER, marker, match.group()) )
+        ix = match.end()
+    if ix < len(line): tokens.append( (USFM_TOKEN_TEXT, None, line[ix:]) )
+    return tokens if numMarkers == line.count( '\\' ) else None
+# end of tokenizeUSFMLine function
+
+
 def parseWordAttributes( workName, BBB:str, C:str, V:str, wordAttributeString, errorList=None ) -> dict[str,str]:
     """
     Take the attributes of a USFM3 \\w field (the attributes include the first pipe/vertical-bar symbol)
@@ -579,7 +737,7 @@ class InternalBibleEntry:
     Each entry holds the original and adjusted markers (e.g., \\s will be adjusted to \\s1)
         plus the cleanText with notes, etc. removed and stored in the "extras" list.
     """
-    __slots__ = ('marker', 'originalMarker', 'adjustedText', 'cleanText', 'extras', 'originalText') # Define allowed self variables (more efficient than a dict when have many instances)
+    __slots__ = ('marker', 'originalMarker', 'adjustedText', 'cleanText', 'extras', 'originalText',) # Define allowed self variables (more efficient than a dict when have many instances)
 
 
     def __init__( self, marker:str, originalMarker:str,
@@ -688,7 +846,15 @@ class InternalBibleEntry:
         else: raise IndexError( 'Invalid {} index number'.format( keyIndex ) )
     # end of InternalBibleEntry.__getitem__
 
+    # The marker code and flags are looked up in the marker registry (rather than being stored in every entry)
+    @property
+    def markerCode( self ) -> int: return getMarkerCodeAndFlags( self.marker )[0]
+    @property
+    def markerFlags( self ) -> int: return getMarkerFlags( self.marker ) # See MARKER_FLAG_xxx
+
     def getMarker( self ): return self.marker
+    def getMarkerCode( self ) -> int: return getMarkerCodeAndFlags( self.marker )[0]
+    def getMarkerFlags( self ) -> int: return getMarkerFlags( self.marker ) # See MARKER_FLAG_xxx
     def getOriginalMarker( self ): return self.originalMarker
     def getAdjustedText( self ): return self.adjustedText # Notes are removed
     def getText( self ): return self.adjustedText # Notes are removed
@@ -840,6 +1006,15 @@ class InternalBibleEntryList:
         return self.data[keyIndex]
     # end of InternalBibleEntryList.__getitem__
 
+    def _getEntrySlice( self, startIndex:int, endIndex:int ) -> list[InternalBibleEntry]:
+        """
+        Returns a (new) list of the entries from startIndex up to (but not including) endIndex.
+
+        Used by InternalBibleEntryListView.
+        """
+        return self.data[startIndex:endIndex]
+    # end of InternalBibleEntryList._getEntrySlice
+
 
     def append( self, newBibleEntry ) -> None:
         """
@@ -876,6 +1051,20 @@ class InternalBibleEntryList:
     # end of InternalBibleEntryList.__add__
 
 
+    def replaceEntries( self, startIndex:int, endIndex:int, newEntries ) -> None:
+        """
+        Replace the entries from startIndex up to (but not including) endIndex
+            with the newEntries (an InternalBibleEntryList or a list of InternalBibleEntries)
+            which don't have to be the same length.
+
+        Used to splice an edited chapter back into a book.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleEntryList.replaceEntries( {startIndex}, {endIndex}, ({len(newEntries)}) )" )
+        assert 0 <= startIndex <= endIndex <= len(self.data)
+        self.data[startIndex:endIndex] = list( newEntries )
+    # end of InternalBibleEntryList.replaceEntries
+
+
     def contains( self, searchMarker, maxLines=None ):
         """
         Search some or all of the entries and return the index of the first line containing the given marker.
@@ -894,6 +1083,428 @@ class InternalBibleEntryList:
 
 
 
+class InternalBibleEntryListView( InternalBibleEntryList ):
+    """
+    A window onto count consecutive entries (from start) of another InternalBibleEntryList
+        (usually a book's _processedLines) which doesn't copy the entries.
+
+    So getting the entries for a verse or chapter doesn't have to make a new list.
+
+    It can be read anywhere that an InternalBibleEntryList can be.
+    If it's changed (e.g., with append, extend, or +),
+        or if its data list is accessed, the entries are copied first (just once)
+        so the original list is never changed.
+
+    Note: Like any window, it shows the current entries at those positions,
+        so it shouldn't be kept after the original list has been edited.
+    """
+    __slots__ = ('_baseList','_start','_count','_ownData') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, baseList:InternalBibleEntryList, start:int, count:int ) -> None:
+        """
+        Note that we don't call InternalBibleEntryList.__init__ because we don't have our own data (yet).
+        """
+        if isinstance( baseList, InternalBibleEntryListView ) and baseList._ownData is None: # Don't make views of views
+            start += baseList._start
+            baseList = baseList._baseList
+        self._baseList, self._start, self._count = baseList, start, max( 0, count ) # Same as an empty slice if count is negative
+        self._ownData:list[InternalBibleEntry]|None = None
+    # end of InternalBibleEntryListView.__init__
+
+
+    @property
+    def data( self ) -> list[InternalBibleEntry]:
+        """
+        For compatibility with code that accesses (or changes) the list inside an InternalBibleEntryList.
+
+        The first time, this copies our entries into a list of our own.
+        """
+        if self._ownData is None:
+            self._ownData = self._baseList._getEntrySlice( self._start, self._start+self._count )
+            self._baseList = None # We don't need it now
+        return self._ownData
+    # end of InternalBibleEntryListView.data
+
+
+    def _getEntrySlice( self, startIndex:int, endIndex:int ) -> list[InternalBibleEntry]:
+        """
+        Returns a (new) list of the entries from startIndex up to (but not including) endIndex.
+        """
+        if self._ownData is not None: return self._ownData[startIndex:endIndex]
+        startIndex, endIndex, _step = slice( startIndex, endIndex ).indices( self._count )
+        return self._baseList._getEntrySlice( self._start+startIndex, self._start+max(startIndex,endIndex) )
+    # end of InternalBibleEntryListView._getEntrySlice
+
+
+    def __len__( self ):
+        return self._count if self._ownData is None else len( self._ownData )
+    def __getitem__( self, keyIndex ):
+        if self._ownData is not None: return InternalBibleEntryList.__getitem__( self, keyIndex )
+        if isinstance( keyIndex, slice ): # Get the start, stop, and step from the slice
+            start, stop, step = keyIndex.indices( self._count )
+            if step == 1: return InternalBibleEntryListView( self._baseList, self._start+start, max( 0, stop-start ) )
+            return InternalBibleEntryList( [self._baseList[self._start+ii] for ii in range( start, stop, step )] )
+        # Otherwise assume keyIndex is an int
+        if keyIndex < 0: keyIndex += self._count
+        if not 0 <= keyIndex < self._count: raise IndexError( f"InternalBibleEntryListView index {keyIndex} out of range" )
+        return self._baseList[self._start+keyIndex]
+    # end of InternalBibleEntryListView.__getitem__
+
+    def __iter__( self ):
+        return iter( self._ownData if self._ownData is not None else self._baseList._getEntrySlice( self._start, self._start+self._count ) )
+    # end of InternalBibleEntryListView.__iter__
+
+
+    def contains( self, searchMarker, maxLines=None ):
+        """
+        Search some or all of the entries and return the index of the first line containing the given marker.
+
+        maxLines is the integer maxLines to search
+            or None to search them all.
+
+        Returns None if no match is found
+        """
+        for j,entry in enumerate( self ):
+            if entry.marker == searchMarker: return j
+            if maxLines is not None:
+                if j >= maxLines: break
+    # end of InternalBibleEntryListView.contains
+
+
+    def __reduce__( self ): # Pickle it as a normal InternalBibleEntryList (without the whole of the original list)
+        return InternalBibleEntryList, ( list( self ), )
+# end of class InternalBibleEntryListView
+
+
+
+class InternalBibleStringTable:
+    """
+    A table for interning strings (e.g., markers or texts)
+        so that each distinct string is only stored once
+        and can be referred to by a small integer code.
+
+    Code 0 is always None.
+    """
+    __slots__ = ('strings','codeDict') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self ) -> None:
+        """
+        """
+        self.strings:list[str|None] = [None]
+        self.codeDict:dict[str,int] = {}
+    # end of InternalBibleStringTable.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        return f"InternalBibleStringTable object: {len(self.strings)-1:,} strings"
+
+    def __len__( self ) -> int: return len( self.strings )
+
+
+    def getCode( self, someString:str|None ) -> int:
+        """
+        Returns the integer code for the string (adding it to the table if necessary).
+        """
+        if someString is None: return 0
+        try: return self.codeDict[someString]
+        except KeyError:
+            code = self.codeDict[someString] = len( self.strings )
+            self.strings.append( someString )
+            return code
+    # end of InternalBibleStringTable.getCode
+# end of class InternalBibleStringTable
+
+
+
+class InternalBibleEntryView( InternalBibleEntry ):
+    """
+    An InternalBibleEntry-compatible view of one entry
+        in an InternalBibleColumnarEntryList.
+
+    Reading a field fetches it from the columns of the list,
+        and setting a field (e.g., with setCleanText()) writes it back into the list.
+    """
+    __slots__ = ('_entryList','_index') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, entryList:InternalBibleColumnarEntryList, index:int ) -> None:
+        """
+        No checks are done here because the entry was checked when it was added to the list.
+        """
+        self._entryList, self._index = entryList, index
+    # end of InternalBibleEntryView.__init__
+
+
+    def __eq__( self, other ):
+        return isinstance( other, InternalBibleEntry ) and all( self[j] == other[j] for j in range( 6 ) )
+
+    def __reduce__( self ): # Pickle it as a normal (standalone) InternalBibleEntry
+        return InternalBibleEntry, tuple( self[j] for j in range( 6 ) )
+
+
+    @property
+    def marker( self ) -> str: return self._entryList._getField( self._index, 0 )
+    @marker.setter
+    def marker( self, newValue:str ) -> None: self._entryList._setField( self._index, 0, newValue )
+    @property
+    def originalMarker( self ) -> str|None: return self._entryList._getField( self._index, 1 )
+    @originalMarker.setter
+    def originalMarker( self, newValue:str|None ) -> None: self._entryList._setField( self._index, 1, newValue )
+    @property
+    def adjustedText( self ) -> str|None: return self._entryList._getField( self._index, 2 )
+    @adjustedText.setter
+    def adjustedText( self, newValue:str|None ) -> None: self._entryList._setField( self._index, 2, newValue )
+    @property
+    def cleanText( self ) -> str: return self._entryList._getField( self._index, 3 )
+    @cleanText.setter
+    def cleanText( self, newValue:str ) -> None: self._entryList._setField( self._index, 3, newValue )
+    @property
+    def extras( self ) -> InternalBibleExtraList|None: return self._entryList._getField( self._index, 4 )
+    @extras.setter
+    def extras( self, newValue:InternalBibleExtraList|None ) -> None: self._entryList._setField( self._index, 4, newValue )
+    @property
+    def originalText( self ) -> str|None: return self._entryList._getField( self._index, 5 )
+    @originalText.setter
+    def originalText( self, newValue:str|None ) -> None: self._entryList._setField( self._index, 5, newValue )
+# end of class InternalBibleEntryView
+
+
+
+class InternalBibleColumnarEntryList( InternalBibleEntryList ):
+    """
+    An alternative (struct-of-arrays) InternalBibleEntryList
+        which uses much less memory than a list of InternalBibleEntry objects.
+
+    The markers are stored as codes (into a small marker table) in arrays,
+        the three text fields are stored as codes into a (possibly shared) string table,
+        and the (relatively rare) extras are stored in a dict by entry index.
+
+    Indexing or iterating hands out InternalBibleEntryView objects
+        so existing code that expects InternalBibleEntries keeps working.
+    """
+    __slots__ = ('_markerTable','_textTable',
+                 '_markerCodes','_originalMarkerCodes',
+                 '_adjustedTextCodes','_cleanTextCodes','_originalTextCodes',
+                 '_extrasDict') # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, initialData=None, textTable:InternalBibleStringTable|None=None ) -> None:
+        """
+        initialData can be an InternalBibleEntryList (or a list of InternalBibleEntries).
+
+        textTable can be given so that several lists (e.g., all the books of a Bible)
+            can share the same stored strings.
+        """
+        self._markerTable = InternalBibleStringTable()
+        self._textTable = InternalBibleStringTable() if textTable is None else textTable
+        self._markerCodes, self._originalMarkerCodes = array( 'H' ), array( 'H' )
+        self._adjustedTextCodes, self._cleanTextCodes, self._originalTextCodes = array( 'I' ), array( 'I' ), array( 'I' )
+        self._extrasDict:dict[int,InternalBibleExtraList] = {}
+        if initialData is not None:
+            for entry in initialData:
+                self.append( entry )
+    # end of InternalBibleColumnarEntryList.__init__
+
+
+    @property
+    def data( self ) -> tuple[InternalBibleEntryView,...]:
+        """
+        For compatibility with code that reads the list inside an InternalBibleEntryList.
+
+        Note that this is a new (read-only) tuple of views
+            so use append(), pop(), replaceEntries(), etc. to change our data.
+        """
+        return tuple( InternalBibleEntryView( self, j ) for j in range( len(self._markerCodes) ) )
+    # end of InternalBibleColumnarEntryList.data
+
+
+    def _getField( self, index:int, fieldNumber:int ):
+        """
+        Returns the field (numbered as for InternalBibleEntry.__getitem__) for the entry.
+        """
+        if fieldNumber == 0: return self._markerTable.strings[self._markerCodes[index]]
+        if fieldNumber == 1: return self._markerTable.strings[self._originalMarkerCodes[index]]
+        if fieldNumber == 2: return self._textTable.strings[self._adjustedTextCodes[index]]
+        if fieldNumber == 3: return self._textTable.strings[self._cleanTextCodes[index]]
+        if fieldNumber == 4: return self._extrasDict.get( index )
+        if fieldNumber == 5: return self._textTable.strings[self._originalTextCodes[index]]
+        raise IndexError( f"Invalid {fieldNumber} field number" )
+    # end of InternalBibleColumnarEntryList._getField
+
+    def _setField( self, index:int, fieldNumber:int, newValue ) -> None:
+        """
+        Sets the field (numbered as for InternalBibleEntry.__getitem__) for the entry.
+
+        Note that any old string is left in the string table.
+        """
+        if fieldNumber == 0: self._markerCodes[index] = self._markerTable.getCode( newValue )
+        elif fieldNumber == 1: self._originalMarkerCodes[index] = self._markerTable.getCode( newValue )
+        elif fieldNumber == 2: self._adjustedTextCodes[index] = self._textTable.getCode( newValue )
+        elif fieldNumber == 3: self._cleanTextCodes[index] = self._textTable.getCode( newValue )
+        elif fieldNumber == 4:
+            if newValue is None: self._extrasDict.pop( index, None )
+            else: self._extrasDict[index] = newValue
+        elif fieldNumber == 5: self._originalTextCodes[index] = self._textTable.getCode( newValue )
+        else: raise IndexError( f"Invalid {fieldNumber} field number" )
+    # end of InternalBibleColumnarEntryList._setField
+
+
+    def __len__( self ): return len( self._markerCodes )
+    def __getitem__( self, keyIndex ):
+        if isinstance( keyIndex, slice ): # Return a normal InternalBibleEntryList of views
+            newList = InternalBibleEntryList()
+            newList.data = [InternalBibleEntryView( self, ii ) for ii in range(*keyIndex.indices(len(self)))]
+            return newList
+        # Otherwise assume keyIndex is an int
+        numEntries = len( self._markerCodes )
+        if keyIndex < 0: keyIndex += numEntries
+        if not 0 <= keyIndex < numEntries: raise IndexError( f"InternalBibleColumnarEntryList index {keyIndex} out of range" )
+        return InternalBibleEntryView( self, keyIndex )
+    # end of InternalBibleColumnarEntryList.__getitem__
+
+    def __iter__( self ):
+        for j in range( len(self._markerCodes) ):
+            yield InternalBibleEntryView( self, j )
+    # end of InternalBibleColumnarEntryList.__iter__
+
+    def _getEntrySlice( self, startIndex:int, endIndex:int ) -> list[InternalBibleEntryView]:
+        """
+        Returns a (new) list of views of the entries from startIndex up to (but not including) endIndex.
+
+        Used by InternalBibleEntryListView.
+        """
+        return [InternalBibleEntryView( self, j ) for j in range( *slice( startIndex, endIndex ).indices( len(self._markerCodes) ) )]
+    # end of InternalBibleColumnarEntryList._getEntrySlice
+
+
+    def append( self, newBibleEntry ) -> None:
+        """
+        Append (the fields of) the newBibleEntry to the InternalBibleColumnarEntryList.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleColumnarEntryList.append( {newBibleEntry} )" )
+        assert isinstance( newBibleEntry, InternalBibleEntry )
+        getMarkerCode, getTextCode = self._markerTable.getCode, self._textTable.getCode
+        self._markerCodes.append( getMarkerCode( newBibleEntry.marker ) )
+        self._originalMarkerCodes.append( getMarkerCode( newBibleEntry.originalMarker ) )
+        self._adjustedTextCodes.append( getTextCode( newBibleEntry.adjustedText ) )
+        self._cleanTextCodes.append( getTextCode( newBibleEntry.cleanText ) )
+        self._originalTextCodes.append( getTextCode( newBibleEntry.originalText ) )
+        if newBibleEntry.extras is not None:
+            self._extrasDict[len(self._markerCodes)-1] = newBibleEntry.extras
+    # end of InternalBibleColumnarEntryList.append
+
+    def pop( self ): # Doesn't allow a parameter
+        """
+        Remove and return the last entry (as a standalone InternalBibleEntry)
+            or None if the InternalBibleColumnarEntryList is empty.
+        """
+        if not self._markerCodes: return None
+        lastIndex = len(self._markerCodes) - 1
+        lastEntry = InternalBibleEntry( *(self._getField( lastIndex, j ) for j in range( 6 )) )
+        for column in ( self._markerCodes, self._originalMarkerCodes,
+                        self._adjustedTextCodes, self._cleanTextCodes, self._originalTextCodes ):
+            column.pop()
+        self._extrasDict.pop( lastIndex, None )
+        return lastEntry
+    # end of InternalBibleColumnarEntryList.pop
+
+    def extend( self, additionalList ) -> None:
+        """
+        Extend the InternalBibleColumnarEntryList with the newList given.
+        """
+        assert isinstance( additionalList, InternalBibleEntryList )
+        for entry in additionalList:
+            self.append( entry )
+    # end of InternalBibleColumnarEntryList.extend
+    def __add__( self, listToAppend ):
+        """
+        So we can use Python + operator to add lists (e.g., to combine verses)
+        """
+        self.extend( listToAppend )
+        return self
+    # end of InternalBibleColumnarEntryList.__add__
+
+
+    def replaceEntries( self, startIndex:int, endIndex:int, newEntries ) -> None:
+        """
+        Replace (the fields of) the entries from startIndex up to (but not including) endIndex
+            with the fields of the newEntries which don't have to be the same length.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleColumnarEntryList.replaceEntries( {startIndex}, {endIndex}, ({len(newEntries)}) )" )
+        assert 0 <= startIndex <= endIndex <= len(self._markerCodes)
+        getMarkerCode, getTextCode = self._markerTable.getCode, self._textTable.getCode
+        newMarkerCodes, newOriginalMarkerCodes = array( 'H' ), array( 'H' )
+        newAdjustedTextCodes, newCleanTextCodes, newOriginalTextCodes = array( 'I' ), array( 'I' ), array( 'I' )
+        newExtrasDict:dict[int,InternalBibleExtraList] = {}
+        for j,newBibleEntry in enumerate( newEntries, start=startIndex ):
+            newMarkerCodes.append( getMarkerCode( newBibleEntry.marker ) )
+            newOriginalMarkerCodes.append( getMarkerCode( newBibleEntry.originalMarker ) )
+            newAdjustedTextCodes.append( getTextCode( newBibleEntry.adjustedText ) )
+            newCleanTextCodes.append( getTextCode( newBibleEntry.cleanText ) )
+            newOriginalTextCodes.append( getTextCode( newBibleEntry.originalText ) )
+            if newBibleEntry.extras is not None: newExtrasDict[j] = newBibleEntry.extras
+        self._markerCodes[startIndex:endIndex] = newMarkerCodes
+        self._originalMarkerCodes[startIndex:endIndex] = newOriginalMarkerCodes
+        self._adjustedTextCodes[startIndex:endIndex] = newAdjustedTextCodes
+        self._cleanTextCodes[startIndex:endIndex] = newCleanTextCodes
+        self._originalTextCodes[startIndex:endIndex] = newOriginalTextCodes
+
+        # The extras are stored by entry index, so the following ones have to be moved
+        delta = len(newMarkerCodes) - (endIndex - startIndex)
+        for j,extras in self._extrasDict.items():
+            if j < startIndex: newExtrasDict[j] = extras
+            elif j >= endIndex: newExtrasDict[j+delta] = extras
+        self._extrasDict = newExtrasDict
+    # end of InternalBibleColumnarEntryList.replaceEntries
+
+
+    def contains( self, searchMarker, maxLines=None ):
+        """
+        Search some or all of the entries and return the index of the first line containing the given marker.
+
+        maxLines is the integer maxLines to search
+            or None to search them all.
+
+        Returns None if no match is found
+        """
+        try: searchCode = self._markerTable.codeDict[searchMarker]
+        except KeyError: return None # We don't have that marker at all
+        markerCodes = self._markerCodes if maxLines is None else self._markerCodes[:maxLines+1]
+        try: return markerCodes.index( searchCode )
+        except ValueError: return None
+    # end of InternalBibleColumnarEntryList.contains
+# end of class InternalBibleColumnarEntryList
+
+
+ENTRY_LIST_SIZE_HANDLERS = { # for BibleOrgSysGlobals.totalSize() -- the subclasses must come first
+    InternalBibleColumnarEntryList: lambda entryList: iter( (entryList._markerTable, entryList._textTable,
+                        entryList._markerCodes, entryList._originalMarkerCodes,
+                        entryList._adjustedTextCodes, entryList._cleanTextCodes, entryList._originalTextCodes,
+                        entryList._extrasDict) ),
+    InternalBibleEntryListView: lambda entryList: iter( () if entryList._ownData is None else (entryList._ownData,) ), # Doesn't own the entries
+    InternalBibleEntryList: lambda entryList: iter( entryList.data ),
+    InternalBibleStringTable: lambda stringTable: iter( (stringTable.strings, stringTable.codeDict) ),
+    InternalBibleEntry: lambda entry: iter( (entry.marker, entry.originalMarker, entry.adjustedText, entry.cleanText, entry.extras, entry.originalText) ),
+    InternalBibleExtraList: lambda extraList: iter( extraList.data ),
+    InternalBibleExtra: lambda extra: iter( (extra.myType, extra.index, extra.noteText, extra.cleanNoteText) ),
+    }
+
+def getEntryListMemorySize( entryList:InternalBibleEntryList ) -> int:
+    """
+    Returns the approximate memory footprint (in bytes) of the InternalBibleEntryList
+        (either representation) including all of its entries and strings.
+
+    Note that strings in a shared InternalBibleStringTable are all counted.
+    """
+    return BibleOrgSysGlobals.totalSize( entryList, handlers=ENTRY_LIST_SIZE_HANDLERS )
+# end of getEntryListMemorySize
+
+
+
 def briefDemo() -> None:
     """
     Demonstrate reading and processing some Bible databases.
@@ -953,6 +1564,16 @@ def fullDemo() -> None:
     dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"resultDict = {resultDict}" )
     assert resultDict == {'word': 'word', 'x': 'pos="noun"'}
 
+    entryList = InternalBibleEntryList( [InternalBibleEntry( 'v', 'v', '1', '1', None, '1' ),
+                                         InternalBibleEntry( 'v~', 'v', 'In the beginning', 'In the beginning', None, 'In the beginning' ),
+                                         InternalBibleEntry( '¬v', None, None, '', None, None )] )
+    columnarEntryList = InternalBibleColumnarEntryList( entryList )
+    assert [tuple(entry) for entry in columnarEntryList] == [tuple(entry) for entry in entryList]
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Entry list memory sizes: {getEntryListMemorySize( entryList ):,} bytes as objects, {getEntryListMemorySize( columnarEntryList ):,} bytes as columns" )
+    entryListView = InternalBibleEntryListView( columnarEntryList, 1, 2 ) # Just the verse text and the verse end marker
+    assert len(entryListView) == 2 and entryListView[0].getMarker() == 'v~'
+    assert [tuple(entry) for entry in entryListView] == [tuple(entry) for entry in entryList[1:]]
+
     #IBB = InternalBibleInternals( 'GEN' )
     ## The following fields would normally be filled in a by "load" routine in the derived class
     #IBB.objectNameString = 'Dummy test Internal Bible Book object'
@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# InternalBibleSearchIndexes.py
+#
+# Module handling search indexes for internal Bibles
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module for defining and manipulating Bible search indexes including:
+
+    InternalBibleBookWordIndex
+        An inverted index for one Bible book
+            mapping words (alphabetic runs in the cleanText) to searchable entries.
+    InternalBibleWordIndex
+        Holds the InternalBibleBookWordIndex for each book of a Bible
+            and can be saved to and reloaded from the BOSObjectCache folder.
+
+    InternalBibleBookTrigramIndex
+        A trigram (three character) index for one Bible book
+            used to prefilter lines for regex searches.
+    InternalBibleTrigramIndex
+        Holds the InternalBibleBookTrigramIndex for each book of a Bible
+            (made as required) and keeps prefilter statistics.
+
+For regex searches, the literal strings which must occur in any match
+    are extracted from the parsed regex, and only lines containing
+    all of their trigrams need to be searched with the actual regex.
+
+The indexes are only used to narrow down which entries need to be searched,
+    so InternalBible.findText() still does the actual matching
+    and hence gives identical results with or without the index.
+
+A "word" here is a maximal run of characters for which str.isalpha() is True,
+    because that's how findText() decides word boundaries for wordMode.
+Separate term dictionaries are built (lazily) for each combination of
+    caselessFlag and ignoreDiacriticsFlag.
+"""
+from __future__ import annotations # So we can use typing -> ClassName (before Python 3.10)
+from gettext import gettext as _
+from pathlib import Path
+import logging
+import re
+import hashlib
+from array import array
+from bisect import bisect_left
+try: import re._parser as sre_parse # Python 3.11+
+except ImportError: import sre_parse
+
+if __name__ == '__main__':
+    import os.path
+    import sys
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2025-06-02' # by RJH
+SHORT_PROGRAM_NAME = "BibleSearchIndexes"
+PROGRAM_NAME = "Bible search indexes handler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+WORD_INDEX_FORMAT_VERSION = 1 # Increment this if the saved index format changes
+SEARCH_INDEX_CACHE_FOLDERPATH = BibleOrgSysGlobals.DEFAULT_WRITEABLE_CACHE_FOLDERPATH.joinpath( 'SearchIndexes/' )
+
+WORD_CHARACTERS_REGEX = re.compile( r'[^\W\d_]+' ) # Finds candidate runs -- we still have to check them with isalpha()
+
+TRIGRAM_LENGTH = 3
+REGEX_REPEAT_OPS = tuple( getattr( sre_parse, opName ) for opName in ('MAX_REPEAT','MIN_REPEAT','POSSESSIVE_REPEAT') if hasattr( sre_parse, opName ) )
+REGEX_ATOMIC_GROUP_OP = getattr( sre_parse, 'ATOMIC_GROUP', None ) # Python 3.11+
+
+
+
+def getAlphaRuns( someText:str ) -> list[tuple[int,int,str]]:
+    """
+    Find the maximal runs of alphabetic characters (as defined by str.isalpha) in the text.
+
+    Returns a list of 3-tuples: startIndex, endIndex, runText
+    """
+    results = []
+    for match in WORD_CHARACTERS_REGEX.finditer( someText ):
+        run = match.group()
+        if run.isalpha():
+            results.append( (match.start(), match.end(), run) )
+        else: # rare -- contains something like a superscript digit
+            runStartIx = match.start()
+            startIx = None
+            for j,char in enumerate( run ):
+                if char.isalpha():
+                    if startIx is None: startIx = j
+                elif startIx is not None:
+                    results.append( (runStartIx+startIx, runStartIx+j, run[startIx:j]) )
+                    startIx = None
+            if startIx is not None:
+                results.append( (runStartIx+startIx, match.end(), run[startIx:]) )
+    return results
+# end of getAlphaRuns
+
+
+def foldText( someText:str, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> str:
+    """
+    Adjust the text in exactly the same way that findText() does.
+    """
+    if ignoreDiacriticsFlag: someText = BibleOrgSysGlobals.removeAccents( someText )
+    if caselessFlag: someText = someText.lower()
+    return someText
+# end of foldText
+
+
+def getBookSignature( givenBibleEntries ) -> str:
+    """
+    Returns a hash of the searchable parts of the book
+        so that we can tell if a saved index is still valid.
+    """
+    hasher = hashlib.md5()
+    for entry in givenBibleEntries:
+        hasher.update( f'{entry.getMarker()}\n{entry.getCleanText()}\n'.encode( 'utf-8', errors='surrogatepass' ) )
+    return hasher.hexdigest()
+# end of getBookSignature
+
+
+
+class InternalBibleBookWordIndex:
+    """
+    Handles the inverted word index for an internal Bible book.
+
+    The index contains "records" for the entries that findText() would search,
+        i.e., not the added ¬ lines, and only lines with some cleanText.
+    Each record stores the entryIndex, and the C and V exactly as findText() calculates them.
+
+    Postings are stored as array('I') of record numbers (in ascending order).
+    """
+    __slots__ = ('BBB','signature','givenBibleEntries',
+                 'entryIndexes','Cs','Vs', '_postings','_sortedTerms',
+                 ) # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, BBB:str ) -> None:
+        """
+        Creates the (empty) word index object for a Bible book.
+        """
+        self.BBB = BBB
+        self.signature = self.givenBibleEntries = None
+        self.entryIndexes, self.Cs, self.Vs = array( 'I' ), [], []
+        self._postings, self._sortedTerms = {}, {}
+    # end of InternalBibleBookWordIndex.__init__
+
+
+    def __getstate__( self ):
+        """
+        Needed for pickling because we use __slots__
+            and we don't want to save the Bible entries themselves.
+        """
+        return { 'BBB':self.BBB, 'signature':self.signature,
+                'entryIndexes':self.entryIndexes, 'Cs':self.Cs, 'Vs':self.Vs,
+                '_postings':self._postings, }
+    def __setstate__( self, state ) -> None:
+        for key,value in state.items():
+            setattr( self, key, value )
+        self.givenBibleEntries = None
+        self._sortedTerms = {}
+    # end of InternalBibleBookWordIndex.__getstate__/__setstate__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index.
+        """
+        result = f"InternalBibleBookWordIndex object for {self.BBB}:"
+        result += f"\n  {len(self.entryIndexes):,} searchable entries"
+        for (caselessFlag,ignoreDiacriticsFlag),postings in self._postings.items():
+            result += f"\n  {len(postings):,} terms with caseless={caselessFlag} ignoreDiacritics={ignoreDiacriticsFlag}"
+        return result
+    # end of InternalBibleBookWordIndex.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self.entryIndexes )
+    # end of InternalBibleBookWordIndex.__len__
+
+
+    def makeIndex( self, givenBibleEntries ) -> None:
+        """
+        Go through the processed Bible entries and record the searchable ones.
+
+        The C and V calculations here must exactly mirror those in InternalBible.findText().
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookWordIndex.makeIndex( {len(givenBibleEntries)} ) for {self.BBB}" )
+
+        self.givenBibleEntries = givenBibleEntries
+        self.signature = getBookSignature( givenBibleEntries )
+        self.entryIndexes, self.Cs, self.Vs = array( 'I' ), [], []
+        self._postings, self._sortedTerms = {}, {}
+
+        C, V = '-1', '-1' # So first/id line starts at -1:0
+        for entryIndex,lineEntry in enumerate( givenBibleEntries ):
+            marker, cleanText = lineEntry.getMarker(), lineEntry.getCleanText()
+            if marker[0] == '¬': continue # findText always ignores these added lines
+            if marker in ('headers','intro','chapters'): continue # findText always ignores these added lines
+            if marker == 'c': C, V = cleanText, '0'
+            elif marker == 'v': V = cleanText
+            elif C == '-1': V = str( int(V) + 1 )
+            if cleanText:
+                self.entryIndexes.append( entryIndex )
+                self.Cs.append( C )
+                self.Vs.append( V )
+    # end of InternalBibleBookWordIndex.makeIndex
+
+
+    def attachEntries( self, givenBibleEntries ) -> bool:
+        """
+        Used after reloading a saved index.
+
+        Returns True if the index is still valid for the given entries.
+        """
+        if getBookSignature( givenBibleEntries ) != self.signature:
+            return False
+        self.givenBibleEntries = givenBibleEntries
+        return True
+    # end of InternalBibleBookWordIndex.attachEntries
+
+
+    def getRecord( self, recordNumber:int ) -> tuple[int,str,str]:
+        """
+        Returns a 3-tuple: entryIndex, C, V
+        """
+        return self.entryIndexes[recordNumber], self.Cs[recordNumber], self.Vs[recordNumber]
+    # end of InternalBibleBookWordIndex.getRecord
+
+
+    def getPostings( self, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> dict[str,array]:
+        """
+        Returns the term dictionary for the given flags,
+            making it first if necessary.
+        """
+        key = (caselessFlag,ignoreDiacriticsFlag)
+        try: return self._postings[key]
+        except KeyError: pass
+
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Making {self.BBB} word postings for caseless={caselessFlag} ignoreDiacritics={ignoreDiacriticsFlag}…" )
+        postings = {}
+        for recordNumber,entryIndex in enumerate( self.entryIndexes ):
+            textToBeIndexed = foldText( self.givenBibleEntries[entryIndex].getCleanText(), caselessFlag, ignoreDiacriticsFlag )
+            terms = set()
+            for term in WORD_CHARACTERS_REGEX.findall( textToBeIndexed ):
+                if term.isalpha(): terms.add( term )
+                else: # rare -- contains something like a superscript digit
+                    terms.update( subterm for _startIx,_endIx,subterm in getAlphaRuns( term ) )
+            for term in terms:
+                try: postings[term].append( recordNumber )
+                except KeyError: postings[term] = array( 'I', (recordNumber,) )
+        self._postings[key] = postings
+        return postings
+    # end of InternalBibleBookWordIndex.getPostings
+
+
+    def _getSortedTerms( self, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> tuple[list[str],list[str]]:
+        """
+        Returns two sorted lists of the terms:
+            the terms themselves (for prefix searches)
+            and the reversed terms (for suffix searches).
+        """
+        key = (caselessFlag,ignoreDiacriticsFlag)
+        try: return self._sortedTerms[key]
+        except KeyError: pass
+        postings = self.getPostings( caselessFlag, ignoreDiacriticsFlag )
+        self._sortedTerms[key] = sorted( postings ), sorted( term[::-1] for term in postings )
+        return self._sortedTerms[key]
+    # end of InternalBibleBookWordIndex._getSortedTerms
+
+
+    def _getMatchingTerms( self, run:str, leftBounded:bool, rightBounded:bool, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> list[str]:
+        """
+        Find all of the index terms that could contain the alphabetic run from the search text.
+        """
+        postings = self.getPostings( caselessFlag, ignoreDiacriticsFlag )
+        if leftBounded and rightBounded: # must be the entire term
+            return [run] if run in postings else []
+        if leftBounded: # must be at the start of the term
+            sortedTerms = self._getSortedTerms( caselessFlag, ignoreDiacriticsFlag )[0]
+            results = []
+            for ix in range( bisect_left( sortedTerms, run ), len(sortedTerms) ):
+                if not sortedTerms[ix].startswith( run ): break
+                results.append( sortedTerms[ix] )
+            return results
+        if rightBounded: # must be at the end of the term
+            reversedRun = run[::-1]
+            sortedReversedTerms = self._getSortedTerms( caselessFlag, ignoreDiacriticsFlag )[1]
+            results = []
+            for ix in range( bisect_left( sortedReversedTerms, reversedRun ), len(sortedReversedTerms) ):
+                if not sortedReversedTerms[ix].startswith( reversedRun ): break
+                results.append( sortedReversedTerms[ix][::-1] )
+            return results
+        return [term for term in postings if run in term]
+    # end of InternalBibleBookWordIndex._getMatchingTerms
+
+
+    def getCandidateRecords( self, ourFindText:str, wordMode:str, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> list[int]|None:
+        """
+        Given the search text (already adjusted for caselessFlag and ignoreDiacriticsFlag),
+            return a sorted list of record numbers which might possibly contain it.
+
+        Every alphabetic run in the search text must occur somewhere in a matching line.
+        Runs that are preceded by a non-letter (or by the start of a whole word search)
+            must be at the start of a term, and similarly for the ends of runs.
+
+        Returns None if the index can't help (e.g., the search text has no letters).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleBookWordIndex.getCandidateRecords( {ourFindText!r}, {wordMode} ) for {self.BBB}" )
+        assert self.givenBibleEntries is not None
+
+        runs = getAlphaRuns( ourFindText )
+        if not runs: return None
+
+        candidates = None
+        for startIx,endIx,run in sorted( runs, key=lambda r: -len(r[2]) ): # Do the longest (hopefully rarest) runs first
+            leftBounded = startIx > 0 or wordMode in ('Whole','Begins')
+            rightBounded = endIx < len(ourFindText) or wordMode in ('Whole','EndsWord','EndsLine')
+            postings = self.getPostings( caselessFlag, ignoreDiacriticsFlag )
+            runCandidates = set()
+            for term in self._getMatchingTerms( run, leftBounded, rightBounded, caselessFlag, ignoreDiacriticsFlag ):
+                runCandidates.update( postings[term] )
+            candidates = runCandidates if candidates is None else candidates & runCandidates
+            if not candidates: return []
+        return sorted( candidates )
+    # end of InternalBibleBookWordIndex.getCandidateRecords
+# end of class InternalBibleBookWordIndex
+
+
+
+class InternalBibleWordIndex:
+    """
+    Holds the word index for each book of an internal Bible.
+
+    Book indexes are automatically remade if the book entries have changed
+        (e.g., after InternalBible.reloadBook()).
+    """
+    def __init__( self, workName:str ) -> None:
+        """
+        Creates the (empty) word index object for a Bible.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleWordIndex.__init__( {workName} )" )
+        self.workName = workName
+        self.formatVersion = WORD_INDEX_FORMAT_VERSION
+        self.bookIndexes = {}
+    # end of InternalBibleWordIndex.__init__
+
+
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index.
+        """
+        result = f"InternalBibleWordIndex object for {self.workName}:"
+        result += f"\n  {len(self.bookIndexes)} books with {sum( len(bookIndex) for bookIndex in self.bookIndexes.values() ):,} searchable entries"
+        return result
+    # end of InternalBibleWordIndex.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self.bookIndexes )
+    # end of InternalBibleWordIndex.__len__
+
+
+    def __contains__( self, BBB:str ) -> bool:
+        return BBB in self.bookIndexes
+    # end of InternalBibleWordIndex.__contains__
+
+
+    def makeIndex( self, BibleObject ) -> int:
+        """
+        Make (or validate any previously loaded) word indexes for all the loaded books.
+
+        Returns the number of book indexes that had to be (re)made.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleWordIndex.makeIndex( {BibleObject.getAName()} )" )
+        numMade = 0
+        for BBB,bookObject in BibleObject.books.items():
+            if self.getBookIndex( BBB, bookObject, makeFlag=False ) is None:
+                self.makeBookIndex( BBB, bookObject )
+                numMade += 1
+        for BBB in list( self.bookIndexes ):
+            if BBB not in BibleObject.books: del self.bookIndexes[BBB] # Must have been an old book
+        return numMade
+    # end of InternalBibleWordIndex.makeIndex
+
+
+    def makeBookIndex( self, BBB:str, bookObject ) -> InternalBibleBookWordIndex:
+        """
+        Make the word index for a single book.
+        """
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Making word index for {self.workName} {BBB}…" )
+        bookIndex = InternalBibleBookWordIndex( BBB )
+        bookIndex.makeIndex( bookObject._processedLines )
+        bookIndex.getPostings( caselessFlag=True, ignoreDiacriticsFlag=False ) # Make the default ones now
+        self.bookIndexes[BBB] = bookIndex
+        return bookIndex
+    # end of InternalBibleWordIndex.makeBookIndex
+
+
+    def getBookIndex( self, BBB:str, bookObject, makeFlag:bool=True ) -> InternalBibleBookWordIndex|None:
+        """
+        Returns the word index for the book,
+            checking first that it still refers to the current book entries.
+        """
+        try: bookIndex = self.bookIndexes[BBB]
+        except KeyError: bookIndex = None
+        if bookIndex is not None and bookIndex.givenBibleEntries is not bookObject._processedLines:
+            if bookIndex.givenBibleEntries is not None \
+            or not bookIndex.attachEntries( bookObject._processedLines ): # It's out-of-date
+                del self.bookIndexes[BBB]
+                bookIndex = None
+        if bookIndex is None and makeFlag:
+            bookIndex = self.makeBookIndex( BBB, bookObject )
+        return bookIndex
+    # end of InternalBibleWordIndex.getBookIndex
+
+
+    def invalidateBook( self, BBB:str ) -> None:
+        """
+        Forget the index for the book (probably because it has been edited or reloaded).
+        """
+        try: del self.bookIndexes[BBB]
+        except KeyError: pass
+    # end of InternalBibleWordIndex.invalidateBook
+
+
+    @staticmethod
+    def getCacheFilename( BibleObject ) -> str:
+        """
+        Returns a safe filename for saving the word index for the given Bible.
+        """
+        name = BibleObject.getAName( abbrevFirst=True )
+        if not name: name = BibleObject.objectTypeString
+        return BibleOrgSysGlobals.makeSafeFilename( f'{name}_{BibleObject.objectTypeString}.wordIndex.pickle' )
+    # end of InternalBibleWordIndex.getCacheFilename
+
+
+    def save( self, BibleObject, folderpath=None ) -> bool:
+        """
+        Save the index into the BOSObjectCache folder (by default).
+
+        Returns True if successful.
+        """
+        if folderpath is None: folderpath = SEARCH_INDEX_CACHE_FOLDERPATH
+        filename = self.getCacheFilename( BibleObject )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Saving word index for {} to {}…").format( self.workName, Path( folderpath, filename ) ) )
+        return BibleOrgSysGlobals.pickleObject( self, filename, folderpath )
+    # end of InternalBibleWordIndex.save
+
+
+    @staticmethod
+    def load( BibleObject, folderpath=None ) -> InternalBibleWordIndex|None:
+        """
+        Try to load a previously saved index from the BOSObjectCache folder (by default).
+
+        Note that the individual book indexes are only checked against the book contents
+            when they're first used (or when makeIndex() is called).
+
+        Returns None if no usable index was found.
+        """
+        if folderpath is None: folderpath = SEARCH_INDEX_CACHE_FOLDERPATH
+        filename = InternalBibleWordIndex.getCacheFilename( BibleObject )
+        if not Path( folderpath, filename ).is_file(): return None
+        try: wordIndex = BibleOrgSysGlobals.unpickleObject( filename, folderpath )
+        except Exception as err:
+            logging.warning( f"Unable to load word index for {BibleObject.getAName()} from {folderpath}: {err}" )
+            return None
+        if not isinstance( wordIndex, InternalBibleWordIndex ) \
+        or wordIndex.formatVersion != WORD_INDEX_FORMAT_VERSION:
+            logging.info( f"Ignoring out-of-date word index for {BibleObject.getAName()} in {folderpath}" )
+            return None
+        return wordIndex
+    # end of InternalBibleWordIndex.load
+# end of class InternalBibleWordIndex
+
+
+
+def getRegexLiteralQuery( parsedItems ) -> str|tuple|None:
+    """
+    Given a parsed regular expression (from sre_parse),
+        find the literal strings which must be present in any match.
+
+    Returns None if there are no usable literals (of at least three characters),
+        or a literal string,
+        or a 2-tuple ('AND'|'OR', list of sub-queries).
+    """
+    parts, currentLiteral = [], ''
+    for op,av in parsedItems:
+        if op is sre_parse.LITERAL:
+            currentLiteral += chr( av )
+            continue
+        if len(currentLiteral) >= TRIGRAM_LENGTH: parts.append( currentLiteral )
+        currentLiteral = ''
+        subQuery = None
+        if op is sre_parse.SUBPATTERN:
+            if not av[1] & re.IGNORECASE: # can't use literals from a (?i:…) group
+                subQuery = getRegexLiteralQuery( av[-1] )
+        elif op in REGEX_REPEAT_OPS:
+            if av[0] > 0: # the item must occur at least once
+                subQuery = getRegexLiteralQuery( av[2] )
+        elif op is sre_parse.BRANCH:
+            alternativeQueries = [getRegexLiteralQuery( alternative ) for alternative in av[1]]
+            if None not in alternativeQueries:
+                subQuery = ('OR', alternativeQueries)
+        elif op is REGEX_ATOMIC_GROUP_OP:
+            subQuery = getRegexLiteralQuery( av )
+        if subQuery is not None: parts.append( subQuery )
+    if len(currentLiteral) >= TRIGRAM_LENGTH: parts.append( currentLiteral )
+    if not parts: return None
+    return parts[0] if len(parts) == 1 else ('AND', parts)
+# end of getRegexLiteralQuery
+
+
+def getCompiledRegexLiteralQuery( compiledRegex ) -> str|tuple|None:
+    """
+    Find the literal strings which must be present in any match of the compiled regular expression.
+
+    Returns None if the regex can't be used for prefiltering,
+        e.g., if it's case insensitive or has no literals of at least three characters.
+    """
+    if compiledRegex.flags & re.IGNORECASE: return None
+    try: parsedItems = sre_parse.parse( compiledRegex.pattern, compiledRegex.flags )
+    except Exception as err: # Shouldn't happen as it's already compiled
+        logging.warning( f"getCompiledRegexLiteralQuery: Unable to parse regex {compiledRegex.pattern!r}: {err}" )
+        return None
+    return getRegexLiteralQuery( parsedItems )
+# end of getCompiledRegexLiteralQuery
+
+
+
+class InternalBibleBookTrigramIndex:
+    """
+    Handles the trigram index for an internal Bible book.
+
+    Postings are stored as array('I') of entry indexes (in ascending order)
+        into the processed lines of the book.
+    Separate postings are made (lazily) for each combination of
+        includeExtrasFlag (i.e., searching the full text), caselessFlag, and ignoreDiacriticsFlag.
+    """
+    __slots__ = ('BBB','givenBibleEntries','_postings',) # Define allowed self variables (more efficient than a dict when have many instances)
+
+
+    def __init__( self, BBB:str, givenBibleEntries ) -> None:
+        """
+        Creates the (empty) trigram index object for a Bible book.
+        """
+        self.BBB, self.givenBibleEntries = BBB, givenBibleEntries
+        self._postings = {}
+    # end of InternalBibleBookTrigramIndex.__init__
+
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index.
+        """
+        result = f"InternalBibleBookTrigramIndex object for {self.BBB}:"
+        for (includeExtrasFlag,caselessFlag,ignoreDiacriticsFlag),postings in self._postings.items():
+            result += f"\n  {len(postings):,} trigrams with includeExtras={includeExtrasFlag} caseless={caselessFlag} ignoreDiacritics={ignoreDiacriticsFlag}"
+        return result
+    # end of InternalBibleBookTrigramIndex.__str__
+
+
+    def getPostings( self, includeExtrasFlag:bool, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> dict[str,array]:
+        """
+        Returns the trigram dictionary for the given flags,
+            making it first if necessary.
+        """
+        key = (includeExtrasFlag,caselessFlag,ignoreDiacriticsFlag)
+        try: return self._postings[key]
+        except KeyError: pass
+
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Making {self.BBB} trigram postings for includeExtras={includeExtrasFlag} caseless={caselessFlag} ignoreDiacritics={ignoreDiacriticsFlag}…" )
+        postings = {}
+        for entryIndex,lineEntry in enumerate( self.givenBibleEntries ):
+            textToBeIndexed = lineEntry.getFullText() if includeExtrasFlag else lineEntry.getCleanText()
+            if not textToBeIndexed or len(textToBeIndexed) < TRIGRAM_LENGTH: continue
+            textToBeIndexed = foldText( textToBeIndexed, caselessFlag, ignoreDiacriticsFlag )
+            for trigram in { textToBeIndexed[ix:ix+TRIGRAM_LENGTH] for ix in range( len(textToBeIndexed) - TRIGRAM_LENGTH + 1 ) }:
+                try: postings[trigram].append( entryIndex )
+                except KeyError: postings[trigram] = array( 'I', (entryIndex,) )
+        self._postings[key] = postings
+        return postings
+    # end of InternalBibleBookTrigramIndex.getPostings
+
+
+    def getCandidateEntryIndexes( self, literalQuery:str|tuple, includeExtrasFlag:bool, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> set[int]:
+        """
+        Given a query from getCompiledRegexLiteralQuery(),
+            return the set of entry indexes which might possibly match.
+        """
+        postings = self.getPostings( includeExtrasFlag, caselessFlag, ignoreDiacriticsFlag )
+
+        def evaluate( query ) -> set[int]:
+            if isinstance( query, str ):
+                candidates = None
+                for ix in range( len(query) - TRIGRAM_LENGTH + 1 ):
+                    try: trigramEntries = postings[query[ix:ix+TRIGRAM_LENGTH]]
+                    except KeyError: return set()
+                    candidates = set( trigramEntries ) if candidates is None else candidates.intersection( trigramEntries )
+                    if not candidates: break
+                return candidates
+            operator, subQueries = query
+            if operator == 'AND':
+                candidates = None
+                for subQuery in subQueries:
+                    candidates = evaluate( subQuery ) if candidates is None else candidates & evaluate( subQuery )
+                    if not candidates: break
+                return candidates
+            assert operator == 'OR'
+            candidates = set()
+            for subQuery in subQueries:
+                candidates |= evaluate( subQuery )
+            return candidates
+        # end of evaluate
+
+        return evaluate( literalQuery )
+    # end of InternalBibleBookTrigramIndex.getCandidateEntryIndexes
+# end of class InternalBibleBookTrigramIndex
+
+
+
+class InternalBibleTrigramIndex:
+    """
+    Holds the trigram index for each book of an internal Bible
+        which is used to prefilter lines for regex searches.
+
+    Book indexes are made when they're first needed
+        and automatically remade if the book entries have changed.
+
+    Also keeps statistics on how effective the prefiltering is.
+    """
+    def __init__( self, workName:str ) -> None:
+        """
+        Creates the (empty) trigram index object for a Bible.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleTrigramIndex.__init__( {workName} )" )
+        self.workName = workName
+        self.bookIndexes = {}
+        self.resetStatistics()
+    # end of InternalBibleTrigramIndex.__init__
+
+
+    def __str__( self ) -> str:
+        """
+        Just display a simplified view of the index and the statistics.
+        """
+        result = f"InternalBibleTrigramIndex object for {self.workName}:"
+        result += f"\n  {len(self.bookIndexes)} books indexed"
+        for key,value in self.getStatistics().items():
+            result += f"\n  {key}={value:,}" if isinstance( value, int ) else f"\n  {key}={value}"
+        return result
+    # end of InternalBibleTrigramIndex.__str__
+
+
+    def __len__( self ) -> int:
+        return len( self.bookIndexes )
+    # end of InternalBibleTrigramIndex.__len__
+
+
+    def __contains__( self, BBB:str ) -> bool:
+        return BBB in self.bookIndexes
+    # end of InternalBibleTrigramIndex.__contains__
+
+
+    def getBookIndex( self, BBB:str, bookObject ) -> InternalBibleBookTrigramIndex:
+        """
+        Returns the trigram index for the book,
+            making it first if necessary.
+        """
+        try:
+            bookIndex = self.bookIndexes[BBB]
+            if bookIndex.givenBibleEntries is bookObject._processedLines:
+                return bookIndex
+        except KeyError: pass
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Making trigram index for {self.workName} {BBB}…" )
+        bookIndex = self.bookIndexes[BBB] = InternalBibleBookTrigramIndex( BBB, bookObject._processedLines )
+        return bookIndex
+    # end of InternalBibleTrigramIndex.getBookIndex
+
+
+    def invalidateBook( self, BBB:str ) -> None:
+        """
+        Forget the index for the book (probably because it has been edited or reloaded).
+        """
+        try: del self.bookIndexes[BBB]
+        except KeyError: pass
+    # end of InternalBibleTrigramIndex.invalidateBook
+
+
+    def resetStatistics( self ) -> None:
+        """
+        Reset the prefilter counts.
+        """
+        self.numQueries = self.numPrefilteredQueries = 0
+        self.numLinesSearchable = self.numCandidateLines = self.numMatchedLines = 0
+    # end of InternalBibleTrigramIndex.resetStatistics
+
+
+    def recordQuery( self, prefilteredFlag:bool, numLinesSearchable:int=0, numCandidateLines:int=0, numMatchedLines:int=0 ) -> None:
+        """
+        Update the statistics after a regex search.
+        """
+        self.numQueries += 1
+        if prefilteredFlag:
+            self.numPrefilteredQueries += 1
+            self.numLinesSearchable += numLinesSearchable
+            self.numCandidateLines += numCandidateLines
+            self.numMatchedLines += numMatchedLines
+    # end of InternalBibleTrigramIndex.recordQuery
+
+
+    def getStatistics( self ) -> dict[str,int|float]:
+        """
+        Returns a dictionary of prefilter statistics including:
+            candidateRate: the proportion of lines that still had to be searched with the regex
+            hitRate: the proportion of candidate lines that actually matched
+        """
+        return { 'numQueries':self.numQueries, 'numPrefilteredQueries':self.numPrefilteredQueries,
+                'numLinesSearchable':self.numLinesSearchable, 'numCandidateLines':self.numCandidateLines,
+                'numMatchedLines':self.numMatchedLines,
+                'candidateRate':round( self.numCandidateLines / self.numLinesSearchable, 4 ) if self.numLinesSearchable else None,
+                'hitRate':round( self.numMatchedLines / self.numCandidateLines, 4 ) if self.numCandidateLines else None,
+                }
+    # end of InternalBibleTrigramIndex.getStatistics
+# end of class InternalBibleTrigramIndex
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest1/' )
+    UB = USFMBible( testFolder, "Matigsalug", 'MBTV' )
+    UB.load()
+    UB.makeWordIndex( saveFlag=False )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, UB.wordIndex )
+    for findText in ( 'Dios', 'regex:D.os', ):
+        _optionsDict, resultSummaryDict, resultList = UB.findText( { 'findText':findText } )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Found {findText!r} {len(resultList):,} times in {resultSummaryDict['foundBookList']}" )
+# end of InternalBibleSearchIndexes.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of InternalBibleSearchIndexes.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of InternalBibleSearchIndexes.py
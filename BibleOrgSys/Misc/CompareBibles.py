@@ -93,10 +93,10 @@ from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.Bible import Bible, BibleBook
 
 
-LAST_MODIFIED_DATE = '2020-11-05' # by RJH
+LAST_MODIFIED_DATE = '2025-06-25' # by RJH
 SHORT_PROGRAM_NAME = "CompareBibles"
 PROGRAM_NAME = "Bible compare analyzer"
-PROGRAM_VERSION = '0.27'
+PROGRAM_VERSION = '0.28'
 PROGRAM_NAME_VERSION = '{} v{}'.format( SHORT_PROGRAM_NAME, PROGRAM_VERSION )
 PROGRAM_NAME_VERSION_DATE = '{} {} {}'.format( PROGRAM_NAME_VERSION, _("last modified"), LAST_MODIFIED_DATE )
 
@@ -1005,13 +1005,10 @@ def analyzeBibles( Bible1:Bible, Bible2:Bible ) -> dict[str,list]:
     if BibleOrgSysGlobals.maxProcesses > 1: # Check all the books as quickly as possible
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Comparing {} books using {} processes…").format( numBooks, BibleOrgSysGlobals.maxProcesses ) )
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
-        BibleOrgSysGlobals.alreadyMultiprocessing = True
-        with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-            results = pool.map( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
-            assert len(results) == numBooks
-            for j,BBB in enumerate( commonBooks ):
-                bResults[BBB] = results[j] # Saves them in the correct order
-        BibleOrgSysGlobals.alreadyMultiprocessing = False
+        results = BibleOrgSysGlobals.mapInWorkers( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
+        assert len(results) == numBooks
+        for j,BBB in enumerate( commonBooks ):
+            bResults[BBB] = results[j] # Saves them in the correct order
     else: # Just single threaded
         for BBB in commonBooks: # Do individual book prechecks
             vPrint( 'Verbose', DEBUGGING_THIS_MODULE, "  " + _("Comparing {}…").format( BBB ) )
@@ -1061,13 +1058,10 @@ def compareBibles( Bible1, Bible2,
     if BibleOrgSysGlobals.maxProcesses > 1: # Check all the books as quickly as possible
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, _("Comparing {} books using {} processes…").format( numBooks, BibleOrgSysGlobals.maxProcesses ) )
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
-        BibleOrgSysGlobals.alreadyMultiprocessing = True
-        with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-            results = pool.map( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
-            assert len(results) == numBooks
-            for j,BBB in enumerate( commonBooks ):
-                bResults[BBB] = results[j] # Saves them in the correct order
-        BibleOrgSysGlobals.alreadyMultiprocessing = False
+        results = BibleOrgSysGlobals.mapInWorkers( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
+        assert len(results) == numBooks
+        for j,BBB in enumerate( commonBooks ):
+            bResults[BBB] = results[j] # Saves them in the correct order
     else: # Just single threaded
         for BBB in commonBooks: # Do individual book prechecks
             vPrint( 'Verbose', DEBUGGING_THIS_MODULE, "  " + _("Comparing {}…").format( BBB ) )
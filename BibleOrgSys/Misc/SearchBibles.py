@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# SearchBibles.py
+#
+# Module to search for the same text in many Bibles at once
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module to search for the same text in a collection of loaded Bibles
+    (e.g., in many different versions) and to group the results by verse.
+
+Includes:
+    iterFindTextInBibles( BibleObjects, optionsDict, resultSummaryDict=None, cancelCallback=None, parallelFlag=False )
+    findTextInBibles( BibleObjects, optionsDict, parallelFlag=False )
+
+The books are searched in canonical order (using BibleBooksCodes)
+    and the verse groups for each book are yielded as soon as that book has been searched in every Bible.
+
+If parallelFlag is set (and BibleOrgSysGlobals.maxProcesses > 1),
+    the books from every Bible are searched by one pool of worker processes,
+    except that Bibles with a word index (see InternalBible.makeWordIndex())
+    or sqlite-based Bibles are searched in this process (while the workers are busy with the others).
+
+NOTE: The verses are grouped by their BBB, C and V exactly as given by each Bible,
+    i.e., no versification mapping is done.
+"""
+from gettext import gettext as _
+import os.path
+
+if __name__ == '__main__':
+    import sys
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBible import prepareFindTextOptions, _findTextInBookMP, FIND_TEXT_WORKER_OPTIONS
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+SHORT_PROGRAM_NAME = "SearchBibles"
+PROGRAM_NAME = "Multiple Bible searcher"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+
+def _getVerseGroupSortKey( verseKey:SimpleVerseKey ) -> tuple[int,int,str]:
+    """
+    Returns a key for sorting the verses within a book.
+    """
+    try: verseNumber = verseKey.getVerseNumberInt()
+    except ValueError: verseNumber = -1
+    return verseKey.getChapterNumberInt(), verseNumber, verseKey.getVerseNumStr()
+# end of _getVerseGroupSortKey
+
+
+
+def iterFindTextInBibles( BibleObjects:list, optionsDict, resultSummaryDict:dict|None=None, cancelCallback=None, parallelFlag:bool=False ):
+    """
+    Search all of the given (loaded) Bibles for the given text which is contained in a dictionary of options
+        exactly as for InternalBible.findText().
+
+    Returns an iterator which yields 2-tuples containing:
+        1/ A SimpleVerseKey for the verse
+        2/ A list (parallel to BibleObjects) of lists of the InternalBible.findText() results for that verse
+            (so the list will be empty for any Bibles where nothing was found in that verse).
+    The optionsDict is checked and updated immediately (not when the iteration starts).
+
+    If a resultSummaryDict is given, it's updated as the search proceeds with:
+        searchedBookList, foundBookList, numGroups, numResults, and cancelled flag.
+
+    If cancelCallback is given, it's called (with no parameters) before each book is searched
+        and if it returns True, the search is stopped.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"iterFindTextInBibles( {len(BibleObjects)} Bibles, {optionsDict}, {parallelFlag} )" )
+
+    prepareFindTextOptions( optionsDict, _("{} Bibles").format( len(BibleObjects) ) ) # Sets the defaults and updates the history
+    searchList = []
+    for BibleObject in BibleObjects:
+        BibleOptionsDict = { key:value for key,value in optionsDict.items() if key != 'workName' }
+        BibleOptionsDict['findHistoryList'] = [] # We don't want to affect the given list
+        searchList.append( (BibleOptionsDict,) + BibleObject._prepareFindText( BibleOptionsDict ) )
+
+    if resultSummaryDict is None: resultSummaryDict = {}
+    resultSummaryDict.update( { 'searchedBookList':[], 'foundBookList':[], 'numGroups':0, 'numResults':0, 'cancelled':False, } )
+    return _iterFindTextInBiblesResults( BibleObjects, searchList, resultSummaryDict, cancelCallback, parallelFlag )
+# end of iterFindTextInBibles
+
+
+def _iterFindTextInBiblesResults( BibleObjects:list, searchList:list[tuple], resultSummaryDict:dict, cancelCallback, parallelFlag:bool ):
+    """
+    The generator which does the actual search for iterFindTextInBibles().
+    """
+    BBBSet = set()
+    for BibleObject,(BibleOptionsDict,*_plan) in zip( BibleObjects, searchList ):
+        BBBSet.update( BBB for BBB in BibleObject.books \
+                        if BibleOptionsDict['bookList'] is None or BibleOptionsDict['bookList']=='ALL' or BBB in BibleOptionsDict['bookList'] )
+    searchBBBs = sorted( BBBSet, key=BibleOrgSysGlobals.loadedBibleBooksCodes.getReferenceNumber )
+
+    prefilterCountsList = [{ 'numLinesSearchable':0, 'numCandidateLines':0, 'numMatchedLines':0, } for _BibleObject in BibleObjects]
+    useWorkers = parallelFlag and BibleOrgSysGlobals.maxProcesses > 1 and not BibleOrgSysGlobals.alreadyMultiprocessing
+    workerFlags = [useWorkers and not useWordIndex and BibleObject._canFindTextInWorkers() \
+                    for BibleObject,(_BibleOptionsDict,_ourFindText,_compiledFindText,_ourMarkerList,useWordIndex,_regexLiteralQuery) in zip( BibleObjects, searchList )]
+
+    def iterWorkerParameters():
+        """
+        Yields the parameters for all of the book searches that the workers will do (in the same order that we'll want the results).
+
+        This is a generator (rather than a list) so that the parameters for the later books
+            (which includes their trigram prefiltering) are only made as the workers need them.
+        """
+        for BBB in searchBBBs:
+            for BibleObject,workerFlag,prefilterCounts,(BibleOptionsDict,ourFindText,compiledFindText,ourMarkerList,_useWordIndex,regexLiteralQuery) \
+                    in zip( BibleObjects, workerFlags, prefilterCountsList, searchList ):
+                if workerFlag and BBB in BibleObject.books:
+                    workerOptionsDict = { key:BibleOptionsDict[key] for key in FIND_TEXT_WORKER_OPTIONS } # Not things like parentWindow
+                    yield BibleObject._getFindTextMPParameters( BBB, BibleOptionsDict, workerOptionsDict, ourFindText, compiledFindText, ourMarkerList,
+                                                                regexLiteralQuery, prefilterCounts )
+    # end of _iterFindTextInBiblesResults.iterWorkerParameters
+
+    workerResults = None
+    if any( workerFlags ):
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, _("Searching {} books in {} Bibles using {} processes…").format( len(searchBBBs), len(BibleObjects), BibleOrgSysGlobals.maxProcesses ) )
+        workerResults = BibleOrgSysGlobals.imapInWorkers( _findTextInBookMP, iterWorkerParameters() ) # keeps our order
+    try:
+        for BBB in searchBBBs:
+            if cancelCallback is not None and cancelCallback():
+                resultSummaryDict['cancelled'] = True
+                return
+            resultSummaryDict['searchedBookList'].append( BBB )
+
+            verseGroups = {}
+            for j,(BibleObject,workerFlag,prefilterCounts,(BibleOptionsDict,ourFindText,compiledFindText,ourMarkerList,useWordIndex,regexLiteralQuery)) \
+                    in enumerate( zip( BibleObjects, workerFlags, prefilterCountsList, searchList ) ):
+                if BBB not in BibleObject.books: continue
+                if workerFlag:
+                    compactBookResults, numMatchedLines = next( workerResults )
+                    prefilterCounts['numMatchedLines'] += numMatchedLines
+                    bookResults = ( (SimpleVerseKey( BBB, *compactResult[0] ),) + compactResult[1:] for compactResult in compactBookResults )
+                else: # search it here
+                    _BBB, bookResults = next( BibleObject._iterFindTextBookResults( [BBB], BibleOptionsDict, ourFindText, compiledFindText, ourMarkerList,
+                                                                                        useWordIndex, regexLiteralQuery, prefilterCounts ) )
+                for resultTuple in bookResults:
+                    verseKey = resultTuple[0]
+                    CV = verseKey.getChapterNumStr(), verseKey.getVerseNumStr()
+                    try: verseGroup = verseGroups[CV]
+                    except KeyError:
+                        verseGroup = verseGroups[CV] = (SimpleVerseKey( BBB, *CV ), [[] for _BibleObject in BibleObjects])
+                    verseGroup[1][j].append( resultTuple )
+                    resultSummaryDict['numResults'] += 1
+
+            if verseGroups:
+                resultSummaryDict['foundBookList'].append( BBB )
+                for verseKey,verseResults in sorted( verseGroups.values(), key=lambda verseGroup: _getVerseGroupSortKey( verseGroup[0] ) ):
+                    resultSummaryDict['numGroups'] += 1
+                    yield verseKey, verseResults
+    finally: # we still want these even if the caller stopped iterating early
+        if workerResults is not None:
+            workerResults.close() # Don't queue any more unwanted book searches
+        for BibleObject,prefilterCounts,(BibleOptionsDict,_ourFindText,_compiledFindText,_ourMarkerList,_useWordIndex,regexLiteralQuery) \
+                in zip( BibleObjects, prefilterCountsList, searchList ):
+            if BibleOptionsDict['regexFlag']:
+                BibleObject.trigramIndex.recordQuery( regexLiteralQuery is not None, **prefilterCounts )
+# end of _iterFindTextInBiblesResults
+
+
+
+def findTextInBibles( BibleObjects:list, optionsDict, parallelFlag:bool=False ):
+    """
+    Search all of the given (loaded) Bibles for the given text which is contained in a dictionary of options
+        exactly as for InternalBible.findText().
+
+    Always returns three values:
+        1/ The updated dictionary of all parameters, i.e., updated optionsDict
+        2/ The result summary dict, containing searchedBookList, foundBookList, numGroups, numResults, and cancelled
+        3/ A list of the 2-tuples as yielded by iterFindTextInBibles(), i.e., results grouped by verse.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"findTextInBibles( {len(BibleObjects)} Bibles, {optionsDict}, {parallelFlag} )" )
+
+    resultSummaryDict = {}
+    resultList = list( iterFindTextInBibles( BibleObjects, optionsDict, resultSummaryDict, parallelFlag=parallelFlag ) )
+    return optionsDict, resultSummaryDict, resultList
+# end of findTextInBibles
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    BibleObjects = []
+    for testFolderName,abbreviation in ( ('USFMTest1','MBTV1'), ('USFMTest2','MBTV2'), ):
+        UB = USFMBible( BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( testFolderName ), "Matigsalug", abbreviation )
+        UB.load()
+        BibleObjects.append( UB )
+
+    for parallelFlag in (False, True):
+        _optionsDict, resultSummaryDict, resultList = findTextInBibles( BibleObjects, { 'findText':'kandin' }, parallelFlag=parallelFlag )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {parallelFlag=} found {resultSummaryDict['numResults']:,} results in {resultSummaryDict['numGroups']:,} verses from {resultSummaryDict['foundBookList']}" )
+    for verseKey,verseResults in resultList[:3]:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    {verseKey.getShortText()} {[len(BibleResults) for BibleResults in verseResults]}" )
+# end of SearchBibles.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of SearchBibles.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of SearchBibles.py
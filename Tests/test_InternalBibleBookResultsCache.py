@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleBookResultsCache.py
+#
+# Module testing the cached InternalBibleBook _discover() and checkBook() results (BibleOrgSysGlobals.bookResultsCacheFlag)
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that the cached book discover and check results
+    are the same as the uncached ones,
+    are used again if the book hasn't changed,
+    and aren't used if the book or the check settings have changed.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Book results cache tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+from unittest import mock
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals import InternalBibleBook as InternalBibleBookModule
+from BibleOrgSys.Internals.InternalBibleBook import InternalBibleBook
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_FILENAMES = { 'JDE':'MBT66JUD.SCP', 'REV':'MBT67REV.SCP', }
+
+
+class BookResultsCacheTests( unittest.TestCase ):
+    """ Check when the cached book results are (and aren't) used. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+
+    def setUp( self ):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.folderpath = Path( self.tempFolder.name, 'Bible/' )
+        os.makedirs( self.folderpath )
+        for filename in TEST_FILENAMES.values():
+            shutil.copy2( TEST_FOLDERPATH.joinpath( filename ), self.folderpath )
+        self.cacheFolderpath = Path( self.tempFolder.name, 'BookResults/' )
+        self.savedCacheFolderpath = InternalBibleBookModule.BOOK_RESULTS_CACHE_FOLDERPATH
+        InternalBibleBookModule.BOOK_RESULTS_CACHE_FOLDERPATH = self.cacheFolderpath
+        self.savedFlags = BibleOrgSysGlobals.bookResultsCacheFlag, BibleOrgSysGlobals.strictCheckingFlag
+        BibleOrgSysGlobals.bookResultsCacheFlag = True
+
+    def tearDown( self ):
+        InternalBibleBookModule.BOOK_RESULTS_CACHE_FOLDERPATH = self.savedCacheFolderpath
+        BibleOrgSysGlobals.bookResultsCacheFlag, BibleOrgSysGlobals.strictCheckingFlag = self.savedFlags
+        self.tempFolder.cleanup()
+
+    def loadBible( self ) -> USFMBible:
+        UB = USFMBible( self.folderpath, "Matigsalug", 'MBTV' )
+        UB.load()
+        self.assertEqual( list( UB.books ), list( TEST_FILENAMES ) )
+        return UB
+    # end of loadBible
+
+    def checkBible( self, UB:USFMBible ) -> tuple[list[str],list[str]]:
+        """
+        Runs the discover and the checks on the Bible
+            and returns the lists of books that were actually discovered and checked (i.e., not from the cache).
+        """
+        discoveredBBBs, checkedBBBs = [], []
+        originalMakeDiscoveryResults, originalDoCheckSFMs = InternalBibleBook._makeDiscoveryResults, InternalBibleBook.doCheckSFMs
+        def countedMakeDiscoveryResults( bookObject ):
+            discoveredBBBs.append( bookObject.BBB )
+            return originalMakeDiscoveryResults( bookObject )
+        def countedDoCheckSFMs( bookObject, *args, **kwargs ):
+            checkedBBBs.append( bookObject.BBB )
+            return originalDoCheckSFMs( bookObject, *args, **kwargs )
+        with mock.patch.object( InternalBibleBook, '_makeDiscoveryResults', countedMakeDiscoveryResults ), \
+             mock.patch.object( InternalBibleBook, 'doCheckSFMs', countedDoCheckSFMs ):
+            UB.check()
+        return discoveredBBBs, checkedBBBs
+    # end of checkBible
+
+    def getUncachedResults( self ) -> tuple[dict,dict]:
+        """ Returns the discovery results and the book check results without using the cache. """
+        BibleOrgSysGlobals.bookResultsCacheFlag = False
+        try:
+            UB = self.loadBible()
+            self.assertEqual( self.checkBible( UB ), (list( TEST_FILENAMES ), list( TEST_FILENAMES )) )
+        finally: BibleOrgSysGlobals.bookResultsCacheFlag = True
+        return UB.discoveryResults, { BBB:bookObject.checkResultsDictionary for BBB,bookObject in UB.books.items() }
+    # end of getUncachedResults
+
+    def assertSameResults( self, UB:USFMBible, expectedResults:tuple[dict,dict] ) -> None:
+        self.assertEqual( UB.discoveryResults, expectedResults[0] )
+        self.assertEqual( { BBB:bookObject.checkResultsDictionary for BBB,bookObject in UB.books.items() }, expectedResults[1] )
+    # end of assertSameResults
+
+    def test_010_noHashWithoutFlag( self ):
+        """ Test that the raw lines aren't hashed (and nothing is cached) if the flag isn't set. """
+        BibleOrgSysGlobals.bookResultsCacheFlag = False
+        UB = self.loadBible()
+        self.assertTrue( all( bookObject.getContentHash() is None for bookObject in UB.books.values() ) )
+        self.checkBible( UB )
+        self.assertFalse( self.cacheFolderpath.exists() )
+        BibleOrgSysGlobals.bookResultsCacheFlag = True # Turned on too late for these books
+        self.assertEqual( UB.books['JDE']._getCachedResultsFilename( 'discover' ), None )
+        self.assertEqual( UB.books['JDE']._discover(), UB.discoveryResults['JDE'] )
+        self.assertFalse( self.cacheFolderpath.exists() )
+    # end of test_010_noHashWithoutFlag
+
+    def test_020_hit( self ):
+        """ Test that the cached results are used (and are the same as the uncached ones) if nothing has changed. """
+        expectedResults = self.getUncachedResults()
+        UB = self.loadBible()
+        self.assertTrue( all( len(bookObject.getContentHash())==32 for bookObject in UB.books.values() ) )
+        self.assertEqual( self.checkBible( UB ), (list( TEST_FILENAMES ), list( TEST_FILENAMES )) ) # Nothing cached yet
+        self.assertSameResults( UB, expectedResults )
+        self.assertEqual( len( os.listdir( self.cacheFolderpath ) ), 2 * len(TEST_FILENAMES) )
+
+        UB = self.loadBible()
+        self.assertEqual( self.checkBible( UB ), ([], []) ) # All from the cache
+        self.assertSameResults( UB, expectedResults )
+    # end of test_020_hit
+
+    def test_030_contentChange( self ):
+        """ Test that the cached results aren't used after the book has been changed. """
+        UB = self.loadBible()
+        self.checkBible( UB )
+        oldContentHash = UB.books['JDE'].getContentHash()
+
+        filepath = self.folderpath.joinpath( TEST_FILENAMES['JDE'] )
+        with open( filepath, 'rt', encoding='utf-8' ) as bookFile: bookText = bookFile.read()
+        self.assertEqual( bookText.count( '\\v 3 ' ), 1 )
+        with open( filepath, 'wt', encoding='utf-8', newline='' ) as bookFile: bookFile.write( bookText.replace( '\\v 3 ', '\\v 3 “Edited” ' ) )
+        expectedResults = self.getUncachedResults()
+        UB = self.loadBible()
+        self.assertNotEqual( UB.books['JDE'].getContentHash(), oldContentHash )
+        self.assertEqual( UB.books['REV'].getContentHash(), self.loadBible().books['REV'].getContentHash() )
+        discoveredBBBs, checkedBBBs = self.checkBible( UB )
+        self.assertEqual( discoveredBBBs, ['JDE'] ) # REV is unchanged
+        self.assertIn( 'JDE', checkedBBBs )
+        self.assertSameResults( UB, expectedResults )
+
+        bookObject = UB.books['JDE']
+        oldContentHash = bookObject.getContentHash()
+        self.assertTrue( UB.replaceBookChapterLines( 'JDE', '1', [('c','1'),('p',''),('v','1 Edited again.')] ) )
+        self.assertNotIn( bookObject.getContentHash(), (None, oldContentHash) )
+        self.assertIsNone( bookObject._loadCachedResults( 'discover' ) )
+    # end of test_030_contentChange
+
+    def test_040_checkFlagChange( self ):
+        """ Test that the cached check results aren't used after the check settings have changed. """
+        UB = self.loadBible()
+        self.checkBible( UB )
+        expectedCheckResults = { BBB:bookObject.checkResultsDictionary for BBB,bookObject in UB.books.items() }
+
+        UB = self.loadBible()
+        BibleOrgSysGlobals.strictCheckingFlag = True
+        self.assertEqual( self.checkBible( UB ), ([], list( TEST_FILENAMES )) ) # Same discovery, but checked again
+        BibleOrgSysGlobals.strictCheckingFlag = False
+
+        UB = self.loadBible()
+        UB.books['REV'].checkUSFMSequencesFlag = not UB.books['REV'].checkUSFMSequencesFlag
+        self.assertEqual( self.checkBible( UB ), ([], ['REV']) )
+
+        UB = self.loadBible()
+        self.assertEqual( self.checkBible( UB ), ([], []) ) # The original settings are still cached
+        self.assertEqual( { BBB:bookObject.checkResultsDictionary for BBB,bookObject in UB.books.items() }, expectedCheckResults )
+    # end of test_040_checkFlagChange
+# end of BookResultsCacheTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleBookResultsCache.py
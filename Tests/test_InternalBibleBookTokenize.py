@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleBookTokenize.py
+#
+# Module testing the tokenized InternalBibleBook._processLineFix() code
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that _processLineFix() gives exactly the same results
+    with TOKENIZE_LINES_FLAG set (using _processLineFixTokens() for well-formed lines)
+    as with the older step-by-step code,
+    and that unusual lines fall back to the step-by-step code.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Tokenized line processing tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals import InternalBibleBook as InternalBibleBookModule
+from BibleOrgSys.Formats.USFMBible import USFMBible
+from BibleOrgSys.Formats.USFMBibleBook import USFMBibleBook
+
+
+TEST_FOLDERPATHS = ( Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFM3AllMarkersProject/' ),
+                        Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' ), )
+
+# These lines are all handled by _processLineFixTokens()
+WELL_FORMED_LINES = (
+    ('v~', 'In the beginning God created the heavens and the earth.'),
+    ('v~', 'In the \\nd Lord\\nd* we trust (\\add and \\+nd rest\\+nd*\\add*).'),
+    ('v~', 'In the beginning\\f + \\fr 1:1 \\ft Or \\fq When\\fq* God began.\\f* God created.'),
+    ('v~', 'The heavens\\x + \\xo 1:1 \\xt Psa 33:6.\\x* and the earth.'),
+    ('v~', 'He said\\fe + \\fr 1:2 \\ft An endnote.\\fe* this.'),
+    ('v~', '\\w In|strong="H7225"\\w* the \\w beginning|lemma="reshit" strong="H7225"\\w* God.'),
+    ('v~', 'And \\+w God|strong="H430"\\+w* said.'),
+    ('v~', 'Tom &amp; Jerry ran.'),
+    ('v~', 'Tom &amp; \\nd Jerry\\nd* ran &lt;quickly&gt;.'),
+    ('p~', 'A paragraph continuation\\f + \\fr 1:3 \\ft With a note.\\f*'),
+    ('s1', 'A section heading'),
+    ('ip', 'An introduction with \\bk The Book\\bk* in it.'),
+    )
+
+# These lines have something unusual in them so _processLineFixTokens() leaves them for the step-by-step code
+FALLBACK_LINES = (
+    ('v~', 'Nested\\f + \\fr 1:1 \\ft A note \\x - \\xo 1:1 \\xt Gen 1:1.\\x* inside a note.\\f* notes.'),
+    ('v~', 'An unclosed\\f + \\fr 1:1 \\ft note which never ends.'),
+    ('v~', 'An unopened note end\\f* here.'),
+    ('v~', 'Mismatched\\f + \\fr 1:1 \\ft note ends.\\x* here.'),
+    ('v~', 'A space before the note \\f + \\fr 1:1 \\ft Note.\\f* here.'),
+    ('v~', 'A space before the note at the end \\f + \\fr 1:1 \\ft Note.\\f*'),
+    ('v~', 'Attributes|strong="H1234" outside any word field.'),
+    ('v~', 'Attributes in the wrong field \\nd Lord|strong="H3068"\\nd* here.'),
+    ('v~', 'A word field \\w without|strong="H1234" a closing marker.'),
+    ('v~', 'No caller\\f \\fr 1:1 \\ft Note.\\f* here.'),
+    ('v~', 'A minus caller\\x - \\xo 1:1 \\xt Gen 1:1.\\x* here.'),
+    ('v~', 'Unmarked note text\\f + Just text.\\f* here.'),
+    ('v~', 'An \\NB uppercase marker.'),
+    )
+
+
+def getResultTuple( processLineFixResult ) -> tuple:
+    """ Returns the results of _processLineFix() in a form that can be compared. """
+    adjText, cleanText, extras = processLineFixResult
+    return adjText, cleanText, [(extra.getType(), extra.getIndex(), extra.getText(), extra.getCleanText()) for extra in extras]
+# end of getResultTuple
+
+
+def getEntryTuples( entries ) -> list[tuple]:
+    """ Returns the processed entries in a form that can be compared. """
+    return [(entry.getMarker(), entry.getOriginalMarker(), entry.getAdjustedText(), entry.getCleanText(), entry.getOriginalText(),
+                str(entry.getExtras()) if entry.getExtras() else None) for entry in entries]
+# end of getEntryTuples
+
+
+class TokenizeLinesTests( unittest.TestCase ):
+    """ Compare the tokenized line processing with the step-by-step code. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+
+    def setUp( self ):
+        self.savedFlag = InternalBibleBookModule.TOKENIZE_LINES_FLAG
+        self.bookObject = USFMBibleBook( 'Tokenize test', 'MAT' )
+        self.bookObject.rtsCount = self.bookObject.fwmifCount = self.bookObject.fswncCount = -1 # Don't give these once-only warnings (so every call gives the same errors)
+
+    def tearDown( self ):
+        InternalBibleBookModule.TOKENIZE_LINES_FLAG = self.savedFlag
+
+    def processLine( self, tokenizeFlag:bool, marker:str, text:str ) -> tuple[tuple,list[str],list]:
+        """ Process the line (with the flag set as given) and return the results and the errors. """
+        InternalBibleBookModule.TOKENIZE_LINES_FLAG = tokenizeFlag
+        self.bookObject.checkResultsDictionary['Priority Errors'] = []
+        fixErrors:list[str] = []
+        result = getResultTuple( self.bookObject._processLineFix( '1', '2', marker, text, fixErrors ) )
+        return result, fixErrors, list( self.bookObject.checkResultsDictionary['Priority Errors'] )
+    # end of processLine
+
+    def test_010_wellFormedLines( self ):
+        """ Test that well-formed lines are tokenized and give the same results. """
+        for marker,text in WELL_FORMED_LINES:
+            with self.subTest( marker=marker, text=text ):
+                self.assertIsNotNone( self.bookObject._processLineFixTokens( '1', '2', marker, text, f'MAT 1:2 {marker}', [] ) )
+                tokenizedResults = self.processLine( True, marker, text )
+                self.assertEqual( tokenizedResults, self.processLine( False, marker, text ) )
+                self.assertEqual( tokenizedResults[1], [] ) # No errors
+    # end of test_010_wellFormedLines
+
+    def test_020_fallbackLines( self ):
+        """ Test that unusual lines are left for the step-by-step code (so give the same results and errors). """
+        for marker,text in FALLBACK_LINES:
+            with self.subTest( marker=marker, text=text ):
+                fixErrors:list[str] = []
+                self.assertIsNone( self.bookObject._processLineFixTokens( '1', '2', marker, text, f'MAT 1:2 {marker}', fixErrors ) )
+                self.assertEqual( fixErrors, [] ) # Nothing is reported by the tokenized code
+                self.assertEqual( self.processLine( True, marker, text ), self.processLine( False, marker, text ) )
+    # end of test_020_fallbackLines
+
+    def test_030_books( self ):
+        """ Test that whole books load the same with and without tokenizing the lines. """
+        numBooks = 0
+        for folderpath in TEST_FOLDERPATHS:
+            UB = USFMBible( folderpath, 'Tokenize test', encoding='utf-8' )
+            UB.preload()
+            for BBB in UB.possibleFilenameDict:
+                with self.subTest( folder=folderpath.name, BBB=BBB ):
+                    bookObjects = {}
+                    for tokenizeFlag in (True, False):
+                        InternalBibleBookModule.TOKENIZE_LINES_FLAG = tokenizeFlag
+                        bookObjects[tokenizeFlag] = USFMBibleBook( UB, BBB )
+                        bookObjects[tokenizeFlag].load( UB.possibleFilenameDict[BBB], folderpath, 'utf-8' )
+                        bookObjects[tokenizeFlag].processLines()
+                    self.assertEqual( getEntryTuples( bookObjects[True]._processedLines ), getEntryTuples( bookObjects[False]._processedLines ) )
+                    self.assertEqual( bookObjects[True].checkResultsDictionary, bookObjects[False].checkResultsDictionary )
+                    numBooks += 1
+        self.assertGreater( numBooks, 10 )
+    # end of test_030_books
+# end of TokenizeLinesTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleBookTokenize.py
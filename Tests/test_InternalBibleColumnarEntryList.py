@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleColumnarEntryList.py
+#
+# Module testing InternalBibleColumnarEntryList in InternalBibleInternals.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that InternalBibleColumnarEntryList
+    gives exactly the same entries as a normal InternalBibleEntryList
+    after the same appends, pops, slices, and replaceEntries() calls,
+    and that whole Bibles converted with makeColumnarEntryLists() are unchanged.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Columnar entry list tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntry, InternalBibleEntryList, InternalBibleColumnarEntryList
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'MRK', 'JDE', 'REV', )
+
+
+def getEntryTuple( entry:InternalBibleEntry ) -> tuple:
+    """ Returns the fields of the entry in a form that can be compared. """
+    extras = entry.getExtras()
+    return ( entry.getMarker(), entry.getOriginalMarker(), entry.getAdjustedText(), entry.getCleanText(), entry.getOriginalText(),
+                None if extras is None else [(extra.getType(), extra.getIndex(), extra.getText(), extra.getCleanText()) for extra in extras] )
+# end of getEntryTuple
+
+
+def getEntryTuples( entryList ) -> list[tuple]:
+    return [getEntryTuple( entry ) for entry in entryList]
+
+
+def copyEntry( entry:InternalBibleEntry ) -> InternalBibleEntry:
+    """ Returns a standalone copy of the (possibly view) entry. """
+    return InternalBibleEntry( entry.getMarker(), entry.getOriginalMarker(), entry.getAdjustedText(), entry.getCleanText(),
+                                entry.getExtras(), entry.getOriginalText() )
+# end of copyEntry
+
+
+class InternalBibleColumnarEntryListTests( unittest.TestCase ):
+    """ Compare the columnar entry list with a normal entry list. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+        cls.bookEntries = [copyEntry( entry ) for entry in cls.UB.books['JDE']._processedLines]
+        cls.extrasEntries = [entry for entry in cls.bookEntries if entry.getExtras()]
+
+    def setUp( self ):
+        self.normalList = InternalBibleEntryList( self.bookEntries )
+        self.columnarList = InternalBibleColumnarEntryList( self.normalList )
+
+    def checkSame( self ) -> None:
+        """ Check that the columnar list has the same entries as the normal list (and that its extras are stored by the right indexes). """
+        self.assertEqual( len(self.columnarList), len(self.normalList) )
+        self.assertEqual( getEntryTuples( self.columnarList ), getEntryTuples( self.normalList ) )
+        self.assertEqual( sorted( self.columnarList._extrasDict ), [j for j,entry in enumerate( self.normalList ) if entry.getExtras() is not None] )
+    # end of checkSame
+
+    def test_010_conversion( self ):
+        """ Test that the conversion keeps every field (including the extras). """
+        self.assertGreater( len(self.extrasEntries), 2 )
+        self.checkSame()
+        for j in ( 0, 5, -1, -len(self.normalList) ):
+            self.assertEqual( getEntryTuple( self.columnarList[j] ), getEntryTuple( self.normalList[j] ) )
+        for j in ( len(self.normalList), -len(self.normalList)-1 ):
+            with self.assertRaises( IndexError ): self.columnarList[j]
+        for marker in ( 'c', 'v', 'q1', 'NoSuchMarker', ):
+            for maxLines in ( None, 3, 30, ):
+                self.assertEqual( self.columnarList.contains( marker, maxLines ), self.normalList.contains( marker, maxLines ) )
+    # end of test_010_conversion
+
+    def test_020_readOnlyData( self ):
+        """ Test that the data can be read but not changed. """
+        data = self.columnarList.data
+        self.assertIsInstance( data, tuple )
+        self.assertEqual( getEntryTuples( data ), getEntryTuples( self.normalList.data ) )
+        with self.assertRaises( AttributeError ): data.append( self.bookEntries[0] )
+        with self.assertRaises( TypeError ): data[0] = self.bookEntries[0]
+        with self.assertRaises( TypeError ): del data[0]
+        with self.assertRaises( AttributeError ): self.columnarList.data = []
+        self.checkSame()
+    # end of test_020_readOnlyData
+
+    def test_030_appendAndPop( self ):
+        """ Test appending, extending, and popping. """
+        for entry in self.extrasEntries[:2] + self.bookEntries[:3]:
+            self.normalList.append( entry )
+            self.columnarList.append( entry )
+        self.checkSame()
+        additionalList = InternalBibleEntryList( self.bookEntries[3:8] + self.extrasEntries[-1:] )
+        self.normalList.extend( additionalList )
+        self.columnarList.extend( additionalList )
+        self.checkSame()
+        while self.normalList:
+            self.assertEqual( getEntryTuple( self.columnarList.pop() ), getEntryTuple( self.normalList.pop() ) )
+            if len(self.normalList) % 10 == 0: self.checkSame()
+        self.checkSame()
+        self.assertIsNone( self.columnarList.pop() )
+    # end of test_030_appendAndPop
+
+    def test_040_slices( self ):
+        """ Test slicing. """
+        numEntries = len(self.normalList)
+        for keySlice in ( slice( 0, 10 ), slice( 5, numEntries ), slice( -8, None ), slice( 3, 3 ), slice( 10, 5 ),
+                            slice( 0, numEntries, 3 ), slice( None, None, -1 ), slice( numEntries-5, numEntries+20 ), ):
+            with self.subTest( keySlice=keySlice ):
+                columnarSlice = self.columnarList[keySlice]
+                self.assertIsInstance( columnarSlice, InternalBibleEntryList )
+                self.assertEqual( getEntryTuples( columnarSlice ), getEntryTuples( self.normalList[keySlice] ) )
+                self.assertEqual( getEntryTuples( self.columnarList._getEntrySlice( keySlice.start, keySlice.stop ) ),
+                                    getEntryTuples( self.normalList._getEntrySlice( keySlice.start, keySlice.stop ) ) )
+    # end of test_040_slices
+
+    def test_050_replaceEntries( self ):
+        """ Test replacing entries (which must move the extras of the following entries). """
+        extrasIndexes = sorted( self.columnarList._extrasDict )
+        middleIndex = extrasIndexes[len(extrasIndexes)//2]
+        for startIndex,endIndex,newEntries in (
+                (middleIndex-2, middleIndex+1, self.bookEntries[:1]), # Shorter (and removes some extras)
+                (middleIndex, middleIndex, self.extrasEntries[:3] + self.bookEntries[:2]), # Insert (with extras)
+                (3, 8, self.bookEntries[10:15]), # Same length
+                (0, 2, self.bookEntries[:2] + self.extrasEntries + self.bookEntries[:4]), # Longer at the start
+                (len(self.normalList)-4, len(self.normalList), []), # Delete at the end
+                (len(self.normalList), len(self.normalList), self.extrasEntries[-2:]), # Append
+                (0, len(self.normalList), InternalBibleEntryList( self.bookEntries[:20] )), # Everything (given an entry list)
+                ):
+            with self.subTest( startIndex=startIndex, endIndex=endIndex, numNewEntries=len(newEntries) ):
+                self.normalList.replaceEntries( startIndex, endIndex, newEntries )
+                self.columnarList.replaceEntries( startIndex, endIndex, newEntries )
+                self.checkSame()
+        self.columnarList.replaceEntries( 2, 4, self.columnarList[10:13] ) # Replace with views of our own entries
+        self.normalList.replaceEntries( 2, 4, [copyEntry( entry ) for entry in self.normalList[10:13]] )
+        self.checkSame()
+    # end of test_050_replaceEntries
+
+    def test_060_entryViews( self ):
+        """ Test that changing the fields of an entry view changes the list. """
+        entryView = self.columnarList[4]
+        entryView.cleanText = 'Changed text'
+        entryView.extras = self.extrasEntries[0].getExtras()
+        self.normalList[4].cleanText = 'Changed text'
+        self.normalList[4].extras = self.extrasEntries[0].getExtras()
+        self.checkSame()
+        self.columnarList[4].extras = None
+        self.normalList[4].extras = None
+        self.checkSame()
+    # end of test_060_entryViews
+
+    def test_070_wholeBible( self ):
+        """ Test that converting a whole Bible doesn't change its entries or the verse lookups. """
+        columnarUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        columnarUB.preload()
+        for BBB in TEST_BOOKS:
+            columnarUB.loadBook( BBB )
+        columnarUB.makeColumnarEntryLists()
+        textTables = set()
+        for BBB in TEST_BOOKS:
+            with self.subTest( BBB=BBB ):
+                columnarEntries = columnarUB.books[BBB]._processedLines
+                self.assertIsInstance( columnarEntries, InternalBibleColumnarEntryList )
+                textTables.add( id(columnarEntries._textTable) )
+                self.assertEqual( getEntryTuples( columnarEntries ), getEntryTuples( self.UB.books[BBB]._processedLines ) )
+                for C,V in list( self.UB.books[BBB]._CVIndex )[::7]:
+                    if not V.isdigit(): continue # SimpleVerseKey doesn't take verse bridges
+                    verseKey = SimpleVerseKey( BBB, C, V )
+                    expectedVerseEntries, expectedContext = self.UB.getContextVerseData( verseKey )
+                    verseEntries, context = columnarUB.getContextVerseData( verseKey )
+                    self.assertEqual( getEntryTuples( verseEntries ), getEntryTuples( expectedVerseEntries ) )
+                    self.assertEqual( context, expectedContext )
+        self.assertEqual( len(textTables), 1 ) # They all share the one string table
+        self.assertLess( columnarUB.getEntryListsMemorySize(), self.UB.getEntryListsMemorySize() )
+    # end of test_070_wholeBible
+# end of InternalBibleColumnarEntryListTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleColumnarEntryList.py
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleConcordance.py
+#
+# Module testing InternalBibleConcordance.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that concordances written by InternalBibleConcordance.writeConcordance()
+    read back (with BibleConcordance) to give the same postings as a simple word count.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Bible concordance tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBibleConcordance import writeConcordance, BibleConcordance, CONCORDANCE_TEXT_MARKERS
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'MRK', 'JDE', 'REV', )
+
+
+def getWords( someText:str ) -> list[str]:
+    """
+    Split the text into maximal alphabetic runs.
+    """
+    words, currentWord = [], ''
+    for char in someText:
+        if char.isalpha(): currentWord += char
+        elif currentWord: words.append( currentWord ); currentWord = ''
+    if currentWord: words.append( currentWord )
+    return words
+# end of getWords
+
+
+def getExpectedPostings( BibleObject, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> tuple[dict[str,list[int]],dict[str,int],list[tuple[str,str,str]]]:
+    """
+    Count the words in each verse the slow way.
+
+    Returns the postings dict, the word counts dict, and the list of verse (BBB,C,V) keys.
+    """
+    postings, wordCounts, verseKeys = {}, {}, []
+    for BBB,bookObject in BibleObject.books.items():
+        for (C,V),indexEntry in bookObject._CVIndex.items():
+            ordinal = len( verseKeys )
+            verseKeys.append( (BBB,C,V) )
+            for entryIndex in range( indexEntry.getEntryIndex(), indexEntry.getNextEntryIndex() ):
+                lineEntry = bookObject._processedLines[entryIndex]
+                if lineEntry.getMarker() not in CONCORDANCE_TEXT_MARKERS: continue
+                text = lineEntry.getCleanText()
+                if ignoreDiacriticsFlag: text = BibleOrgSysGlobals.removeAccents( text )
+                if caselessFlag: text = text.lower()
+                for word in getWords( text ):
+                    wordCounts[word] = wordCounts.get( word, 0 ) + 1
+                    wordPostings = postings.setdefault( word, [] )
+                    if not wordPostings or wordPostings[-1] != ordinal: wordPostings.append( ordinal )
+    return postings, wordCounts, verseKeys
+# end of getExpectedPostings
+
+
+class SyntheticIndexEntry:
+    def __init__( self, entryIndex:int ) -> None: self.entryIndex = entryIndex
+    def getEntryIndex( self ) -> int: return self.entryIndex
+    def getNextEntryIndex( self ) -> int: return self.entryIndex + 1
+
+class SyntheticEntry:
+    def __init__( self, cleanText:str ) -> None: self.cleanText = cleanText
+    def getMarker( self ) -> str: return 'v~'
+    def getCleanText( self ) -> str: return self.cleanText
+
+class SyntheticBook:
+    """ Just enough of an InternalBibleBook for writeConcordance(), with one line in each verse. """
+    def __init__( self, verseTexts:list[str] ) -> None:
+        self._processedFlag = True
+        self._processedLines = [SyntheticEntry( verseText ) for verseText in verseTexts]
+        self._CVIndex = { ('1',str(j+1)):SyntheticIndexEntry( j ) for j in range( len(verseTexts) ) }
+
+class SyntheticBible:
+    """ Just enough of an InternalBible for writeConcordance(). """
+    def __init__( self, verseTexts:list[str] ) -> None: self.books = { 'PSA':SyntheticBook( verseTexts ) }
+    def getAName( self, abbrevFirst:bool=False ) -> str: return 'Synthetic'
+
+
+class BibleConcordanceTests( unittest.TestCase ):
+    """ Round-trip tests for Bible concordance files. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+
+    def setUp( self ):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.concordanceFilepath = Path( self.tempFolder.name, 'test.BOSConcordance' )
+
+    def tearDown( self ):
+        self.tempFolder.cleanup()
+
+    def checkConcordance( self, BibleObject, caselessFlag:bool, ignoreDiacriticsFlag:bool ) -> tuple[dict[str,list[int]],set[int]]:
+        """ Write the concordance and check that everything reads back correctly (returning the postings and the delta widths used). """
+        self.assertTrue( writeConcordance( BibleObject, self.concordanceFilepath, caselessFlag, ignoreDiacriticsFlag ) )
+        expectedPostings, expectedWordCounts, verseKeys = getExpectedPostings( BibleObject, caselessFlag, ignoreDiacriticsFlag )
+        concordance = BibleConcordance( self.concordanceFilepath )
+        try:
+            self.assertEqual( concordance.terms, sorted( expectedPostings ) )
+            self.assertEqual( len(concordance.verseKeys), len(verseKeys) )
+            self.assertEqual( concordance.numWords, sum( expectedWordCounts.values() ) )
+            for word,ordinals in expectedPostings.items():
+                self.assertEqual( list( concordance.getOrdinals( word ) ), ordinals, word )
+                self.assertEqual( concordance.getWordFrequency( word ), (expectedWordCounts[word],len(ordinals)), word )
+            self.assertEqual( list( concordance.getOrdinals( 'zzzz' ) ), [] )
+            self.assertEqual( concordance.getWordFrequency( 'zzzz' ), (0,0) )
+            for ordinal in range( 0, len(verseKeys), 97 ):
+                self.assertEqual( concordance.getOrdinalKey( ordinal ), verseKeys[ordinal] )
+            widthsUsed = set( concordance._widths )
+        finally: concordance.close()
+        return expectedPostings, widthsUsed
+    # end of checkConcordance
+
+    def test_010_testBible( self ):
+        """ Test a concordance of a real Bible with each of the folding options. """
+        for caselessFlag in ( True, False ):
+            for ignoreDiacriticsFlag in ( False, True ):
+                with self.subTest( caselessFlag=caselessFlag, ignoreDiacriticsFlag=ignoreDiacriticsFlag ):
+                    expectedPostings, widthsUsed = self.checkConcordance( self.UB, caselessFlag, ignoreDiacriticsFlag )
+                    self.assertEqual( widthsUsed, {1,2} )
+    # end of test_010_testBible
+
+    def test_020_findVersesWithAll( self ):
+        """ Test multi-word queries (and the query folding). """
+        writeConcordance( self.UB, self.concordanceFilepath )
+        expectedPostings, _expectedWordCounts, verseKeys = getExpectedPostings( self.UB, True, False )
+        concordance = BibleConcordance( self.concordanceFilepath )
+        try:
+            self.assertIn( 'Manama', concordance ) # caseless
+            self.assertNotIn( 'Mánama', concordance ) # not ignoring diacritics
+            for words in ( ['sikandin'], ['manama','sikandin'], ['Manama','Jesus','ne'], ['manama','zzzz'], ):
+                expectedOrdinals = sorted( set.intersection( *(set( expectedPostings.get( word.lower(), [] ) ) for word in words) ) )
+                self.assertEqual( concordance.getOrdinalsWithAll( words ), expectedOrdinals, words )
+                expectedKeys = [SimpleVerseKey( BBB, C, V.split('-')[0] ) for BBB,C,V in (verseKeys[ordinal] for ordinal in expectedOrdinals)]
+                self.assertEqual( concordance.findVersesWithAll( words ), expectedKeys, words )
+            self.assertEqual( concordance.getCoOccurrenceCount( 'manama', 'sikandin' ),
+                                len( set( expectedPostings['manama'] ) & set( expectedPostings['sikandin'] ) ) )
+        finally: concordance.close()
+    # end of test_020_findVersesWithAll
+
+    def test_030_wideDeltas( self ):
+        """ Test postings which need 2-byte and 4-byte deltas. """
+        numVerses = 70_000
+        verseTexts = ['every verse'] * numVerses
+        verseTexts[0] = 'every verse rare middle middle'
+        verseTexts[300] = 'every verse middle' # delta of 300 needs 2 bytes
+        verseTexts[numVerses-1] = 'every verse Rare' # delta of 69,999 needs 4 bytes
+        expectedPostings, widthsUsed = self.checkConcordance( SyntheticBible( verseTexts ), True, False )
+        self.assertEqual( widthsUsed, {1,2,4} )
+        self.assertEqual( expectedPostings['rare'], [0,numVerses-1] )
+        self.assertEqual( expectedPostings['middle'], [0,300] )
+    # end of test_030_wideDeltas
+
+    def test_040_badFile( self ):
+        """ Test that a non-concordance file is rejected. """
+        with open( self.concordanceFilepath, 'wb' ) as badFile: badFile.write( b'Not a concordance file' )
+        with self.assertRaises( ValueError ): BibleConcordance( self.concordanceFilepath )
+    # end of test_040_badFile
+# end of BibleConcordanceTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleConcordance.py
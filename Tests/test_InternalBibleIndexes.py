@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleIndexes.py
+#
+# Module testing InternalBibleIndexes.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that InternalBibleBookSortedCVIndex gives the same results
+    as the (dictionary-based) InternalBibleBookCVIndex that it's made from.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Internal Bible indexes tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleBookCVIndex, InternalBibleBookSortedCVIndex
+from BibleOrgSys.Formats.USFMBible import USFMBible
+from BibleOrgSys.Formats.USFMBibleBook import USFMBibleBook
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'GEN', 'MAL', 'JDE', ) # GEN has lots of verse bridges
+
+# None of the test files have verses with letter suffixes or verse lists
+SYNTHETIC_BOOK_TEXT = """\\id JDE Synthetic test book
+\\h Jude
+\\mt1 Jude
+\\c 1
+\\p
+\\v 1 One.
+\\v 2a Two A.
+\\s1 Heading
+\\p
+\\v 2b Two B.
+\\v 3-5 Three to five.
+\\v 6,7 Six and seven.
+\\v 8 Eight.
+\\c 2
+\\p
+\\v 1 Two one.
+\\v 2-3 Two two to three.
+\\q1
+\\v 4a Four a.
+\\v 4b Four b.
+\\v 5
+\\c 4
+\\p
+\\v 1 Four one (no chapter three).
+"""
+
+
+def getResult( function, *args, **kwargs ):
+    """
+    Call the function and return something that can be compared,
+        i.e., the entries (and the context list if there is one)
+        or else the type of the exception.
+    """
+    try: result = function( *args, **kwargs )
+    except Exception as err: return type(err)
+    entries, contextList = result if isinstance( result, tuple ) else (result, None)
+    return [(entry.getMarker(), entry.getOriginalText(), entry.getCleanText()) for entry in entries], contextList
+# end of getResult
+
+
+def getTestKeys( CVIndex:InternalBibleBookCVIndex ) -> list[tuple[str,str]]:
+    """
+    Returns all of the index keys, along with every other verse number (with and without suffixes)
+        from zero to past the end of each chapter, and some keys in a missing chapter.
+    """
+    testKeys = list( CVIndex )
+    chapterMaxVs = {}
+    for C,V in CVIndex:
+        try: chapterMaxVs[C] = max( chapterMaxVs.get( C, 0 ), *(int(Vpart.rstrip( 'ab' )) for Vpart in V.replace( ',', '-' ).split( '-' )) )
+        except ValueError: pass
+    for C,maxV in chapterMaxVs.items():
+        for intV in range( maxV+3 ):
+            for V in ( str(intV), f'{intV}a', f'{intV}b', f'{intV}-{intV+1}' ):
+                if (C,V) not in testKeys: testKeys.append( (C,V) )
+    missingC = str( max( int(C) for C in chapterMaxVs ) + 1 )
+    testKeys += [(missingC,'0'), (missingC,'1'), (missingC,'1a')]
+    return testKeys
+# end of getTestKeys
+
+
+class InternalBibleBookSortedCVIndexTests( unittest.TestCase ):
+    """ Compare the sorted C:V index with the normal C:V index. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        cls.testBooks = {}
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+            cls.testBooks[BBB] = cls.UB.books[BBB]
+        with tempfile.TemporaryDirectory() as tempFolderpath:
+            with open( Path( tempFolderpath, 'synthetic.usfm' ), 'wt', encoding='utf-8' ) as bookFile:
+                bookFile.write( SYNTHETIC_BOOK_TEXT )
+            syntheticBible = USFMBible( tempFolderpath, "Synthetic", 'SYN' )
+            syntheticBook = USFMBibleBook( syntheticBible, 'JDE' )
+            syntheticBook.load( 'synthetic.usfm', tempFolderpath, 'utf-8' )
+        syntheticBook.processLines()
+        cls.testBooks['Synthetic'] = syntheticBook
+
+    def getIndexes( self, bookObject ) -> tuple[InternalBibleBookCVIndex,InternalBibleBookSortedCVIndex]:
+        CVIndex = bookObject._CVIndex
+        sortedCVIndex = bookObject.getSortedCVIndex()
+        self.assertIsInstance( CVIndex, InternalBibleBookCVIndex )
+        self.assertIsInstance( sortedCVIndex, InternalBibleBookSortedCVIndex )
+        return CVIndex, sortedCVIndex
+
+    def test_010_syntheticKeys( self ):
+        """ Check that the synthetic book has the sort of keys that we want to test. """
+        CVIndex = self.testBooks['Synthetic']._CVIndex
+        for CVKey in ( ('1','2a'), ('1','2b'), ('1','3-5'), ('1','6,7'), ('2','2-3'), ('2','4a'), ('4','1'), ):
+            self.assertIn( CVKey, CVIndex )
+        self.assertNotIn( ('3','0'), CVIndex )
+        self.assertTrue( any( '-' in V for _C,V in self.testBooks['GEN']._CVIndex ) )
+    # end of test_010_syntheticKeys
+
+    def test_020_exactKeys( self ):
+        """ Test the dictionary-style access. """
+        for name,bookObject in self.testBooks.items():
+            with self.subTest( book=name ):
+                CVIndex, sortedCVIndex = self.getIndexes( bookObject )
+                self.assertEqual( len(sortedCVIndex), len(CVIndex) )
+                for CVKey in getTestKeys( CVIndex ):
+                    self.assertEqual( CVKey in sortedCVIndex, CVKey in CVIndex, CVKey )
+                    if CVKey in CVIndex:
+                        self.assertEqual( list( sortedCVIndex[CVKey] ), list( CVIndex[CVKey] ), CVKey )
+                    else:
+                        with self.assertRaises( KeyError ): sortedCVIndex[CVKey]
+    # end of test_020_exactKeys
+
+    def test_030_getVerseEntries( self ):
+        """ Test verse lookups (with and without strict). """
+        for name,bookObject in self.testBooks.items():
+            CVIndex, sortedCVIndex = self.getIndexes( bookObject )
+            testKeys = getTestKeys( CVIndex )
+            for strict in ( True, False ):
+                with self.subTest( book=name, strict=strict ):
+                    numFound = 0
+                    for CVKey in testKeys:
+                        expectedResult = getResult( CVIndex.getVerseEntries, CVKey, strict=strict )
+                        self.assertEqual( getResult( sortedCVIndex.getVerseEntries, CVKey, strict=strict ), expectedResult, CVKey )
+                        if expectedResult is not KeyError: numFound += 1
+                    self.assertGreaterEqual( numFound, len(CVIndex) ) # Every key should be found
+    # end of test_030_getVerseEntries
+
+    def test_040_getVerseEntriesWithContext( self ):
+        """ Test verse lookups with each of the strict and complete settings. """
+        for name,bookObject in self.testBooks.items():
+            CVIndex, sortedCVIndex = self.getIndexes( bookObject )
+            testKeys = getTestKeys( CVIndex )
+            for strict in ( True, False ):
+                for complete in ( False, True ):
+                    with self.subTest( book=name, strict=strict, complete=complete ):
+                        for CVKey in testKeys:
+                            self.assertEqual( getResult( sortedCVIndex.getVerseEntriesWithContext, CVKey, strict=strict, complete=complete ),
+                                                getResult( CVIndex.getVerseEntriesWithContext, CVKey, strict=strict, complete=complete ), CVKey )
+    # end of test_040_getVerseEntriesWithContext
+
+    def test_050_syntheticLookups( self ):
+        """ Spot check some results from the synthetic book (so that we're not only comparing the two indexes). """
+        sortedCVIndex = self.testBooks['Synthetic'].getSortedCVIndex()
+        def getTexts( result ) -> list[str]:
+            return [entry.getCleanText() for entry in (result[0] if isinstance( result, tuple ) else result) if entry.getMarker()=='v~']
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntries( ('1','3'), strict=False ) ), ['Three to five.'] )
+        with self.assertRaises( KeyError ): sortedCVIndex.getVerseEntries( ('1','4'), strict=False ) # Only finds bridges that start with the verse
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('1','4') ) ), ['Three to five.'] )
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('1','7') ) ), ['Six and seven.'] )
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('1','2') ) ), ['Two A.'] )
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('1','2'), complete=True ) ), ['Two A.','Two B.'] )
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('1','2b') ) ), ['Two B.'] )
+        self.assertEqual( getTexts( sortedCVIndex.getVerseEntriesWithContext( ('2','3a') ) ), ['Two two to three.'] )
+        for CVKey in ( ('1','9'), ('3','1'), ('2','6') ):
+            with self.assertRaises( KeyError ): sortedCVIndex.getVerseEntriesWithContext( CVKey )
+        with self.assertRaises( KeyError ): sortedCVIndex.getVerseEntriesWithContext( ('1','2'), strict=True )
+    # end of test_050_syntheticLookups
+
+    def test_060_getChapterEntries( self ):
+        """ Test chapter lookups. """
+        for name,bookObject in self.testBooks.items():
+            with self.subTest( book=name ):
+                CVIndex, sortedCVIndex = self.getIndexes( bookObject )
+                chapters = sorted( {C for C,_V in CVIndex}, key=int )
+                for C in ['-1', '0'] + chapters + [str(int(chapters[-1])+1)]:
+                    self.assertEqual( getResult( sortedCVIndex.getChapterEntries, C ), getResult( CVIndex.getChapterEntries, C ), C )
+                    self.assertEqual( getResult( sortedCVIndex.getChapterEntriesWithContext, C ), getResult( CVIndex.getChapterEntriesWithContext, C ), C )
+    # end of test_060_getChapterEntries
+# end of InternalBibleBookSortedCVIndexTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleIndexes.py
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleMarkerFlags.py
+#
+# Module testing the marker codes and MARKER_FLAG_xxx bitflags in InternalBibleInternals.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that each of the MARKER_FLAG_xxx bit tests
+    gives exactly the same answer as searching the marker list that it replaced,
+    and that the marker registry doesn't grow with unregistered markers.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Marker flags tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals import InternalBibleInternals as InternalBibleInternalsModule
+from BibleOrgSys.Internals.InternalBibleInternals import InternalBibleEntry, InternalBibleEntryList, InternalBibleColumnarEntryList, \
+    getMarkerCodeAndFlags, getMarkerFlags, getMarkerFromCode, \
+    BOS_PRINTABLE_MARKERS, BOS_ALL_CUSTOM_MARKERS, BOS_NESTING_MARKERS, BOS_END_MARKERS, \
+    MARKER_FLAG_NEWLINE, MARKER_FLAG_PARAGRAPH, MARKER_FLAG_CHARACTER, MARKER_FLAG_NOTE, MARKER_FLAG_HEADING, MARKER_FLAG_TITLE, \
+    MARKER_FLAG_INTRODUCTION, MARKER_FLAG_HEADER, MARKER_FLAG_PRINTABLE, MARKER_FLAG_VERSE_TEXT, MARKER_FLAG_BOS_CUSTOM, \
+    MARKER_FLAG_NESTING, MARKER_FLAG_END, MARKER_FLAG_BIBLE_PARAGRAPH
+from BibleOrgSys.Reference.USFM3Markers import USFM_ALL_TITLE_MARKERS, USFM_ALL_INTRODUCTION_MARKERS, \
+    USFM_ALL_SECTION_HEADING_MARKERS, USFM_BIBLE_PARAGRAPH_MARKERS, OFTEN_IGNORED_USFM_HEADER_MARKERS
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFM3AllMarkersProject/' )
+UNREGISTERED_MARKERS = ( 'zzz', 'NB', 'p9', 'ss9', 'v~~', '', '¬zzz', '¬', 'zzz¬', )
+
+
+class MarkerFlagsTests( unittest.TestCase ):
+    """ Compare the marker flag bit tests with the old marker list searches. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        UB = USFMBible( TEST_FOLDERPATH, 'Marker flags test', encoding='utf-8' )
+        UB.load()
+        cls.bookEntries = [entry for bookObject in UB.books.values() for entry in bookObject._processedLines]
+        cls.flagLists = ( (MARKER_FLAG_NEWLINE, BibleOrgSysGlobals.loadedUSFMMarkers.getNewlineMarkersList( 'Combined' )),
+                            (MARKER_FLAG_PARAGRAPH, BibleOrgSysGlobals.USFMParagraphMarkers),
+                            (MARKER_FLAG_CHARACTER, BibleOrgSysGlobals.USFMAllExpandedCharacterMarkers),
+                            (MARKER_FLAG_NOTE, BibleOrgSysGlobals.loadedUSFMMarkers.getNoteMarkersList()),
+                            (MARKER_FLAG_HEADING, USFM_ALL_SECTION_HEADING_MARKERS),
+                            (MARKER_FLAG_TITLE, USFM_ALL_TITLE_MARKERS),
+                            (MARKER_FLAG_INTRODUCTION, USFM_ALL_INTRODUCTION_MARKERS),
+                            (MARKER_FLAG_HEADER, OFTEN_IGNORED_USFM_HEADER_MARKERS),
+                            (MARKER_FLAG_PRINTABLE, BOS_PRINTABLE_MARKERS),
+                            (MARKER_FLAG_VERSE_TEXT, ('v~','p~')),
+                            (MARKER_FLAG_BOS_CUSTOM, BOS_ALL_CUSTOM_MARKERS),
+                            (MARKER_FLAG_NESTING, BOS_NESTING_MARKERS),
+                            (MARKER_FLAG_END, BOS_END_MARKERS),
+                            (MARKER_FLAG_BIBLE_PARAGRAPH, USFM_BIBLE_PARAGRAPH_MARKERS), )
+        cls.testMarkers = set( UNREGISTERED_MARKERS )
+        for _flag,markerList in cls.flagLists: cls.testMarkers.update( markerList )
+        cls.testMarkers.update( entry.getMarker() for entry in cls.bookEntries )
+        cls.testMarkers.update( entry.getOriginalMarker() for entry in cls.bookEntries if entry.getOriginalMarker() )
+
+    def test_010_flagsMatchLists( self ):
+        """ Test that each flag is set for exactly the markers in its list. """
+        self.assertGreater( len(self.testMarkers), 200 )
+        for flag,markerList in self.flagLists:
+            for marker in sorted( self.testMarkers ):
+                with self.subTest( flag=hex(flag), marker=marker ):
+                    expectedFlag = marker in markerList or (flag==MARKER_FLAG_END and marker[:1]=='¬')
+                    self.assertEqual( bool( getMarkerFlags( marker ) & flag ), expectedFlag )
+                    self.assertEqual( bool( getMarkerCodeAndFlags( marker )[1] & flag ), expectedFlag )
+    # end of test_010_flagsMatchLists
+
+    def test_020_callSiteTests( self ):
+        """ Test the combined bit tests used in InternalBible, BibleWriter, etc. against the list searches they replaced. """
+        for marker in sorted( self.testMarkers ):
+            with self.subTest( marker=marker ):
+                markerFlags = getMarkerFlags( marker )
+                self.assertEqual( bool( markerFlags & (MARKER_FLAG_VERSE_TEXT|MARKER_FLAG_PARAGRAPH) ),
+                                    marker in ('v~','p~') or marker in BibleOrgSysGlobals.USFMParagraphMarkers )
+                self.assertEqual( bool( markerFlags & (MARKER_FLAG_HEADER|MARKER_FLAG_TITLE|MARKER_FLAG_INTRODUCTION) ),
+                                    marker in OFTEN_IGNORED_USFM_HEADER_MARKERS or marker in USFM_ALL_TITLE_MARKERS or marker in USFM_ALL_INTRODUCTION_MARKERS )
+                self.assertEqual( bool( markerFlags & MARKER_FLAG_BIBLE_PARAGRAPH ), marker in USFM_BIBLE_PARAGRAPH_MARKERS )
+    # end of test_020_callSiteTests
+
+    def test_030_codes( self ):
+        """ Test that registered markers round-trip through their codes and unregistered markers all get code 0. """
+        registeredMarkers = set()
+        for _flag,markerList in self.flagLists: registeredMarkers.update( markerList )
+        self.assertFalse( registeredMarkers.intersection( UNREGISTERED_MARKERS ) )
+        codes = set()
+        for marker in sorted( self.testMarkers ):
+            markerCode = getMarkerCodeAndFlags( marker )[0]
+            if marker in registeredMarkers:
+                self.assertGreater( markerCode, 0, marker )
+                self.assertEqual( getMarkerFromCode( markerCode ), marker )
+                codes.add( markerCode )
+            else: self.assertEqual( markerCode, 0, marker )
+        self.assertEqual( len(codes), len(registeredMarkers) ) # All different
+        self.assertIsNone( getMarkerFromCode( 0 ) )
+    # end of test_030_codes
+
+    def test_040_unregisteredMarkersNotKept( self ):
+        """ Test that looking up lots of unregistered markers doesn't grow the registry. """
+        registrySize = len( InternalBibleInternalsModule._markerRegistryDict )
+        for j in range( 5000 ):
+            self.assertEqual( getMarkerCodeAndFlags( f'unknown{j}' ), (0,0) )
+            self.assertEqual( getMarkerFlags( f'¬unknown{j}' ), MARKER_FLAG_END )
+        self.assertEqual( len( InternalBibleInternalsModule._markerRegistryDict ), registrySize )
+    # end of test_040_unregisteredMarkersNotKept
+
+    def test_050_entries( self ):
+        """ Test that the entries (and columnar entry views) give the flags from the registry (even after the marker is changed). """
+        self.assertNotIn( 'markerFlags', InternalBibleEntry.__slots__ )
+        self.assertNotIn( 'markerCode', InternalBibleEntry.__slots__ )
+        columnarList = InternalBibleColumnarEntryList( InternalBibleEntryList( self.bookEntries ) )
+        for entry,entryView in zip( self.bookEntries, columnarList ):
+            self.assertEqual( (entry.getMarkerCode(), entry.getMarkerFlags()), getMarkerCodeAndFlags( entry.getMarker() ) )
+            self.assertEqual( (entryView.markerCode, entryView.markerFlags), (entry.markerCode, entry.markerFlags) )
+        entry = InternalBibleEntry( 'p', 'p', '', '', None, '' )
+        self.assertTrue( entry.getMarkerFlags() & MARKER_FLAG_PARAGRAPH )
+        entry.marker = 's1'
+        self.assertEqual( entry.getMarkerFlags(), getMarkerFlags( 's1' ) )
+        self.assertFalse( entry.getMarkerFlags() & MARKER_FLAG_PARAGRAPH )
+    # end of test_050_entries
+# end of MarkerFlagsTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleMarkerFlags.py
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleMultiprocessing.py
+#
+# Module testing the multiprocessing in InternalBible.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that loading the books in the process-wide worker pool (from small per-book payloads)
+    gives the same books as loading them one by one,
+    that discovering and checking in worker processes gives the same results as doing the books one by one,
+    that we don't fork while the process-wide worker pool is running,
+    that a timeout only terminates the worker pool if nothing else is using it,
+    and testing nested worker pool tasks.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Bible multiprocessing tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import pickle
+import time
+import multiprocessing
+from unittest import mock
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals import InternalBible as InternalBibleModule
+from BibleOrgSys.Formats.USFMBible import USFMBible
+from BibleOrgSys.Formats.USXXMLBible import USXXMLBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+USX_TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USXTest1/' )
+
+
+def getBookTuples( BibleObject ) -> dict[str,list[tuple]]:
+    """ Returns the processed entries of each book in a form that can be compared. """
+    return { BBB:[(entry.getMarker(), entry.getCleanText(), entry.getOriginalText()) for entry in bookObject._processedLines]
+                for BBB,bookObject in BibleObject.books.items() }
+# end of getBookTuples
+
+
+def noForking( numProcesses:int ):
+    """ Replaces BibleOrgSysGlobals.getForkedWorkerPool() when forking isn't expected. """
+    raise AssertionError( "Shouldn't fork here" )
+
+
+class BibleMultiprocessingTests( unittest.TestCase ):
+    """ Compare the multiprocessing book loads with the single process ones. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.singleUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.singleUB.load()
+        cls.singleBookTuples = getBookTuples( cls.singleUB )
+
+    def setUp( self ):
+        self.savedMaxProcesses = BibleOrgSysGlobals.maxProcesses
+        BibleOrgSysGlobals.maxProcesses = 2
+
+    def tearDown( self ):
+        BibleOrgSysGlobals.maxProcesses = self.savedMaxProcesses
+        BibleOrgSysGlobals.shutdownWorkerPool()
+
+    def checkLoad( self ) -> USFMBible:
+        """ Load the Bible in the process-wide worker pool (without forking) and compare the books. """
+        UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        with mock.patch.object( BibleOrgSysGlobals, 'getForkedWorkerPool', noForking ):
+            UB.load()
+        self.assertIsNotNone( BibleOrgSysGlobals._workerPool ) # It was used
+        self.assertEqual( list( UB.books ), list( self.singleUB.books ) )
+        self.assertEqual( getBookTuples( UB ), self.singleBookTuples )
+        for bookObject in UB.books.values():
+            self.assertIs( bookObject.containerBibleObject, UB )
+        return UB
+    # end of checkLoad
+
+    def test_010_payloadLoad( self ):
+        """ Test loading the books in the process-wide worker pool. """
+        self.checkLoad()
+        self.checkLoad() # Again with the same worker processes
+    # end of test_010_payloadLoad
+
+    def test_020_payloads( self ):
+        """ Test that the book load payloads are small (and don't grow as books are loaded and discovered). """
+        UB = self.checkLoad()
+        payload = UB._getBookLoadPayload( 'MRK', 'MBT42MRK.SCP' )
+        self.assertEqual( payload[:5], (USFMBible, UB.sourceFolder, 'MRK', 'MBT42MRK.SCP', UB.encoding) )
+        self.assertFalse( set( payload[5] ).difference( InternalBibleModule.BOOK_LOADER_ATTRIBUTE_NAMES ) )
+        payloadSize = len( pickle.dumps( payload ) )
+        UB.discover()
+        self.assertEqual( len( pickle.dumps( UB._getBookLoadPayload( 'MRK', 'MBT42MRK.SCP' ) ) ), payloadSize )
+        self.assertLess( payloadSize * 100, len( pickle.dumps( UB.books['MRK'] ) ) )
+
+        bookObject = InternalBibleModule._loadBookFromPayloadMP( payload ) # In this process
+        self.assertIsNone( bookObject.containerBibleObject )
+        self.assertEqual( getBookTuples( UB )['MRK'],
+                            [(entry.getMarker(), entry.getCleanText(), entry.getOriginalText()) for entry in bookObject._processedLines] )
+    # end of test_020_payloads
+
+    def test_025_USXPayloadLoad( self ):
+        """ Test loading USX books (which are loaded from the givenFolderName) in the process-wide worker pool. """
+        BibleOrgSysGlobals.maxProcesses = 1
+        singleUB = USXXMLBible( USX_TEST_FOLDERPATH, "USX test" )
+        singleUB.load()
+        self.assertGreater( len(singleUB.books), 1 )
+        BibleOrgSysGlobals.maxProcesses = 2
+        UB = USXXMLBible( USX_TEST_FOLDERPATH, "USX test" )
+        with mock.patch.object( BibleOrgSysGlobals, 'getForkedWorkerPool', noForking ):
+            UB.load()
+        self.assertEqual( list( UB.books ), list( singleUB.books ) )
+        self.assertEqual( getBookTuples( UB ), getBookTuples( singleUB ) )
+        self.assertEqual( UB.combinedBookNameDict, singleUB.combinedBookNameDict )
+        self.assertTrue( all( bookObject.containerBibleObject is UB for bookObject in UB.books.values() ) )
+    # end of test_025_USXPayloadLoad
+
+    def test_030_nestedTasks( self ):
+        """ Test that tasks given to the worker pool from a worker process are run there (with a warning). """
+        BibleOrgSysGlobals.alreadyMultiprocessing = True # Pretend that we're a worker process
+        try:
+            self.assertIsNone( BibleOrgSysGlobals.getWorkerPool() )
+            with self.assertLogs( level='WARNING' ):
+                self.assertEqual( BibleOrgSysGlobals.mapInWorkers( abs, [-1,2,-3] ), [1,2,3] )
+            with self.assertLogs( level='WARNING' ):
+                self.assertEqual( BibleOrgSysGlobals.starmapInWorkers( pow, [(2,3),(3,2)] ), [8,9] )
+            with self.assertLogs( level='WARNING' ):
+                self.assertEqual( list( BibleOrgSysGlobals.imapInWorkers( abs, [-4,5] ) ), [4,5] )
+        finally: BibleOrgSysGlobals.alreadyMultiprocessing = False
+        self.assertEqual( BibleOrgSysGlobals.mapInWorkers( abs, [-1,2,-3] ), [1,2,3] ) # Now in the worker pool
+    # end of test_030_nestedTasks
+
+    def test_040_parallelDiscover( self ):
+        """ Test that discovering the books in forked worker processes gives the same results as discovering them one by one. """
+        if 'fork' not in multiprocessing.get_all_start_methods(): self.skipTest( "Can't fork on this system" )
+        serialUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        serialUB.load()
+        serialUB.discover()
+        parallelUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        parallelUB.load()
+        numDiscoverCalls = { 'MP':0 }
+        def countedDiscoverBooksMP():
+            numDiscoverCalls['MP'] += 1
+            return type(parallelUB)._discoverBooksMP( parallelUB )
+        parallelUB._discoverBooksMP = countedDiscoverBooksMP
+        parallelUB.discover( parallelFlag=True )
+        self.assertEqual( numDiscoverCalls['MP'], 1 )
+        self.assertEqual( list( parallelUB.discoveryResults ), list( serialUB.discoveryResults ) )
+        self.assertEqual( parallelUB.discoveryResults, serialUB.discoveryResults )
+    # end of test_040_parallelDiscover
+
+    def test_050_parallelCheck( self ):
+        """ Test that checking the books in forked worker processes gives the same results as checking them one by one. """
+        if 'fork' not in multiprocessing.get_all_start_methods(): self.skipTest( "Can't fork on this system" )
+        serialUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        serialUB.load()
+        serialUB.check()
+        parallelUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        parallelUB.load()
+        numCheckCalls = { 'MP':0 }
+        def countedCheckBooksMP( *args ):
+            numCheckCalls['MP'] += 1
+            return type(parallelUB)._checkBooksMP( parallelUB, *args )
+        parallelUB._checkBooksMP = countedCheckBooksMP
+        parallelUB.check( parallelFlag=True )
+        self.assertEqual( numCheckCalls['MP'], 1 )
+        self.assertEqual( parallelUB.discoveryResults, serialUB.discoveryResults )
+        for BBB,bookObject in serialUB.books.items():
+            self.assertEqual( parallelUB.books[BBB].checkResultsDictionary, bookObject.checkResultsDictionary, BBB )
+        self.assertEqual( parallelUB.getCheckResults(), serialUB.getCheckResults() )
+    # end of test_050_parallelCheck
+
+    def test_060_noForkWithWorkerPool( self ):
+        """ Test that we don't fork while the process-wide worker pool is running. """
+        if 'fork' not in multiprocessing.get_all_start_methods(): self.skipTest( "Can't fork on this system" )
+        self.assertIsNotNone( BibleOrgSysGlobals.getWorkerPool() )
+        with BibleOrgSysGlobals.getForkedWorkerPool( 2 ) as pool: # The idle pool is stopped first
+            self.assertIsNone( BibleOrgSysGlobals._workerPool )
+            self.assertEqual( pool.map( abs, [-1,2] ), [1,2] )
+
+        serialUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        serialUB.load()
+        serialUB.discover()
+        results = BibleOrgSysGlobals.imapInWorkers( abs, [-1,-2,-3] )
+        self.assertEqual( next( results ), 1 ) # So now the pool is in use
+        self.assertIsNone( BibleOrgSysGlobals.getForkedWorkerPool( 2 ) )
+        parallelUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        parallelUB.load()
+        parallelUB.discover( parallelFlag=True ) # Done in this process instead
+        self.assertEqual( parallelUB.discoveryResults, serialUB.discoveryResults )
+        self.assertEqual( list( results ), [2,3] )
+        self.assertEqual( BibleOrgSysGlobals._workerPoolUseCount, 0 )
+    # end of test_060_noForkWithWorkerPool
+
+    def test_070_timeout( self ):
+        """ Test that a timeout only terminates the worker pool if nothing else is using it. """
+        workerPool = BibleOrgSysGlobals.getWorkerPool()
+        results = BibleOrgSysGlobals.imapInWorkers( abs, [-1,-2,-3] )
+        self.assertEqual( next( results ), 1 ) # So now the pool is in use
+        with self.assertRaises( multiprocessing.TimeoutError ):
+            BibleOrgSysGlobals.mapInWorkers( time.sleep, [1,1], timeout=0.1 )
+        self.assertIs( BibleOrgSysGlobals._workerPool, workerPool ) # Still running
+        self.assertEqual( list( results ), [2,3] )
+        self.assertEqual( BibleOrgSysGlobals._workerPoolUseCount, 0 )
+
+        with self.assertRaises( multiprocessing.TimeoutError ):
+            BibleOrgSysGlobals.mapInWorkers( time.sleep, [5,5], timeout=0.1 )
+        self.assertIsNone( BibleOrgSysGlobals._workerPool ) # Terminated
+        self.assertEqual( BibleOrgSysGlobals._workerPoolUseCount, 0 )
+        self.assertEqual( BibleOrgSysGlobals.mapInWorkers( abs, [-1,2,-3] ), [1,2,3] ) # In a new pool
+        self.assertIsNot( BibleOrgSysGlobals._workerPool, workerPool )
+    # end of test_070_timeout
+# end of BibleMultiprocessingTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleMultiprocessing.py
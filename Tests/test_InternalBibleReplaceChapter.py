@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleReplaceChapter.py
+#
+# Module testing InternalBible.replaceBookChapterLines() and InternalBibleBook.replaceChapterLines()
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that replacing one edited chapter of a loaded book
+    gives the same processed lines, indexes, discovery results, and check results
+    as loading the edited book file from scratch.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Replace chapter tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.InputOutput.USFMFile import USFMFile
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_FILENAMES = { 'MRK':'MBT42MRK.SCP', 'JDE':'MBT66JUD.SCP', 'REV':'MBT67REV.SCP', }
+
+
+def getEntryTuples( entries ) -> list[tuple]:
+    """ Returns the entries in a form that can be compared. """
+    return [(entry.getMarker(), entry.getOriginalMarker(), entry.getAdjustedText(), entry.getCleanText(), entry.getOriginalText(),
+                str(entry.getExtras()) if entry.getExtras() else None) for entry in entries]
+# end of getEntryTuples
+
+
+class ReplaceChapterTests( unittest.TestCase ):
+    """ Compare replacing a chapter with reloading the edited book. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+
+    def setUp( self ):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.folderpath = Path( self.tempFolder.name )
+        for filename in TEST_FILENAMES.values():
+            shutil.copy2( TEST_FOLDERPATH.joinpath( filename ), self.folderpath )
+        self.UB = self.loadBible()
+
+    def tearDown( self ):
+        self.tempFolder.cleanup()
+
+    def loadBible( self ) -> USFMBible:
+        """ Load all the books in the temporary folder and do the discovery (and the section indexes). """
+        UB = USFMBible( self.folderpath, "Matigsalug", 'MBTV' )
+        UB.load()
+        UB.discover()
+        for bookObject in UB.books.values(): bookObject._makeBookSectionIndex()
+        return UB
+    # end of loadBible
+
+    def editBookFile( self, BBB:str, C:str, oldText:str, newText:str ) -> list[tuple[str,str]]:
+        """
+        Replace the oldText with newText (which must both be in chapter C) in the book file
+            and return the raw lines for the edited chapter.
+        """
+        filepath = self.folderpath.joinpath( TEST_FILENAMES[BBB] )
+        with open( filepath, 'rt', encoding='utf-8' ) as bookFile: bookText = bookFile.read()
+        self.assertEqual( bookText.count( oldText ), 1, oldText )
+        with open( filepath, 'wt', encoding='utf-8', newline='' ) as bookFile: bookFile.write( bookText.replace( oldText, newText ) )
+        return self.getChapterRawLines( BBB, C )
+    # end of editBookFile
+
+    def getChapterRawLines( self, BBB:str, C:str ) -> list[tuple[str,str]]:
+        """ Returns the raw (marker,text) lines for chapter C from the book file. """
+        usfmFile = USFMFile()
+        usfmFile.read( self.folderpath.joinpath( TEST_FILENAMES[BBB] ) )
+        chapterLines, inChapter = [], False
+        for marker,text in usfmFile.lines:
+            if marker == 'c': inChapter = text.strip() == C
+            if inChapter: chapterLines.append( (marker,text) )
+        self.assertTrue( chapterLines )
+        return chapterLines
+    # end of getChapterRawLines
+
+    def checkSameAsReloaded( self, BBB:str ) -> None:
+        """ Compare our edited Bible with one loaded from the edited files. """
+        reloadedBible = self.loadBible()
+        bookObject, reloadedBookObject = self.UB.books[BBB], reloadedBible.books[BBB]
+        self.assertEqual( getEntryTuples( bookObject._processedLines ), getEntryTuples( reloadedBookObject._processedLines ) )
+        self.assertEqual( [(CVKey,list(indexEntry)) for CVKey,indexEntry in bookObject._CVIndex.items()],
+                            [(CVKey,list(indexEntry)) for CVKey,indexEntry in reloadedBookObject._CVIndex.items()] )
+        self.assertEqual( bookObject.checkResultsDictionary.get( 'Fix Text Errors' ), reloadedBookObject.checkResultsDictionary.get( 'Fix Text Errors' ) )
+        self.assertEqual( self.UB.discoveryResults[BBB], reloadedBible.discoveryResults[BBB] )
+        self.assertEqual( self.UB.discoveryResults['ALL'], reloadedBible.discoveryResults['ALL'] )
+        self.assertTrue( bookObject._indexedSectionsFlag )
+        self.assertEqual( [(key,str(indexEntry)) for key,indexEntry in bookObject._SectionIndex.items()],
+                            [(key,str(indexEntry)) for key,indexEntry in reloadedBookObject._SectionIndex.items()] )
+        self.assertEqual( getEntryTuples( self.UB.getContextVerseData( (BBB,'1','1') )[0] ),
+                            getEntryTuples( reloadedBible.getContextVerseData( (BBB,'1','1') )[0] ) )
+        return reloadedBible
+    # end of checkSameAsReloaded
+
+    def test_010_textEdit( self ):
+        """ Test an edit that only changes the verse texts (so the C:V index doesn't change). """
+        bookObject = self.UB.books['MRK']
+        oldCVIndexEntry = bookObject._CVIndex[('3','5')]
+        newRawLines = self.editBookFile( 'MRK', '3', 'Ne dutu, nabelu e si Hisus', 'Ne dutu, nabelu e si Hisus Kristu' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'MRK', '3', newRawLines ) )
+        self.assertIs( bookObject._CVIndex[('3','5')], oldCVIndexEntry ) # Wasn't remade
+        self.assertIn( 'Hisus Kristu', self.UB.getVerseText( ('MRK','3','5') ) )
+        self.checkSameAsReloaded( 'MRK' )
+    # end of test_010_textEdit
+
+    def test_020_structureEdit( self ):
+        """ Test edits that add and remove lines (so the index entries have to be moved). """
+        newRawLines = self.editBookFile( 'MRK', '3', '\\v 5 Ne dutu,', '\\s Bag-u ne ulu\n\\p\n\\v 5\\f + \\fr 3:5 \\ft Note.\\f* Ne dutu,' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'MRK', '3', newRawLines ) )
+        self.checkSameAsReloaded( 'MRK' )
+        newRawLines = self.editBookFile( 'MRK', '3', '\\s Bag-u ne ulu\n', '' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'MRK', '3', newRawLines ) )
+        self.checkSameAsReloaded( 'MRK' )
+        # The last chapter of a book (with a new verse)
+        newRawLines = self.getChapterRawLines( 'REV', '22' )
+        with open( self.folderpath.joinpath( TEST_FILENAMES['REV'] ), 'at', encoding='utf-8' ) as bookFile: bookFile.write( '\\v 22 Amen.\n' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'REV', '22', newRawLines + [('v','22 Amen.')] ) )
+        self.assertEqual( self.UB.getVerseText( ('REV','22','22') ), 'Amen.' )
+        self.checkSameAsReloaded( 'REV' )
+    # end of test_020_structureEdit
+
+    def test_030_fallbacks( self ):
+        """ Test edits which can't be done by just replacing the chapter. """
+        bookObject = self.UB.books['MRK']
+        originalEntries = getEntryTuples( bookObject._processedLines )
+        originalDiscoveryResults = self.UB.discoveryResults['ALL']
+        chapterLines = self.getChapterRawLines( 'MRK', '3' )
+        for C,newRawLines in ( ('3', chapterLines[1:]), # Doesn't start with the chapter line
+                                ('3', chapterLines + [('c','4')]), # More than one chapter
+                                ('4', chapterLines), # Wrong chapter
+                                ('99', [('c','99'),('p',''),('v','1 No chapter 99.')]), # Chapter isn't there
+                                ('3', [chapterLines[0], ('ip','Introduction paragraph.')] + chapterLines[1:]), # Changes the nesting
+                              ):
+            with self.subTest( C=C, numLines=len(newRawLines), firstLine=newRawLines[0] ):
+                self.assertFalse( self.UB.replaceBookChapterLines( 'MRK', C, newRawLines ) )
+                self.assertEqual( getEntryTuples( bookObject._processedLines ), originalEntries )
+                self.assertIs( self.UB.discoveryResults['ALL'], originalDiscoveryResults )
+        self.assertTrue( bookObject._indexedSectionsFlag )
+    # end of test_030_fallbacks
+
+    def test_040_fixTextErrors( self ):
+        """ Test that the fix text errors are replaced (not duplicated) when a chapter is replaced. """
+        bookObject = self.UB.books['REV']
+        originalFixErrors = list( bookObject.checkResultsDictionary.get( 'Fix Text Errors', [] ) )
+        chapterLines = self.getChapterRawLines( 'REV', '1' )
+        for _n in range( 3 ):
+            self.assertTrue( self.UB.replaceBookChapterLines( 'REV', '1', chapterLines ) )
+            self.assertEqual( bookObject.checkResultsDictionary.get( 'Fix Text Errors', [] ), originalFixErrors )
+        # Now make a new error (a cross-reference without a caller) in chapter 2
+        newRawLines = self.editBookFile( 'REV', '2', '\\v 1 Ne migkahi sikandin, “Isulat', '\\v 1 \\x - \\xo 2:1: \\xt Isa 1:1.\\x*Ne migkahi sikandin, “Isulat' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'REV', '2', newRawLines ) )
+        self.assertEqual( len( bookObject.checkResultsDictionary['Fix Text Errors'] ), len(originalFixErrors) + 1 )
+        self.checkSameAsReloaded( 'REV' )
+        # And fix it again
+        newRawLines = self.editBookFile( 'REV', '2', '\\v 1 \\x - \\xo 2:1: \\xt Isa 1:1.\\x*Ne migkahi sikandin, “Isulat', '\\v 1 Ne migkahi sikandin, “Isulat' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'REV', '2', newRawLines ) )
+        self.assertEqual( bookObject.checkResultsDictionary.get( 'Fix Text Errors', [] ), originalFixErrors )
+    # end of test_040_fixTextErrors
+
+    def test_050_checkResults( self ):
+        """ Test that checking the book after replacing a chapter gives the same results as after reloading it. """
+        newRawLines = self.editBookFile( 'MRK', '3', '\\v 5 Ne dutu,', '\\s Bag-u ne ulu\n\\p\n\\v 5 Ne dutu, "Ne dutu"' )
+        self.assertTrue( self.UB.replaceBookChapterLines( 'MRK', '3', newRawLines ) )
+        reloadedBible = self.checkSameAsReloaded( 'MRK' )
+        self.UB.check( ['MRK'] )
+        reloadedBible.check( ['MRK'] )
+        self.assertEqual( self.UB.books['MRK'].checkResultsDictionary, reloadedBible.books['MRK'].checkResultsDictionary )
+    # end of test_050_checkResults
+# end of ReplaceChapterTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleReplaceChapter.py
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleSearch.py
+#
+# Module testing the InternalBible.findText() search paths
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that the InternalBible.findText() search paths
+    (word index, trigram regex prefilter, iterFindText(), parallel search, and folded texts)
+    all give exactly the same results as a plain scan of every line.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "InternalBible search tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBible import prepareFindTextOptions, _iterFindTextInBookEntries
+from BibleOrgSys.Internals.InternalBibleSearchIndexes import InternalBibleWordIndex
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'LEV', 'MRK', 'JDE', 'REV', ) # Just a few books so that the tests run quickly
+
+WORD_MODES = ( 'Any', 'Whole', 'Begins', 'EndsWord', 'EndsLine', )
+FIND_TEXTS = ( 'kandin', 'Manama', 'mánama', 'ne', 'zzzz', )
+REGEX_FIND_TEXTS = ( 'regex:kand.n', 'regex:(Manama|Jesus)', 'regex:[Ss]ikand[ai]n\\b', 'regex:due.+ware', 'regex:^Ne ', 'regex:[0-9]+', )
+
+
+def getScanResults( BibleObject, optionsDict:dict ) -> list[tuple]:
+    """
+    Search every line of every book without using any of the indexes (or folded texts).
+    """
+    optionsDict = dict( optionsDict )
+    ourFindText, compiledFindText, ourMarkerList = prepareFindTextOptions( optionsDict, 'Test' )
+    resultList = []
+    for BBB,bookObject in BibleObject.books.items():
+        resultList.extend( _iterFindTextInBookEntries( BBB, bookObject._processedLines, optionsDict,
+                                                        ourFindText, compiledFindText, ourMarkerList ) )
+    return resultList
+# end of getScanResults
+
+
+def getAllOptions( findTexts ):
+    """
+    Yields options dictionaries for each combination of findText, wordMode, caselessFlag, and ignoreDiacriticsFlag.
+    """
+    for findText in findTexts:
+        for wordMode in ( ('Any',) if findText.startswith( 'regex:' ) else WORD_MODES ):
+            for caselessFlag in ( False, True ):
+                for ignoreDiacriticsFlag in ( False, True ):
+                    yield { 'findText':findText, 'wordMode':wordMode, 'caselessFlag':caselessFlag, 'ignoreDiacriticsFlag':ignoreDiacriticsFlag }
+# end of getAllOptions
+
+
+class InternalBibleSearchTests( unittest.TestCase ):
+    """ Compare the findText() search paths against a plain scan. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+
+    def tearDown( self ):
+        self.UB.wordIndex = None
+        self.UB.discardFoldedCleanTexts()
+
+    def checkAgainstScan( self, findTexts, extraOptions=None, parallelFlag:bool=False ):
+        """ Check that findText() gives the same results as the plain scan for all the options. """
+        for optionsDict in getAllOptions( findTexts ):
+            if extraOptions: optionsDict.update( extraOptions )
+            with self.subTest( **optionsDict ):
+                expectedResults = getScanResults( self.UB, optionsDict )
+                _optionsDict, resultSummaryDict, resultList = self.UB.findText( dict(optionsDict), parallelFlag=parallelFlag )
+                self.assertEqual( resultList, expectedResults )
+                self.assertEqual( resultSummaryDict['numResults'], len(expectedResults) )
+
+    def test_010_scan( self ):
+        """ Make sure that the test searches actually find things. """
+        self.assertGreater( len( getScanResults( self.UB, { 'findText':'kandin' } ) ), 100 )
+        self.assertGreater( len( getScanResults( self.UB, { 'findText':'mánama', 'ignoreDiacriticsFlag':True } ) ), 100 )
+        self.assertEqual( getScanResults( self.UB, { 'findText':'mánama', 'ignoreDiacriticsFlag':False } ), [] )
+        self.assertGreater( len( getScanResults( self.UB, { 'findText':'regex:kand.n' } ) ), 100 )
+    # end of test_010_scan
+
+    def test_020_noIndex( self ):
+        """ Test findText() with no word index. """
+        self.assertIsNone( self.UB.__dict__.get( 'wordIndex' ) )
+        self.checkAgainstScan( FIND_TEXTS )
+    # end of test_020_noIndex
+
+    def test_030_wordIndex( self ):
+        """ Test findText() using the word index. """
+        wordIndex = self.UB.makeWordIndex( loadFlag=False, saveFlag=False )
+        self.assertEqual( len(wordIndex), len(self.UB.books) )
+        self.checkAgainstScan( FIND_TEXTS )
+        self.checkAgainstScan( FIND_TEXTS[:2], { 'includeIntroFlag':False } )
+    # end of test_030_wordIndex
+
+    def test_040_savedWordIndex( self ):
+        """ Test findText() using a saved and reloaded word index. """
+        with tempfile.TemporaryDirectory() as tempFolder:
+            self.UB.makeWordIndex( loadFlag=False, saveFlag=False )
+            self.assertTrue( self.UB.saveWordIndex( tempFolder ) )
+            self.UB.wordIndex = None
+            loadedWordIndex = InternalBibleWordIndex.load( self.UB, tempFolder )
+        self.assertIsInstance( loadedWordIndex, InternalBibleWordIndex )
+        self.assertEqual( loadedWordIndex.makeIndex( self.UB ), 0 ) # Nothing should need remaking
+        self.UB.wordIndex = loadedWordIndex
+        self.checkAgainstScan( FIND_TEXTS )
+    # end of test_040_savedWordIndex
+
+    def test_050_trigramPrefilter( self ):
+        """ Test regex findText() using the trigram prefilter. """
+        self.checkAgainstScan( REGEX_FIND_TEXTS )
+        self.checkAgainstScan( REGEX_FIND_TEXTS, { 'includeExtrasFlag':True } )
+        statistics = self.UB.getTrigramIndexStatistics()
+        self.assertGreater( statistics['numPrefilteredQueries'], 0 )
+        self.assertLess( statistics['numCandidateLines'], statistics['numLinesSearchable'] )
+    # end of test_050_trigramPrefilter
+
+    def test_060_iterFindText( self ):
+        """ Test iterFindText() with maxResults and cancelCallback. """
+        expectedResults = getScanResults( self.UB, { 'findText':'sikandin' } )
+        resultSummaryDict = {}
+        resultList = list( self.UB.iterFindText( { 'findText':'sikandin' }, resultSummaryDict, maxResults=10 ) )
+        self.assertEqual( resultList, expectedResults[:10] )
+        self.assertTrue( resultSummaryDict['reachedMaxResults'] )
+
+        resultSummaryDict = {}
+        resultList = list( self.UB.iterFindText( { 'findText':'sikandin' }, resultSummaryDict,
+                                                    cancelCallback=lambda: len(resultSummaryDict['searchedBookList']) > 2 ) )
+        self.assertTrue( resultSummaryDict['cancelled'] )
+        self.assertEqual( resultList, expectedResults[:len(resultList)] )
+    # end of test_060_iterFindText
+
+    def test_070_parallel( self ):
+        """ Test findText() searching the books in worker processes. """
+        savedMaxProcesses = BibleOrgSysGlobals.maxProcesses
+        BibleOrgSysGlobals.maxProcesses = 2
+        try:
+            self.checkAgainstScan( FIND_TEXTS[:2] + REGEX_FIND_TEXTS[:2], parallelFlag=True )
+        finally:
+            BibleOrgSysGlobals.maxProcesses = savedMaxProcesses
+            BibleOrgSysGlobals.shutdownWorkerPool()
+    # end of test_070_parallel
+
+    def test_080_foldedTexts( self ):
+        """ Test findText() using the saved folded cleanTexts (with and without the word index). """
+        self.assertGreater( self.UB.makeFoldedCleanTexts(), 0 )
+        self.checkAgainstScan( FIND_TEXTS[:3] + REGEX_FIND_TEXTS[:3] )
+        self.UB.makeWordIndex( loadFlag=False, saveFlag=False )
+        self.checkAgainstScan( FIND_TEXTS[:3] )
+    # end of test_080_foldedTexts
+# end of InternalBibleSearchTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleSearch.py
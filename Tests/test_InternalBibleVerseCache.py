@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleVerseCache.py
+#
+# Module testing the InternalBibleVerseCache (as used by InternalBible.getContextVerseData(), etc.)
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that the cached InternalBible.getContextVerseData() and getVerseText() results
+    are the same as the uncached ones,
+    that the cached results for a book are discarded when it's edited, reprocessed, or unloaded,
+    and that the least recently used results are evicted at the size limit.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Verse cache tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.InputOutput.USFMFile import USFMFile
+from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleVerseCache
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_FILENAMES = { 'MRK':'MBT42MRK.SCP', 'JDE':'MBT66JUD.SCP', 'REV':'MBT67REV.SCP', }
+TEST_REFERENCES = ( ('MRK','1','1'), ('MRK','3','5'), ('MRK','16','20'), ('JDE','1','3'), ('JDE','1','25'), ('REV','1','1'), ('REV','22','21'),
+                    ('JDE','1'), ('REV','2'), ('MRK','-1','1'), ('MRK','99','1'), ('MAT','1','1'), )
+
+
+def getEntryTuples( entries ) -> list[tuple]:
+    """ Returns the entries in a form that can be compared. """
+    return [(entry.getMarker(), entry.getOriginalMarker(), entry.getAdjustedText(), entry.getCleanText(), entry.getOriginalText(),
+                str(entry.getExtras()) if entry.getExtras() else None) for entry in entries]
+# end of getEntryTuples
+
+
+def getResult( function, *args, **kwargs ):
+    """
+    Call the function and return something that can be compared,
+        i.e., the entries and the context list, the text, None, or else the type of the exception.
+    """
+    try: result = function( *args, **kwargs )
+    except Exception as err: return type(err)
+    if isinstance( result, tuple ): return getEntryTuples( result[0] ), result[1]
+    return result
+# end of getResult
+
+
+class InternalBibleVerseCacheTests( unittest.TestCase ):
+    """ Compare the cached verse lookups with the uncached ones. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+
+    def setUp( self ):
+        self.uncachedUB = self.loadBible()
+        self.UB = self.loadBible()
+        self.UB.setVerseCacheSize( 100 )
+
+    def loadBible( self ) -> USFMBible:
+        UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        UB.preload()
+        for BBB in TEST_FILENAMES: UB.loadBook( BBB )
+        return UB
+    # end of loadBible
+
+    def getVerseLookups( self ):
+        """ Yields a description, the lookup function name, and its parameters for lots of lookups. """
+        for reference in TEST_REFERENCES:
+            for strict in (False, True):
+                for complete in (False, True):
+                    yield 'getContextVerseData', (reference,), { 'strict':strict, 'complete':complete }
+            if len(reference) == 3:
+                verseKey = SimpleVerseKey( *reference ) if int(reference[1]) > 0 else reference
+                yield 'getContextVerseData', (verseKey,), {}
+                for fullTextFlag in (False, True):
+                    for includeNonCanonical in (False, True):
+                        yield 'getVerseText', (verseKey,), { 'fullTextFlag':fullTextFlag, 'includeNonCanonical':includeNonCanonical }
+    # end of getVerseLookups
+
+    def checkAgainstUncached( self, BBBs=None ) -> None:
+        """ Check that every lookup gives the same (cached) result as the uncached Bible. """
+        for functionName,args,kwargs in self.getVerseLookups():
+            if BBBs is not None and args[0][0] not in BBBs: continue
+            with self.subTest( function=functionName, args=args, **kwargs ):
+                expectedResult = getResult( getattr( self.uncachedUB, functionName ), *args, **kwargs )
+                self.assertEqual( getResult( getattr( self.UB, functionName ), *args, **kwargs ), expectedResult ) # Might be a miss
+                self.assertEqual( getResult( getattr( self.UB, functionName ), *args, **kwargs ), expectedResult ) # Now a hit (if it was found)
+    # end of checkAgainstUncached
+
+    def test_010_hits( self ):
+        """ Test that the cached results are the same as the uncached ones. """
+        self.assertIsInstance( self.UB.verseCache, InternalBibleVerseCache )
+        self.assertIsNone( self.uncachedUB.getVerseCacheStatistics() )
+        self.checkAgainstUncached()
+        statistics = self.UB.getVerseCacheStatistics()
+        self.assertGreater( statistics['numHits'], 50 )
+        self.assertEqual( statistics['numEvictions'], 0 )
+        self.assertLessEqual( statistics['size'], statistics['numHits'] ) # Every found result was used again (and the tuple and SimpleVerseKey lookups share their keys)
+    # end of test_010_hits
+
+    def test_020_callerChanges( self ):
+        """ Test that changing a returned result doesn't change the cached result. """
+        expectedResult = getResult( self.uncachedUB.getContextVerseData, ('JDE','1','3') )
+        verseEntries, contextList = self.UB.getContextVerseData( ('JDE','1','3') )
+        verseEntries.append( verseEntries[0] )
+        contextList.append( 'Changed' )
+        self.assertEqual( getResult( self.UB.getContextVerseData, ('JDE','1','3') ), expectedResult )
+        self.assertEqual( self.UB.verseCache.numHits, 1 )
+    # end of test_020_callerChanges
+
+    def test_030_invalidateOnEdit( self ):
+        """ Test that replacing a chapter discards the cached results for that book (only). """
+        self.checkAgainstUncached()
+        numCached = len(self.UB.verseCache)
+        numCachedJDE = sum( 1 for key in self.UB.verseCache._cache if key[0]=='JDE' )
+        self.assertGreater( numCachedJDE, 0 )
+
+        usfmFile = USFMFile()
+        usfmFile.read( TEST_FOLDERPATH.joinpath( TEST_FILENAMES['JDE'] ) )
+        chapterLines, inChapter = [], False
+        for marker,text in usfmFile.lines:
+            if marker == 'c': inChapter = text.strip() == '1'
+            if inChapter: chapterLines.append( (marker, text.replace( 'Manama', 'Manama Edited' ) if marker=='v' and text.startswith( '3 ' ) else text) )
+        self.assertTrue( any( 'Edited' in text for _marker,text in chapterLines ) )
+        for UB in (self.UB, self.uncachedUB):
+            self.assertTrue( UB.replaceBookChapterLines( 'JDE', '1', chapterLines ) )
+        self.assertEqual( len(self.UB.verseCache), numCached - numCachedJDE )
+        self.assertFalse( any( key[0]=='JDE' for key in self.UB.verseCache._cache ) )
+        self.assertEqual( self.UB.verseCache.numInvalidations, numCachedJDE )
+        self.assertIn( 'Edited', self.UB.getVerseText( ('JDE','1','3') ) )
+        self.checkAgainstUncached()
+
+        self.UB.reProcessBook( 'REV' )
+        self.assertFalse( any( key[0]=='REV' for key in self.UB.verseCache._cache ) )
+        self.UB.unloadBook( 'MRK' )
+        self.assertFalse( any( key[0]=='MRK' for key in self.UB.verseCache._cache ) )
+        self.UB.clearVerseCache()
+        self.assertEqual( len(self.UB.verseCache), 0 )
+    # end of test_030_invalidateOnEdit
+
+    def test_040_eviction( self ):
+        """ Test that the least recently used results are evicted at the size limit. """
+        self.UB.setVerseCacheSize( 3 )
+        references = [('MRK','1','1'), ('MRK','1','2'), ('MRK','1','3'), ('MRK','1','4'), ('MRK','1','5')]
+        for reference in references[:3]:
+            self.UB.getVerseText( reference )
+        self.UB.getVerseText( references[0] ) # Now the most recently used
+        self.UB.getVerseText( references[3] ) # Evicts references[1]
+        cache = self.UB.verseCache
+        self.assertEqual( len(cache), 3 )
+        self.assertEqual( [key[2] for key in cache._cache], [references[2], references[0], references[3]] )
+        self.assertEqual( (cache.numHits, cache.numMisses, cache.numEvictions), (1, 4, 1) )
+        self.UB.getVerseText( references[4] )
+        self.assertEqual( [key[2] for key in cache._cache], [references[0], references[3], references[4]] )
+        self.assertEqual( self.UB.getVerseText( references[1] ), self.uncachedUB.getVerseText( references[1] ) ) # Evicted but still right
+        self.assertEqual( cache.numEvictions, 3 )
+
+        self.UB.setVerseCacheSize( 1 )
+        self.assertEqual( [key[2] for key in cache._cache], [references[1]] )
+        self.assertEqual( cache.getStatistics()['maxSize'], 1 )
+        self.UB.setVerseCacheSize( 0 )
+        self.assertNotIn( 'verseCache', self.UB.__dict__ )
+        self.assertIsNone( self.UB.getVerseCacheStatistics() )
+        self.assertEqual( self.UB.getVerseText( references[1] ), self.uncachedUB.getVerseText( references[1] ) )
+    # end of test_040_eviction
+# end of InternalBibleVerseCacheTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleVerseCache.py
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_InternalBibleVerseOrdinalIndex.py
+#
+# Module testing InternalBibleVerseOrdinalIndex in InternalBibleIndexes.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that the InternalBibleVerseOrdinalIndex verse ordinals
+    round-trip with the book C:V indexes,
+    and that the BibleConcordance uses the same ordinals.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Verse ordinal index tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Internals.InternalBibleIndexes import InternalBibleVerseOrdinalIndex
+from BibleOrgSys.Internals.InternalBibleConcordance import writeConcordance, BibleConcordance
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'GEN', 'MRK', 'JDE', 'REV', ) # GEN has lots of verse bridges
+
+
+class InternalBibleVerseOrdinalIndexTests( unittest.TestCase ):
+    """ Check the verse ordinals against the book C:V indexes. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+        cls.ordinalIndex = cls.UB.getVerseOrdinalIndex()
+
+    def getExpectedBCVs( self ) -> list[tuple[str,str,str]]:
+        """ Returns the (BBB,C,V) of every book C:V index entry in the Bible's book order. """
+        return [(BBB,C,V) for BBB,bookObject in self.UB.books.items() for C,V in bookObject._CVIndex]
+
+    def test_010_ordinalRoundTrips( self ):
+        """ Test that every C:V index entry round-trips through its ordinal (and back). """
+        self.assertIsInstance( self.ordinalIndex, InternalBibleVerseOrdinalIndex )
+        expectedBCVs = self.getExpectedBCVs()
+        self.assertEqual( len(self.ordinalIndex), len(expectedBCVs) )
+        self.assertEqual( self.ordinalIndex.bookCodes, list( TEST_BOOKS ) )
+        for ordinal,BCV in enumerate( expectedBCVs ):
+            self.assertEqual( self.ordinalIndex.getBCV( ordinal ), BCV )
+            self.assertEqual( self.ordinalIndex.getOrdinal( BCV ), ordinal )
+            self.assertEqual( self.ordinalIndex.getOrdinal( BCV + ('',) ), ordinal ) # BCVS tuple
+            self.assertEqual( self.ordinalIndex.getBookCode( ordinal ), BCV[0] )
+            self.assertIn( BCV, self.ordinalIndex )
+            BBB, C, V = BCV
+            indexEntry = self.UB.books[BBB]._CVIndex[(C,V)]
+            self.assertEqual( self.ordinalIndex.getEntryRange( ordinal ), range( indexEntry.getEntryIndex(), indexEntry.getNextEntryIndex() ) )
+        verseKey = SimpleVerseKey( 'MRK', '3', '5' )
+        self.assertEqual( self.ordinalIndex.getBCV( self.ordinalIndex.getOrdinal( verseKey ) ), verseKey.getBCV() )
+    # end of test_010_ordinalRoundTrips
+
+    def test_020_badReferences( self ):
+        """ Test references and ordinals which aren't in the index. """
+        for BCV in ( ('MAT','1','1'), ('MRK','99','1'), ('MRK','1','999'), ):
+            self.assertNotIn( BCV, self.ordinalIndex )
+            with self.assertRaises( KeyError ): self.ordinalIndex.getOrdinal( BCV )
+        for ordinal in ( -1, len(self.ordinalIndex), len(self.ordinalIndex) + 10 ):
+            with self.assertRaises( IndexError ): self.ordinalIndex.getBCV( ordinal )
+            with self.assertRaises( IndexError ): self.ordinalIndex.getBookCode( ordinal )
+            with self.assertRaises( IndexError ): self.ordinalIndex.getEntryRange( ordinal )
+        with self.assertRaises( IndexError ): self.ordinalIndex.getBookEntrySlices( 5, 4 )
+    # end of test_020_badReferences
+
+    def test_030_ranges( self ):
+        """ Test the book, chapter and verse ordinal ranges (which must cover the index exactly). """
+        expectedBCVs = self.getExpectedBCVs()
+        bookRanges = [self.ordinalIndex.getBookOrdinalRange( BBB ) for BBB in TEST_BOOKS]
+        self.assertEqual( [ordinal for bookRange in bookRanges for ordinal in bookRange], list( range( len(expectedBCVs) ) ) )
+        for BBB in TEST_BOOKS:
+            chapters = list( dict.fromkeys( C for C,_V in self.UB.books[BBB]._CVIndex ) )
+            chapterRanges = [self.ordinalIndex.getChapterOrdinalRange( BBB, C ) for C in chapters]
+            self.assertEqual( [ordinal for chapterRange in chapterRanges for ordinal in chapterRange], list( self.ordinalIndex.getBookOrdinalRange( BBB ) ) )
+            for C,chapterRange in zip( chapters, chapterRanges ):
+                self.assertTrue( all( expectedBCVs[ordinal][:2] == (BBB,C) for ordinal in chapterRange ) )
+        self.assertEqual( self.ordinalIndex.getOrdinalRange( ('MRK','1','1'), ('JDE','1','3') ),
+                            range( self.ordinalIndex.getOrdinal( ('MRK','1','1') ), self.ordinalIndex.getOrdinal( ('JDE','1','3') ) + 1 ) )
+        with self.assertRaises( KeyError ): self.ordinalIndex.getBookOrdinalRange( 'MAT' )
+        with self.assertRaises( KeyError ): self.ordinalIndex.getChapterOrdinalRange( 'MRK', '99' )
+    # end of test_030_ranges
+
+    def test_040_bookEntrySlices( self ):
+        """ Test that the entry slices across book boundaries match the C:V index entries. """
+        startOrdinal, endOrdinal = self.ordinalIndex.getOrdinal( ('MRK','16','19') ), self.ordinalIndex.getOrdinal( ('REV','1','2') )
+        bookEntrySlices = self.ordinalIndex.getBookEntrySlices( startOrdinal, endOrdinal )
+        self.assertEqual( [BBB for BBB,_startIndex,_endIndex in bookEntrySlices], ['MRK','JDE','REV'] )
+        for BBB,startIndex,endIndex in bookEntrySlices:
+            bookOrdinals = [ordinal for ordinal in range( startOrdinal, endOrdinal+1 ) if self.ordinalIndex.getBookCode( ordinal ) == BBB]
+            self.assertEqual( startIndex, self.ordinalIndex.getEntryRange( bookOrdinals[0] ).start )
+            self.assertEqual( endIndex, self.ordinalIndex.getEntryRange( bookOrdinals[-1] ).stop )
+    # end of test_040_bookEntrySlices
+
+    def test_050_sortAndMap( self ):
+        """ Test sorting references and mapping the ordinals to another Bible's. """
+        references = [('REV','1','1'), SimpleVerseKey( 'GEN', '2', '3' ), ('MRK','1','1'), ('GEN','1','1')]
+        self.assertEqual( [self.ordinalIndex.getOrdinal( reference ) for reference in self.ordinalIndex.sortReferences( references )],
+                            sorted( self.ordinalIndex.getOrdinal( reference ) for reference in references ) )
+        otherUB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        otherUB.preload()
+        for BBB in ( 'REV', 'MRK', 'MAT', ): # Different order and some different books
+            otherUB.loadBook( BBB )
+        otherOrdinalIndex = otherUB.getVerseOrdinalIndex()
+        ordinalMap = self.ordinalIndex.getOrdinalMap( otherOrdinalIndex )
+        self.assertEqual( len(ordinalMap), len(self.ordinalIndex) )
+        for ordinal,otherOrdinal in enumerate( ordinalMap ):
+            BCV = self.ordinalIndex.getBCV( ordinal )
+            if BCV[0] in otherUB.books: self.assertEqual( otherOrdinalIndex.getBCV( otherOrdinal ), BCV )
+            else: self.assertEqual( otherOrdinal, -1 )
+    # end of test_050_sortAndMap
+
+    def test_060_concordanceOrdinals( self ):
+        """ Test that the concordance uses the same verse ordinals. """
+        with tempfile.TemporaryDirectory() as tempFolderpath:
+            concordanceFilepath = Path( tempFolderpath, 'test.BOSConcordance' )
+            self.assertTrue( writeConcordance( self.UB, concordanceFilepath ) )
+            concordance = BibleConcordance( concordanceFilepath )
+            try:
+                self.assertEqual( len(concordance.verseKeys), len(self.ordinalIndex) )
+                for ordinal in range( len(self.ordinalIndex) ):
+                    self.assertEqual( concordance.getOrdinalKey( ordinal ), self.ordinalIndex.getBCV( ordinal ) )
+                ordinals = concordance.getOrdinals( 'kandin' )
+                self.assertGreater( len(ordinals), 10 )
+                for ordinal in ordinals:
+                    BBB = self.ordinalIndex.getBookCode( ordinal )
+                    bookEntries = self.UB.books[BBB]._processedLines
+                    self.assertTrue( any( 'kandin' in bookEntries[entryIndex].getCleanText().lower()
+                                            for entryIndex in self.ordinalIndex.getEntryRange( ordinal ) ) )
+            finally: concordance.close()
+    # end of test_060_concordanceOrdinals
+# end of InternalBibleVerseOrdinalIndexTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_InternalBibleVerseOrdinalIndex.py
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_SQLiteFTSBible.py
+#
+# Module testing SQLiteFTSBible.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing SQLiteFTSBible.py.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "SQLite FTS Bible tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+from unittest import mock
+import sys
+import tempfile
+import sqlite3
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Formats import SQLiteFTSBible
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_BOOKS = ( 'MRK', 'JDE', ) # Just a few books so that the tests run quickly
+
+realSQLiteConnect = sqlite3.connect # because we patch it below
+
+
+class NoFTS5Cursor:
+    """ Wraps a sqlite3.Cursor to behave as if SQLite was built without FTS5. """
+    def __init__( self, cursor ): self.cursor = cursor
+    def execute( self, sql, *args ):
+        if 'USING fts5' in sql: raise sqlite3.OperationalError( 'no such module: fts5' )
+        return self.cursor.execute( sql, *args )
+    def __getattr__( self, name ): return getattr( self.cursor, name )
+
+class NoFTS5Connection:
+    """ Wraps a sqlite3.Connection to behave as if SQLite was built without FTS5. """
+    def __init__( self, *args, **kwargs ): self.connection = realSQLiteConnect( *args, **kwargs )
+    def cursor( self ): return NoFTS5Cursor( self.connection.cursor() )
+    def __getattr__( self, name ): return getattr( self.connection, name )
+
+
+class SQLiteFTSBibleTests( unittest.TestCase ):
+    """ Unit tests for writing and searching SQLite FTS databases. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.UB = USFMBible( TEST_FOLDERPATH, "Matigsalug", 'MBTV' )
+        cls.UB.preload()
+        for BBB in TEST_BOOKS:
+            cls.UB.loadBook( BBB )
+
+    def setUp( self ):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.outputFolderpath = Path( self.tempFolder.name )
+
+    def tearDown( self ):
+        self.tempFolder.cleanup()
+
+    def test_010_findText( self ):
+        """ Test that the searcher gives the same results as InternalBible.findText(). """
+        if not SQLiteFTSBible.createSQLiteFTSDatabase( self.UB, self.outputFolderpath ):
+            self.skipTest( "This SQLite doesn't have FTS5" )
+        searcher = SQLiteFTSBible.SQLiteFTSBibleSearcher( self.outputFolderpath.joinpath( f'MBTV{SQLiteFTSBible.SQLITE_FTS_FILENAME_ENDING}' ) )
+        try:
+            self.assertEqual( searcher.getBookList(), list( TEST_BOOKS ) )
+            for optionsDict in ( { 'findText':'kandin' }, { 'findText':'Manama', 'caselessFlag':False },
+                                    { 'findText':'mánama', 'ignoreDiacriticsFlag':True }, { 'findText':'kandin', 'wordMode':'Whole' },
+                                    { 'findText':'regex:[Kk]and.n\\b' }, { 'findText':'zzzz' }, ):
+                with self.subTest( **optionsDict ):
+                    expectedResults = self.UB.findText( dict(optionsDict) )[2]
+                    self.assertEqual( searcher.findText( dict(optionsDict) )[2], expectedResults )
+            self.assertTrue( searcher.rankedSearch( 'kandin', maxResults=3 ) )
+        finally: searcher.close()
+    # end of test_010_findText
+
+    def test_020_noFTS5( self ):
+        """ Test that a SQLite build without FTS5 gives an error (rather than an exception). """
+        with mock.patch.object( SQLiteFTSBible.sqlite3, 'connect', NoFTS5Connection ):
+            with self.assertLogs( level='ERROR' ):
+                result = SQLiteFTSBible.createSQLiteFTSDatabase( self.UB, self.outputFolderpath )
+        self.assertFalse( result )
+        self.assertEqual( os.listdir( self.outputFolderpath ), [] ) # Unusable database was removed
+    # end of test_020_noFTS5
+# end of SQLiteFTSBibleTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_SQLiteFTSBible.py
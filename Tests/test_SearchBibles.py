@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_SearchBibles.py
+#
+# Module testing SearchBibles.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that searching many Bibles at once with SearchBibles.py
+    (both in this process and with the worker processes)
+    gives the same results as searching each Bible with InternalBible.findText(),
+    and that the results are streamed (and can be cancelled).
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "Multiple Bible search tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Misc.SearchBibles import iterFindTextInBibles, findTextInBibles
+from BibleOrgSys.Formats.USFMBible import USFMBible
+
+
+TEST_DATA_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/' )
+TEST_BIBLES = ( ('USFMTest1','MBTV1',None), ('USFMTest2','MBTV2',('GEN','LEV','MRK','JDE','REV')), )
+
+FIND_OPTIONS = ( { 'findText':'kandin' },
+                    { 'findText':'Manama', 'wordMode':'Whole', 'caselessFlag':False },
+                    { 'findText':'mánama', 'ignoreDiacriticsFlag':True },
+                    { 'findText':'regex:kand.n' },
+                    { 'findText':'zzzz' }, )
+
+
+def getVerseResultLists( resultList:list[tuple], numBibles:int ) -> list[list[tuple]]:
+    """ Returns the verse grouped results as a list of results for each Bible. """
+    BibleResultLists = [[] for _j in range( numBibles )]
+    for _verseKey,verseResults in resultList:
+        for BibleResultList,BibleVerseResults in zip( BibleResultLists, verseResults ):
+            BibleResultList.extend( BibleVerseResults )
+    return BibleResultLists
+# end of getVerseResultLists
+
+
+class SearchBiblesTests( unittest.TestCase ):
+    """ Compare the multiple Bible searches with the single Bible ones. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+        cls.BibleObjects = []
+        for folderName,abbreviation,BBBs in TEST_BIBLES:
+            UB = USFMBible( TEST_DATA_FOLDERPATH.joinpath( folderName ), "Matigsalug", abbreviation )
+            if BBBs is None: UB.load()
+            else:
+                UB.preload()
+                for BBB in BBBs: UB.loadBook( BBB )
+            cls.BibleObjects.append( UB )
+
+    def setUp( self ):
+        self.savedMaxProcesses = BibleOrgSysGlobals.maxProcesses
+        BibleOrgSysGlobals.maxProcesses = 2
+
+    def tearDown( self ):
+        BibleOrgSysGlobals.maxProcesses = self.savedMaxProcesses
+        BibleOrgSysGlobals.shutdownWorkerPool()
+        for BibleObject in self.BibleObjects:
+            BibleObject.wordIndex = None
+            BibleObject.__dict__.pop( '_getFindTextMPParameters', None )
+
+    def checkAgainstFindText( self, parallelFlag:bool ) -> None:
+        """ Check that findTextInBibles() gives the same results as findText() on each Bible. """
+        for optionsDict in FIND_OPTIONS:
+            with self.subTest( parallelFlag=parallelFlag, **optionsDict ):
+                expectedResultLists = [BibleObject.findText( dict(optionsDict) )[2] for BibleObject in self.BibleObjects]
+                _optionsDict, resultSummaryDict, resultList = findTextInBibles( self.BibleObjects, dict(optionsDict), parallelFlag=parallelFlag )
+                self.assertEqual( getVerseResultLists( resultList, len(self.BibleObjects) ), expectedResultLists )
+                self.assertEqual( resultSummaryDict['numResults'], sum( len(expectedResults) for expectedResults in expectedResultLists ) )
+                self.assertEqual( resultSummaryDict['numGroups'], len(resultList) )
+                self.assertFalse( resultSummaryDict['cancelled'] )
+                for verseKey,verseResults in resultList:
+                    self.assertTrue( any( verseResults ) )
+                    for BibleVerseResults in verseResults:
+                        for resultTuple in BibleVerseResults:
+                            self.assertEqual( resultTuple[0].getBCV(), verseKey.getBCV() )
+    # end of checkAgainstFindText
+
+    def test_010_serial( self ):
+        """ Test searching the Bibles in this process. """
+        _optionsDict, resultSummaryDict, _resultList = findTextInBibles( self.BibleObjects, { 'findText':'kandin' } )
+        self.assertGreater( resultSummaryDict['numResults'], 100 )
+        self.assertGreater( len(resultSummaryDict['foundBookList']), 4 )
+        self.checkAgainstFindText( parallelFlag=False )
+    # end of test_010_serial
+
+    def test_020_parallel( self ):
+        """ Test searching the Bibles in the worker processes. """
+        self.checkAgainstFindText( parallelFlag=True )
+    # end of test_020_parallel
+
+    def test_030_parallelWithWordIndex( self ):
+        """ Test searching in the worker processes when one of the Bibles is searched here using its word index. """
+        self.BibleObjects[1].makeWordIndex( loadFlag=False, saveFlag=False )
+        self.checkAgainstFindText( parallelFlag=True )
+    # end of test_030_parallelWithWordIndex
+
+    def test_040_streaming( self ):
+        """ Test that the first results come before the worker parameters for all of the books have been made. """
+        numParameters = { 'made':0 }
+        for BibleObject in self.BibleObjects:
+            def countedGetFindTextMPParameters( *args, BibleObject=BibleObject, **kwargs ):
+                numParameters['made'] += 1
+                return type(BibleObject)._getFindTextMPParameters( BibleObject, *args, **kwargs )
+            BibleObject._getFindTextMPParameters = countedGetFindTextMPParameters
+        numBooks = sum( len(BibleObject.books) for BibleObject in self.BibleObjects )
+        resultSummaryDict = {}
+        resultIterator = iterFindTextInBibles( self.BibleObjects, { 'findText':'kandin' }, resultSummaryDict, parallelFlag=True )
+        self.assertEqual( numParameters['made'], 0 ) # Nothing is done until we start iterating
+        next( resultIterator )
+        self.assertGreater( numParameters['made'], 0 )
+        self.assertLess( numParameters['made'], numBooks )
+        resultIterator.close()
+        self.assertLess( numParameters['made'], numBooks )
+        self.assertLess( len(resultSummaryDict['searchedBookList']), len( set().union( *(BibleObject.books for BibleObject in self.BibleObjects) ) ) )
+        list( iterFindTextInBibles( self.BibleObjects, { 'findText':'kandin' }, parallelFlag=True ) )
+        self.assertGreaterEqual( numParameters['made'], numBooks ) # The full search makes them all
+    # end of test_040_streaming
+
+    def test_050_cancel( self ):
+        """ Test cancelling the search after the first book (both in this process and with the workers). """
+        for parallelFlag in (False, True):
+            with self.subTest( parallelFlag=parallelFlag ):
+                resultSummaryDict = {}
+                resultList = list( iterFindTextInBibles( self.BibleObjects, { 'findText':'kandin' }, resultSummaryDict,
+                                    cancelCallback=lambda: len(resultSummaryDict['searchedBookList']) >= 1, parallelFlag=parallelFlag ) )
+                self.assertTrue( resultSummaryDict['cancelled'] )
+                self.assertEqual( resultSummaryDict['searchedBookList'], ['GEN'] )
+                self.assertTrue( all( verseKey.getBBB() == 'GEN' for verseKey,_verseResults in resultList ) )
+    # end of test_050_cancel
+# end of SearchBiblesTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_SearchBibles.py
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_USFMBibleBatchReplace.py
+#
+# Module testing USFMBible.batchFindReplaceText()
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing batchFindReplaceText() (and compileFindReplaceRules()) in USFMBible.py
+    on copies of some test book files in a temporary folder.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "USFM Bible batch replace tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Formats.USFMBible import USFMBible, batchFindReplaceText, compileFindReplaceRules
+
+
+TEST_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/USFMTest2/' )
+TEST_FILENAMES = { 'MRK':'MBT42MRK.SCP', 'JDE':'MBT66JUD.SCP', }
+
+
+class USFMBibleBatchReplaceTests( unittest.TestCase ):
+    """ Unit tests for batchFindReplaceText(). """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+        BibleOrgSysGlobals.preloadCommonData()
+
+    def setUp( self ):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.folderpath = Path( self.tempFolder.name )
+        for filename in TEST_FILENAMES.values():
+            shutil.copy2( TEST_FOLDERPATH.joinpath( filename ), self.folderpath )
+        self.UB = USFMBible( self.folderpath, "Matigsalug", 'MBTV' )
+        self.UB.preload()
+
+    def tearDown( self ):
+        self.tempFolder.cleanup()
+
+    def getBookText( self, BBB:str ) -> str:
+        with open( self.folderpath.joinpath( TEST_FILENAMES[BBB] ), 'rt', encoding='utf-8' ) as bookFile:
+            return bookFile.read()
+
+    def test_010_rulePriority( self ):
+        """ Test that the first rule that matches at any position is used (and that replacements aren't searched again). """
+        originalText = self.getBookText( 'MRK' )
+        numSikandin, numKandin = originalText.count( 'sikandin' ), originalText.count( 'kandin' )
+        self.assertGreater( numSikandin, 100 )
+        self.assertGreater( numKandin, numSikandin )
+        resultDict = batchFindReplaceText( self.UB, [('sikan','SIKAN'), ('sikandin','WRONG'), ('kandin','sikandin'), ('SIKAN','WRONG')],
+                                            { 'bookList':['MRK'], 'doBackups':False } )
+        self.assertEqual( resultDict['ruleReplaceCounts'], [originalText.count( 'sikan' ), 0, numKandin-numSikandin, 0] )
+        self.assertEqual( resultDict['numReplaces'], sum( resultDict['ruleReplaceCounts'] ) )
+        self.assertEqual( resultDict['searchedBookList'], ['MRK'] )
+        self.assertEqual( resultDict['replacedBookList'], ['MRK'] )
+        newText = self.getBookText( 'MRK' )
+        self.assertEqual( newText.count( 'SIKANdin' ), numSikandin )
+        self.assertNotIn( 'WRONG', newText )
+        with open( self.folderpath.joinpath( TEST_FILENAMES['MRK'] ), 'rb' ) as bookFile:
+            self.assertIn( b'\r\n', bookFile.read() ) # Line endings are kept
+    # end of test_010_rulePriority
+
+    def test_020_wordModes( self ):
+        """ Test the wordMode of non-regex rules. """
+        originalText = self.getBookText( 'MRK' )
+        resultDict = batchFindReplaceText( self.UB, [('kandin','KANDIN','Whole'), ('sika','SIKA','Begins')],
+                                            { 'bookList':['MRK'], 'doBackups':False } )
+        newText = self.getBookText( 'MRK' )
+        self.assertEqual( newText.count( ' KANDIN' ), originalText.count( ' kandin' ) - originalText.count( ' kandin' + 'x' ) )
+        self.assertNotIn( 'sKANDIN', newText ) # Not a whole word
+        self.assertEqual( resultDict['ruleReplaceCounts'][1], newText.count( 'SIKA' ) )
+        self.assertNotIn( 'kSIKA', newText )
+    # end of test_020_wordModes
+
+    def test_030_regexGroups( self ):
+        """ Test that regex rules can use groups in the replaceText. """
+        originalText = self.getBookText( 'MRK' )
+        resultDict = batchFindReplaceText( self.UB, [('regex:(Pila)(tu)\\b', '\\2\\1'), ('regex:(?P<name>Hirudis)', '<\\g<name>>')],
+                                            { 'doBackups':False } )
+        newText = self.getBookText( 'MRK' )
+        self.assertEqual( newText.count( 'tuPila' ), originalText.count( 'Pilatu' ) )
+        self.assertEqual( newText.count( '<Hirudis>' ), originalText.count( 'Hirudis' ) )
+        self.assertEqual( resultDict['replacedBookList'], ['MRK'] )
+    # end of test_030_regexGroups
+
+    def test_040_badRules( self ):
+        """ Test that rules which can't be combined are rejected (before any files are changed). """
+        originalText = self.getBookText( 'MRK' )
+        for badRuleList in ( [('regex:(ka)\\1', 'x')], [('regex:(?P<k>ka)(?P=k)', 'x')], [('regex:(ka', 'x')], [('', 'x')], [('kandin', 'x', 'Whle')], [('kandin', 'x', None)], ):
+            with self.subTest( ruleList=badRuleList ):
+                with self.assertRaises( ValueError ): compileFindReplaceRules( badRuleList )
+                with self.assertRaises( ValueError ): batchFindReplaceText( self.UB, [('kandin','WRONG')] + badRuleList )
+        self.assertEqual( self.getBookText( 'MRK' ), originalText )
+    # end of test_040_badRules
+
+    def test_050_backups( self ):
+        """ Test that the backups are rotated (and that only changed files are backed up). """
+        bookFilepath = self.folderpath.joinpath( TEST_FILENAMES['MRK'] )
+        texts = [self.getBookText( 'MRK' )]
+        for n in range( 1, 8 ):
+            batchFindReplaceText( self.UB, [('Pilatu',f'Pilatu{n}'),(f'Pilatu{n-1}','Pilatu')] )
+            texts.append( self.getBookText( 'MRK' ) )
+        self.assertIn( 'Pilatu7', texts[-1] )
+        # There's a maximum of five backups with the latest one in .bak
+        self.assertEqual( sorted( os.listdir( self.folderpath ) ),
+                            sorted( list( TEST_FILENAMES.values() ) + [f'{TEST_FILENAMES["MRK"]}.bak{suffix}' for suffix in ('','2','3','4','5')] ) )
+        with open( f'{bookFilepath}.bak', 'rt', encoding='utf-8' ) as backupFile: self.assertEqual( backupFile.read(), texts[-2] )
+        for n in range( 2, 6 ):
+            with open( f'{bookFilepath}.bak{n}', 'rt', encoding='utf-8' ) as backupFile: self.assertEqual( backupFile.read(), texts[-1-n] )
+    # end of test_050_backups
+
+    def test_060_unchangedBooks( self ):
+        """ Test that books without any replacements aren't written or reloaded. """
+        for BBB in TEST_FILENAMES: self.UB.loadBook( BBB )
+        originalBooks = dict( self.UB.books )
+        JDEFilepath = self.folderpath.joinpath( TEST_FILENAMES['JDE'] )
+        JDEModifiedTime = os.stat( JDEFilepath ).st_mtime_ns
+        self.assertEqual( self.UB.findText( { 'findText':'Pilatu' } )[1]['foundBookList'], ['MRK'] )
+
+        resultDict = batchFindReplaceText( self.UB, [('Pilatu','Pilato'), ('Pilato','WRONG')] )
+        self.assertEqual( resultDict['searchedBookList'], ['MRK','JDE'] )
+        self.assertEqual( resultDict['replacedBookList'], ['MRK'] )
+        self.assertEqual( resultDict['reloadedBookList'], ['MRK'] )
+        self.assertEqual( os.stat( JDEFilepath ).st_mtime_ns, JDEModifiedTime )
+        self.assertFalse( os.access( f'{JDEFilepath}.bak', os.F_OK ) )
+        self.assertIs( self.UB.books['JDE'], originalBooks['JDE'] ) # not reloaded
+        self.assertIsNot( self.UB.books['MRK'], originalBooks['MRK'] ) # reloaded
+        self.assertEqual( self.UB.findText( { 'findText':'Pilatu' } )[1]['numResults'], 0 )
+        self.assertEqual( self.UB.findText( { 'findText':'Pilato' } )[1]['foundBookList'], ['MRK'] )
+
+        # A replacement that gives the same text doesn't write the file either
+        MRKFilepath = self.folderpath.joinpath( TEST_FILENAMES['MRK'] )
+        MRKModifiedTime = os.stat( MRKFilepath ).st_mtime_ns
+        resultDict = batchFindReplaceText( self.UB, [('Pilato','Pilato')] )
+        self.assertEqual( resultDict['replacedBookList'], [] )
+        self.assertEqual( os.stat( MRKFilepath ).st_mtime_ns, MRKModifiedTime )
+    # end of test_060_unchangedBooks
+# end of USFMBibleBatchReplaceTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_USFMBibleBatchReplace.py
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -\*- coding: utf-8 -\*-
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# test_USFMFile.py
+#
+# Module testing USFMFile.py
+#
+# Copyright (C) 2025 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+BOS@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module testing that USFMFile.read() gives exactly the same lines
+    with BULK_READ_FLAG set (using _readBulk() and USFM_BUFFER_LINE_REGEX)
+    as with the original line-by-line code.
+"""
+
+LAST_MODIFIED_DATE = '2025-06-26' # by RJH
+PROGRAM_NAME = "USFM file tests"
+PROGRAM_VERSION = '0.01'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+BOSTopFolderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+if BOSTopFolderpath not in sys.path:
+    sys.path.insert( 0, BOSTopFolderpath ) # So we can run it from the above folder and still do these imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.InputOutput import USFMFile as USFMFileModule
+from BibleOrgSys.InputOutput.USFMFile import USFMFile, USFM_BUFFER_LINE_REGEX, splitUSFMMarkerFromText
+
+
+TEST_DATA_FOLDERPATH = Path( BOSTopFolderpath, 'Tests/DataFilesForTests/' )
+
+TEST_LINES = [ '\\id MAT Test file',
+                '# A comment line',
+                '\\c 1',
+                '',
+                '\\p',
+                '\\v 1 The first verse',
+                'continues on this line',
+                '   and on this indented one',
+                '',
+                '\\v 2  Two spaces after the verse number.',
+                '\\ts\\*',
+                '\\ts\\* Text after a self-closed marker',
+                '\\qs*',
+                '\\qs* Selah',
+                '\\s1\\nd Lord\\nd* text straight after the marker',
+                '\\',
+                '\\ ',
+                '\\v 3 A verse with a trailing space ',
+                '\\rem A remark',
+                'continuing the remark',
+                '#Another comment after the remark',
+                '\\v 4 A verse with \\w word|strong="H1234"\\w* attributes.',
+                '\t',
+                ' ',
+                '\\v 5 The last line (without a final newline)', ]
+
+
+class USFMFileTests( unittest.TestCase ):
+    """ Compare the bulk USFM file reading with the line-by-line code. """
+
+    @classmethod
+    def setUpClass( cls ):
+        parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+
+    def setUp( self ):
+        self.savedFlag = USFMFileModule.BULK_READ_FLAG
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.filepath = Path( self.tempFolder.name, 'test.usfm' )
+
+    def tearDown( self ):
+        USFMFileModule.BULK_READ_FLAG = self.savedFlag
+        self.tempFolder.cleanup()
+
+    def readBothWays( self, filepath:Path, ignoreSFMs=None, encoding:str|None=None ) -> list[tuple[str|None,str]]:
+        """ Read the file with and without BULK_READ_FLAG and check that the lines are the same. """
+        results = {}
+        for bulkFlag in (True, False):
+            USFMFileModule.BULK_READ_FLAG = bulkFlag
+            usfmFile = USFMFile()
+            usfmFile.read( filepath, ignoreSFMs=ignoreSFMs, encoding=encoding )
+            results[bulkFlag] = usfmFile.lines
+        self.assertEqual( results[True], results[False] )
+        return results[True]
+    # end of readBothWays
+
+    def writeTestFile( self, fileText:str, encoding:str='utf-8' ) -> None:
+        with open( self.filepath, 'wb' ) as testFile: testFile.write( fileText.encode( encoding ) )
+
+    def test_010_splitLines( self ):
+        """ Test that the buffer regex splits each line like splitUSFMMarkerFromText() does. """
+        for line in TEST_LINES:
+            if not line or line[0] == '#': continue
+            with self.subTest( line=line ):
+                matches = USFM_BUFFER_LINE_REGEX.findall( line )
+                self.assertEqual( len(matches), 1 )
+                backslash, markerName, closure, text = matches[0]
+                self.assertEqual( (markerName+closure if backslash else None, text), splitUSFMMarkerFromText( line ) )
+    # end of test_010_splitLines
+
+    def test_020_lineEndings( self ):
+        """ Test LF and CRLF files (with and without a BOM and a final newline). """
+        expectedLines = None
+        for newline in ( '\n', '\r\n' ):
+            for BOM in ( '', BibleOrgSysGlobals.BOM ):
+                for finalNewline in ( '', newline ):
+                    with self.subTest( newline=newline, BOM=bool(BOM), finalNewline=bool(finalNewline) ):
+                        self.writeTestFile( BOM + newline.join( TEST_LINES ) + finalNewline )
+                        lines = self.readBothWays( self.filepath )
+                        if expectedLines is None: expectedLines = lines
+                        else: self.assertEqual( lines, expectedLines )
+        self.assertEqual( expectedLines[0], ('id','MAT Test file') ) # BOM removed
+        self.assertIn( ('v','1 The first verse continues on this line    and on this indented one'), expectedLines )
+        self.assertIn( ('v','2  Two spaces after the verse number.'), expectedLines )
+        self.assertIn( ('ts\\*',''), expectedLines )
+        self.assertIn( ('ts\\*',' Text after a self-closed marker'), expectedLines )
+        self.assertIn( ('qs*',' Selah'), expectedLines )
+        self.assertIn( ('s1','\\nd Lord\\nd* text straight after the marker'), expectedLines )
+        self.assertIn( ('v','4 A verse with \\w word|strong="H1234"\\w* attributes. \t  '), expectedLines ) # The tab and space lines are continuations
+        self.assertEqual( expectedLines[-1], ('v','5 The last line (without a final newline)') )
+        self.assertFalse( any( text.startswith( '#' ) or text.endswith( '\r' ) for _marker,text in expectedLines ) )
+    # end of test_020_lineEndings
+
+    def test_030_ignoreSFMs( self ):
+        """ Test that ignored markers (and their continuation lines) are dropped. """
+        self.writeTestFile( '\n'.join( TEST_LINES ) )
+        lines = self.readBothWays( self.filepath, ignoreSFMs=('rem','ts\\*','v') )
+        self.assertFalse( any( marker in ('rem','ts\\*','v') for marker,_text in lines ) )
+        self.assertFalse( any( 'continu' in text for _marker,text in lines ) )
+        self.assertIn( ('c','1'), lines )
+    # end of test_030_ignoreSFMs
+
+    def test_040_nonSFMStart( self ):
+        """ Test non-SFM lines before the first marker. """
+        self.writeTestFile( '\r\n'.join( ['Not a USFM line', 'nor this one', '#A comment', ''] + TEST_LINES ) )
+        lines = self.readBothWays( self.filepath )
+        self.assertEqual( lines[0], (None,'Not a USFM line nor this one') )
+        self.assertEqual( lines[1], ('id','MAT Test file') )
+    # end of test_040_nonSFMStart
+
+    def test_050_encodings( self ):
+        """ Test other encodings (and that undecodable files are still read line-by-line). """
+        self.writeTestFile( '\n'.join( TEST_LINES + ['\\v 6 Ŋ€Ü'] ), 'utf-16' )
+        self.assertEqual( self.readBothWays( self.filepath, encoding='utf-16' )[-1], ('v','6 Ŋ€Ü') )
+        self.writeTestFile( '\n'.join( TEST_LINES + ['\\v 6 Übung'] ), 'latin-1' )
+        self.assertEqual( self.readBothWays( self.filepath, encoding='latin-1' )[-1], ('v','6 Übung') )
+        self.assertFalse( USFMFile()._readBulk( self.filepath, (), 'utf-8' ) ) # Not valid UTF-8
+    # end of test_050_encodings
+
+    def test_060_testFiles( self ):
+        """ Test all of the USFM and SFM files in the test data folders. """
+        numFiles = 0
+        for folderpath,_subfolderNames,filenames in os.walk( TEST_DATA_FOLDERPATH ):
+            for filename in filenames:
+                if os.path.splitext( filename )[1].upper() in ('.SFM','.USFM','.SCP','.PTX','.SFM3'):
+                    with self.subTest( filename=filename ):
+                        self.readBothWays( Path( folderpath, filename ) )
+                        numFiles += 1
+        self.assertGreater( numFiles, 20 )
+    # end of test_060_testFiles
+# end of USFMFileTests class
+
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, PROGRAM_NAME_VERSION )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of test_USFMFile.py